@@ -17,6 +17,9 @@ from identity.infrastructure.database.sqlalchemy.models.user_base import (
 from photos.infrastructure.database.sqlalchemy.models.photo_base import (
     PhotoBase,
 )
+from photos.infrastructure.database.sqlalchemy.models.photo_object_base import (
+    PhotoObjectBase,
+)
 
 
 # Needed for proper database configuration, e.g. fkeys and tables
@@ -24,6 +27,7 @@ __models__: list[type[Base]] = [
     UserBase,
     TokenBase,
     PhotoBase,
+    PhotoObjectBase,
 ]
 
 # this is the Alembic Config object, which provides
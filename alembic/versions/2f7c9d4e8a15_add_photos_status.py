@@ -0,0 +1,28 @@
+"""add photos status
+
+Revision ID: 2f7c9d4e8a15
+Revises: 8d2e4b6a1c93
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f7c9d4e8a15'
+down_revision: Union[str, Sequence[str], None] = '8d2e4b6a1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('photos', sa.Column('status', sa.String(length=16), server_default='active', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('photos', 'status')
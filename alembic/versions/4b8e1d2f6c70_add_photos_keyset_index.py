@@ -0,0 +1,29 @@
+"""add photos keyset index
+
+Revision ID: 4b8e1d2f6c70
+Revises: 2f7c9d4e8a15
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8e1d2f6c70'
+down_revision: Union[str, Sequence[str], None] = '2f7c9d4e8a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_photos_user_id_created_at_photo_id', 'photos', ['user_id', 'created_at', 'photo_id'], unique=False)
+    op.drop_index(op.f('ix_photos_user_id'), table_name='photos')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_photos_user_id'), 'photos', ['user_id'], unique=False)
+    op.drop_index('ix_photos_user_id_created_at_photo_id', table_name='photos')
@@ -0,0 +1,27 @@
+"""add tokens issued_at index
+
+Revision ID: 5c1f9a7e2b40
+Revises: 33eca3feeca1
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1f9a7e2b40'
+down_revision: Union[str, Sequence[str], None] = '33eca3feeca1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_tokens_issued_at'), 'tokens', ['issued_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_tokens_issued_at'), table_name='tokens')
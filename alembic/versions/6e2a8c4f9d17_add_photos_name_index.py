@@ -0,0 +1,27 @@
+"""add photos name index
+
+Revision ID: 6e2a8c4f9d17
+Revises: 9a3c5e7f1b24
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2a8c4f9d17'
+down_revision: str | Sequence[str] | None = '9a3c5e7f1b24'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_photos_name', 'photos', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_photos_name', table_name='photos')
@@ -0,0 +1,27 @@
+"""add users descriptor covering index
+
+Revision ID: 8d2e4b6a1c93
+Revises: 5c1f9a7e2b40
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4b6a1c93'
+down_revision: Union[str, Sequence[str], None] = '5c1f9a7e2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_user_id_username', 'users', ['user_id'], unique=False, postgresql_include=['username'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_user_id_username', table_name='users', postgresql_include=['username'])
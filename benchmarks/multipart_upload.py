@@ -0,0 +1,81 @@
+# Compares multipart upload throughput with sequential parts against
+# concurrent parts.
+# Usage: PYTHONPATH=src python benchmarks/multipart_upload.py [size_mib]
+# NOTE: needs a running MinIO, configured through S3_ENDPOINT,
+# S3_ACCESS_KEY, S3_SECRET_KEY and S3_BUCKET (defaults match
+# configs/base.yaml); objects are written under benchmarks/ and removed
+import asyncio
+import os
+import sys
+import time
+from collections.abc import AsyncIterator
+
+from common.infrastructure.config.s3_config import S3Config
+from common.infrastructure.storage.s3.client import S3Client
+from photos.infrastructure.storage.s3.repositories.photo_repository import (
+    S3PhotoRepository,
+)
+
+
+PART_SIZE = 8 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+CONCURRENCY = (1, 2, 4, 8)
+ROUNDS = 3
+
+
+async def _content(size: int) -> AsyncIterator[bytes]:
+    chunk = os.urandom(CHUNK_SIZE)
+    for _ in range(size // CHUNK_SIZE):
+        yield chunk
+
+
+async def _measure(
+    repository: S3PhotoRepository, client: S3Client, size: int
+) -> float:
+    best = float("inf")
+    for round_ in range(ROUNDS):
+        name = f"benchmarks/multipart-{repository.concurrency}-{round_}"
+        start = time.perf_counter()
+        await repository.upload_photo(
+            name, "application/octet-stream", _content(size)
+        )
+        best = min(best, time.perf_counter() - start)
+        await client.remove_object(repository.bucket_name, name)
+    return size / best / (1024 * 1024)
+
+
+async def main(size_mib: int) -> None:
+    config = S3Config(
+        endpoint=os.getenv("S3_ENDPOINT", "localhost:9000"),
+        access_key=os.getenv("S3_ACCESS_KEY", "minio"),
+        secret_key=os.getenv("S3_SECRET_KEY", "minio"),
+        bucket_name=os.getenv("S3_BUCKET", "photos"),
+    )
+    client = S3Client.create(config)
+    try:
+        if not await client.bucket_exists(config.bucket_name):
+            await client.make_bucket(config.bucket_name)
+
+        size = size_mib * 1024 * 1024
+        print(f"object: {size_mib} MiB, part: {PART_SIZE // 1024 // 1024} MiB")
+        print(f"{'concurrency':<14}{'MiB/s':>10}{'speedup':>10}")
+        baseline = None
+        for concurrency in CONCURRENCY:
+            repository = S3PhotoRepository(
+                client,
+                config.bucket_name,
+                part_size=PART_SIZE,
+                concurrency=concurrency,
+            )
+            throughput = await _measure(repository, client, size)
+            baseline = baseline or throughput
+            print(
+                f"{concurrency:<14}{throughput:>10.1f}"
+                f"{throughput / baseline:>9.2f}x"
+            )
+    finally:
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 128))
@@ -0,0 +1,126 @@
+# Compares per-call CPU of ORM entity loads against the Core column
+# lookups used by the hot repository reads.
+# Usage: PYTHONPATH=src python benchmarks/repository_reads.py [iterations]
+# NOTE: runs against in-memory SQLite (aiosqlite), so the numbers reflect
+# SQLAlchemy/mapping overhead rather than network latency
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from auth.application.dtos.models.token import Token, TokenTypeEnum
+from auth.infrastructure.database.sqlalchemy.mappers.token_mapper import (
+    TokenMapper,
+)
+from auth.infrastructure.database.sqlalchemy.models.token_base import TokenBase
+from auth.infrastructure.database.sqlalchemy.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.models.base import Base
+from common.infrastructure.database.sqlalchemy.session_factory import (
+    MakerSessionFactory,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from identity.domain.entity.user import User
+from identity.infrastructure.database.sqlalchemy.mappers.user_mapper import (
+    UserMapper,
+)
+from identity.infrastructure.database.sqlalchemy.models.user_base import (
+    UserBase,
+)
+from identity.infrastructure.database.sqlalchemy.repositories.user_repository import (
+    UserRepository,
+)
+
+
+async def measure(
+    call: Callable[[], Awaitable[Any]], iterations: int
+) -> float:
+    for _ in range(min(iterations, 100)):
+        await call()
+    start = time.process_time()
+    for _ in range(iterations):
+        await call()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+async def main(iterations: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[UserBase.__table__, TokenBase.__table__],
+        )
+
+    maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    executor = QueryExecutor(UnitOfWork(MakerSessionFactory(maker)))
+    users = UserRepository(executor)
+    tokens = RefreshTokenRepository(executor)
+
+    now = datetime.now(UTC)
+    user = User(uuid4(), "benchmark-user", "hash")
+    token = Token(
+        token_id=uuid4(),
+        user_id=user.user_id,
+        value="benchmark-token",
+        token_type=TokenTypeEnum.REFRESH,
+        issued_at=now,
+        expires_at=now + timedelta(days=1),
+        revoked=False,
+    )
+    await users.add(user)
+    await tokens.add(token)
+
+    async def orm_user_by_id() -> User:
+        stmt = select(UserBase).where(UserBase.user_id == user.user_id)
+        base = await executor.execute_scalar_one(stmt)
+        assert base is not None
+        return UserMapper.to_domain(base)
+
+    async def orm_user_by_username() -> User:
+        stmt = select(UserBase).where(UserBase.username == user.username)
+        base = await executor.execute_scalar_one(stmt)
+        assert base is not None
+        return UserMapper.to_domain(base)
+
+    async def orm_token() -> Token:
+        stmt = select(TokenBase).where(TokenBase.value == token.value)
+        base = await executor.execute_scalar_one(stmt)
+        assert base is not None
+        return TokenMapper.to_domain(base)
+
+    cases: list[tuple[str, Callable[[], Awaitable[Any]], Any]] = [
+        (
+            "user.get_by_id",
+            orm_user_by_id,
+            lambda: users.get_by_id(user.user_id),
+        ),
+        (
+            "user.get_by_username",
+            orm_user_by_username,
+            lambda: users.get_by_username(user.username),
+        ),
+        ("token.get", orm_token, lambda: tokens.get(token.value)),
+    ]
+
+    print(f"iterations: {iterations}")
+    print(f"{'lookup':<24}{'orm, us':>10}{'core, us':>10}{'saved':>8}")
+    for name, orm, core in cases:
+        assert await orm() == await core()
+        orm_us = await measure(orm, iterations)
+        core_us = await measure(core, iterations)
+        saved = 1 - core_us / orm_us
+        print(f"{name:<24}{orm_us:>10.1f}{core_us:>10.1f}{saved:>8.0%}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000))
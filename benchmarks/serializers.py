@@ -0,0 +1,64 @@
+# Compares serialize/deserialize cost of the cache serializer backends.
+# Usage: PYTHONPATH=src python benchmarks/serializers.py [iterations]
+import sys
+import timeit
+from uuid import uuid4
+
+from auth.infrastructure.serializers.marshmallow.shemas import (
+    UserDescriptorSchema,
+)
+from common.infrastructure.config.cache_config import CacheSerializerFormat
+from common.infrastructure.di.container.providers import (
+    provide_cache_serializer,
+)
+from common.infrastructure.serializers.marshmallow.serializer import (
+    MarshmallowSerializer,
+)
+from common.infrastructure.serializers.msgpack.serializer import (
+    MsgpackDataclassSerializer,
+)
+from common.infrastructure.serializers.orjson.serializer import (
+    OrjsonDataclassSerializer,
+)
+from common.infrastructure.serializers.serializer import ISerializer
+from identity.domain.value_objects.descriptor import UserDescriptor
+
+
+def measure(
+    serializer: ISerializer[UserDescriptor],
+    obj: UserDescriptor,
+    iterations: int,
+) -> tuple[float, float, int]:
+    payload = serializer.serialize(obj)
+    assert serializer.deserialize(payload) == obj
+
+    dump = timeit.timeit(lambda: serializer.serialize(obj), number=iterations)
+    load = timeit.timeit(
+        lambda: serializer.deserialize(payload), number=iterations
+    )
+    return dump / iterations * 1e6, load / iterations * 1e6, len(payload)
+
+
+def main(iterations: int) -> None:
+    descriptor = UserDescriptor(user_id=uuid4(), username="benchmark-user")
+    schema = UserDescriptorSchema()
+
+    backends: dict[str, ISerializer[UserDescriptor]] = {
+        "marshmallow": MarshmallowSerializer[UserDescriptor](schema),
+        "orjson": OrjsonDataclassSerializer(UserDescriptor),
+        "msgpack": MsgpackDataclassSerializer(UserDescriptor),
+    }
+    for fmt in CacheSerializerFormat:
+        backends[f"prefixed[{fmt.value}]"] = provide_cache_serializer(
+            UserDescriptor, schema, fmt
+        )
+
+    print(f"iterations: {iterations}")
+    print(f"{'backend':<24}{'dump, us':>10}{'load, us':>10}{'bytes':>8}")
+    for name, serializer in backends.items():
+        dump, load, size = measure(serializer, descriptor, iterations)
+        print(f"{name:<24}{dump:>10.2f}{load:>10.2f}{size:>8}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -7,8 +7,12 @@ from auth.infrastructure.di.container.container import (
     AuthContainer,
     GRPCTokenContainer,
 )
+from auth.infrastructure.tasks.user_cache_prewarm import (
+    UserCachePrewarmTask,
+)
 from auth.presentation.grpc.generated import auth_pb2_grpc
 from common.infrastructure.app.app import App
+from common.infrastructure.app.metrics_app import MetricsApp
 from common.infrastructure.config.config import AppConfig
 from common.infrastructure.database.redis.redis import RedisDatabase
 from common.infrastructure.database.sqlalchemy.database import Database
@@ -18,9 +22,15 @@ from common.infrastructure.logger.logging.utils import log_config
 from common.infrastructure.server.fastapi.middleware.logging_middleware import (
     TraceMiddleware,
 )
+from common.infrastructure.server.fastapi.middleware.unit_of_work_middleware import (
+    UnitOfWorkMiddleware,
+)
 from common.infrastructure.server.fastapi.server import FastAPIServer
 from common.infrastructure.server.grpc.client import GRPCClient, LazyStub
 from common.infrastructure.storage.minio.storage import MinioStorage
+from common.infrastructure.tasks.asyncio_task_publisher import (
+    AsyncioBackgroundTaskPublisher,
+)
 from identity.infrastructure.di.container.container import IdentityContainer
 from photos.infrastructure.app.app import PhotosApp
 from photos.infrastructure.di.container.container import PhotoContainer
@@ -54,11 +64,17 @@ def main():
     client = GRPCClient(logger, config.grpc)
     logger.info("gRPC client initialized")
 
+    # Background tasks
+    task_publisher = AsyncioBackgroundTaskPublisher(logger)
+
     # Server
     logger.info("setting up FastAPI server...")
     server = FastAPIServer(logger)
     server.on_start_up(client.connect)
     server.on_start_up(storage.ensure_bucket)
+    server.on_start_up(redis.start_tracking)
+    server.on_start_up(database.start_replica_monitor)
+    server.on_tear_down(task_publisher.shutdown)
     server.on_tear_down(database.shutdown)
     server.on_tear_down(storage.shutdown)
     server.on_tear_down(redis.shutdown)
@@ -73,24 +89,31 @@ def main():
     identity_container = IdentityContainer(
         ttl=300,
         namespace="user",
+        serializer_format=config.cache.serializer,
         uuid_generator=uuid_generator,
         query_executor=query_executor,
+        read_only_query_executor=common_container.read_only_query_executor,
         redis=redis,
+        redis_circuit_breaker=common_container.redis_circuit_breaker,
     )
     user_repository = identity_container.user_repository
 
     stub = providers.Object(LazyStub(client, auth_pb2_grpc.AuthServiceStub))
     token_container = GRPCTokenContainer(
         stub=stub,
+        grpc_circuit_breaker=common_container.grpc_circuit_breaker,
         ttl=300,
         namespace="user",
+        serializer_format=config.cache.serializer,
+        cache_config=config.cache,
         auth_config=config.auth,
         clock=clock,
         uuid_generator=uuid_generator,
         token_generator=common_container.token_generator,
         query_executor=query_executor,
+        read_only_query_executor=common_container.read_only_query_executor,
         redis=redis,
-        user_repository=user_repository,
+        redis_circuit_breaker=common_container.redis_circuit_breaker,
     )
 
     auth_container = AuthContainer(
@@ -100,18 +123,43 @@ def main():
         token_issuer=token_container.token_issuer,
         token_revoker=token_container.token_revoker,
         token_refresher=token_container.token_refresher,
+        task_publisher=task_publisher,
+        caching_user_descriptor_repository=(
+            token_container.caching_user_read_repository
+        ),
+        caching_user_read_repository=(
+            identity_container.caching_user_read_repository
+        ),
     )
 
     photo_container = PhotoContainer(
         presigned_url_expiration_delta=timedelta(minutes=15),
+        upload_expiration_delta=timedelta(minutes=15),
+        max_upload_size=config.photo_uploads.max_size,
+        max_upload_body_overhead=config.photo_uploads.max_body_overhead,
         allowed_extensions=["jpg", "jpeg", "png", "gif"],
         uuid_generator=uuid_generator,
         query_executor=query_executor,
         minio_storage=storage,
+        storage_webhook_token=config.s3.webhook_token,
+        variants_config=config.photo_variants,
+        storage_circuit_breaker=common_container.storage_circuit_breaker,
+        metrics_registry=common_container.metrics_registry,
+        task_publisher=task_publisher,
     )
+    server.on_tear_down(photo_container.image_renderer().shutdown)
+
+    if config.cache.prewarm_enabled:
+        prewarm = UserCachePrewarmTask(
+            token_container.user_cache_prewarmer(), logger
+        )
+        server.on_start_up(prewarm.run)
 
     logger.info("building application...")
 
+    server.use_middleware(
+        UnitOfWorkMiddleware, unit_of_work=common_container.unit_of_work()
+    )
     server.use_middleware(TraceMiddleware, logger=logger)
 
     app = App(config, logger, server)
@@ -119,6 +167,7 @@ def main():
         TokenApp(token_container, server),
         AuthApp(auth_container, identity_container, server),
         PhotosApp(photo_container, server),
+        MetricsApp(common_container, server),
     )
     app.configure()
 
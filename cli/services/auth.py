@@ -2,14 +2,19 @@ import asyncio
 
 from auth.infrastructure.app.app import TokenGRPCApp
 from auth.infrastructure.di.container.container import TokenContainer
+from auth.infrastructure.tasks.user_cache_prewarm import (
+    UserCachePrewarmTask,
+)
 from common.infrastructure.config.config import AppConfig
 from common.infrastructure.database.redis.redis import RedisDatabase
 from common.infrastructure.database.sqlalchemy.database import Database
 from common.infrastructure.di.container.container import CommonContainer
 from common.infrastructure.logger.logging.logger_factory import LoggerFactory
 from common.infrastructure.logger.logging.utils import log_config
+from common.infrastructure.server.grpc.interceptors import (
+    UnitOfWorkInterceptor,
+)
 from common.infrastructure.server.grpc.server import GRPCServer
-from identity.infrastructure.di.container.container import IdentityContainer
 
 
 async def main():
@@ -35,33 +40,37 @@ async def main():
     query_executor = common_container.query_executor
     clock = common_container.clock
 
-    identity_container = IdentityContainer(
-        ttl=300,
-        namespace="user",
-        uuid_generator=uuid_generator,
-        query_executor=query_executor,
-        redis=redis,
-    )
-    user_repository = identity_container.user_repository
-
     token_container = TokenContainer(
         ttl=300,
         namespace="user",
+        serializer_format=config.cache.serializer,
+        cache_config=config.cache,
         auth_config=config.auth,
         clock=clock,
         uuid_generator=uuid_generator,
         token_generator=common_container.token_generator,
         query_executor=query_executor,
+        read_only_query_executor=common_container.read_only_query_executor,
         redis=redis,
-        user_repository=user_repository,
+        redis_circuit_breaker=common_container.redis_circuit_breaker,
     )
 
     # Server
-    server = GRPCServer(logger, config.grpc)
+    server = GRPCServer(
+        logger,
+        config.grpc,
+        interceptors=[UnitOfWorkInterceptor(common_container.unit_of_work())],
+    )
     app = TokenGRPCApp(token_container, server, logger)
     app.configure()
 
     try:
+        await redis.start_tracking()
+        await database.start_replica_monitor()
+        if config.cache.prewarm_enabled:
+            await UserCachePrewarmTask(
+                token_container.user_cache_prewarmer(), logger
+            ).run()
         await server.start()
     except Exception as e:
         logger.exception(f"fatal error: {e}")
@@ -0,0 +1,63 @@
+import asyncio
+
+from auth.infrastructure.di.container.container import TokenContainer
+from auth.infrastructure.tasks.user_cache_prewarm import (
+    UserCachePrewarmTask,
+)
+from common.infrastructure.config.config import AppConfig
+from common.infrastructure.database.redis.redis import RedisDatabase
+from common.infrastructure.database.sqlalchemy.database import Database
+from common.infrastructure.di.container.container import CommonContainer
+from common.infrastructure.logger.logging.logger_factory import LoggerFactory
+from common.infrastructure.logger.logging.utils import log_config
+
+
+async def main():
+    config = AppConfig.load()
+
+    logger = LoggerFactory.create(None, config)
+    logger.info("logger initialized")
+    log_config(logger, config)
+
+    # Database
+    logger.info("initializing database...")
+    database = Database.create(config.db, logger)
+    logger.info("database initialized")
+
+    # Redis
+    logger.info("initializing Redis...")
+    redis = RedisDatabase.create(config.redis, logger)
+    logger.info("redis initialized")
+
+    # Containers
+    common_container = CommonContainer(config=config, database=database)
+
+    token_container = TokenContainer(
+        ttl=300,
+        namespace="user",
+        serializer_format=config.cache.serializer,
+        cache_config=config.cache,
+        auth_config=config.auth,
+        clock=common_container.clock,
+        uuid_generator=common_container.uuid_generator,
+        token_generator=common_container.token_generator,
+        query_executor=common_container.query_executor,
+        read_only_query_executor=common_container.read_only_query_executor,
+        redis=redis,
+        redis_circuit_breaker=common_container.redis_circuit_breaker,
+    )
+
+    # NOTE: runs regardless of `cache.prewarm_enabled`, which only controls
+    # the startup hook
+    task = UserCachePrewarmTask(token_container.user_cache_prewarmer(), logger)
+    try:
+        await task.run()
+    finally:
+        logger.info("stopping all resources...")
+        await database.shutdown()
+        await redis.shutdown()
+        logger.info("all resources stopped gracefully")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+
+class IActiveUserRepository(ABC):
+    @abstractmethod
+    async def get_recently_active(
+        self, since: datetime, limit: int
+    ) -> list[UUID]: ...
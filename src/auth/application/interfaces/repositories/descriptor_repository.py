@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from identity.domain.value_objects.descriptor import UserDescriptor
@@ -7,3 +8,8 @@ from identity.domain.value_objects.descriptor import UserDescriptor
 class IUserDescriptorRepository(ABC):
     @abstractmethod
     async def get_by_id(self, user_id: UUID) -> UserDescriptor: ...
+
+    @abstractmethod
+    async def get_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> list[UserDescriptor]: ...
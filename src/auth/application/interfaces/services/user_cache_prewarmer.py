@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PrewarmResult:
+    users: int
+    warmed: int
+    failed_batches: int
+
+
+class IUserCachePrewarmer(ABC):
+    @abstractmethod
+    async def prewarm(self) -> PrewarmResult: ...
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from identity.domain.value_objects.descriptor import UserDescriptor
+
+
+class IUserCacheWarmer(ABC):
+    @abstractmethod
+    def warm(self, descriptor: UserDescriptor) -> None: ...
+    @abstractmethod
+    def warm_by_id(self, user_id: UUID) -> None: ...
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from uuid import UUID
 
 from auth.application.interfaces.repositories.descriptor_repository import (
@@ -17,7 +18,7 @@ class CachingUserDescriptorRepository(IUserDescriptorRepository):
         self.key_value_cache = key_value_cache
 
     async def get_by_id(self, user_id: UUID) -> UserDescriptor:
-        key = self.key_value_cache.make_key(str(user_id), "descriptor")
+        key = self._make_key(user_id)
 
         cached = await self.key_value_cache.get(key)
         if cached:
@@ -27,3 +28,34 @@ class CachingUserDescriptorRepository(IUserDescriptorRepository):
 
         await self.key_value_cache.set(key, descriptor)
         return descriptor
+
+    async def get_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> list[UserDescriptor]:
+        # NOTE: bulk reads always go to the source in one query and refresh
+        # the cache with a single pipeline
+        descriptors = await self.user_descriptor_repository.get_by_ids(
+            user_ids
+        )
+        await self.key_value_cache.set_many(self._make_items(descriptors))
+        return descriptors
+
+    async def prime(self, descriptor: UserDescriptor) -> None:
+        key = self._make_key(descriptor.user_id)
+        await self.key_value_cache.set(key, descriptor)
+
+    async def prime_many(self, descriptors: Sequence[UserDescriptor]) -> None:
+        await self.key_value_cache.set_many_or_raise(
+            self._make_items(descriptors)
+        )
+
+    def _make_items(
+        self, descriptors: Sequence[UserDescriptor]
+    ) -> dict[str, UserDescriptor]:
+        return {
+            self._make_key(descriptor.user_id): descriptor
+            for descriptor in descriptors
+        }
+
+    def _make_key(self, user_id: UUID) -> str:
+        return self.key_value_cache.make_key(str(user_id), "descriptor")
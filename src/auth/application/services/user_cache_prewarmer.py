@@ -0,0 +1,78 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import UUID
+
+from auth.application.interfaces.repositories.active_user_repository import (
+    IActiveUserRepository,
+)
+from auth.application.interfaces.repositories.descriptor_repository import (
+    IUserDescriptorRepository,
+)
+from auth.application.interfaces.services.user_cache_prewarmer import (
+    IUserCachePrewarmer,
+    PrewarmResult,
+)
+from auth.application.repositories.caching_descriptor_repository import (
+    CachingUserDescriptorRepository,
+)
+from common.domain.clock import IClock
+
+
+class UserCachePrewarmer(IUserCachePrewarmer):
+    # NOTE: descriptors are loaded in batches, at most `concurrency` batches
+    # query the database at once and each batch is written in one pipeline
+    def __init__(
+        self,
+        clock: IClock,
+        active_user_repository: IActiveUserRepository,
+        user_descriptor_repository: IUserDescriptorRepository,
+        caching_user_descriptor_repository: CachingUserDescriptorRepository,
+        limit: int = 1000,
+        window: timedelta = timedelta(days=7),
+        batch_size: int = 100,
+        concurrency: int = 4,
+    ) -> None:
+        self.clock = clock
+        self.active_user_repository = active_user_repository
+        self.user_descriptor_repository = user_descriptor_repository
+        self.caching_user_descriptor_repository = (
+            caching_user_descriptor_repository
+        )
+        self.limit = limit
+        self.window = window
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+    async def prewarm(self) -> PrewarmResult:
+        since = self.clock.now().value - self.window
+        user_ids = await self.active_user_repository.get_recently_active(
+            since, self.limit
+        )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *(
+                self._warm_batch(semaphore, user_ids[i : i + self.batch_size])
+                for i in range(0, len(user_ids), self.batch_size)
+            ),
+            return_exceptions=True,
+        )
+
+        warmed = sum(r for r in results if isinstance(r, int))
+        failed = sum(1 for r in results if isinstance(r, BaseException))
+        return PrewarmResult(
+            users=len(user_ids), warmed=warmed, failed_batches=failed
+        )
+
+    async def _warm_batch(
+        self, semaphore: asyncio.Semaphore, user_ids: Sequence[UUID]
+    ) -> int:
+        async with semaphore:
+            descriptors = await self.user_descriptor_repository.get_by_ids(
+                user_ids
+            )
+            await self.caching_user_descriptor_repository.prime_many(
+                descriptors
+            )
+            return len(descriptors)
@@ -0,0 +1,52 @@
+from functools import partial
+from uuid import UUID
+
+from auth.application.interfaces.services.user_cache_warmer import (
+    IUserCacheWarmer,
+)
+from auth.application.repositories.caching_descriptor_repository import (
+    CachingUserDescriptorRepository,
+)
+from common.application.interfaces.tasks.background_task_publisher import (
+    IBackgroundTaskPublisher,
+)
+from identity.application.read_models.user_read_model import UserReadModel
+from identity.application.repositories.caching_user_read_repository import (
+    CachingUserReadRepository,
+)
+from identity.domain.value_objects.descriptor import UserDescriptor
+
+
+class UserCacheWarmer(IUserCacheWarmer):
+    # NOTE: warming is scheduled in background and never delays the caller
+    def __init__(
+        self,
+        task_publisher: IBackgroundTaskPublisher,
+        user_descriptor_repository: CachingUserDescriptorRepository,
+        user_read_repository: CachingUserReadRepository,
+    ) -> None:
+        self.task_publisher = task_publisher
+        self.user_descriptor_repository = user_descriptor_repository
+        self.user_read_repository = user_read_repository
+
+    def warm(self, descriptor: UserDescriptor) -> None:
+        self.task_publisher.publish(
+            partial(self._prime, descriptor), name="warm_user_cache"
+        )
+
+    def warm_by_id(self, user_id: UUID) -> None:
+        self.task_publisher.publish(
+            partial(self._load, user_id), name="warm_user_cache"
+        )
+
+    async def _load(self, user_id: UUID) -> None:
+        # NOTE: read-through fills the descriptor entry on miss
+        descriptor = await self.user_descriptor_repository.get_by_id(user_id)
+        await self.user_read_repository.prime(self._read_model(descriptor))
+
+    async def _prime(self, descriptor: UserDescriptor) -> None:
+        await self.user_descriptor_repository.prime(descriptor)
+        await self.user_read_repository.prime(self._read_model(descriptor))
+
+    def _read_model(self, descriptor: UserDescriptor) -> UserReadModel:
+        return UserReadModel(descriptor.user_id, descriptor.username)
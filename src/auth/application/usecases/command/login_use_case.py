@@ -8,9 +8,13 @@ from auth.application.interfaces.services.password_hash_service import (
     IPasswordHasher,
 )
 from auth.application.interfaces.services.token_service import ITokenIssuer
+from auth.application.interfaces.services.user_cache_warmer import (
+    IUserCacheWarmer,
+)
 from auth.application.interfaces.usecases.command.login_use_case import (
     ILoginUseCase,
 )
+from identity.application.exceptions import UserNotFoundError
 from identity.application.interfaces.repositories.user_repository import (
     IUserRepository,
 )
@@ -22,17 +26,26 @@ class LoginUseCase(ILoginUseCase):
         user_repository: IUserRepository,
         password_hasher: IPasswordHasher,
         token_issuer: ITokenIssuer,
+        user_cache_warmer: IUserCacheWarmer,
     ) -> None:
         self.user_repository = user_repository
         self.password_hasher = password_hasher
         self.token_issuer = token_issuer
+        self.user_cache_warmer = user_cache_warmer
 
     async def execute(self, command: LoginCommand) -> AuthTokens:
-        if not await self.user_repository.exists_by_username(command.username):
-            raise InvalidUsernameError(command.username)
+        # NOTE: a single lookup, no separate existence check round trip
+        try:
+            user = await self.user_repository.get_by_username(
+                command.username
+            )
+        except UserNotFoundError as e:
+            raise InvalidUsernameError(command.username) from e
 
-        user = await self.user_repository.get_by_username(command.username)
         if not self.password_hasher.verify(command.password, user.password):
             raise InvalidPasswordError(user.user_id)
 
-        return await self.token_issuer.issue_tokens(user.user_id)
+        tokens = await self.token_issuer.issue_tokens(user.user_id)
+
+        self.user_cache_warmer.warm(user.descriptor())
+        return tokens
@@ -3,14 +3,27 @@ from auth.application.dtos.commands.refresh_token_command import (
 )
 from auth.application.dtos.models.auth_tokens import AuthTokens
 from auth.application.interfaces.services.token_service import ITokenRefresher
+from auth.application.interfaces.services.user_cache_warmer import (
+    IUserCacheWarmer,
+)
 from auth.application.interfaces.usecases.command.refresh_token_use_case import (
     IRefreshTokenUseCase,
 )
 
 
 class RefreshTokenUseCase(IRefreshTokenUseCase):
-    def __init__(self, token_refresher: ITokenRefresher) -> None:
+    def __init__(
+        self,
+        token_refresher: ITokenRefresher,
+        user_cache_warmer: IUserCacheWarmer,
+    ) -> None:
         self.token_refresher = token_refresher
+        self.user_cache_warmer = user_cache_warmer
 
     async def execute(self, command: RefreshTokenCommand) -> AuthTokens:
-        return await self.token_refresher.refresh_tokens(command.refresh_token)
+        tokens = await self.token_refresher.refresh_tokens(
+            command.refresh_token
+        )
+
+        self.user_cache_warmer.warm_by_id(tokens.user_id)
+        return tokens
@@ -6,6 +6,9 @@ from auth.application.dtos.commands.register_user_command import (
 from auth.application.interfaces.services.password_hash_service import (
     IPasswordHasher,
 )
+from auth.application.interfaces.services.user_cache_warmer import (
+    IUserCacheWarmer,
+)
 from auth.application.interfaces.usecases.command.register_user_use_case import (
     IRegisterUserUseCase,
 )
@@ -22,10 +25,12 @@ class RegisterUserUseCase(IRegisterUserUseCase):
         user_factory: IUserFactory,
         user_repository: IUserRepository,
         password_hasher: IPasswordHasher,
+        user_cache_warmer: IUserCacheWarmer,
     ) -> None:
         self.user_factory = user_factory
         self.user_repository = user_repository
         self.password_hasher = password_hasher
+        self.user_cache_warmer = user_cache_warmer
 
     async def execute(self, command: RegisterUserCommand) -> UUID:
         if await self.user_repository.exists_by_username(command.username):
@@ -35,4 +40,6 @@ class RegisterUserUseCase(IRegisterUserUseCase):
         user = self.user_factory.create(command.username, hashed_password)
 
         await self.user_repository.add(user)
+
+        self.user_cache_warmer.warm(user.descriptor())
         return user.user_id
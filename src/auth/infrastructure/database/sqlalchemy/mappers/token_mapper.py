@@ -1,3 +1,7 @@
+from typing import Any
+
+from sqlalchemy import Row
+
 from auth.application.dtos.models.token import Token, TokenTypeEnum
 from auth.infrastructure.database.sqlalchemy.models.token_base import (
     TokenBase,
@@ -17,6 +21,18 @@ class TokenMapper:
             revoked=base.revoked,
         )
 
+    @classmethod
+    def from_row(cls, row: Row[Any]) -> Token:
+        return Token(
+            token_id=row.token_id,
+            user_id=row.user_id,
+            value=row.value,
+            token_type=TokenTypeEnum.REFRESH,
+            issued_at=row.issued_at,
+            expires_at=row.expires_at,
+            revoked=row.revoked,
+        )
+
     @classmethod
     def to_persistence(cls, token: Token) -> TokenBase:
         return TokenBase(
@@ -17,7 +17,7 @@ class TokenBase(Base):
     )  # NOTE: No FK
     value: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     issued_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False
+        DateTime(timezone=True), nullable=False, index=True
     )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
@@ -0,0 +1,36 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Integer, bindparam, func, select
+
+from auth.application.interfaces.repositories.active_user_repository import (
+    IActiveUserRepository,
+)
+from auth.infrastructure.database.sqlalchemy.models.token_base import (
+    TokenBase,
+)
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+
+
+# NOTE: the lower bound keeps the scan on ix_tokens_issued_at
+TOKENS = TokenBase.__table__
+GET_RECENTLY_ACTIVE = (
+    select(TOKENS.c.user_id)
+    .where(TOKENS.c.issued_at >= bindparam("since"))
+    .group_by(TOKENS.c.user_id)
+    .order_by(func.max(TOKENS.c.issued_at).desc())
+    .limit(bindparam("limit", type_=Integer))
+)
+
+
+class ActiveUserRepository(IActiveUserRepository):
+    def __init__(self, executor: QueryExecutor):
+        self.executor = executor
+
+    async def get_recently_active(
+        self, since: datetime, limit: int
+    ) -> list[UUID]:
+        rows = await self.executor.execute_rows(
+            GET_RECENTLY_ACTIVE, {"since": since, "limit": limit}
+        )
+        return [row.user_id for row in rows]
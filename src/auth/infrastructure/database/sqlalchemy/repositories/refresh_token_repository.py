@@ -1,4 +1,4 @@
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 
 from auth.application.dtos.models.token import Token
 from auth.application.interfaces.repositories.token_repository import (
@@ -14,16 +14,25 @@ from common.application.exceptions import NotFoundError
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 
 
+# NOTE: hot lookups select table columns (Core) and skip the ORM identity
+# map; statements are built once so their compiled form is reused
+TOKENS = TokenBase.__table__
+GET_TOKEN_BY_VALUE = select(*TOKENS.c).where(
+    TOKENS.c.value == bindparam("value")
+)
+
+
 class RefreshTokenRepository(IRefreshTokenRepository):
     def __init__(self, executor: QueryExecutor):
         self.executor = executor
 
     async def get(self, value: str) -> Token:
-        stmt = select(TokenBase).where(TokenBase.value == value)
-        result = await self.executor.execute_scalar_one(stmt)
-        if not result:
+        row = await self.executor.execute_row(
+            GET_TOKEN_BY_VALUE, {"value": value}
+        )
+        if row is None:
             raise NotFoundError(value)
-        return TokenMapper.to_domain(result)
+        return TokenMapper.from_row(row)
 
     async def revoke(self, value: str) -> None:
         stmt = (
@@ -0,0 +1,52 @@
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, bindparam, select
+
+from auth.application.interfaces.repositories.descriptor_repository import (
+    IUserDescriptorRepository,
+)
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from identity.application.exceptions import UserNotFoundError
+from identity.domain.value_objects.descriptor import UserDescriptor
+from identity.infrastructure.database.sqlalchemy.models.user_base import (
+    UserBase,
+)
+
+
+# NOTE: only the descriptor columns are selected, which
+# ix_users_user_id_username covers
+USERS = UserBase.__table__
+GET_DESCRIPTOR_BY_ID = select(USERS.c.user_id, USERS.c.username).where(
+    USERS.c.user_id == bindparam("user_id")
+)
+GET_DESCRIPTORS_BY_IDS = select(USERS.c.user_id, USERS.c.username).where(
+    USERS.c.user_id.in_(bindparam("user_ids", expanding=True))
+)
+
+
+class UserDescriptorRepository(IUserDescriptorRepository):
+    def __init__(self, executor: QueryExecutor) -> None:
+        self.executor = executor
+
+    async def get_by_id(self, user_id: UUID) -> UserDescriptor:
+        row = await self.executor.execute_row(
+            GET_DESCRIPTOR_BY_ID, {"user_id": user_id}
+        )
+        if row is None:
+            raise UserNotFoundError(user_id)
+        return self._to_descriptor(row)
+
+    async def get_by_ids(
+        self, user_ids: Sequence[UUID]
+    ) -> list[UserDescriptor]:
+        if not user_ids:
+            return []
+        rows = await self.executor.execute_rows(
+            GET_DESCRIPTORS_BY_IDS, {"user_ids": list(user_ids)}
+        )
+        return [self._to_descriptor(row) for row in rows]
+
+    def _to_descriptor(self, row: Row[Any]) -> UserDescriptor:
+        return UserDescriptor(user_id=row.user_id, username=row.username)
@@ -1,11 +1,14 @@
+from datetime import timedelta
+
 from dependency_injector import containers, providers
 
 from auth.application.repositories.caching_descriptor_repository import (
     CachingUserDescriptorRepository,
 )
-from auth.application.repositories.descriptor_repository import (
-    UserDescriptorRepository,
+from auth.application.services.user_cache_prewarmer import (
+    UserCachePrewarmer,
 )
+from auth.application.services.user_cache_warmer import UserCacheWarmer
 from auth.application.usecases.command.login_use_case import LoginUseCase
 from auth.application.usecases.command.logout_use_case import LogoutUseCase
 from auth.application.usecases.command.refresh_token_use_case import (
@@ -14,9 +17,15 @@ from auth.application.usecases.command.refresh_token_use_case import (
 from auth.application.usecases.command.register_user_use_case import (
     RegisterUserUseCase,
 )
+from auth.infrastructure.database.sqlalchemy.repositories.active_user_repository import (
+    ActiveUserRepository,
+)
 from auth.infrastructure.database.sqlalchemy.repositories.refresh_token_repository import (
     RefreshTokenRepository,
 )
+from auth.infrastructure.database.sqlalchemy.repositories.user_descriptor_repository import (
+    UserDescriptorRepository,
+)
 from auth.infrastructure.serializers.marshmallow.shemas import (
     UserDescriptorSchema,
 )
@@ -38,14 +47,19 @@ from auth.infrastructure.services.jwt.token_revoker import JWTTokenRevoker
 from common.application.interfaces.repositories.key_value_store import (
     IKeyValueStore,
 )
+from common.infrastructure.config.cache_config import (
+    CacheConfig,
+    CacheSerializerFormat,
+)
 from common.infrastructure.database.repositories.key_value_cache import (
     TTLKeyValueCache,
 )
 from common.infrastructure.di.container.providers import (
+    provide_cache_serializer,
     redis_key_value_store_provider,
 )
-from common.infrastructure.serializers.marshmallow.serializer import (
-    MarshmallowSerializer,
+from common.infrastructure.server.grpc.circuit_breaker import (
+    CircuitBreakerStub,
 )
 from identity.domain.value_objects.descriptor import UserDescriptor
 
@@ -53,6 +67,13 @@ from identity.domain.value_objects.descriptor import UserDescriptor
 class TokenContainer(containers.DeclarativeContainer):
     ttl = providers.Dependency()
     namespace = providers.Dependency()
+    serializer_format = providers.Dependency(
+        instance_of=CacheSerializerFormat,
+        default=CacheSerializerFormat.ORJSON,
+    )
+    cache_config = providers.Dependency(
+        instance_of=CacheConfig, default=CacheConfig()
+    )
 
     auth_config = providers.Dependency()
     clock = providers.Dependency()
@@ -60,18 +81,25 @@ class TokenContainer(containers.DeclarativeContainer):
     token_generator = providers.Dependency()
 
     query_executor = providers.Dependency()
+    read_only_query_executor = providers.Dependency()
     redis = providers.Dependency()
-    user_repository = providers.Dependency()
+    redis_circuit_breaker = providers.Dependency()
 
     refresh_token_repository = providers.Singleton(
         RefreshTokenRepository, query_executor
     )
     user_descriptor_repository = providers.Singleton(
-        UserDescriptorRepository, user_repository
+        UserDescriptorRepository, read_only_query_executor
+    )
+    active_user_repository = providers.Singleton(
+        ActiveUserRepository, query_executor
     )
 
     user_descriptor_serializer = providers.Singleton(
-        MarshmallowSerializer[UserDescriptor], UserDescriptorSchema()
+        provide_cache_serializer,
+        model=UserDescriptor,
+        schema=UserDescriptorSchema(),
+        serializer_format=serializer_format,
     )
 
     key_value_store: providers.Singleton[IKeyValueStore[UserDescriptor]] = (
@@ -80,6 +108,7 @@ class TokenContainer(containers.DeclarativeContainer):
             redis=redis,
             serializer=user_descriptor_serializer,
             namespace=namespace,
+            breaker=redis_circuit_breaker,
         )
     )
 
@@ -93,6 +122,20 @@ class TokenContainer(containers.DeclarativeContainer):
         key_value_cache=key_value_cache,
     )
 
+    user_cache_prewarmer = providers.Singleton(
+        UserCachePrewarmer,
+        clock=clock,
+        active_user_repository=active_user_repository,
+        user_descriptor_repository=user_descriptor_repository,
+        caching_user_descriptor_repository=caching_user_read_repository,
+        limit=cache_config.provided.prewarm_limit,
+        window=providers.Callable(
+            timedelta, seconds=cache_config.provided.prewarm_window
+        ),
+        batch_size=cache_config.provided.prewarm_batch_size,
+        concurrency=cache_config.provided.prewarm_concurrency,
+    )
+
     token_issuer = providers.Singleton(
         JWTTokenIssuer,
         config=auth_config,
@@ -123,11 +166,18 @@ class TokenContainer(containers.DeclarativeContainer):
 
 class GRPCTokenContainer(TokenContainer):
     stub = providers.Dependency()
+    grpc_circuit_breaker = providers.Dependency()
+
+    guarded_stub = providers.Singleton(
+        CircuitBreakerStub, stub, grpc_circuit_breaker
+    )
 
-    token_issuer = providers.Singleton(GRPCTokenIssuer, stub)
-    token_revoker = providers.Singleton(GRPCTokenRevoker, stub)
-    token_refresher = providers.Singleton(GRPCTokenRefresher, stub)
-    token_introspector = providers.Singleton(GRPCTokenIntrospector, stub)
+    token_issuer = providers.Singleton(GRPCTokenIssuer, guarded_stub)
+    token_revoker = providers.Singleton(GRPCTokenRevoker, guarded_stub)
+    token_refresher = providers.Singleton(GRPCTokenRefresher, guarded_stub)
+    token_introspector = providers.Singleton(
+        GRPCTokenIntrospector, guarded_stub
+    )
 
 
 class AuthContainer(containers.DeclarativeContainer):
@@ -140,13 +190,25 @@ class AuthContainer(containers.DeclarativeContainer):
     token_revoker = providers.Dependency()
     token_refresher = providers.Dependency()
 
+    task_publisher = providers.Dependency()
+    caching_user_descriptor_repository = providers.Dependency()
+    caching_user_read_repository = providers.Dependency()
+
     password_hasher = providers.Singleton(BcryptPasswordHasher)
 
+    user_cache_warmer = providers.Singleton(
+        UserCacheWarmer,
+        task_publisher=task_publisher,
+        user_descriptor_repository=caching_user_descriptor_repository,
+        user_read_repository=caching_user_read_repository,
+    )
+
     register_user_use_case = providers.Singleton(
         RegisterUserUseCase,
         user_factory=user_factory,
         user_repository=user_repository,
         password_hasher=password_hasher,
+        user_cache_warmer=user_cache_warmer,
     )
 
     login_use_case = providers.Singleton(
@@ -154,9 +216,10 @@ class AuthContainer(containers.DeclarativeContainer):
         user_repository=user_repository,
         password_hasher=password_hasher,
         token_issuer=token_issuer,
+        user_cache_warmer=user_cache_warmer,
     )
 
     refresh_token_use_case = providers.Singleton(
-        RefreshTokenUseCase, token_refresher
+        RefreshTokenUseCase, token_refresher, user_cache_warmer
     )
     logout_use_case = providers.Singleton(LogoutUseCase, token_revoker)
@@ -15,7 +15,10 @@ from auth.application.interfaces.services.token_service import (
     ITokenRevoker,
 )
 from auth.presentation.grpc.generated import auth_pb2, auth_pb2_grpc
-from common.application.exceptions import ApplicationError
+from common.application.exceptions import (
+    ApplicationError,
+    ServiceUnavailableError,
+)
 from identity.domain.value_objects.descriptor import UserDescriptor
 
 
@@ -35,6 +38,12 @@ def map_grpc_error(error: grpc.aio.AioRpcError) -> Exception:
     if status_code == grpc.StatusCode.INVALID_ARGUMENT:
         return ValueError(details)
 
+    if status_code in (
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+    ):
+        return ServiceUnavailableError()
+
     return ApplicationError(details or "Internal error")
 
 
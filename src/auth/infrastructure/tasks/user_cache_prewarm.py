@@ -0,0 +1,42 @@
+import logging
+import time
+
+from auth.application.interfaces.services.user_cache_prewarmer import (
+    IUserCachePrewarmer,
+)
+
+
+class UserCachePrewarmTask:
+    # NOTE: a failed prewarm only costs cache misses, so it never aborts
+    # the startup
+    def __init__(
+        self, prewarmer: IUserCachePrewarmer, logger: logging.Logger
+    ):
+        self.prewarmer = prewarmer
+        self.logger = logger
+
+    async def run(self) -> None:
+        self.logger.info("prewarming user cache...")
+        started = time.perf_counter()
+        try:
+            result = await self.prewarmer.prewarm()
+        except Exception as e:
+            self.logger.warning(
+                "user cache prewarm failed",
+                extra={"extra": {"error": str(e)}},
+            )
+            return
+
+        self.logger.info(
+            "user cache prewarmed",
+            extra={
+                "extra": {
+                    "users": result.users,
+                    "warmed": result.warmed,
+                    "failed_batches": result.failed_batches,
+                    "duration_ms": round(
+                        (time.perf_counter() - started) * 1000, 2
+                    ),
+                }
+            },
+        )
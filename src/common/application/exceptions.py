@@ -22,6 +22,22 @@ class NotFoundError(ApplicationError):
         self.entity_id = entity_id
 
 
+class ServiceUnavailableError(ApplicationError):
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(message)
+
+
+class InvalidContentError(ApplicationError):
+    def __init__(self, message: str = "Content is malformed or incomplete"):
+        super().__init__(message)
+
+
+class ContentTooLargeError(ApplicationError):
+    def __init__(self, max_size: int):
+        super().__init__(f"Content exceeds {max_size} bytes")
+        self.max_size = max_size
+
+
 class RepositoryError(ApplicationError): ...
 
 
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+MetricsSource = Callable[[], Mapping[str, Any]]
+
+
+class IMetricsRegistry(ABC):
+    @abstractmethod
+    def register(self, name: str, source: MetricsSource) -> None: ...
+    @abstractmethod
+    def collect(self) -> dict[str, dict[str, Any]]: ...
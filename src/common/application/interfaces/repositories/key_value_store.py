@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Generic, TypeVar
 
 
@@ -12,3 +13,7 @@ class IKeyValueStore(ABC, Generic[T]):
     async def set(
         self, key: str, value: T, expire: int | None = None
     ) -> None: ...
+    @abstractmethod
+    async def set_many(
+        self, items: Mapping[str, T], expire: int | None = None
+    ) -> None: ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+
+TaskFactory = Callable[[], Awaitable[None]]
+
+
+class IBackgroundTaskPublisher(ABC):
+    @abstractmethod
+    def publish(self, task: TaskFactory, name: str | None = None) -> None: ...
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Generic, TypeVar
 
 
@@ -14,6 +15,10 @@ class IKeyValueCache(ABC, Generic[T]):
     async def set(self, key: str, value: T) -> None: ...
     @abstractmethod
     async def set_or_raise(self, key: str, value: T) -> None: ...
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, T]) -> None: ...
+    @abstractmethod
+    async def set_many_or_raise(self, items: Mapping[str, T]) -> None: ...
 
     def make_key(self, *parts: str) -> str:
         return ":".join(parts)
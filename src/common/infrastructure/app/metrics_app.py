@@ -0,0 +1,30 @@
+from typing import ClassVar
+
+from common.application.interfaces.metrics.metrics_registry import (
+    IMetricsRegistry,
+)
+from common.infrastructure.app.http_app import IHTTPApp
+from common.infrastructure.di.container.container import CommonContainer
+from common.infrastructure.server.fastapi.server import FastAPIServer
+from common.presentation.http.fastapi.controllers import metrics_router
+
+
+class MetricsApp(IHTTPApp):
+    prefix = ""
+    tags: ClassVar = ["Metrics"]
+
+    def __init__(
+        self,
+        container: CommonContainer,
+        server: FastAPIServer,
+    ) -> None:
+        self.container = container
+        self.server = server
+
+    def configure_dependencies(self) -> None:
+        self.server.override_dependency(
+            IMetricsRegistry, self.container.metrics_registry()
+        )
+
+    def register_routers(self) -> None:
+        self.server.register_router(metrics_router, self.prefix, self.tags)
@@ -0,0 +1,19 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class CacheSerializerFormat(str, Enum):
+    ORJSON = "orjson"
+    MSGPACK = "msgpack"
+    MARSHMALLOW = "marshmallow"
+
+
+class CacheConfig(BaseModel):
+    serializer: CacheSerializerFormat = CacheSerializerFormat.ORJSON
+
+    prewarm_enabled: bool = False
+    prewarm_limit: int = 1000
+    prewarm_window: int = 604800  # seconds of token activity to consider
+    prewarm_batch_size: int = 100
+    prewarm_concurrency: int = 4
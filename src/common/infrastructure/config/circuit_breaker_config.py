@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class CircuitBreakerConfig(BaseModel):
+    failure_rate_threshold: float = 0.5
+    window_size: int = 20
+    minimum_calls: int = 10
+    open_timeout: float = 30.0
+    half_open_max_calls: int = 3
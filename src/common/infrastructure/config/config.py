@@ -14,9 +14,19 @@ from pydantic_settings import (
 )
 
 from common.infrastructure.config.auth_config import AuthConfig
+from common.infrastructure.config.cache_config import CacheConfig
+from common.infrastructure.config.circuit_breaker_config import (
+    CircuitBreakerConfig,
+)
 from common.infrastructure.config.database_config import DatabaseConfig
 from common.infrastructure.config.grcp_config import GRPCConfig
 from common.infrastructure.config.logger_config import LoggerConfig
+from common.infrastructure.config.photo_uploads_config import (
+    PhotoUploadsConfig,
+)
+from common.infrastructure.config.photo_variants_config import (
+    PhotoVariantsConfig,
+)
 from common.infrastructure.config.redis_config import RedisConfig
 from common.infrastructure.config.s3_config import S3Config
 
@@ -46,6 +56,10 @@ class AppConfig(BaseSettings):
     db: DatabaseConfig
     s3: S3Config
     redis: RedisConfig
+    cache: CacheConfig = CacheConfig()
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
+    photo_uploads: PhotoUploadsConfig = PhotoUploadsConfig()
+    photo_variants: PhotoVariantsConfig = PhotoVariantsConfig()
     grpc: GRPCConfig
     logger: LoggerConfig
 
@@ -53,9 +67,9 @@ class AppConfig(BaseSettings):
         return self.model_dump(
             mode="json",
             exclude={
-                "db": {"db_password"},
+                "db": {"db_pass"},
                 "auth": {"secret_key", "algorithm"},
-                "redis": {"password"},
+                "redis": {"password", "sentinel_password"},
             },
         )
 
@@ -1,6 +1,13 @@
+from enum import Enum
+
 from pydantic import BaseModel
 
 
+class UUIDVersion(str, Enum):
+    V4 = "v4"
+    V7 = "v7"
+
+
 class DatabaseConfig(BaseModel):
     db_name: str | None = None
     db_user: str | None = None
@@ -8,9 +15,54 @@ class DatabaseConfig(BaseModel):
     db_host: str | None = None
     db_port: int | None = None
 
+    # NOTE: db_pool_timeout bounds the wait for a free connection once
+    # db_pool_size + db_max_overflow connections are checked out
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 5.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+
+    db_connect_timeout: float = 5.0
+    db_command_timeout: float | None = 30.0
+    db_statement_cache_size: int = 100
+    db_server_settings: dict[str, str] = {}
+
+    # NOTE: PgBouncer in transaction pooling mode can't keep prepared
+    # statements between transactions, so statement caches are disabled
+    db_pgbouncer: bool = False
+
+    # NOTE: "host:port" entries sharing credentials and database name with
+    # the primary; reads fall back to the primary when none is healthy
+    db_replicas: list[str] = []
+    db_replica_max_lag: float = 5.0
+    db_replica_check_interval: float = 5.0
+    db_replica_sticky_window: float = 5.0
+
+    # NOTE: v7 ids are time ordered and keep primary key inserts local
+    db_uuid_version: UUIDVersion = UUIDVersion.V7
+
+    # NOTE: statements slower than this are logged with normalized SQL
+    db_slow_query_ms: float = 200.0
+
     @property
     def database_url(self) -> str:
+        return self._url(self.db_host, self.db_port)
+
+    @property
+    def replica_urls(self) -> dict[str, str]:
+        urls: dict[str, str] = {}
+        for node in self.db_replicas:
+            host, _, port = node.rpartition(":")
+            urls[node] = self._url(host, int(port))
+        return urls
+
+    def _url(self, host: str | None, port: int | None) -> str:
         return (
             f"postgresql+asyncpg://{self.db_user}:{self.db_pass}"
-            f"@{self.db_host}:{self.db_port}/{self.db_name}"
+            f"@{host}:{port}/{self.db_name}"
         )
+
+    @property
+    def pool_capacity(self) -> int:
+        return self.db_pool_size + self.db_max_overflow
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class PhotoUploadsConfig(BaseModel):
+    # NOTE: applies to API uploads and presigned direct uploads alike
+    max_size: int = 10 * 1024 * 1024
+    # NOTE: room for multipart boundaries and part headers on top of
+    # `max_size` before the request body itself is cut off
+    max_body_overhead: int = 64 * 1024
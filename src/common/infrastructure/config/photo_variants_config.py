@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+
+class PhotoVariantsConfig(BaseModel):
+    # NOTE: preset name -> longest edge in pixels; variants are WebP
+    presets: dict[str, int] = Field(
+        default_factory=lambda: {"thumb": 256, "preview": 1280}
+    )
+    quality: int = 80
+    workers: int = 2
+    # NOTE: renders every preset right after upload instead of on the
+    # first request for a variant
+    eager: bool = False
@@ -1,4 +1,18 @@
-from pydantic import BaseModel, field_validator
+from enum import Enum
+from typing import Self
+
+from pydantic import BaseModel, field_validator, model_validator
+
+
+class RedisTopology(str, Enum):
+    STANDALONE = "standalone"
+    SENTINEL = "sentinel"
+    CLUSTER = "cluster"
+
+
+class RedisTrackingMode(str, Enum):
+    DEFAULT = "default"
+    BCAST = "bcast"
 
 
 class RedisConfig(BaseModel):
@@ -7,9 +21,64 @@ class RedisConfig(BaseModel):
     db: int = 0
     password: str | None = None
 
-    @field_validator("password", mode="after")
+    topology: RedisTopology = RedisTopology.STANDALONE
+    # NOTE: "host:port" entries, host/port above are used when empty
+    sentinel_nodes: list[str] = []
+    sentinel_service_name: str = "mymaster"
+    sentinel_password: str | None = None
+    cluster_nodes: list[str] = []
+
+    # NOTE: pool_timeout bounds the wait for a free connection once
+    # max_connections are checked out (standalone topology only)
+    max_connections: int = 50
+    pool_timeout: float | None = 5.0
+    socket_connect_timeout: float | None = 2.0
+    socket_timeout: float | None = 2.0
+    socket_keepalive: bool = True
+    health_check_interval: int = 30
+    retry_attempts: int = 3
+    retry_backoff_base: float = 0.05
+    retry_backoff_cap: float = 1.0
+
+    # NOTE: server-assisted client-side caching (CLIENT TRACKING)
+    tracking_enabled: bool = False
+    tracking_mode: RedisTrackingMode = RedisTrackingMode.DEFAULT
+    tracking_prefixes: list[str] = ["user:"]
+    tracking_max_entries: int = 10_000
+    tracking_local_ttl: float = 60.0
+    tracking_reconnect_delay: float = 1.0
+
+    @field_validator("password", "sentinel_password", mode="after")
     @classmethod
     def password_to_none(cls, v: str | None):
         if not v:
             return None
         return v
+
+    @model_validator(mode="after")
+    def check_topology(self) -> Self:
+        if self.topology == RedisTopology.CLUSTER:
+            if self.db != 0:
+                raise ValueError("redis cluster supports only db 0")
+            if self.tracking_enabled:
+                raise ValueError(
+                    "client tracking is not supported in cluster topology"
+                )
+        return self
+
+    @property
+    def sentinel_addresses(self) -> list[tuple[str, int]]:
+        return self._parse_addresses(self.sentinel_nodes)
+
+    @property
+    def cluster_addresses(self) -> list[tuple[str, int]]:
+        return self._parse_addresses(self.cluster_nodes)
+
+    def _parse_addresses(self, nodes: list[str]) -> list[tuple[str, int]]:
+        if not nodes:
+            return [(self.host, self.port)]
+        addresses: list[tuple[str, int]] = []
+        for node in nodes:
+            host, _, port = node.rpartition(":")
+            addresses.append((host, int(port)))
+        return addresses
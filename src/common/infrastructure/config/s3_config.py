@@ -7,3 +7,32 @@ class S3Config(BaseModel):
     secret_key: str
     secure: bool = False  # True for HTTPS
     bucket_name: str
+    region: str = "us-east-1"
+    max_connections: int = 32
+    request_timeout: float = 30.0
+    pool_timeout: float = 10.0
+    # NOTE: bucket notifications for direct uploads, e.g.
+    # arn:minio:sqs::PHOTOS:webhook; empty disables the setup
+    notification_queue_arn: str = ""
+    # NOTE: shared secret expected from the storage webhook
+    webhook_token: str = ""
+    # NOTE: signed GET URLs are reused until `presign_cache_margin`
+    # seconds before they expire; 0 entries disables the cache
+    presign_cache_size: int = 10_000
+    presign_cache_margin: float = 60.0
+    # NOTE: aligns presigning time to windows of this many seconds so one
+    # object gets the same URL for the whole window; 0 signs at "now"
+    presign_window: int = 0
+    presign_min_validity: int = 60
+    # NOTE: S3 requires every part except the last to be at least 5 MiB
+    multipart_part_size: int = 8 * 1024 * 1024
+    # NOTE: parts uploaded at once per object; each in-flight part keeps
+    # its buffer, so memory per upload is about (concurrency + 1) parts
+    multipart_concurrency: int = 4
+    # NOTE: a part failing with a 5xx or a transport error is retried
+    # this many times, waiting `retry_backoff * 2**attempt` seconds
+    multipart_part_retries: int = 2
+    multipart_retry_backoff: float = 0.2
+    # NOTE: stores API uploads under their content digest so repeated
+    # content is written once
+    deduplicate_uploads: bool = False
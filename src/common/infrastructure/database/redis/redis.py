@@ -1,40 +1,137 @@
 import logging
-from typing import Self
+from functools import partial
+from typing import Any, Self
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis, RedisCluster
+from redis.asyncio.cluster import ClusterNode
+from redis.asyncio.retry import Retry
+from redis.asyncio.sentinel import Sentinel
+from redis.backoff import EqualJitterBackoff
 
-from common.infrastructure.config.redis_config import RedisConfig
+from common.infrastructure.config.redis_config import (
+    RedisConfig,
+    RedisTopology,
+)
+from common.infrastructure.database.redis.tracking import (
+    RedisInvalidationListener,
+)
+
+
+RedisClient = Redis | RedisCluster
 
 
 class RedisDatabase:
-    def __init__(self, redis: Redis, logger: logging.Logger):
+    def __init__(
+        self,
+        redis: RedisClient,
+        logger: logging.Logger,
+        listener: RedisInvalidationListener | None = None,
+    ):
         self._redis = redis
         self._logger = logger
+        self._listener = listener
 
     @classmethod
     def create(
         cls, config: RedisConfig, logger: logging.Logger | None = None
     ) -> Self:
+        logger = logger or logging.getLogger()
         redis = cls.create_redis_client(config)
-        return cls(redis=redis, logger=logger or logging.getLogger())
+        listener = None
+        if config.tracking_enabled:
+            assert isinstance(redis, Redis)
+            listener = RedisInvalidationListener(
+                redis,
+                config,
+                logger,
+                client_factory=partial(cls.create_node_client, config),
+            )
+        return cls(redis=redis, logger=logger, listener=listener)
 
-    @staticmethod
-    def create_redis_client(config: RedisConfig) -> Redis:
-        return Redis(
+    @classmethod
+    def create_redis_client(cls, config: RedisConfig) -> RedisClient:
+        if config.topology == RedisTopology.CLUSTER:
+            return cls.create_cluster_client(config)
+        return cls.create_node_client(config)
+
+    @classmethod
+    def create_node_client(
+        cls, config: RedisConfig, **overrides: Any
+    ) -> Redis:
+        kwargs = {**cls.connection_kwargs(config), **overrides}
+
+        if config.topology == RedisTopology.SENTINEL:
+            sentinel = Sentinel(
+                config.sentinel_addresses,
+                sentinel_kwargs={
+                    "password": config.sentinel_password,
+                    "socket_timeout": config.socket_timeout,
+                    "socket_connect_timeout": config.socket_connect_timeout,
+                },
+                **kwargs,
+            )
+            return sentinel.master_for(  # type: ignore
+                config.sentinel_service_name,
+                db=config.db,
+                max_connections=config.max_connections,
+            )
+
+        pool = BlockingConnectionPool(
             host=config.host,
             port=config.port,
             db=config.db,
-            password=config.password,
-            decode_responses=True,
+            max_connections=config.max_connections,
+            timeout=config.pool_timeout,
+            **kwargs,
         )
+        return Redis.from_pool(pool)
 
-    def get_client(self) -> Redis:
+    @classmethod
+    def create_cluster_client(cls, config: RedisConfig) -> RedisCluster:
+        return RedisCluster(
+            startup_nodes=[
+                ClusterNode(host, port)
+                for host, port in config.cluster_addresses
+            ],
+            max_connections=config.max_connections,
+            **cls.connection_kwargs(config),
+        )
+
+    @staticmethod
+    def connection_kwargs(config: RedisConfig) -> dict[str, Any]:
+        return {
+            "password": config.password,
+            "socket_connect_timeout": config.socket_connect_timeout,
+            "socket_timeout": config.socket_timeout,
+            "socket_keepalive": config.socket_keepalive,
+            "health_check_interval": config.health_check_interval,
+            "retry": Retry(
+                EqualJitterBackoff(
+                    cap=config.retry_backoff_cap,
+                    base=config.retry_backoff_base,
+                ),
+                config.retry_attempts,
+            ),
+        }
+
+    def get_client(self) -> RedisClient:
         return self._redis
 
+    def get_invalidation_listener(self) -> RedisInvalidationListener | None:
+        return self._listener
+
+    async def start_tracking(self) -> None:
+        if self._listener is None:
+            return
+        self._logger.info("starting redis client tracking...")
+        await self._listener.start()
+
     async def flush_db(self) -> None:
         await self._redis.flushdb()  # type: ignore
 
     async def shutdown(self) -> None:
         self._logger.info("closing redis connection...")
+        if self._listener is not None:
+            await self._listener.stop()
         await self._redis.aclose()
         self._logger.info("redis connection closed gracefully")
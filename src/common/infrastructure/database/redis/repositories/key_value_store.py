@@ -1,11 +1,13 @@
+from collections.abc import Mapping
+
 from redis import RedisError
-from redis.asyncio import Redis
 
 from common.application.exceptions import NotFoundError, RepositoryError
 from common.application.interfaces.repositories.key_value_store import (
     IKeyValueStore,
     T,
 )
+from common.infrastructure.database.redis.redis import RedisClient
 from common.infrastructure.exceptions import SerializationError
 from common.infrastructure.serializers.serializer import ISerializer
 
@@ -13,7 +15,7 @@ from common.infrastructure.serializers.serializer import ISerializer
 class RedisKeyValueStore(IKeyValueStore[T]):
     def __init__(
         self,
-        redis_client: Redis,
+        redis_client: RedisClient,
         serializer: ISerializer[T],
         namespace: str = "",
     ):
@@ -43,3 +45,19 @@ class RedisKeyValueStore(IKeyValueStore[T]):
             await self.redis.set(key, payload, ex=expire)
         except (RedisError, SerializationError) as e:
             raise RepositoryError("Unnable to save value in cache") from e
+
+    async def set_many(
+        self, items: Mapping[str, T], expire: int | None = None
+    ) -> None:
+        try:
+            # NOTE: one round trip; cluster pipelines split by slot
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(
+                        self.make_key(key),
+                        self.serializer.serialize(value),
+                        ex=expire,
+                    )
+                await pipe.execute()
+        except (RedisError, SerializationError) as e:
+            raise RepositoryError("Unnable to save values in cache") from e
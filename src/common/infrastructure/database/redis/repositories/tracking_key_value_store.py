@@ -0,0 +1,121 @@
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+
+from redis.asyncio import Redis
+
+from common.application.interfaces.repositories.key_value_store import T
+from common.infrastructure.database.redis.repositories.key_value_store import (
+    RedisKeyValueStore,
+)
+from common.infrastructure.database.redis.tracking import (
+    RedisInvalidationListener,
+)
+from common.infrastructure.serializers.serializer import ISerializer
+
+
+@dataclass
+class LocalCacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    flushes: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class TrackingRedisKeyValueStore(RedisKeyValueStore[T]):
+    def __init__(
+        self,
+        redis_client: Redis,
+        serializer: ISerializer[T],
+        listener: RedisInvalidationListener,
+        namespace: str = "",
+        max_entries: int = 10_000,
+        local_ttl: float = 60.0,
+    ):
+        super().__init__(redis_client, serializer, namespace)
+        self.listener = listener
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+
+        self._local: dict[str, tuple[T, float]] = {}
+        # NOTE: reads in flight; an invalidation drops the marker so a value
+        # fetched before the invalidation arrived is never stored locally
+        self._pending: dict[str, object] = {}
+        self._stats = LocalCacheStats()
+
+        listener.subscribe(self.invalidate)
+
+    def stats(self) -> LocalCacheStats:
+        return replace(self._stats, size=len(self._local))
+
+    async def get(self, key: str) -> T:
+        full_key = self.make_key(key)
+        entry = self._local.get(full_key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > time.monotonic():
+                self._stats.hits += 1
+                return value
+            self._local.pop(full_key, None)
+        self._stats.misses += 1
+
+        if not self.listener.is_tracking(full_key):
+            return await super().get(key)
+
+        generation = self.listener.generation
+        marker = object()
+        self._pending[full_key] = marker
+        try:
+            value = await super().get(key)
+        except BaseException:
+            self._release(full_key, marker)
+            raise
+
+        if (
+            self._release(full_key, marker)
+            and generation == self.listener.generation
+        ):
+            self._store(full_key, value)
+        return value
+
+    async def set(self, key: str, value: T, expire: int | None = None) -> None:
+        full_key = self.make_key(key)
+        self._local.pop(full_key, None)
+        self._pending.pop(full_key, None)
+        await super().set(key, value, expire)
+
+    async def set_many(
+        self, items: Mapping[str, T], expire: int | None = None
+    ) -> None:
+        for key in items:
+            full_key = self.make_key(key)
+            self._local.pop(full_key, None)
+            self._pending.pop(full_key, None)
+        await super().set_many(items, expire)
+
+    def invalidate(self, keys: list[str] | None) -> None:
+        if keys is None:
+            self._local.clear()
+            self._pending.clear()
+            self._stats.flushes += 1
+            return
+
+        for key in keys:
+            self._pending.pop(key, None)
+            if self._local.pop(key, None) is not None:
+                self._stats.invalidations += 1
+
+    def _release(self, key: str, marker: object) -> bool:
+        if self._pending.get(key) is marker:
+            del self._pending[key]
+            return True
+        return False
+
+    def _store(self, key: str, value: T) -> None:
+        if key not in self._local and len(self._local) >= self.max_entries:
+            # NOTE: dicts keep insertion order, so this drops the oldest
+            del self._local[next(iter(self._local))]
+            self._stats.evictions += 1
+        self._local[key] = (value, time.monotonic() + self.local_ttl)
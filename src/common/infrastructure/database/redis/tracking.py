@@ -0,0 +1,234 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import Any
+
+from redis import RedisError
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.asyncio.connection import AbstractConnection
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+
+from common.infrastructure.config.redis_config import (
+    RedisConfig,
+    RedisTrackingMode,
+)
+
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+# NOTE: None means the whole local cache must be dropped
+InvalidationCallback = Callable[[list[str] | None], None]
+
+
+@dataclass
+class InvalidationStats:
+    messages: int = 0
+    keys: int = 0
+    flushes: int = 0
+    reconnects: int = 0
+
+
+class RedisInvalidationListener:
+    # NOTE: invalidations are redirected (CLIENT TRACKING ... REDIRECT) to a
+    # dedicated pub/sub connection, which works with both RESP2 and RESP3
+    # NOTE: in default mode reads go through a separate tracked client whose
+    # connections enable tracking on connect; in bcast mode a single control
+    # connection tracks the configured prefixes and reads use the main client
+    def __init__(
+        self,
+        client: Redis,
+        config: RedisConfig,
+        logger: logging.Logger,
+        client_factory: Callable[..., Redis],
+    ):
+        self._client = client
+        self._config = config
+        self._logger = logger
+
+        # NOTE: failures must surface so the listener can flush and resync
+        self._listener_client = client_factory(
+            retry=Retry(NoBackoff(), 0),
+            socket_timeout=None,
+            socket_keepalive=True,
+        )
+        self._tracked_client: Redis | None = None
+        if config.tracking_mode == RedisTrackingMode.DEFAULT:
+            self._tracked_client = client_factory(
+                redis_connect_func=self._on_tracked_connect
+            )
+
+        self._callbacks: list[InvalidationCallback] = []
+        self._stats = InvalidationStats()
+        self._pubsub: PubSub | None = None
+        self._control: AbstractConnection | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._client_id: int | None = None
+        self._generation = 0
+        self._ready = asyncio.Event()
+
+    @property
+    def config(self) -> RedisConfig:
+        return self._config
+
+    @property
+    def active(self) -> bool:
+        return self._client_id is not None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get_client(self) -> Redis:
+        return self._tracked_client or self._client
+
+    def stats(self) -> InvalidationStats:
+        return replace(self._stats)
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        self._callbacks.append(callback)
+
+    def is_tracking(self, key: str) -> bool:
+        if not self.active:
+            return False
+        if self._config.tracking_mode == RedisTrackingMode.DEFAULT:
+            return True
+        return key.startswith(tuple(self._config.tracking_prefixes))
+
+    async def start(self, timeout: float = 5.0) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except TimeoutError:
+            # NOTE: keep retrying in background, reads bypass local cache
+            self._logger.warning("redis invalidation listener is not ready")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._teardown()
+        await self._listener_client.aclose()
+        if self._tracked_client is not None:
+            await self._tracked_client.aclose()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._connect()
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as e:
+                self._logger.warning(
+                    "redis invalidation listener disconnected",
+                    extra={"extra": {"error": str(e)}},
+                )
+            await self._teardown()
+            self._stats.reconnects += 1
+            await asyncio.sleep(self._config.tracking_reconnect_delay)
+
+    async def _connect(self) -> None:
+        pubsub = self._listener_client.pubsub()
+        self._pubsub = pubsub
+        await pubsub.connect()
+        connection = pubsub.connection
+        assert connection is not None
+        await connection.send_command("CLIENT", "ID")
+        client_id = int(await connection.read_response())
+        await pubsub.subscribe(INVALIDATE_CHANNEL)
+
+        if self._config.tracking_mode == RedisTrackingMode.BCAST:
+            self._control = await self._open_bcast_control(client_id)
+
+        self._client_id = client_id
+        self._generation += 1
+        if self._tracked_client is not None:
+            # NOTE: reconnect pooled connections so they redirect to us
+            await self._tracked_client.connection_pool.disconnect()
+        self._ready.set()
+        self._logger.info(
+            "redis client tracking enabled",
+            extra={
+                "extra": {
+                    "client_id": client_id,
+                    "mode": self._config.tracking_mode.value,
+                }
+            },
+        )
+
+    async def _listen(self) -> None:
+        assert self._pubsub is not None
+        while True:
+            message = await self._pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=1.0
+            )
+            if message is None or message["type"] != "message":
+                continue
+            self._dispatch(message["data"])
+
+    async def _teardown(self) -> None:
+        was_active = self.active
+        self._client_id = None
+        self._generation += 1
+        if was_active:
+            # NOTE: invalidations may be lost while disconnected
+            self._notify(None)
+
+        if self._control is not None:
+            await self._control.disconnect()
+            self._control = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except (RedisError, OSError):
+                pass
+            self._pubsub = None
+
+    async def _open_bcast_control(
+        self, client_id: int
+    ) -> AbstractConnection:
+        pool = self._listener_client.connection_pool
+        connection = pool.make_connection()
+        await connection.connect()
+        args: list[Any] = ["ON", "REDIRECT", client_id, "BCAST"]
+        for prefix in self._config.tracking_prefixes:
+            args.extend(["PREFIX", prefix])
+        await connection.send_command("CLIENT", "TRACKING", *args)
+        await connection.read_response()
+        return connection
+
+    async def _on_tracked_connect(self, connection: AbstractConnection):
+        await connection.on_connect()
+        if self._client_id is None:
+            return
+        await connection.send_command(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", self._client_id
+        )
+        await connection.read_response()
+
+    def _dispatch(self, data: Any) -> None:
+        self._stats.messages += 1
+        if data is None:
+            self._notify(None)
+            return
+
+        keys = [
+            key.decode() if isinstance(key, bytes) else key for key in data
+        ]
+        self._stats.keys += len(keys)
+        self._notify(keys)
+
+    def _notify(self, keys: list[str] | None) -> None:
+        if keys is None:
+            self._stats.flushes += 1
+        for callback in self._callbacks:
+            callback(keys)
@@ -0,0 +1,37 @@
+from collections.abc import Mapping
+
+from common.application.exceptions import RepositoryError
+from common.application.interfaces.repositories.key_value_store import (
+    IKeyValueStore,
+    T,
+)
+from common.infrastructure.exceptions import CircuitOpenError
+from common.infrastructure.resilience.circuit_breaker import CircuitBreaker
+
+
+class CircuitBreakerKeyValueStore(IKeyValueStore[T]):
+    # NOTE: an open circuit surfaces as RepositoryError, so caches degrade
+    # to a miss immediately instead of waiting for the store to time out
+    def __init__(self, store: IKeyValueStore[T], breaker: CircuitBreaker):
+        self.store = store
+        self.breaker = breaker
+
+    async def get(self, key: str) -> T:
+        try:
+            return await self.breaker.call(self.store.get, key)
+        except CircuitOpenError as e:
+            raise RepositoryError("Unnable to retrive value cache") from e
+
+    async def set(self, key: str, value: T, expire: int | None = None) -> None:
+        try:
+            await self.breaker.call(self.store.set, key, value, expire)
+        except CircuitOpenError as e:
+            raise RepositoryError("Unnable to save value in cache") from e
+
+    async def set_many(
+        self, items: Mapping[str, T], expire: int | None = None
+    ) -> None:
+        try:
+            await self.breaker.call(self.store.set_many, items, expire)
+        except CircuitOpenError as e:
+            raise RepositoryError("Unnable to save values in cache") from e
@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+
 from common.application.exceptions import NotFoundError, RepositoryError
 from common.application.interfaces.repositories.key_value_store import (
     IKeyValueStore,
@@ -27,3 +29,14 @@ class TTLKeyValueCache(IKeyValueCache[T]):
 
     async def set_or_raise(self, key: str, value: T) -> None:
         await self.store.set(key, value, self.ttl)
+
+    async def set_many(self, items: Mapping[str, T]) -> None:
+        try:
+            await self.set_many_or_raise(items)
+        except RepositoryError:
+            pass
+
+    async def set_many_or_raise(self, items: Mapping[str, T]) -> None:
+        if not items:
+            return
+        await self.store.set_many(items, self.ttl)
@@ -1,5 +1,6 @@
 import logging
-from typing import Self
+from typing import Any, Self
+from uuid import uuid4
 
 from sqlalchemy import MetaData, text
 from sqlalchemy.ext.asyncio import (
@@ -9,34 +10,120 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from common.infrastructure.config.database_config import DatabaseConfig
+from common.infrastructure.database.sqlalchemy.instrumentation import (
+    QueryInstrumentation,
+)
+from common.infrastructure.database.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+)
+from common.infrastructure.database.sqlalchemy.replicas import (
+    Replica,
+    ReplicaMonitor,
+    ReplicaRouter,
+)
 from common.infrastructure.database.sqlalchemy.session_factory import MAKER
 
 
 class Database:
-    def __init__(self, engine: AsyncEngine, logger: logging.Logger):
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        logger: logging.Logger,
+        replica_router: ReplicaRouter | None = None,
+        replica_monitor: ReplicaMonitor | None = None,
+        instrumentation: QueryInstrumentation | None = None,
+    ):
         self._engine = engine
         self._logger = logger
+        self._replica_router = replica_router
+        self._replica_monitor = replica_monitor
+        self._instrumentation = instrumentation
         self._create_session_maker()
+        if instrumentation is not None:
+            self._instrument(instrumentation)
 
     @classmethod
     def create(
         cls, config: DatabaseConfig, logger: logging.Logger | None = None
     ) -> Self:
+        logger = logger or logging.getLogger()
+        router, monitor = cls.create_replicas(config, logger)
         return cls(
             engine=cls.create_engine(config),
-            logger=logger or logging.getLogger(),
+            logger=logger,
+            replica_router=router,
+            replica_monitor=monitor,
+            instrumentation=QueryInstrumentation(
+                logger, config.db_slow_query_ms
+            ),
         )
 
-    @staticmethod
-    def create_engine(config: DatabaseConfig) -> AsyncEngine:
+    @classmethod
+    def create_replicas(
+        cls, config: DatabaseConfig, logger: logging.Logger
+    ) -> tuple[ReplicaRouter | None, ReplicaMonitor | None]:
+        if not config.db_replicas:
+            return None, None
+
+        replicas = [
+            Replica(name, cls.create_engine(config, url))
+            for name, url in config.replica_urls.items()
+        ]
+        router = ReplicaRouter(replicas, config.db_replica_sticky_window)
+        monitor = ReplicaMonitor(
+            router,
+            max_lag=config.db_replica_max_lag,
+            interval=config.db_replica_check_interval,
+            logger=logger,
+        )
+        return router, monitor
+
+    @classmethod
+    def create_engine(
+        cls, config: DatabaseConfig, url: str | None = None
+    ) -> AsyncEngine:
         return create_async_engine(
-            config.database_url, echo=False
-        )  # echo=True for detailed logs
+            url or config.database_url,
+            echo=False,  # echo=True for detailed logs
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_timeout=config.db_pool_timeout,
+            pool_recycle=config.db_pool_recycle,
+            pool_pre_ping=config.db_pool_pre_ping,
+            pool_use_lifo=True,
+            connect_args=cls.connect_args(config),
+        )
+
+    @staticmethod
+    def connect_args(config: DatabaseConfig) -> dict[str, Any]:
+        args: dict[str, Any] = {
+            "timeout": config.db_connect_timeout,
+            "command_timeout": config.db_command_timeout,
+            "statement_cache_size": config.db_statement_cache_size,
+            "prepared_statement_cache_size": config.db_statement_cache_size,
+        }
+        if config.db_server_settings:
+            args["server_settings"] = dict(config.db_server_settings)
+        if config.db_pgbouncer:
+            args["statement_cache_size"] = 0
+            args["prepared_statement_cache_size"] = 0
+            # NOTE: names must not clash across server connections that
+            # PgBouncer hands to the same client connection
+            args["prepared_statement_name_func"] = (
+                lambda: f"__asyncpg_{uuid4()}__"
+            )
+        return args
 
     def _create_session_maker(self) -> None:
         self._session_maker = async_sessionmaker(
             bind=self._engine, expire_on_commit=False
         )
+        self._read_only_session_maker = async_sessionmaker(
+            bind=self._engine.execution_options(isolation_level="AUTOCOMMIT"),
+            autoflush=False,
+            expire_on_commit=False,
+        )
 
     def get_engine(self) -> AsyncEngine:
         return self._engine
@@ -44,6 +131,51 @@ class Database:
     def get_session_maker(self) -> MAKER:
         return self._session_maker
 
+    def get_read_only_session_maker(self) -> MAKER:
+        return self._read_only_session_maker
+
+    def get_replica_router(self) -> ReplicaRouter | None:
+        return self._replica_router
+
+    def pool_stats(self) -> dict[str, Any]:
+        return self._pool_stats(self._engine)
+
+    def replica_stats(self) -> dict[str, Any]:
+        if self._replica_router is None:
+            return {}
+        stats = self._replica_router.stats()
+        for replica in self._replica_router.replicas:
+            stats["replicas"][replica.name]["pool"] = self._pool_stats(
+                replica.engine
+            )
+        return stats
+
+    def query_stats(self) -> dict[str, Any]:
+        if self._instrumentation is None:
+            return {}
+        return self._instrumentation.stats()
+
+    async def start_replica_monitor(self) -> None:
+        if self._replica_monitor is None:
+            return
+        await self._replica_monitor.start()
+        self._logger.info(
+            "database replica monitor started",
+            extra={"extra": self.replica_stats()},
+        )
+
+    def _instrument(self, instrumentation: QueryInstrumentation) -> None:
+        instrumentation.attach(self._engine)
+        if self._replica_router is not None:
+            for replica in self._replica_router.replicas:
+                instrumentation.attach(replica.engine)
+
+    def _pool_stats(self, engine: AsyncEngine) -> dict[str, Any]:
+        pool = engine.pool
+        if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+            return pool.stats()
+        return {"status": pool.status()}
+
     async def truncate_database(self, metadata: MetaData) -> None:
         async with self._engine.begin() as conn:
             table_names = [table.name for table in metadata.sorted_tables]
@@ -57,5 +189,10 @@ class Database:
 
     async def shutdown(self) -> None:
         self._logger.info("disposing database engine...")
+        if self._replica_monitor is not None:
+            await self._replica_monitor.stop()
+        if self._replica_router is not None:
+            for replica in self._replica_router.replicas:
+                await replica.engine.dispose()
         await self._engine.dispose()
         self._logger.info("database engine disposed gracefully")
@@ -1,6 +1,8 @@
-from collections.abc import Sequence
-from typing import TypeVar
+import asyncio
+from collections.abc import Mapping, Sequence
+from typing import Any, TypeVar
 
+import sqlalchemy.exc
 from sqlalchemy import Delete, Insert, Row, Select, Update
 from sqlalchemy.sql.dml import (
     ReturningInsert,
@@ -8,15 +10,35 @@ from sqlalchemy.sql.dml import (
 )
 
 from common.infrastructure.database.sqlalchemy.models.base import Base
+from common.infrastructure.database.sqlalchemy.replicas import (
+    Replica,
+    ReplicaRouter,
+)
 from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
 
 
 RESULT = TypeVar("RESULT")
 
+PARAMS = Mapping[str, Any]
+
+
+def is_replica_unavailable(error: BaseException) -> bool:
+    if isinstance(error, sqlalchemy.exc.DBAPIError):
+        return error.connection_invalidated or isinstance(
+            error,
+            (sqlalchemy.exc.OperationalError, sqlalchemy.exc.InterfaceError),
+        )
+    return isinstance(error, (OSError, asyncio.TimeoutError))
+
 
 class QueryExecutor:
-    def __init__(self, uow: UnitOfWork) -> None:
+    # NOTE: plain selects go to a healthy replica unless the current
+    # transaction has written or the context wrote within the sticky window
+    def __init__(
+        self, uow: UnitOfWork, router: ReplicaRouter | None = None
+    ) -> None:
         self.uow = uow
+        self.router = router
 
     async def execute_scalar(
         self,
@@ -69,6 +91,22 @@ class QueryExecutor:
     ) -> Sequence[Row[tuple[RESULT, ...]]]:
         return (await self.execute(statement)).unique().all()
 
+    async def execute_row(
+        self,
+        statement: Select[tuple[RESULT, ...]],
+        params: PARAMS | None = None,
+    ) -> Row[tuple[RESULT, ...]] | None:
+        # NOTE: for column selects, rows are never merged so `.unique()`
+        # is skipped
+        return (await self.execute(statement, params)).one_or_none()
+
+    async def execute_rows(
+        self,
+        statement: Select[tuple[RESULT, ...]],
+        params: PARAMS | None = None,
+    ) -> Sequence[Row[tuple[RESULT, ...]]]:
+        return (await self.execute(statement, params)).all()
+
     async def execute(
         self,
         statement: (
@@ -79,15 +117,26 @@ class QueryExecutor:
             | ReturningInsert[tuple[RESULT]]
             | ReturningUpdate[tuple[RESULT]]
         ),
+        params: PARAMS | None = None,
     ):
+        if isinstance(statement, Select):
+            replica = self._route(statement)
+            if replica is not None:
+                return await self._execute_on_replica(
+                    replica, statement, params
+                )
+            return await self._execute_on_primary(statement, params)
+
+        self._mark_write()
         async with self.uow.get_session() as session:
-            result = await session.execute(statement)
+            result = await session.execute(statement, params)
             return result
 
     async def add(
         self,
         model: Base,
     ) -> None:
+        self._mark_write()
         async with self.uow.get_session() as session:
             session.add(model)
             await session.flush()
@@ -96,6 +145,7 @@ class QueryExecutor:
         self,
         models: Sequence[Base],
     ) -> None:
+        self._mark_write()
         async with self.uow.get_session() as session:
             session.add_all(models)
             await session.flush()
@@ -104,6 +154,49 @@ class QueryExecutor:
         self,
         model: Base,
     ) -> None:
+        self._mark_write()
         async with self.uow.get_session() as session:
             model = await session.merge(model)
             await session.flush()
+
+    def _route(self, statement: Select[Any]) -> Replica | None:
+        if self.router is None:
+            return None
+        if (
+            statement._for_update_arg is not None
+            or self.uow.has_writes()
+            or self.router.is_sticky()
+        ):
+            self.router.use_primary()
+            return None
+        return self.router.pick()
+
+    async def _execute_on_replica(
+        self,
+        replica: Replica,
+        statement: Select[Any],
+        params: PARAMS | None = None,
+    ):
+        assert self.router is not None
+        try:
+            # NOTE: async session results are buffered, rows stay readable
+            # after the replica session is closed
+            async with replica.session_maker() as session:
+                return await session.execute(statement, params)
+        except Exception as e:
+            if not is_replica_unavailable(e):
+                raise
+            self.router.mark_failed(replica)
+
+        return await self._execute_on_primary(statement, params)
+
+    async def _execute_on_primary(
+        self, statement: Select[Any], params: PARAMS | None = None
+    ):
+        async with self.uow.get_session() as session:
+            return await session.execute(statement, params)
+
+    def _mark_write(self) -> None:
+        self.uow.mark_write()
+        if self.router is not None:
+            self.router.mark_write()
@@ -0,0 +1,150 @@
+import logging
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+FINGERPRINT_MAX_LENGTH = 200
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):[A-Za-z_]\w*|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    # NOTE: literals and bind parameters become "?" and IN lists collapse,
+    # so statements differing only in values share one fingerprint
+    normalized = _STRING.sub("?", statement)
+    normalized = _PARAM.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint(statement: str) -> str:
+    return normalize_sql(statement)[:FINGERPRINT_MAX_LENGTH]
+
+
+@dataclass
+class QueryStats:
+    request_id: str | None = None
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest: str | None = None
+
+    def record(self, duration_ms: float, statement: str) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.slowest_ms:
+            self.slowest_ms = duration_ms
+            self.slowest = statement
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "db_queries": self.count,
+            "db_time_ms": f"{self.total_ms:.2f}",
+            "db_slowest_ms": f"{self.slowest_ms:.2f}",
+            "db_slowest": (
+                fingerprint(self.slowest) if self.slowest is not None else None
+            ),
+        }
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "_current_stats", default=None
+)
+
+
+@contextmanager
+def track_queries(request_id: str | None = None) -> Iterator[QueryStats]:
+    # NOTE: the stats object is shared by reference, so statements issued
+    # in tasks spawned with a copy of this context are counted too
+    stats = QueryStats(request_id)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class QueryInstrumentation:
+    def __init__(
+        self, logger: logging.Logger, slow_query_threshold_ms: float
+    ) -> None:
+        self._logger = logger
+        self._slow_query_threshold_ms = slow_query_threshold_ms
+        self._totals = QueryStats()
+        self._slow_queries = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        target = engine.sync_engine
+        event.listen(target, "before_cursor_execute", self._before_execute)
+        event.listen(target, "after_cursor_execute", self._after_execute)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "statements": self._totals.count,
+            "total_ms": round(self._totals.total_ms, 2),
+            "slow_statements": self._slow_queries,
+            "slow_query_threshold_ms": self._slow_query_threshold_ms,
+        }
+
+    def _before_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        # NOTE: kept on the execution context, so failed statements leave
+        # nothing behind
+        if context is not None:
+            context._query_started_at = time.perf_counter()  # type: ignore
+
+    def _after_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        started = getattr(context, "_query_started_at", None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        self._totals.record(duration_ms, statement)
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(duration_ms, statement)
+
+        if duration_ms >= self._slow_query_threshold_ms:
+            self._slow_queries += 1
+            self._logger.warning(
+                "slow query",
+                extra={
+                    "extra": {
+                        "duration_ms": f"{duration_ms:.2f}",
+                        "statement": normalize_sql(statement),
+                        "executemany": executemany,
+                        "request_id": stats.request_id if stats else None,
+                    }
+                },
+            )
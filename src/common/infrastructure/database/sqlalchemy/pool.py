@@ -0,0 +1,65 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass
+class PoolCheckoutStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, waited: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    # NOTE: checkout time includes opening a new connection when the pool
+    # grows into its overflow
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = PoolCheckoutStats()
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        # NOTE: engine.dispose() swaps the pool, keep counters cumulative
+        pool = super().recreate()
+        assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+        pool.checkout_stats = self.checkout_stats
+        return pool
+
+    def stats(self) -> dict[str, Any]:
+        checkout = self.checkout_stats
+        capacity = self.size() + max(self._max_overflow, 0)
+        checked_out = self.checkedout()
+        return {
+            "size": self.size(),
+            "capacity": capacity,
+            "checked_out": checked_out,
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "saturation": round(checked_out / capacity, 4) if capacity else 0,
+            "checkouts": checkout.checkouts,
+            "timeouts": checkout.timeouts,
+            "wait_ms_avg": round(
+                checkout.wait_seconds_total / checkout.checkouts * 1000, 3
+            )
+            if checkout.checkouts
+            else 0.0,
+            "wait_ms_max": round(checkout.wait_seconds_max * 1000, 3),
+        }
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_stats.timeouts += 1
+            raise
+        self.checkout_stats.record(time.perf_counter() - started)
+        return entry
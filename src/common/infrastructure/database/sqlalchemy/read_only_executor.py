@@ -0,0 +1,51 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Select
+
+from common.infrastructure.database.sqlalchemy.executor import (
+    PARAMS,
+    QueryExecutor,
+)
+from common.infrastructure.database.sqlalchemy.models.base import Base
+from common.infrastructure.database.sqlalchemy.replicas import ReplicaRouter
+from common.infrastructure.database.sqlalchemy.session_factory import MAKER
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+
+
+class ReadOnlyQueryExecutor(QueryExecutor):
+    # NOTE: every select runs on its own autocommit session, so there is no
+    # BEGIN/COMMIT round trip and the connection goes back to the pool as
+    # soon as the rows are buffered
+    # NOTE: once the current unit of work has written, reads go through its
+    # session to see the uncommitted changes
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        session_maker: MAKER,
+        router: ReplicaRouter | None = None,
+    ) -> None:
+        super().__init__(uow, router)
+        self.session_maker = session_maker
+
+    async def execute(self, statement: Any, params: PARAMS | None = None):
+        if not isinstance(statement, Select):
+            raise ValueError("Read-only executor accepts select statements")
+        return await super().execute(statement, params)
+
+    async def add(self, model: Base) -> None:
+        raise ValueError("Read-only executor cannot add models")
+
+    async def add_all(self, models: Sequence[Base]) -> None:
+        raise ValueError("Read-only executor cannot add models")
+
+    async def save(self, model: Base) -> None:
+        raise ValueError("Read-only executor cannot save models")
+
+    async def _execute_on_primary(
+        self, statement: Select[Any], params: PARAMS | None = None
+    ):
+        if self.uow.has_writes():
+            return await super()._execute_on_primary(statement, params)
+        async with self.session_maker() as session:
+            return await session.execute(statement, params)
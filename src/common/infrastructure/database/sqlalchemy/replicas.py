@@ -0,0 +1,179 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from common.infrastructure.database.sqlalchemy.session_factory import MAKER
+
+
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        # NOTE: replica reads are single statements, no BEGIN/COMMIT needed
+        self.session_maker: MAKER = async_sessionmaker(
+            bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        # NOTE: replicas stay out of rotation until the first check passes
+        self.healthy = False
+        self.lag: float | None = None
+        self.failures = 0
+
+
+class ReplicaRouter:
+    # NOTE: a write marks the current context (request or task), its reads
+    # go to the primary until `sticky_window` seconds have passed
+    def __init__(
+        self,
+        replicas: Sequence[Replica],
+        sticky_window: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.replicas = list(replicas)
+        self.sticky_window = sticky_window
+        self._clock = clock
+        self._cycle = itertools.cycle(self.replicas)
+        self._last_write: ContextVar[float | None] = ContextVar(
+            "_last_write", default=None
+        )
+        self._replica_reads = 0
+        self._primary_reads = 0
+        self._fallbacks = 0
+
+    def mark_write(self) -> None:
+        self._last_write.set(self._clock())
+
+    def is_sticky(self) -> bool:
+        last_write = self._last_write.get()
+        return (
+            last_write is not None
+            and self._clock() - last_write < self.sticky_window
+        )
+
+    def pick(self) -> Replica | None:
+        for _ in range(len(self.replicas)):
+            replica = next(self._cycle)
+            if replica.healthy:
+                self._replica_reads += 1
+                return replica
+        self._primary_reads += 1
+        return None
+
+    def use_primary(self) -> None:
+        self._primary_reads += 1
+
+    def mark_failed(self, replica: Replica) -> None:
+        replica.healthy = False
+        replica.failures += 1
+        self._fallbacks += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "replica_reads": self._replica_reads,
+            "primary_reads": self._primary_reads,
+            "fallbacks": self._fallbacks,
+            "replicas": {
+                replica.name: {
+                    "healthy": replica.healthy,
+                    "lag": replica.lag,
+                    "failures": replica.failures,
+                }
+                for replica in self.replicas
+            },
+        }
+
+
+class ReplicaMonitor:
+    def __init__(
+        self,
+        router: ReplicaRouter,
+        max_lag: float,
+        interval: float,
+        logger: logging.Logger,
+        timeout: float = 2.0,
+    ):
+        self.router = router
+        self.max_lag = max_lag
+        self.interval = interval
+        self.timeout = timeout
+        self._logger = logger
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        await self.check()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def check(self) -> None:
+        await asyncio.gather(
+            *(self._check(replica) for replica in self.router.replicas)
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with replica.engine.connect() as conn:
+                    lag = float(await conn.scalar(REPLICA_LAG_QUERY) or 0)
+        except Exception as e:
+            self._update(replica, healthy=False, lag=None, error=str(e))
+            return
+        self._update(replica, healthy=lag <= self.max_lag, lag=lag)
+
+    def _update(
+        self,
+        replica: Replica,
+        healthy: bool,
+        lag: float | None,
+        error: str | None = None,
+    ) -> None:
+        changed = replica.healthy != healthy
+        replica.healthy = healthy
+        replica.lag = lag
+        if not changed:
+            return
+
+        extra = {"replica": replica.name, "lag": lag, "error": error}
+        if healthy:
+            self._logger.info(
+                "database replica is back in rotation",
+                extra={"extra": extra},
+            )
+        else:
+            self._logger.warning(
+                "database replica removed from rotation",
+                extra={"extra": extra},
+            )
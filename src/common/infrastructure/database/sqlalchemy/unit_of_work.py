@@ -30,6 +30,8 @@ from common.infrastructure.database.sqlalchemy.session_factory import (
 class Transaction:
     session: AsyncSession
     nesting_level: int = 0
+    rollback_only: bool = False
+    has_writes: bool = False
 
     def should_commit(self) -> bool:
         return self.nesting_level == 0
@@ -68,6 +70,18 @@ class UnitOfWork(IUnitOfWork):
         except Exception as e:
             raise RepositoryError("Unnable to rollback transaction") from e
 
+    def set_rollback_only(self) -> None:
+        # NOTE: the outermost scope rolls back instead of committing
+        self._get_transaction().rollback_only = True
+
+    def mark_write(self) -> None:
+        if self._transaction_exists():
+            self._get_transaction().has_writes = True
+
+    def has_writes(self) -> bool:
+        tx = self._current_transaction.get()
+        return tx is not None and tx.has_writes
+
     async def close(self) -> None:
         session = self._get_session()
 
@@ -116,16 +130,22 @@ class UnitOfWork(IUnitOfWork):
             return
 
         tx = self._get_transaction()
-        if has_error:
-            await self.rollback()
-        elif tx.should_commit():
-            await self.commit()
+        if not tx.should_commit():
+            if has_error:
+                await self.rollback()
+            tx.exit()
+            return
 
-        if tx.should_commit():  # Out of context manager
+        # NOTE: out of context manager, the session is released even if
+        # commit fails so a request scope never leaks its connection
+        try:
+            if has_error or tx.rollback_only:
+                await self.rollback()
+            else:
+                await self.commit()
+        finally:
             await self.close()
             self._reset_session()
-        else:
-            tx.exit()
 
     def _handle_exception(self, exception: BaseException):
         if isinstance(exception, ApplicationError):
@@ -1,12 +1,19 @@
 from dependency_injector import containers, providers
 
-from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
 from common.infrastructure.di.container.providers import (
+    provide_circuit_breaker,
     provide_maker_session_factory,
+    provide_metrics_registry,
+    provide_query_executor,
+    provide_read_only_query_executor,
+    provide_uuid_generator,
 )
+from common.infrastructure.resilience.circuit_breaker import (
+    is_infrastructure_failure,
+)
+from common.infrastructure.server.grpc.circuit_breaker import is_grpc_failure
 from common.infrastructure.services.clock import SystemClock
-from common.infrastructure.services.id_generator import UUID4Generator
 from common.infrastructure.services.secrets_token_generator import (
     SecretsTokenGenerator,
 )
@@ -18,7 +25,9 @@ class CommonContainer(containers.DeclarativeContainer):
 
     # ---------------------- General ----------------------
     clock = providers.Singleton(SystemClock)
-    uuid_generator = providers.Singleton(UUID4Generator)
+    uuid_generator = providers.Singleton(
+        provide_uuid_generator, config.provided.db.db_uuid_version
+    )
     token_generator = providers.Singleton(SecretsTokenGenerator)
 
     # ---------------------- Database ----------------------
@@ -26,4 +35,33 @@ class CommonContainer(containers.DeclarativeContainer):
         provide_maker_session_factory, database
     )
     unit_of_work = providers.Singleton(UnitOfWork, session_factory)
-    query_executor = providers.Singleton(QueryExecutor, unit_of_work)
+    query_executor = providers.Singleton(
+        provide_query_executor, unit_of_work, database
+    )
+    read_only_query_executor = providers.Singleton(
+        provide_read_only_query_executor, unit_of_work, database
+    )
+
+    # ---------------------- Resilience ----------------------
+    metrics_registry = providers.Singleton(provide_metrics_registry, database)
+    redis_circuit_breaker = providers.Singleton(
+        provide_circuit_breaker,
+        name="redis",
+        config=config.provided.circuit_breaker,
+        is_failure=is_infrastructure_failure,
+        metrics_registry=metrics_registry,
+    )
+    storage_circuit_breaker = providers.Singleton(
+        provide_circuit_breaker,
+        name="storage",
+        config=config.provided.circuit_breaker,
+        is_failure=is_infrastructure_failure,
+        metrics_registry=metrics_registry,
+    )
+    grpc_circuit_breaker = providers.Singleton(
+        provide_circuit_breaker,
+        name="grpc",
+        config=config.provided.circuit_breaker,
+        is_failure=is_grpc_failure,
+        metrics_registry=metrics_registry,
+    )
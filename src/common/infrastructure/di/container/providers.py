@@ -1,25 +1,160 @@
 from typing import Any
 
+from marshmallow import Schema
+
+from common.application.interfaces.metrics.metrics_registry import (
+    IMetricsRegistry,
+)
 from common.application.interfaces.repositories.key_value_store import (
     IKeyValueStore,
 )
+from common.domain.uuid_generator import IUUIDGenerator
+from common.infrastructure.config.cache_config import CacheSerializerFormat
+from common.infrastructure.config.circuit_breaker_config import (
+    CircuitBreakerConfig,
+)
+from common.infrastructure.config.database_config import UUIDVersion
 from common.infrastructure.database.redis.redis import RedisDatabase
 from common.infrastructure.database.redis.repositories.key_value_store import (
     RedisKeyValueStore,
 )
+from common.infrastructure.database.redis.repositories.tracking_key_value_store import (
+    TrackingRedisKeyValueStore,
+)
+from common.infrastructure.database.repositories.circuit_breaker_key_value_store import (
+    CircuitBreakerKeyValueStore,
+)
 from common.infrastructure.database.sqlalchemy.database import Database
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.read_only_executor import (
+    ReadOnlyQueryExecutor,
+)
 from common.infrastructure.database.sqlalchemy.session_factory import (
     ISessionFactory,
     MakerSessionFactory,
 )
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from common.infrastructure.metrics.registry import MetricsRegistry
+from common.infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    FailurePredicate,
+)
+from common.infrastructure.serializers.marshmallow.serializer import (
+    MarshmallowSerializer,
+)
+from common.infrastructure.serializers.msgpack.serializer import (
+    MsgpackDataclassSerializer,
+)
+from common.infrastructure.serializers.orjson.serializer import (
+    OrjsonDataclassSerializer,
+)
+from common.infrastructure.serializers.prefixed.serializer import (
+    FormatPrefixedSerializer,
+)
 from common.infrastructure.serializers.serializer import ISerializer
+from common.infrastructure.services.id_generator import (
+    UUID4Generator,
+    UUID7Generator,
+)
+
+
+CACHE_FORMAT_TAGS: dict[CacheSerializerFormat, str] = {
+    CacheSerializerFormat.ORJSON: "oj1",
+    CacheSerializerFormat.MSGPACK: "mp1",
+    CacheSerializerFormat.MARSHMALLOW: "mm1",
+}
+
+
+def provide_uuid_generator(version: UUIDVersion) -> IUUIDGenerator:
+    if version == UUIDVersion.V4:
+        return UUID4Generator()
+    return UUID7Generator()
 
 
 def provide_maker_session_factory(database: Database) -> ISessionFactory:
     return MakerSessionFactory(database.get_session_maker())
 
 
+def provide_query_executor(
+    unit_of_work: UnitOfWork, database: Database
+) -> QueryExecutor:
+    return QueryExecutor(unit_of_work, database.get_replica_router())
+
+
+def provide_read_only_query_executor(
+    unit_of_work: UnitOfWork, database: Database
+) -> ReadOnlyQueryExecutor:
+    return ReadOnlyQueryExecutor(
+        unit_of_work,
+        database.get_read_only_session_maker(),
+        database.get_replica_router(),
+    )
+
+
 def redis_key_value_store_provider(
+    redis: RedisDatabase,
+    serializer: ISerializer[Any],
+    namespace: str,
+    breaker: CircuitBreaker | None = None,
+) -> IKeyValueStore[Any]:
+    store = provide_redis_key_value_store(redis, serializer, namespace)
+    if breaker is None:
+        return store
+    return CircuitBreakerKeyValueStore(store, breaker)
+
+
+def provide_redis_key_value_store(
     redis: RedisDatabase, serializer: ISerializer[Any], namespace: str
 ) -> IKeyValueStore[Any]:
-    return RedisKeyValueStore(redis.get_client(), serializer, namespace)
+    listener = redis.get_invalidation_listener()
+    if listener is None:
+        return RedisKeyValueStore(redis.get_client(), serializer, namespace)
+    return TrackingRedisKeyValueStore(
+        listener.get_client(),
+        serializer,
+        listener,
+        namespace,
+        max_entries=listener.config.tracking_max_entries,
+        local_ttl=listener.config.tracking_local_ttl,
+    )
+
+
+def provide_metrics_registry(database: Database) -> IMetricsRegistry:
+    registry = MetricsRegistry()
+    registry.register("database.pool", database.pool_stats)
+    registry.register("database.queries", database.query_stats)
+    if database.get_replica_router() is not None:
+        registry.register("database.replicas", database.replica_stats)
+    return registry
+
+
+def provide_circuit_breaker(
+    name: str,
+    config: CircuitBreakerConfig,
+    is_failure: FailurePredicate,
+    metrics_registry: IMetricsRegistry,
+) -> CircuitBreaker:
+    breaker = CircuitBreaker(name, config, is_failure)
+    metrics_registry.register(f"circuit_breaker.{name}", breaker.stats)
+    return breaker
+
+
+def provide_cache_serializer(
+    model: type[Any],
+    schema: Schema,
+    serializer_format: CacheSerializerFormat,
+) -> ISerializer[Any]:
+    marshmallow = MarshmallowSerializer[Any](schema)
+    serializers: dict[CacheSerializerFormat, ISerializer[Any]] = {
+        CacheSerializerFormat.ORJSON: OrjsonDataclassSerializer(model),
+        CacheSerializerFormat.MSGPACK: MsgpackDataclassSerializer(model),
+        CacheSerializerFormat.MARSHMALLOW: marshmallow,
+    }
+    return FormatPrefixedSerializer(
+        writer=CACHE_FORMAT_TAGS[serializer_format],
+        serializers={
+            CACHE_FORMAT_TAGS[fmt]: serializer
+            for fmt, serializer in serializers.items()
+        },
+        legacy=marshmallow,
+    )
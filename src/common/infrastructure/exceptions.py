@@ -16,3 +16,9 @@ class InfrastructureError(Exception):
 class SerializationError(InfrastructureError):
     def __init__(self, message: str = "Unnable to serialize object") -> None:
         super().__init__(message)
+
+
+class CircuitOpenError(InfrastructureError):
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Circuit '{name}' is open")
+        self.name = name
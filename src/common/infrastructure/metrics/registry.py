@@ -0,0 +1,17 @@
+from typing import Any
+
+from common.application.interfaces.metrics.metrics_registry import (
+    IMetricsRegistry,
+    MetricsSource,
+)
+
+
+class MetricsRegistry(IMetricsRegistry):
+    def __init__(self) -> None:
+        self._sources: dict[str, MetricsSource] = {}
+
+    def register(self, name: str, source: MetricsSource) -> None:
+        self._sources[name] = source
+
+    def collect(self) -> dict[str, dict[str, Any]]:
+        return {name: dict(source()) for name, source in self._sources.items()}
@@ -0,0 +1,182 @@
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any, ParamSpec, TypeVar
+
+from common.application.exceptions import ApplicationError, RepositoryError
+from common.infrastructure.config.circuit_breaker_config import (
+    CircuitBreakerConfig,
+)
+from common.infrastructure.exceptions import CircuitOpenError
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+FailurePredicate = Callable[[BaseException], bool]
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def is_infrastructure_failure(error: BaseException) -> bool:
+    # NOTE: application errors other than RepositoryError (e.g. not found)
+    # are outcomes of a healthy dependency
+    if isinstance(error, RepositoryError):
+        return True
+    return isinstance(error, Exception) and not isinstance(
+        error, ApplicationError
+    )
+
+
+class CircuitBreaker:
+    # NOTE: failure rate is measured over the last `window_size` calls and
+    # only once `minimum_calls` outcomes were recorded
+    # NOTE: exceptions rejected by `is_failure` and cancellations do not
+    # affect the circuit
+    def __init__(
+        self,
+        name: str,
+        config: CircuitBreakerConfig,
+        is_failure: FailurePredicate = is_infrastructure_failure,
+        clock: Callable[[], float] = time.monotonic,
+        logger: logging.Logger | None = None,
+    ):
+        self.name = name
+        self._config = config
+        self._is_failure = is_failure
+        self._clock = clock
+        self._logger = logger or logging.getLogger(__name__)
+
+        self._state = CircuitState.CLOSED
+        self._window: deque[bool] = deque(maxlen=config.window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+
+        self._calls = 0
+        self._failures = 0
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._config.open_timeout
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return self._window.count(False) / len(self._window)
+
+    async def call(
+        self,
+        func: Callable[P, Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        probe = self._acquire()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            if self._is_failure(e):
+                self._record(probe, success=False)
+            else:
+                self._release(probe)
+            raise
+        self._record(probe, success=True)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "failure_rate": round(self.failure_rate, 4),
+            "calls": self._calls,
+            "failures": self._failures,
+            "rejected": self._rejected,
+            "opened": self._opened,
+        }
+
+    def _acquire(self) -> bool:
+        state = self.state
+        if state == CircuitState.CLOSED:
+            self._calls += 1
+            return False
+        if (
+            state == CircuitState.HALF_OPEN
+            and self._probes < self._config.half_open_max_calls
+        ):
+            self._calls += 1
+            self._probes += 1
+            return True
+
+        self._rejected += 1
+        raise CircuitOpenError(self.name)
+
+    def _release(self, probe: bool) -> None:
+        if probe and self._state == CircuitState.HALF_OPEN:
+            self._probes = max(0, self._probes - 1)
+
+    def _record(self, probe: bool, success: bool) -> None:
+        if not success:
+            self._failures += 1
+
+        if probe:
+            if self._state != CircuitState.HALF_OPEN:
+                return
+            self._probes = max(0, self._probes - 1)
+            if not success:
+                self._open()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self._config.half_open_max_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        if self._state != CircuitState.CLOSED:
+            return
+        self._window.append(success)
+        if (
+            len(self._window) >= self._config.minimum_calls
+            and self.failure_rate >= self._config.failure_rate_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._opened += 1
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        previous = self._state
+        self._state = state
+        self._probes = 0
+        self._probe_successes = 0
+        if state == CircuitState.CLOSED:
+            self._window.clear()
+
+        log = (
+            self._logger.warning
+            if state == CircuitState.OPEN
+            else self._logger.info
+        )
+        log(
+            f"circuit '{self.name}' {previous.value} -> {state.value}",
+            extra={
+                "extra": {
+                    "circuit": self.name,
+                    "state": state.value,
+                    "failure_rate": self.failure_rate,
+                }
+            },
+        )
@@ -0,0 +1,37 @@
+from collections.abc import Callable, Mapping
+from dataclasses import fields
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, get_type_hints
+from uuid import UUID
+
+
+Decoder = Callable[[Any], Any]
+
+DEFAULT_DECODERS: Mapping[type, Decoder] = {
+    UUID: UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+}
+
+
+def field_decoders(
+    model: type[Any], overrides: Mapping[type, Decoder] | None = None
+) -> tuple[tuple[str, Decoder | None], ...]:
+    # NOTE: resolved once per model, so decoding is a plain loop without
+    # any type inspection or validation
+    decoders = {**DEFAULT_DECODERS, **(overrides or {})}
+    hints = get_type_hints(model)
+
+    result: list[tuple[str, Decoder | None]] = []
+    for field in fields(model):
+        hint = hints[field.name]
+        decoder = decoders.get(hint)
+        if decoder is None and _is_enum(hint):
+            decoder = hint
+        result.append((field.name, decoder))
+    return tuple(result)
+
+
+def _is_enum(hint: Any) -> bool:
+    return isinstance(hint, type) and issubclass(hint, Enum)
@@ -8,13 +8,13 @@ class MarshmallowSerializer(ISerializer[T]):
     def __init__(self, schema: Schema):
         self._schema = schema
 
-    def serialize(self, obj: T) -> str:
+    def serialize(self, obj: T) -> bytes:
         try:
-            return self._schema.dumps(obj)  # type: ignore
+            return self._schema.dumps(obj).encode()  # type: ignore
         except Exception as e:
             raise SerializationError from e
 
-    def deserialize(self, data: str) -> T:
+    def deserialize(self, data: bytes) -> T:
         try:
             return self._schema.loads(data)  # type: ignore
         except Exception as e:
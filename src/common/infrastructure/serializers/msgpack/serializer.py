@@ -0,0 +1,55 @@
+from datetime import date
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import msgpack
+
+from common.infrastructure.exceptions import SerializationError
+from common.infrastructure.serializers.dataclass_fields import field_decoders
+from common.infrastructure.serializers.serializer import ISerializer, T
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return value.bytes
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Unsupported type: {type(value).__name__}")
+
+
+class MsgpackDataclassSerializer(ISerializer[T]):
+    # NOTE: fields are packed positionally in declaration order, so
+    # reordering dataclass fields requires a new format tag
+    def __init__(self, model: type[T]):
+        self._model = model
+        self._fields = field_decoders(
+            model, {UUID: lambda v: UUID(bytes=v)}
+        )
+        self._names = tuple(name for name, _ in self._fields)
+
+    def serialize(self, obj: T) -> bytes:
+        try:
+            return msgpack.packb(  # type: ignore
+                [getattr(obj, name) for name in self._names],
+                default=_encode,
+                use_bin_type=True,
+            )
+        except Exception as e:
+            raise SerializationError from e
+
+    def deserialize(self, data: bytes) -> T:
+        try:
+            values: list[Any] = msgpack.unpackb(data, raw=False)
+            return self._model(
+                *[
+                    decode(value) if decode else value
+                    for (_, decode), value in zip(
+                        self._fields, values, strict=True
+                    )
+                ]
+            )
+        except Exception as e:
+            raise SerializationError from e
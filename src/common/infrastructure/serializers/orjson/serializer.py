@@ -0,0 +1,31 @@
+from typing import Any
+
+import orjson
+
+from common.infrastructure.exceptions import SerializationError
+from common.infrastructure.serializers.dataclass_fields import field_decoders
+from common.infrastructure.serializers.serializer import ISerializer, T
+
+
+class OrjsonDataclassSerializer(ISerializer[T]):
+    def __init__(self, model: type[T]):
+        self._model = model
+        self._fields = field_decoders(model)
+
+    def serialize(self, obj: T) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except Exception as e:
+            raise SerializationError from e
+
+    def deserialize(self, data: bytes) -> T:
+        try:
+            raw: dict[str, Any] = orjson.loads(data)
+            return self._model(
+                **{
+                    name: decode(raw[name]) if decode else raw[name]
+                    for name, decode in self._fields
+                }
+            )
+        except Exception as e:
+            raise SerializationError from e
@@ -0,0 +1,49 @@
+from collections.abc import Mapping
+
+from common.infrastructure.exceptions import SerializationError
+from common.infrastructure.serializers.serializer import ISerializer, T
+
+
+FORMAT_MARKER = b"\x00"
+TAG_LENGTH = 3
+HEADER_LENGTH = len(FORMAT_MARKER) + TAG_LENGTH
+
+
+class FormatPrefixedSerializer(ISerializer[T]):
+    # NOTE: every payload starts with a marker byte and a 3-byte format tag,
+    # so readers understand all registered formats while writers switch over
+    # NOTE: payloads without a header are handed to the legacy serializer
+    def __init__(
+        self,
+        writer: str,
+        serializers: Mapping[str, ISerializer[T]],
+        legacy: ISerializer[T] | None = None,
+    ):
+        readers: dict[bytes, ISerializer[T]] = {}
+        for tag, serializer in serializers.items():
+            encoded = tag.encode("ascii")
+            if len(encoded) != TAG_LENGTH:
+                raise ValueError(f"Format tag must be 3 bytes: {tag!r}")
+            readers[encoded] = serializer
+
+        if writer not in serializers:
+            raise ValueError(f"Unknown writer format: {writer!r}")
+
+        self._readers = readers
+        self._writer = serializers[writer]
+        self._header = FORMAT_MARKER + writer.encode("ascii")
+        self._legacy = legacy
+
+    def serialize(self, obj: T) -> bytes:
+        return self._header + self._writer.serialize(obj)
+
+    def deserialize(self, data: bytes) -> T:
+        if data[:1] != FORMAT_MARKER:
+            if self._legacy is None:
+                raise SerializationError("Missing payload format header")
+            return self._legacy.deserialize(data)
+
+        reader = self._readers.get(data[1:HEADER_LENGTH])
+        if reader is None:
+            raise SerializationError("Unknown payload format")
+        return reader.deserialize(data[HEADER_LENGTH:])
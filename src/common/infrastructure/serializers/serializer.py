@@ -7,6 +7,6 @@ T = TypeVar("T")
 
 class ISerializer(ABC, Generic[T]):
     @abstractmethod
-    def serialize(self, obj: T) -> str: ...
+    def serialize(self, obj: T) -> bytes: ...
     @abstractmethod
-    def deserialize(self, data: str) -> T: ...
+    def deserialize(self, data: bytes) -> T: ...
@@ -8,10 +8,12 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from common.application.exceptions import (
     ApplicationError,
+    ContentTooLargeError,
     DuplicateEntryError,
     NotFoundError,
     OptimisticLockError,
     RepositoryError,
+    ServiceUnavailableError,
 )
 from common.domain.exceptions import DomainError
 
@@ -37,7 +39,9 @@ class DomainErrorHandler(IHTTPErrorHandler):
 
 class ApplicationErrorHandler(IHTTPErrorHandler):
     ERROR_STATUS_MAP: ClassVar[dict[type[Exception], int]] = {
-        NotFoundError: status.HTTP_404_NOT_FOUND
+        NotFoundError: status.HTTP_404_NOT_FOUND,
+        ServiceUnavailableError: status.HTTP_503_SERVICE_UNAVAILABLE,
+        ContentTooLargeError: status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
     }
 
     def can_handle(self, exc: Exception) -> bool:
@@ -8,6 +8,10 @@ from typing import Any
 from fastapi import FastAPI, Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from common.infrastructure.database.sqlalchemy.instrumentation import (
+    track_queries,
+)
+
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: FastAPI, logger: logging.Logger):
@@ -31,24 +35,27 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         self.logger.info("incoming request", extra={"extra": extra})
 
-        try:
-            response: Response = await call_next(request)
-        except Exception:
-            # NOTE: Normally shouldn't be invoked
-            process_time = (time.time() - start_time) * 1000
-            extra.update(
-                {
-                    "process_time_ms": f"{process_time:.2f}",
-                }
-            )
+        with track_queries(request_id) as queries:
+            try:
+                response: Response = await call_next(request)
+            except Exception:
+                # NOTE: Normally shouldn't be invoked
+                process_time = (time.time() - start_time) * 1000
+                extra.update(
+                    {
+                        "process_time_ms": f"{process_time:.2f}",
+                        **queries.as_dict(),
+                    }
+                )
 
-            self.logger.exception(
-                "request failed",
-                extra={"extra": extra},
-            )
-            raise
+                self.logger.exception(
+                    "request failed",
+                    extra={"extra": extra},
+                )
+                raise
 
         process_time = (time.time() - start_time) * 1000
+        extra.update(queries.as_dict())
         if response.status_code >= 400:
             extra.update(
                 {
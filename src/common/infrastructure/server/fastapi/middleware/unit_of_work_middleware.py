@@ -0,0 +1,27 @@
+from collections.abc import Awaitable, Callable
+
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+
+
+class UnitOfWorkMiddleware(BaseHTTPMiddleware):
+    # NOTE: must be the innermost middleware so it sees raised errors
+    # before they are turned into responses
+    # NOTE: sessions acquire a pool connection on the first statement, so
+    # requests that never touch the database never check one out
+    def __init__(self, app: FastAPI, unit_of_work: UnitOfWork):
+        super().__init__(app)
+        self.unit_of_work = unit_of_work
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        async with self.unit_of_work:
+            response = await call_next(request)
+            if response.status_code >= 400:
+                self.unit_of_work.set_rollback_only()
+        return response
@@ -0,0 +1,57 @@
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import grpc
+
+from common.application.exceptions import ServiceUnavailableError
+from common.infrastructure.exceptions import CircuitOpenError
+from common.infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    is_infrastructure_failure,
+)
+
+
+TRANSIENT_STATUS_CODES = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.INTERNAL,
+        grpc.StatusCode.UNKNOWN,
+    }
+)
+
+
+def is_grpc_failure(error: BaseException) -> bool:
+    if isinstance(error, grpc.aio.AioRpcError):
+        return error.code() in TRANSIENT_STATUS_CODES
+    return is_infrastructure_failure(error)
+
+
+class CircuitBreakerStub:
+    # NOTE: business errors (e.g. UNAUTHENTICATED) pass through without
+    # affecting the circuit; an open circuit fails fast with 503
+    def __init__(self, stub: Any, breaker: CircuitBreaker):
+        self._stub = stub
+        self._breaker = breaker
+
+    def __getattr__(
+        self, item: str
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        method = getattr(self._stub, item)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await self._breaker.call(
+                    self._invoke, method, *args, **kwargs
+                )
+            except CircuitOpenError as e:
+                raise ServiceUnavailableError(
+                    "Upstream service unavailable"
+                ) from e
+
+        return call
+
+    @staticmethod
+    async def _invoke(method: Any, *args: Any, **kwargs: Any) -> Any:
+        return await method(*args, **kwargs)
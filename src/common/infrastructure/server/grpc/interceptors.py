@@ -0,0 +1,40 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import grpc
+from grpc import aio
+
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+
+
+class UnitOfWorkInterceptor(aio.ServerInterceptor):
+    # NOTE: only unary-unary RPCs are scoped, streaming handlers would hold
+    # the session for the lifetime of the stream
+    def __init__(self, unit_of_work: UnitOfWork):
+        self.unit_of_work = unit_of_work
+
+    async def intercept_service(
+        self,
+        continuation: Callable[
+            [grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]
+        ],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        behavior = handler.unary_unary
+
+        async def scoped(request: Any, context: aio.ServicerContext) -> Any:
+            async with self.unit_of_work:
+                response = await behavior(request, context)
+                if context.code() not in (None, grpc.StatusCode.OK):
+                    self.unit_of_work.set_rollback_only()
+                return response
+
+        return grpc.unary_unary_rpc_method_handler(
+            scoped,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
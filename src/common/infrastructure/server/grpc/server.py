@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from collections.abc import Sequence
 
 from grpc import aio
 
@@ -9,10 +10,15 @@ from common.infrastructure.config.grcp_config import GRPCConfig
 class GRPCServer:
     """Async gRPC server with graceful shutdown support. Should be created and started/stopped within one coroutine."""
 
-    def __init__(self, logger: logging.Logger, config: GRPCConfig):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        config: GRPCConfig,
+        interceptors: Sequence[aio.ServerInterceptor] = (),
+    ):
         self._logger = logger
         self._config = config
-        self._server = aio.server()
+        self._server = aio.server(interceptors=list(interceptors))
 
     def get_server(self) -> aio.Server:
         return self._server
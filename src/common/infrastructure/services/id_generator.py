@@ -1,3 +1,7 @@
+import secrets
+import threading
+import time
+from collections.abc import Callable
 from uuid import UUID, uuid4
 
 from common.domain.uuid_generator import IUUIDGenerator
@@ -6,3 +10,55 @@ from common.domain.uuid_generator import IUUIDGenerator
 class UUID4Generator(IUUIDGenerator):
     def create(self) -> UUID:
         return uuid4()
+
+
+def _time_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+class UUID7Generator(IUUIDGenerator):
+    # NOTE: RFC 9562 UUIDv7, a 48-bit millisecond timestamp followed by 74
+    # random bits; within one millisecond the random part is incremented
+    # (method 2), so ids from this process are strictly increasing
+    # NOTE: the timestamp never goes back, a clock step back or a counter
+    # overflow keeps counting on the last used millisecond
+    _RANDOM_BITS = 74
+    _RAND_B_BITS = 62
+
+    def __init__(
+        self,
+        time_ms: Callable[[], int] = _time_ms,
+        randbits: Callable[[int], int] = secrets.randbits,
+    ):
+        self._time_ms = time_ms
+        self._randbits = randbits
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def create(self) -> UUID:
+        with self._lock:
+            now = self._time_ms()
+            if now > self._last_ms:
+                self._last_ms = now
+                self._counter = self._seed()
+            else:
+                self._counter += 1
+                if self._counter >> self._RANDOM_BITS:
+                    self._last_ms += 1
+                    self._counter = self._seed()
+            timestamp, counter = self._last_ms, self._counter
+
+        rand_a = counter >> self._RAND_B_BITS
+        rand_b = counter & ((1 << self._RAND_B_BITS) - 1)
+        return UUID(
+            int=(timestamp & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | rand_a << 64
+            | 0b10 << 62
+            | rand_b
+        )
+
+    def _seed(self) -> int:
+        # NOTE: the top bit is left clear to make room for increments
+        return self._randbits(self._RANDOM_BITS - 1)
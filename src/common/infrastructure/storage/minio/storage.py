@@ -1,12 +1,14 @@
-from typing import Self
-
-from minio import Minio  # type: ignore
+from typing import Any, Self
 
 from common.infrastructure.config.s3_config import S3Config
+from common.infrastructure.storage.s3.client import S3Client
+
+
+OBJECT_CREATED_EVENTS = ["s3:ObjectCreated:Put", "s3:ObjectCreated:Post"]
 
 
 class MinioStorage:
-    def __init__(self, client: Minio, config: S3Config):
+    def __init__(self, client: S3Client, config: S3Config):
         self._client = client
         self._bucket_name = config.bucket_name
         self._config = config
@@ -17,27 +19,30 @@ class MinioStorage:
         return cls(client=client, config=config)
 
     @staticmethod
-    def create_client(config: S3Config) -> Minio:
-        return Minio(
-            endpoint=config.endpoint,
-            access_key=config.access_key,
-            secret_key=config.secret_key,
-            secure=config.secure,
-        )
+    def create_client(config: S3Config) -> S3Client:
+        return S3Client.create(config)
 
     def get_config(self) -> S3Config:
         return self._config
 
-    def get_client(self) -> Minio:
+    def get_client(self) -> S3Client:
         return self._client
 
     def get_bucket_name(self) -> str:
         return self._bucket_name
 
-    def ensure_bucket(self) -> None:
-        if not self._client.bucket_exists(self._bucket_name):
-            self._client.make_bucket(self._bucket_name)
-
-    def shutdown(self) -> None:
-        """MinIO does not maintain a persistent connection"""
-        pass
+    def stats(self) -> dict[str, Any]:
+        return self._client.stats()
+
+    async def ensure_bucket(self) -> None:
+        if not await self._client.bucket_exists(self._bucket_name):
+            await self._client.make_bucket(self._bucket_name)
+        if self._config.notification_queue_arn:
+            await self._client.set_bucket_notification(
+                self._bucket_name,
+                self._config.notification_queue_arn,
+                OBJECT_CREATED_EVENTS,
+            )
+
+    async def shutdown(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,382 @@
+import base64
+import json
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Self
+from urllib.parse import quote
+from xml.etree import ElementTree
+
+import httpx
+
+from common.infrastructure.config.s3_config import S3Config
+from common.infrastructure.storage.s3.presign_cache import PresignedUrlCache
+from common.infrastructure.storage.s3.signer import (
+    ALGORITHM,
+    EMPTY_PAYLOAD_HASH,
+    UNSIGNED_PAYLOAD,
+    SigV4Signer,
+)
+
+
+S3_NAMESPACE = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+# NOTE: SigV4 presigned URLs are valid for at most seven days
+MAX_PRESIGN_EXPIRES = 7 * 24 * 60 * 60
+
+
+class S3ClientError(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(f"{code}: {message} (status {status})")
+        self.status = status
+        self.code = code
+
+
+@dataclass(frozen=True)
+class UploadedPart:
+    number: int
+    etag: str
+
+
+@dataclass
+class S3ClientStats:
+    requests: int = 0
+    failures: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+
+def _find(element: ElementTree.Element, tag: str) -> str:
+    node = element.find(f"{S3_NAMESPACE}{tag}")
+    if node is None:
+        node = element.find(tag)
+    if node is None or node.text is None:
+        return ""
+    return node.text
+
+
+def _parse_error(status: int, body: bytes) -> S3ClientError:
+    try:
+        root = ElementTree.fromstring(body)
+    except ElementTree.ParseError:
+        return S3ClientError(status, "UnknownError", body[:200].decode())
+    return S3ClientError(status, _find(root, "Code"), _find(root, "Message"))
+
+
+class S3Client:
+    # NOTE: path-style S3 API over a pooled async HTTP client, so storage
+    # I/O never occupies executor threads; requests beyond
+    # `max_connections` wait for a free connection inside the pool
+    # NOTE: bodies are sent as UNSIGNED-PAYLOAD to avoid hashing every part
+    # on the event loop, integrity relies on Content-Length and TLS
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        config: S3Config,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ):
+        self._http = http_client
+        self._config = config
+        self._clock = clock
+        self._host = config.endpoint
+        self._base_url = (
+            f"{'https' if config.secure else 'http'}://{config.endpoint}"
+        )
+        self._signer = SigV4Signer(
+            config.access_key, config.secret_key, config.region
+        )
+        self._stats = S3ClientStats()
+        self._presign_cache = PresignedUrlCache(
+            config.presign_cache_size, config.presign_cache_margin
+        )
+
+    @classmethod
+    def create(cls, config: S3Config) -> Self:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_connections,
+            ),
+            timeout=httpx.Timeout(
+                config.request_timeout, pool=config.pool_timeout
+            ),
+        )
+        return cls(http_client, config)
+
+    def stats(self) -> dict[str, Any]:
+        presign = self._presign_cache.stats()
+        return {
+            "requests": self._stats.requests,
+            "failures": self._stats.failures,
+            "in_flight": self._stats.in_flight,
+            "peak_in_flight": self._stats.peak_in_flight,
+            "max_connections": self._config.max_connections,
+            "waiting": max(
+                0, self._stats.in_flight - self._config.max_connections
+            ),
+            "presign_cache_hits": presign.hits,
+            "presign_cache_misses": presign.misses,
+            "presign_cache_evictions": presign.evictions,
+            "presign_cache_size": presign.size,
+        }
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def bucket_exists(self, bucket: str) -> bool:
+        try:
+            await self._request("HEAD", f"/{bucket}")
+        except S3ClientError as e:
+            if e.status == 404:
+                return False
+            raise
+        return True
+
+    async def make_bucket(self, bucket: str) -> None:
+        await self._request("PUT", f"/{bucket}")
+
+    async def put_object(
+        self, bucket: str, key: str, data: bytes, content_type: str
+    ) -> str:
+        response = await self._request(
+            "PUT",
+            f"/{bucket}/{key}",
+            headers={"Content-Type": content_type},
+            content=data,
+        )
+        return response.headers.get("ETag", "").strip('"')
+
+    async def get_object(self, bucket: str, key: str) -> bytes:
+        response = await self._request("GET", f"/{bucket}/{key}")
+        return response.content
+
+    async def object_exists(self, bucket: str, key: str) -> bool:
+        try:
+            await self._request("HEAD", f"/{bucket}/{key}")
+        except S3ClientError as e:
+            if e.status == 404:
+                return False
+            raise
+        return True
+
+    async def get_object_range(
+        self, bucket: str, key: str, start: int, end: int
+    ) -> bytes:
+        response = await self._request(
+            "GET",
+            f"/{bucket}/{key}",
+            headers={"Range": f"bytes={start}-{end}"},
+        )
+        return response.content
+
+    async def copy_object(self, bucket: str, source: str, key: str) -> None:
+        response = await self._request(
+            "PUT",
+            f"/{bucket}/{key}",
+            headers={
+                "x-amz-copy-source": SigV4Signer.quote_path(
+                    f"/{bucket}/{source}"
+                )
+            },
+        )
+        # NOTE: like completion, a copy may fail after a 200 status line
+        self._raise_for_embedded_error(response)
+
+    async def remove_object(self, bucket: str, key: str) -> None:
+        await self._request("DELETE", f"/{bucket}/{key}")
+
+    async def create_multipart_upload(
+        self, bucket: str, key: str, content_type: str
+    ) -> str:
+        response = await self._request(
+            "POST",
+            f"/{bucket}/{key}",
+            query={"uploads": ""},
+            headers={"Content-Type": content_type},
+        )
+        return _find(ElementTree.fromstring(response.content), "UploadId")
+
+    async def upload_part(
+        self,
+        bucket: str,
+        key: str,
+        upload_id: str,
+        number: int,
+        data: bytes,
+    ) -> UploadedPart:
+        response = await self._request(
+            "PUT",
+            f"/{bucket}/{key}",
+            query={"partNumber": str(number), "uploadId": upload_id},
+            content=data,
+        )
+        return UploadedPart(number, response.headers["ETag"].strip('"'))
+
+    async def complete_multipart_upload(
+        self,
+        bucket: str,
+        key: str,
+        upload_id: str,
+        parts: Sequence[UploadedPart],
+    ) -> None:
+        body = "".join(
+            f"<Part><PartNumber>{part.number}</PartNumber>"
+            f'<ETag>"{part.etag}"</ETag></Part>'
+            for part in sorted(parts, key=lambda part: part.number)
+        )
+        response = await self._request(
+            "POST",
+            f"/{bucket}/{key}",
+            query={"uploadId": upload_id},
+            headers={"Content-Type": "application/xml"},
+            content=(
+                f"<CompleteMultipartUpload>{body}</CompleteMultipartUpload>"
+            ).encode(),
+        )
+        # NOTE: completion may fail after the 200 status line was sent
+        self._raise_for_embedded_error(response)
+
+    async def abort_multipart_upload(
+        self, bucket: str, key: str, upload_id: str
+    ) -> None:
+        await self._request(
+            "DELETE", f"/{bucket}/{key}", query={"uploadId": upload_id}
+        )
+
+    async def set_bucket_notification(
+        self, bucket: str, queue_arn: str, events: Sequence[str]
+    ) -> None:
+        body = "".join(f"<Event>{event}</Event>" for event in events)
+        await self._request(
+            "PUT",
+            f"/{bucket}",
+            query={"notification": ""},
+            headers={"Content-Type": "application/xml"},
+            content=(
+                "<NotificationConfiguration><QueueConfiguration>"
+                f"<Queue>{queue_arn}</Queue>{body}"
+                "</QueueConfiguration></NotificationConfiguration>"
+            ).encode(),
+        )
+
+    def presigned_post_policy(
+        self,
+        bucket: str,
+        key: str,
+        content_type: str,
+        max_size: int,
+        expires: timedelta,
+    ) -> tuple[str, dict[str, str]]:
+        now = self._clock()
+        fields = {
+            "key": key,
+            "Content-Type": content_type,
+            "x-amz-algorithm": ALGORITHM,
+            "x-amz-credential": self._signer.credential(now),
+            "x-amz-date": now.strftime("%Y%m%dT%H%M%SZ"),
+        }
+        policy = {
+            "expiration": (now + expires).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "conditions": [
+                {"bucket": bucket},
+                ["content-length-range", 1, max_size],
+                *({name: value} for name, value in fields.items()),
+            ],
+        }
+        encoded = base64.b64encode(
+            json.dumps(policy, separators=(",", ":")).encode()
+        ).decode()
+        fields["policy"] = encoded
+        fields["x-amz-signature"] = self._signer.sign_policy(encoded, now)
+        return f"{self._base_url}/{bucket}", fields
+
+    def presigned_get_object(
+        self, bucket: str, key: str, expires: timedelta
+    ) -> str:
+        now = self._clock()
+        signed_at, seconds = self._presign_window(now, expires)
+        window = signed_at if self._config.presign_window > 0 else None
+        cache_key = ("GET", bucket, key, seconds, window)
+        url = self._presign_cache.get(cache_key, now)
+        if url is not None:
+            return url
+
+        path = f"/{bucket}/{key}"
+        query = self._signer.presign(
+            "GET", self._host, path, {}, seconds, signed_at
+        )
+        url = f"{self._base_url}{SigV4Signer.quote_path(path)}?{query}"
+        self._presign_cache.put(
+            cache_key, url, signed_at + timedelta(seconds=seconds)
+        )
+        return url
+
+    def _presign_window(
+        self, now: datetime, expires: timedelta
+    ) -> tuple[datetime, int]:
+        seconds = int(expires.total_seconds())
+        window = self._config.presign_window
+        if window <= 0:
+            return now, seconds
+
+        # NOTE: every request within one window signs at its start, so the
+        # URL is byte-identical and browsers and CDNs can cache the object;
+        # the expiry is extended by the window so the URL handed out at the
+        # end of the window is still valid for the requested time, and for
+        # at least `presign_min_validity` seconds
+        signed_at = datetime.fromtimestamp(
+            int(now.timestamp()) // window * window, UTC
+        )
+        seconds = max(
+            seconds + window, window + self._config.presign_min_validity
+        )
+        return signed_at, min(seconds, MAX_PRESIGN_EXPIRES)
+
+    def _raise_for_embedded_error(self, response: httpx.Response) -> None:
+        root = ElementTree.fromstring(response.content)
+        if root.tag.endswith("Error"):
+            self._stats.failures += 1
+            raise _parse_error(response.status_code, response.content)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        content: bytes | None = None,
+    ) -> httpx.Response:
+        query = query or {}
+        signed = self._signer.sign_headers(
+            method,
+            path,
+            query,
+            {"Host": self._host, **(headers or {})},
+            EMPTY_PAYLOAD_HASH if content is None else UNSIGNED_PAYLOAD,
+            self._clock(),
+        )
+        url = f"{self._base_url}{SigV4Signer.quote_path(path)}"
+        if query:
+            url += "?" + "&".join(
+                f"{key}={quote(value, safe='')}" if value else key
+                for key, value in query.items()
+            )
+
+        self._stats.requests += 1
+        self._stats.in_flight += 1
+        self._stats.peak_in_flight = max(
+            self._stats.peak_in_flight, self._stats.in_flight
+        )
+        try:
+            response = await self._http.request(
+                method, url, headers=signed, content=content
+            )
+        except httpx.HTTPError:
+            self._stats.failures += 1
+            raise
+        finally:
+            self._stats.in_flight -= 1
+
+        if response.status_code >= 300:
+            self._stats.failures += 1
+            raise _parse_error(response.status_code, response.content)
+        return response
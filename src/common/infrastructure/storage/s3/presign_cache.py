@@ -0,0 +1,52 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+
+
+PresignKey = tuple[str, str, str, int, datetime | None]
+
+
+@dataclass
+class PresignCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class PresignedUrlCache:
+    # NOTE: bounded LRU of signed URLs; an entry is served only while at
+    # least `margin` seconds of its validity remain, so a client never
+    # receives a URL that is about to expire
+    def __init__(self, max_entries: int = 10_000, margin: float = 60.0):
+        self.max_entries = max_entries
+        self.margin = margin
+
+        self._entries: dict[PresignKey, tuple[str, datetime]] = {}
+        self._stats = PresignCacheStats()
+
+    def stats(self) -> PresignCacheStats:
+        return replace(self._stats, size=len(self._entries))
+
+    def get(self, key: PresignKey, now: datetime) -> str | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            url, expires_at = entry
+            if (expires_at - now).total_seconds() > self.margin:
+                # NOTE: reinserting moves the entry to the most recent end
+                self._entries[key] = entry
+                self._stats.hits += 1
+                return url
+        self._stats.misses += 1
+        return None
+
+    def put(self, key: PresignKey, url: str, expires_at: datetime) -> None:
+        if self.max_entries <= 0:
+            return
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            # NOTE: dicts keep insertion order, so this drops the oldest
+            del self._entries[next(iter(self._entries))]
+            self._stats.evictions += 1
+        self._entries[key] = (url, expires_at)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,76 @@
+import asyncio
+import contextvars
+import logging
+from dataclasses import dataclass, replace
+
+from common.application.interfaces.tasks.background_task_publisher import (
+    IBackgroundTaskPublisher,
+    TaskFactory,
+)
+
+
+@dataclass
+class BackgroundTaskStats:
+    published: int = 0
+    completed: int = 0
+    failed: int = 0
+    dropped: int = 0
+
+
+class AsyncioBackgroundTaskPublisher(IBackgroundTaskPublisher):
+    # NOTE: tasks run in an empty context so they never share the caller's
+    # unit of work, which may already be closed when the task starts
+    # NOTE: failures are logged and never propagated to the publisher
+    def __init__(self, logger: logging.Logger, max_pending: int = 1024):
+        self._logger = logger
+        self._max_pending = max_pending
+        # NOTE: the event loop keeps only weak references to tasks
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stats = BackgroundTaskStats()
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def stats(self) -> BackgroundTaskStats:
+        return replace(self._stats)
+
+    def publish(self, task: TaskFactory, name: str | None = None) -> None:
+        if self._closed or len(self._tasks) >= self._max_pending:
+            self._stats.dropped += 1
+            self._logger.warning(
+                "background task dropped", extra={"extra": {"task": name}}
+            )
+            return
+
+        created = asyncio.create_task(
+            self._run(task, name), name=name, context=contextvars.Context()
+        )
+        self._stats.published += 1
+        self._tasks.add(created)
+        created.add_done_callback(self._tasks.discard)
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        self._closed = True
+        if not self._tasks:
+            return
+
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run(self, task: TaskFactory, name: str | None) -> None:
+        try:
+            await task()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._stats.failed += 1
+            self._logger.warning(
+                "background task failed",
+                extra={"extra": {"task": name, "error": str(e)}},
+            )
+            return
+        self._stats.completed += 1
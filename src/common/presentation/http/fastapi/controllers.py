@@ -0,0 +1,20 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+from fastapi_utils.cbv import cbv
+
+from common.application.interfaces.metrics.metrics_registry import (
+    IMetricsRegistry,
+)
+
+
+metrics_router = APIRouter()
+
+
+@cbv(metrics_router)
+class MetricsController:
+    metrics_registry: IMetricsRegistry = Depends()
+
+    @metrics_router.get("/metrics")
+    async def metrics(self) -> dict[str, dict[str, Any]]:
+        return self.metrics_registry.collect()
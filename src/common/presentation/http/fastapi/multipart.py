@@ -0,0 +1,124 @@
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from fastapi import Request
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.requests import ClientDisconnect
+
+from common.application.exceptions import (
+    ContentTooLargeError,
+    InvalidContentError,
+)
+
+
+if TYPE_CHECKING:
+    from python_multipart.multipart import MultipartCallbacks
+
+
+class _FileFieldCollector:
+    def __init__(self, field: bytes):
+        self._field = field
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._name: bytes | None = None
+        self._active = False
+        self.chunks: list[bytes] = []
+        self.found = False
+        self.finished = False
+
+    def callbacks(self) -> "MultipartCallbacks":
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+    def _on_part_begin(self) -> None:
+        self._name = None
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_field.lower() == b"content-disposition":
+            _, options = parse_options_header(bytes(self._header_value))
+            self._name = options.get(b"name")
+        self._header_field.clear()
+        self._header_value.clear()
+
+    def _on_headers_finished(self) -> None:
+        self._active = not self.found and self._name == self._field
+        self.found = self.found or self._active
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._active:
+            self.chunks.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._active:
+            self._active = False
+            self.finished = True
+
+
+def _declared_length(request: Request) -> int | None:
+    try:
+        return int(request.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def stream_multipart_file(
+    request: Request, field: str, max_size: int | None = None
+) -> AsyncIterator[bytes]:
+    # NOTE: the body is parsed as it is received and only the content of
+    # `field` is yielded, so nothing is spooled to memory or disk; reading
+    # stops as soon as the field ends
+    # NOTE: `max_size` bounds the whole body; a declared Content-Length
+    # over it is rejected before anything is read, a chunked body once
+    # the received bytes cross it
+    content_type, options = parse_options_header(
+        request.headers.get("content-type")
+    )
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise InvalidContentError("Expected multipart/form-data body")
+
+    length = _declared_length(request)
+    if max_size is not None and length is not None and length > max_size:
+        raise ContentTooLargeError(max_size)
+
+    collector = _FileFieldCollector(field.encode())
+    parser = MultipartParser(boundary, collector.callbacks())
+    received = 0
+    try:
+        async for chunk in request.stream():
+            received += len(chunk)
+            if max_size is not None and received > max_size:
+                raise ContentTooLargeError(max_size)
+            parser.write(chunk)
+            data = collector.drain()
+            if data:
+                yield data
+            if collector.finished:
+                return
+    except MultipartParseError as e:
+        raise InvalidContentError("Malformed multipart body") from e
+    except ClientDisconnect as e:
+        raise InvalidContentError("Upload interrupted by client") from e
+
+    if not collector.found:
+        raise InvalidContentError(f"Missing file field '{field}'")
+    raise InvalidContentError("Incomplete multipart body")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from identity.domain.entity.user import User
@@ -8,6 +9,8 @@ class IUserRepository(ABC):
     @abstractmethod
     async def get_by_id(self, user_id: UUID) -> User: ...
     @abstractmethod
+    async def get_by_ids(self, user_ids: Sequence[UUID]) -> list[User]: ...
+    @abstractmethod
     async def exists_by_username(self, username: str) -> bool: ...
     @abstractmethod
     async def get_by_username(self, username: str) -> User: ...
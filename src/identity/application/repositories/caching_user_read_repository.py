@@ -27,3 +27,7 @@ class CachingUserReadRepository(IUserReadRepository):
 
         await self.key_value_cache.set(key, user)
         return user
+
+    async def prime(self, user: UserReadModel) -> None:
+        key = self.key_value_cache.make_key(str(user.user_id))
+        await self.key_value_cache.set(key, user)
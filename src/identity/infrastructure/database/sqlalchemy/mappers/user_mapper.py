@@ -1,3 +1,7 @@
+from typing import Any
+
+from sqlalchemy import Row
+
 from identity.application.read_models.user_read_model import UserReadModel
 from identity.domain.entity.user import User
 from identity.infrastructure.database.sqlalchemy.models.user_base import (
@@ -14,6 +18,14 @@ class UserMapper:
             password=base.password,
         )
 
+    @classmethod
+    def from_row(cls, row: Row[Any]) -> User:
+        return User(
+            user_id=row.user_id,
+            username=row.username,
+            password=row.password,
+        )
+
     @classmethod
     def to_persistence(cls, user: User) -> UserBase:
         return UserBase(
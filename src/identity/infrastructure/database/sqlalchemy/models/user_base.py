@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -9,6 +9,14 @@ from common.infrastructure.database.sqlalchemy.models.base import Base
 
 class UserBase(Base):
     __tablename__ = "users"
+    # NOTE: covers descriptor lookups so they can use index-only scans
+    __table_args__ = (
+        Index(
+            "ix_users_user_id_username",
+            "user_id",
+            postgresql_include=["username"],
+        ),
+    )
 
     user_id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True)
     username: Mapped[str] = mapped_column(String, unique=True, nullable=False)
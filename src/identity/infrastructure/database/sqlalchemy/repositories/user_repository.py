@@ -1,6 +1,7 @@
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import exists, select
+from sqlalchemy import bindparam, exists, select
 
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from identity.application.exceptions import UserNotFoundError
@@ -16,27 +17,51 @@ from identity.infrastructure.database.sqlalchemy.models.user_base import (
 )
 
 
+# NOTE: hot lookups select table columns (Core) and skip the ORM identity
+# map; statements are built once so their compiled form is reused
+USERS = UserBase.__table__
+GET_USER_BY_ID = select(*USERS.c).where(
+    USERS.c.user_id == bindparam("user_id")
+)
+GET_USER_BY_USERNAME = select(*USERS.c).where(
+    USERS.c.username == bindparam("username")
+)
+GET_USERS_BY_IDS = select(*USERS.c).where(
+    USERS.c.user_id.in_(bindparam("user_ids", expanding=True))
+)
+
+
 class UserRepository(IUserRepository):
     def __init__(self, executor: QueryExecutor) -> None:
         self.executor = executor
 
     async def get_by_id(self, user_id: UUID) -> User:
-        stmt = select(UserBase).where(UserBase.user_id == user_id)
-        user = await self.executor.execute_scalar_one(stmt)
-        if not user:
+        row = await self.executor.execute_row(
+            GET_USER_BY_ID, {"user_id": user_id}
+        )
+        if row is None:
             raise UserNotFoundError(user_id)
-        return UserMapper.to_domain(user)
+        return UserMapper.from_row(row)
+
+    async def get_by_ids(self, user_ids: Sequence[UUID]) -> list[User]:
+        if not user_ids:
+            return []
+        rows = await self.executor.execute_rows(
+            GET_USERS_BY_IDS, {"user_ids": list(user_ids)}
+        )
+        return [UserMapper.from_row(row) for row in rows]
 
     async def exists_by_username(self, username: str) -> bool:
         stmt = select(exists().where(UserBase.username == username))
         return await self.executor.execute_scalar(stmt)
 
     async def get_by_username(self, username: str) -> User:
-        stmt = select(UserBase).where(UserBase.username == username)
-        user = await self.executor.execute_scalar_one(stmt)
-        if not user:
+        row = await self.executor.execute_row(
+            GET_USER_BY_USERNAME, {"username": username}
+        )
+        if row is None:
             raise UserNotFoundError(username)
-        return UserMapper.to_domain(user)
+        return UserMapper.from_row(row)
 
     async def add(self, entity: User) -> None:
         model = UserMapper.to_persistence(entity)
@@ -3,15 +3,14 @@ from dependency_injector import containers, providers
 from common.application.interfaces.repositories.key_value_store import (
     IKeyValueStore,
 )
+from common.infrastructure.config.cache_config import CacheSerializerFormat
 from common.infrastructure.database.repositories.key_value_cache import (
     TTLKeyValueCache,
 )
 from common.infrastructure.di.container.providers import (
+    provide_cache_serializer,
     redis_key_value_store_provider,
 )
-from common.infrastructure.serializers.marshmallow.serializer import (
-    MarshmallowSerializer,
-)
 from identity.application.read_models.user_read_model import UserReadModel
 from identity.application.repositories.caching_user_read_repository import (
     CachingUserReadRepository,
@@ -34,19 +33,28 @@ from identity.infrastructure.serializers.marshmallow.shemas import (
 class IdentityContainer(containers.DeclarativeContainer):
     ttl = providers.Dependency()
     namespace = providers.Dependency()
+    serializer_format = providers.Dependency(
+        instance_of=CacheSerializerFormat,
+        default=CacheSerializerFormat.ORJSON,
+    )
 
     uuid_generator = providers.Dependency()
     query_executor = providers.Dependency()
+    read_only_query_executor = providers.Dependency()
     redis = providers.Dependency()
+    redis_circuit_breaker = providers.Dependency()
 
     user_factory = providers.Singleton(UserFactory, uuid_generator)
     user_repository = providers.Singleton(UserRepository, query_executor)
     user_read_repository = providers.Singleton(
-        UserReadRepository, query_executor
+        UserReadRepository, read_only_query_executor
     )
 
     user_read_model_serializer = providers.Singleton(
-        MarshmallowSerializer[UserReadModel], UserReadModelSchema()
+        provide_cache_serializer,
+        model=UserReadModel,
+        schema=UserReadModelSchema(),
+        serializer_format=serializer_format,
     )
 
     key_value_store: providers.Singleton[IKeyValueStore[UserReadModel]] = (
@@ -55,6 +63,7 @@ class IdentityContainer(containers.DeclarativeContainer):
             redis=redis,
             serializer=user_read_model_serializer,
             namespace=namespace,
+            breaker=redis_circuit_breaker,
         )
     )
 
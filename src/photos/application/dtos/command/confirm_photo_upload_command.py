@@ -0,0 +1,6 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ConfirmPhotoUploadCommand:
+    name: str
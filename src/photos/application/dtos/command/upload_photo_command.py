@@ -1,7 +1,7 @@
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from typing import BinaryIO
 
 
 @dataclass(frozen=True)
 class UploadPhotoCommand:
-    content: BinaryIO
+    content: AsyncIterator[bytes]
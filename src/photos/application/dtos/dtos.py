@@ -1,7 +1,76 @@
+import base64
+import binascii
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
+from photos.application.exceptions import InvalidPhotoCursorError
+from photos.domain.entity.photo import Photo
 
 
 @dataclass(frozen=True)
 class FileType:
     extension: str
     mime: str
+
+
+@dataclass(frozen=True)
+class UploadPolicy:
+    url: str
+    fields: dict[str, str]
+
+
+@dataclass(frozen=True)
+class PhotoUploadDTO:
+    name: str
+    url: str
+    fields: dict[str, str]
+
+
+@dataclass(frozen=True)
+class PhotoCursor:
+    # NOTE: keyset position, the next page starts strictly after it
+    created_at: datetime
+    photo_id: UUID
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.photo_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> Self:
+        try:
+            raw = base64.urlsafe_b64decode(value.encode()).decode()
+            created_at, photo_id = raw.split("|")
+            return cls(
+                created_at=datetime.fromisoformat(created_at),
+                photo_id=UUID(photo_id),
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidPhotoCursorError(value) from e
+
+
+@dataclass(frozen=True)
+class PhotoPage:
+    photos: list[Photo]
+    next_cursor: PhotoCursor | None
+
+
+@dataclass(frozen=True)
+class PhotoDTO:
+    name: str
+    mime: str
+    url: str
+
+
+@dataclass(frozen=True)
+class PhotoPageDTO:
+    photos: list[PhotoDTO]
+    next_cursor: str | None
+
+
+@dataclass(frozen=True)
+class PresignedUrlDTO:
+    name: str
+    url: str
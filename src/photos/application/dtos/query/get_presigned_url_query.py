@@ -4,3 +4,4 @@ from dataclasses import dataclass
 @dataclass(frozen=True)
 class GetPresignedUrlQuery:
     name: str
+    variant: str | None = None
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ListPhotosQuery:
+    limit: int
+    cursor: str | None = None
@@ -4,3 +4,24 @@ from common.application.exceptions import ApplicationError
 class InvalidFileTypeError(ApplicationError):
     def __init__(self, message: str = "File type cannot be determined"):
         super().__init__(message)
+
+
+class InvalidUploadSizeError(ApplicationError):
+    def __init__(self, size: int, max_size: int):
+        super().__init__(
+            f"Upload size must be between 1 and {max_size} bytes, got {size}"
+        )
+        self.size = size
+        self.max_size = max_size
+
+
+class InvalidPhotoCursorError(ApplicationError):
+    def __init__(self, cursor: str):
+        super().__init__(f"Invalid photo cursor: {cursor}")
+        self.cursor = cursor
+
+
+class UnknownPhotoVariantError(ApplicationError):
+    def __init__(self, variant: str):
+        super().__init__(f"Unknown photo variant: {variant}")
+        self.variant = variant
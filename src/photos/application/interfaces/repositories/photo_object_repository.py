@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class IPhotoObjectRepository(ABC):
+    # NOTE: returns the reference count after adding one, 1 means the
+    # object is new and still has to be stored
+    @abstractmethod
+    async def acquire(self, name: str) -> int: ...
@@ -1,15 +1,30 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterable, Sequence
 from datetime import timedelta
-from typing import BinaryIO
+
+from photos.application.dtos.dtos import UploadPolicy
 
 
 class IPhotoRepository(ABC):
     @abstractmethod
     async def upload_photo(
-        self, name: str, mime: str, data: BinaryIO
+        self, name: str, mime: str, data: AsyncIterable[bytes]
     ) -> None: ...
     @abstractmethod
+    async def create_upload_policy(
+        self, name: str, mime: str, max_size: int, expires_in: timedelta
+    ) -> UploadPolicy: ...
+    @abstractmethod
+    async def read_head(self, name: str, size: int) -> bytes: ...
+    @abstractmethod
+    async def download_photo(self, name: str) -> bytes: ...
+    @abstractmethod
+    async def photo_exists(self, name: str) -> bool: ...
+    @abstractmethod
+    async def copy_photo(self, source: str, name: str) -> None: ...
+    @abstractmethod
+    async def delete_photo(self, name: str) -> None: ...
+    @abstractmethod
     async def get_presigned_get_url(
         self, name: str, expires_in: timedelta
     ) -> str: ...
@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from photos.application.dtos.dtos import PhotoCursor, PhotoPage
 from photos.domain.entity.photo import Photo
 
 
 class IUserPhotoRepository(ABC):
+    @abstractmethod
+    async def get_by_id(
+        self, photo_id: UUID, lock: bool = False
+    ) -> Photo: ...
+    @abstractmethod
+    async def exists_active(self, name: str) -> bool: ...
     @abstractmethod
     async def add(self, entity: Photo) -> None: ...
     @abstractmethod
+    async def save(self, entity: Photo) -> None: ...
+    @abstractmethod
     async def list_by_user_id(self, user_id: UUID) -> list[Photo]: ...
+    @abstractmethod
+    async def list_page_by_user_id(
+        self, user_id: UUID, limit: int, after: PhotoCursor | None = None
+    ) -> PhotoPage: ...
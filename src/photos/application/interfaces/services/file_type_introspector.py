@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO
 
 from photos.application.dtos.dtos import FileType
 
 
 class IFileTypeIntrospector(ABC):
+    @property
     @abstractmethod
-    def extract(self, data: BinaryIO) -> FileType: ...
+    def head_size(self) -> int: ...
+    @abstractmethod
+    def extract(self, head: bytes) -> FileType: ...
+    @abstractmethod
+    def from_mime(self, mime: str) -> FileType: ...
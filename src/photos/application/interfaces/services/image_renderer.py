@@ -0,0 +1,6 @@
+from abc import ABC, abstractmethod
+
+
+class IImageRenderer(ABC):
+    @abstractmethod
+    async def render(self, data: bytes, max_size: int) -> bytes: ...
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class IPhotoVariantService(ABC):
+    @abstractmethod
+    async def ensure(self, name: str, variant: str) -> str: ...
+    @abstractmethod
+    def schedule(self, name: str) -> None: ...
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from photos.application.dtos.command.confirm_photo_upload_command import (
+    ConfirmPhotoUploadCommand,
+)
+from photos.domain.value_objects.photo_status import PhotoStatus
+
+
+class IConfirmPhotoUploadUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self, command: ConfirmPhotoUploadCommand
+    ) -> PhotoStatus: ...
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.command.request_photo_upload_command import (
+    RequestPhotoUploadCommand,
+)
+from photos.application.dtos.dtos import PhotoUploadDTO
+
+
+class IRequestPhotoUploadUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self, command: RequestPhotoUploadCommand, descriptor: UserDescriptor
+    ) -> PhotoUploadDTO: ...
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from photos.application.dtos.dtos import PresignedUrlDTO
+from photos.application.dtos.query.get_presigned_urls_query import (
+    GetPresignedUrlsQuery,
+)
+
+
+class IGetPresignedUrlsUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self, query: GetPresignedUrlsQuery
+    ) -> list[PresignedUrlDTO]: ...
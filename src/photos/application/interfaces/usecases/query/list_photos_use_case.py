@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.dtos import PhotoPageDTO
+from photos.application.dtos.query.list_photos_query import ListPhotosQuery
+
+
+class IListPhotosUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self, query: ListPhotosQuery, descriptor: UserDescriptor
+    ) -> PhotoPageDTO: ...
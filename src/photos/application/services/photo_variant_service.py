@@ -0,0 +1,113 @@
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from functools import partial
+
+from common.application.exceptions import NotFoundError
+from common.application.interfaces.tasks.background_task_publisher import (
+    IBackgroundTaskPublisher,
+)
+from photos.application.exceptions import UnknownPhotoVariantError
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.image_renderer import (
+    IImageRenderer,
+)
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
+from photos.domain.exceptions import InvalidPhotoNameError
+from photos.domain.value_objects.photo_variant import PhotoVariant
+
+
+async def _once(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+class PhotoVariantService(IPhotoVariantService):
+    # NOTE: a variant is rendered once and kept in storage, later requests
+    # only check that the object exists; concurrent requests for the same
+    # missing variant share one render
+    # NOTE: only names of active photos are rendered, so variants cannot be
+    # derived from other variants or from unconfirmed direct uploads
+    def __init__(
+        self,
+        photo_repository: IPhotoRepository,
+        user_photo_repository: IUserPhotoRepository,
+        image_renderer: IImageRenderer,
+        task_publisher: IBackgroundTaskPublisher,
+        variants: Sequence[PhotoVariant],
+        eager: bool = False,
+    ) -> None:
+        self.photo_repository = photo_repository
+        self.user_photo_repository = user_photo_repository
+        self.image_renderer = image_renderer
+        self.task_publisher = task_publisher
+        self.variants = {variant.name: variant for variant in variants}
+        self.eager = eager
+
+        self._rendering: dict[str, asyncio.Task[None]] = {}
+
+    async def ensure(self, name: str, variant: str) -> str:
+        preset = self.variants.get(variant)
+        if preset is None:
+            raise UnknownPhotoVariantError(variant)
+        if PhotoVariant.is_variant_name(name):
+            raise InvalidPhotoNameError(name)
+        if not await self.user_photo_repository.exists_active(name):
+            raise NotFoundError(name)
+
+        object_name = preset.object_name(name)
+        if await self.photo_repository.photo_exists(object_name):
+            return object_name
+
+        task = self._rendering.get(object_name)
+        if task is None:
+            task = asyncio.create_task(self._render(name, [preset]))
+            self._rendering[object_name] = task
+            task.add_done_callback(partial(self._forget, object_name))
+        # NOTE: a disconnecting client must not cancel a shared render
+        await asyncio.shield(task)
+        return object_name
+
+    def schedule(self, name: str) -> None:
+        if not self.eager or not self.variants:
+            return
+        self.task_publisher.publish(
+            partial(self._render_missing, name), name="render_photo_variants"
+        )
+
+    def _forget(self, object_name: str, task: asyncio.Task[None]) -> None:
+        self._rendering.pop(object_name, None)
+        if not task.cancelled():
+            # NOTE: retrieves the error even when every waiter has left
+            task.exception()
+
+    async def _render_missing(self, name: str) -> None:
+        # NOTE: deduplicated uploads may already have every variant
+        missing = [
+            variant
+            for variant in self.variants.values()
+            if not await self.photo_repository.photo_exists(
+                variant.object_name(name)
+            )
+        ]
+        if missing:
+            await self._render(name, missing)
+
+    async def _render(
+        self, name: str, variants: Sequence[PhotoVariant]
+    ) -> None:
+        original = await self.photo_repository.download_photo(name)
+        for variant in variants:
+            data = await self.image_renderer.render(
+                original, variant.max_size
+            )
+            await self.photo_repository.upload_photo(
+                name=variant.object_name(name),
+                mime=variant.mime,
+                data=_once(data),
+            )
@@ -0,0 +1,65 @@
+from common.application.exceptions import NotFoundError
+from photos.application.dtos.command.confirm_photo_upload_command import (
+    ConfirmPhotoUploadCommand,
+)
+from photos.application.exceptions import InvalidFileTypeError
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.file_type_introspector import (
+    IFileTypeIntrospector,
+)
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
+from photos.application.interfaces.usecases.command.confirm_photo_upload_use_case import (
+    IConfirmPhotoUploadUseCase,
+)
+from photos.domain.entity.photo import Photo
+from photos.domain.value_objects.photo_status import PhotoStatus
+
+
+class ConfirmPhotoUploadUseCase(IConfirmPhotoUploadUseCase):
+    def __init__(
+        self,
+        photo_repository: IPhotoRepository,
+        user_photo_repository: IUserPhotoRepository,
+        file_type_introspector: IFileTypeIntrospector,
+        photo_variant_service: IPhotoVariantService,
+    ) -> None:
+        self.photo_repository = photo_repository
+        self.user_photo_repository = user_photo_repository
+        self.file_type_introspector = file_type_introspector
+        self.photo_variant_service = photo_variant_service
+
+    async def execute(self, command: ConfirmPhotoUploadCommand) -> PhotoStatus:
+        photo = await self.user_photo_repository.get_by_id(
+            Photo.id_from_name(command.name), lock=True
+        )
+        # NOTE: notifications are delivered at least once
+        if not photo.is_pending():
+            return photo.status
+
+        if await self._has_declared_type(photo):
+            photo.activate()
+        else:
+            photo.reject()
+            await self.photo_repository.delete_photo(photo.name)
+
+        await self.user_photo_repository.save(photo)
+        if photo.status == PhotoStatus.ACTIVE:
+            self.photo_variant_service.schedule(photo.name)
+        return photo.status
+
+    async def _has_declared_type(self, photo: Photo) -> bool:
+        try:
+            head = await self.photo_repository.read_head(
+                photo.name, self.file_type_introspector.head_size
+            )
+            file_type = self.file_type_introspector.extract(head)
+        except (NotFoundError, InvalidFileTypeError):
+            return False
+        return file_type.mime == photo.mime
@@ -0,0 +1,106 @@
+import hashlib
+from collections.abc import AsyncIterator, Callable
+
+from photos.application.interfaces.repositories.photo_object_repository import (
+    IPhotoObjectRepository,
+)
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.file_type_introspector import (
+    IFileTypeIntrospector,
+)
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
+from photos.application.usecases.command.upload_photo_use_case import (
+    UploadPhotoUseCase,
+)
+from photos.domain.entity.photo import Photo
+from photos.domain.interfaces.photo_factory import IPhotoFactory
+
+
+async def _buffer(
+    chunks: AsyncIterator[bytes], limit: int
+) -> tuple[bytes, bool]:
+    data = bytearray()
+    while len(data) <= limit:
+        try:
+            data += await anext(chunks)
+        except StopAsyncIteration:
+            return bytes(data), True
+    return bytes(data), False
+
+
+async def _once(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+async def _hashing(
+    head: bytes,
+    chunks: AsyncIterator[bytes],
+    update: Callable[[bytes], None],
+) -> AsyncIterator[bytes]:
+    yield head
+    async for chunk in chunks:
+        update(chunk)
+        yield chunk
+
+
+class DeduplicatingUploadPhotoUseCase(UploadPhotoUseCase):
+    # NOTE: photos are stored under the SHA-256 of their content. Content
+    # that fits in `buffer_size` is hashed before anything is written, so
+    # a duplicate never reaches storage; larger content is streamed to a
+    # staging object while hashed and copied server side only when new
+    # NOTE: the reference row stays locked until the request commits, so
+    # a concurrent duplicate waits for the first upload to finish
+    def __init__(
+        self,
+        photo_factory: IPhotoFactory,
+        photo_repository: IPhotoRepository,
+        user_photo_repository: IUserPhotoRepository,
+        photo_object_repository: IPhotoObjectRepository,
+        file_type_introspector: IFileTypeIntrospector,
+        photo_variant_service: IPhotoVariantService,
+        max_size: int,
+        buffer_size: int,
+    ) -> None:
+        super().__init__(
+            photo_factory,
+            photo_repository,
+            user_photo_repository,
+            file_type_introspector,
+            photo_variant_service,
+            max_size,
+        )
+        self.photo_object_repository = photo_object_repository
+        self.buffer_size = buffer_size
+
+    async def _store(
+        self, photo: Photo, content: AsyncIterator[bytes]
+    ) -> None:
+        head, complete = await _buffer(content, self.buffer_size)
+        digest = hashlib.sha256(head)
+        if complete:
+            photo.address_by_content(digest.hexdigest())
+            if await self.photo_object_repository.acquire(photo.name) == 1:
+                await self.photo_repository.upload_photo(
+                    name=photo.name, mime=photo.mime, data=_once(head)
+                )
+            return
+
+        staging = photo.name
+        await self.photo_repository.upload_photo(
+            name=staging,
+            mime=photo.mime,
+            data=_hashing(head, content, digest.update),
+        )
+        photo.address_by_content(digest.hexdigest())
+        try:
+            if await self.photo_object_repository.acquire(photo.name) == 1:
+                await self.photo_repository.copy_photo(staging, photo.name)
+        finally:
+            await self.photo_repository.delete_photo(staging)
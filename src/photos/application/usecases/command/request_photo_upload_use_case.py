@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.command.request_photo_upload_command import (
+    RequestPhotoUploadCommand,
+)
+from photos.application.dtos.dtos import PhotoUploadDTO
+from photos.application.exceptions import InvalidUploadSizeError
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.file_type_introspector import (
+    IFileTypeIntrospector,
+)
+from photos.application.interfaces.usecases.command.request_photo_upload_use_case import (
+    IRequestPhotoUploadUseCase,
+)
+from photos.domain.interfaces.photo_factory import IPhotoFactory
+
+
+class RequestPhotoUploadUseCase(IRequestPhotoUploadUseCase):
+    def __init__(
+        self,
+        photo_factory: IPhotoFactory,
+        photo_repository: IPhotoRepository,
+        user_photo_repository: IUserPhotoRepository,
+        file_type_introspector: IFileTypeIntrospector,
+        max_size: int,
+        expiration_delta: timedelta,
+    ) -> None:
+        self.photo_factory = photo_factory
+        self.photo_repository = photo_repository
+        self.user_photo_repository = user_photo_repository
+        self.file_type_introspector = file_type_introspector
+        self.max_size = max_size
+        self.expiration_delta = expiration_delta
+
+    async def execute(
+        self, command: RequestPhotoUploadCommand, descriptor: UserDescriptor
+    ) -> PhotoUploadDTO:
+        if not 0 < command.size <= self.max_size:
+            raise InvalidUploadSizeError(command.size, self.max_size)
+
+        file_type = self.file_type_introspector.from_mime(command.mime)
+        photo = self.photo_factory.create_pending(
+            descriptor.user_id,
+            extension=file_type.extension,
+            mime=file_type.mime,
+        )
+        await self.user_photo_repository.add(photo)
+
+        # NOTE: the client uploads straight to storage, the declared size
+        # and content type are enforced by the signed policy
+        policy = await self.photo_repository.create_upload_policy(
+            photo.name, photo.mime, command.size, self.expiration_delta
+        )
+        return PhotoUploadDTO(
+            name=photo.name, url=policy.url, fields=policy.fields
+        )
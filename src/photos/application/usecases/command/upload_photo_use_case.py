@@ -1,7 +1,10 @@
+from collections.abc import AsyncIterator
+
 from identity.domain.value_objects.descriptor import UserDescriptor
 from photos.application.dtos.command.upload_photo_command import (
     UploadPhotoCommand,
 )
+from photos.application.exceptions import InvalidUploadSizeError
 from photos.application.interfaces.repositories.photo_repository import (
     IPhotoRepository,
 )
@@ -11,12 +14,46 @@ from photos.application.interfaces.repositories.user_photo_repository import (
 from photos.application.interfaces.services.file_type_introspector import (
     IFileTypeIntrospector,
 )
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
 from photos.application.interfaces.usecases.command.upload_photo_use_case import (
     IUploadPhotoUseCase,
 )
+from photos.domain.entity.photo import Photo
 from photos.domain.interfaces.photo_factory import IPhotoFactory
 
 
+async def _read_head(chunks: AsyncIterator[bytes], size: int) -> bytes:
+    head = bytearray()
+    while len(head) < size:
+        try:
+            head += await anext(chunks)
+        except StopAsyncIteration:
+            break
+    return bytes(head)
+
+
+async def _prepend(
+    head: bytes, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    if head:
+        yield head
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _limit(
+    chunks: AsyncIterator[bytes], max_size: int
+) -> AsyncIterator[bytes]:
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > max_size:
+            raise InvalidUploadSizeError(size, max_size)
+        yield chunk
+
+
 class UploadPhotoUseCase(IUploadPhotoUseCase):
     def __init__(
         self,
@@ -24,16 +61,25 @@ class UploadPhotoUseCase(IUploadPhotoUseCase):
         photo_repository: IPhotoRepository,
         user_photo_repository: IUserPhotoRepository,
         file_type_introspector: IFileTypeIntrospector,
+        photo_variant_service: IPhotoVariantService,
+        max_size: int,
     ) -> None:
         self.photo_factory = photo_factory
         self.photo_repository = photo_repository
         self.user_photo_repository = user_photo_repository
         self.file_type_introspector = file_type_introspector
+        self.photo_variant_service = photo_variant_service
+        self.max_size = max_size
 
     async def execute(
         self, command: UploadPhotoCommand, descriptor: UserDescriptor
     ) -> str:
-        file_type = self.file_type_introspector.extract(command.content)
+        # NOTE: the type is sniffed from the first bytes, the rest of the
+        # content is streamed to storage without being buffered
+        head = await _read_head(
+            command.content, self.file_type_introspector.head_size
+        )
+        file_type = self.file_type_introspector.extract(head)
 
         photo = self.photo_factory.create(
             descriptor.user_id,
@@ -41,10 +87,20 @@ class UploadPhotoUseCase(IUploadPhotoUseCase):
             mime=file_type.mime,
         )
 
-        await self.photo_repository.upload_photo(
-            name=photo.name, mime=photo.mime, data=command.content
+        # NOTE: oversized content fails mid-stream, which aborts the
+        # storage upload before the rest of the body is read
+        await self._store(
+            photo, _limit(_prepend(head, command.content), self.max_size)
         )
-        # NOTE: Consider implementing event driven model with PUT presigned urls and storage side callbacks"
+        # NOTE: RequestPhotoUploadUseCase lets clients skip the API entirely
         await self.user_photo_repository.add(photo)
+        self.photo_variant_service.schedule(photo.name)
 
         return photo.name
+
+    async def _store(
+        self, photo: Photo, content: AsyncIterator[bytes]
+    ) -> None:
+        await self.photo_repository.upload_photo(
+            name=photo.name, mime=photo.mime, data=content
+        )
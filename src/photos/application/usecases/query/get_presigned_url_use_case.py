@@ -6,6 +6,9 @@ from photos.application.dtos.query.get_presigned_url_query import (
 from photos.application.interfaces.repositories.photo_repository import (
     IPhotoRepository,
 )
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
 from photos.application.interfaces.usecases.query.get_presigned_url_use_case import (
     IGetPresignedUrlUseCase,
 )
@@ -13,12 +16,19 @@ from photos.application.interfaces.usecases.query.get_presigned_url_use_case imp
 
 class GetPresignedUrlUseCase(IGetPresignedUrlUseCase):
     def __init__(
-        self, photo_repository: IPhotoRepository, expiration_delta: timedelta
+        self,
+        photo_repository: IPhotoRepository,
+        photo_variant_service: IPhotoVariantService,
+        expiration_delta: timedelta,
     ) -> None:
         self.photo_repository = photo_repository
+        self.photo_variant_service = photo_variant_service
         self.expiration_delta = expiration_delta
 
     async def execute(self, query: GetPresignedUrlQuery) -> str:
+        name = query.name
+        if query.variant is not None:
+            name = await self.photo_variant_service.ensure(name, query.variant)
         return await self.photo_repository.get_presigned_get_url(
-            query.name, self.expiration_delta
+            name, self.expiration_delta
         )
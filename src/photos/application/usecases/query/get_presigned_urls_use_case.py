@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from photos.application.dtos.dtos import PresignedUrlDTO
+from photos.application.dtos.query.get_presigned_urls_query import (
+    GetPresignedUrlsQuery,
+)
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.usecases.query.get_presigned_urls_use_case import (
+    IGetPresignedUrlsUseCase,
+)
+
+
+class GetPresignedUrlsUseCase(IGetPresignedUrlsUseCase):
+    def __init__(
+        self, photo_repository: IPhotoRepository, expiration_delta: timedelta
+    ) -> None:
+        self.photo_repository = photo_repository
+        self.expiration_delta = expiration_delta
+
+    async def execute(
+        self, query: GetPresignedUrlsQuery
+    ) -> list[PresignedUrlDTO]:
+        urls = await self.photo_repository.get_presigned_get_urls(
+            query.names, self.expiration_delta
+        )
+        return [
+            PresignedUrlDTO(name=name, url=url)
+            for name, url in zip(query.names, urls, strict=True)
+        ]
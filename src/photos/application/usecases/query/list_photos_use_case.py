@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.dtos import PhotoCursor, PhotoDTO, PhotoPageDTO
+from photos.application.dtos.query.list_photos_query import ListPhotosQuery
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.usecases.query.list_photos_use_case import (
+    IListPhotosUseCase,
+)
+
+
+class ListPhotosUseCase(IListPhotosUseCase):
+    def __init__(
+        self,
+        photo_repository: IPhotoRepository,
+        user_photo_repository: IUserPhotoRepository,
+        expiration_delta: timedelta,
+    ) -> None:
+        self.photo_repository = photo_repository
+        self.user_photo_repository = user_photo_repository
+        self.expiration_delta = expiration_delta
+
+    async def execute(
+        self, query: ListPhotosQuery, descriptor: UserDescriptor
+    ) -> PhotoPageDTO:
+        after = PhotoCursor.decode(query.cursor) if query.cursor else None
+        page = await self.user_photo_repository.list_page_by_user_id(
+            descriptor.user_id, query.limit, after
+        )
+        # NOTE: the whole page is signed in one batch
+        urls = await self.photo_repository.get_presigned_get_urls(
+            [photo.name for photo in page.photos], self.expiration_delta
+        )
+        next_cursor = page.next_cursor
+        return PhotoPageDTO(
+            photos=[
+                PhotoDTO(name=photo.name, mime=photo.mime, url=url)
+                for photo, url in zip(page.photos, urls, strict=True)
+            ],
+            next_cursor=next_cursor.encode() if next_cursor else None,
+        )
@@ -1,7 +1,12 @@
 from dataclasses import dataclass
+from pathlib import PurePosixPath
 from typing import Self
 from uuid import UUID
 
+from common.domain.exceptions import InvariantViolationError
+from photos.domain.exceptions import InvalidPhotoNameError
+from photos.domain.value_objects.photo_status import PhotoStatus
+
 
 @dataclass
 class Photo:
@@ -9,14 +14,49 @@ class Photo:
     user_id: UUID
     name: str
     mime: str
+    status: PhotoStatus = PhotoStatus.ACTIVE
 
     @classmethod
     def create(
-        cls, photo_id: UUID, user_id: UUID, extension: str, mime: str
+        cls,
+        photo_id: UUID,
+        user_id: UUID,
+        extension: str,
+        mime: str,
+        status: PhotoStatus = PhotoStatus.ACTIVE,
     ) -> Self:
         return cls(
             photo_id=photo_id,
             user_id=user_id,
             name=f"{photo_id}.{extension}",
             mime=mime,
+            status=status,
         )
+
+    @staticmethod
+    def id_from_name(name: str) -> UUID:
+        try:
+            return UUID(PurePosixPath(name).stem)
+        except ValueError as e:
+            raise InvalidPhotoNameError(name) from e
+
+    def address_by_content(self, digest: str) -> None:
+        # NOTE: identical content shares one object, keyed by its digest
+        self.name = f"{digest}{PurePosixPath(self.name).suffix}"
+
+    def is_pending(self) -> bool:
+        return self.status == PhotoStatus.PENDING
+
+    def activate(self) -> None:
+        self._ensure_pending()
+        self.status = PhotoStatus.ACTIVE
+
+    def reject(self) -> None:
+        self._ensure_pending()
+        self.status = PhotoStatus.REJECTED
+
+    def _ensure_pending(self) -> None:
+        if not self.is_pending():
+            raise InvariantViolationError(
+                f"Photo {self.photo_id} is already {self.status.value}"
+            )
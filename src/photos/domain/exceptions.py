@@ -4,3 +4,8 @@ from common.domain.exceptions import DomainError
 class InvalidExtensionTypeError(DomainError):
     def __init__(self, ext: str) -> None:
         super().__init__(f"Invalid file extension type: {ext}")
+
+
+class InvalidPhotoNameError(DomainError):
+    def __init__(self, name: str) -> None:
+        super().__init__(f"Invalid photo name: {name}")
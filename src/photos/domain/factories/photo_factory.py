@@ -5,6 +5,7 @@ from photos.domain.entity.photo import Photo
 from photos.domain.exceptions import InvalidExtensionTypeError
 from photos.domain.interfaces.extenstion_policy import IExtensionPolicy
 from photos.domain.interfaces.photo_factory import IPhotoFactory
+from photos.domain.value_objects.photo_status import PhotoStatus
 
 
 class PhotoFactory(IPhotoFactory):
@@ -15,9 +16,19 @@ class PhotoFactory(IPhotoFactory):
         self.ext_policy = ext_policy
 
     def create(self, user_id: UUID, extension: str, mime: str) -> Photo:
+        return self._create(user_id, extension, mime, PhotoStatus.ACTIVE)
+
+    def create_pending(
+        self, user_id: UUID, extension: str, mime: str
+    ) -> Photo:
+        return self._create(user_id, extension, mime, PhotoStatus.PENDING)
+
+    def _create(
+        self, user_id: UUID, extension: str, mime: str, status: PhotoStatus
+    ) -> Photo:
         if not self.ext_policy.is_allowed(extension):
             raise InvalidExtensionTypeError(extension)
 
         return Photo.create(
-            self.uuid_generator.create(), user_id, extension, mime
+            self.uuid_generator.create(), user_id, extension, mime, status
         )
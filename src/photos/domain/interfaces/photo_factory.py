@@ -7,3 +7,7 @@ from photos.domain.entity.photo import Photo
 class IPhotoFactory(ABC):
     @abstractmethod
     def create(self, user_id: UUID, extension: str, mime: str) -> Photo: ...
+    @abstractmethod
+    def create_pending(
+        self, user_id: UUID, extension: str, mime: str
+    ) -> Photo: ...
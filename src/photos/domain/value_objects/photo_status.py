@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class PhotoStatus(str, Enum):
+    PENDING = "pending"
+    ACTIVE = "active"
+    REJECTED = "rejected"
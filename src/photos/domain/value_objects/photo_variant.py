@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PhotoVariant:
+    name: str
+    max_size: int
+
+    mime = "image/webp"
+    prefix = "variants/"
+
+    def object_name(self, photo_name: str) -> str:
+        # NOTE: the original name is kept whole, so a variant never parses
+        # as a photo id when storage notifications report it
+        return f"{self.prefix}{self.name}/{photo_name}.webp"
+
+    @classmethod
+    def is_variant_name(cls, name: str) -> bool:
+        return name.startswith(cls.prefix)
@@ -2,17 +2,33 @@ from typing import ClassVar
 
 from common.infrastructure.app.http_app import IHTTPApp
 from common.infrastructure.server.fastapi.server import FastAPIServer
+from photos.application.interfaces.usecases.command.confirm_photo_upload_use_case import (
+    IConfirmPhotoUploadUseCase,
+)
+from photos.application.interfaces.usecases.command.request_photo_upload_use_case import (
+    IRequestPhotoUploadUseCase,
+)
 from photos.application.interfaces.usecases.command.upload_photo_use_case import (
     IUploadPhotoUseCase,
 )
 from photos.application.interfaces.usecases.query.get_presigned_url_use_case import (
     IGetPresignedUrlUseCase,
 )
+from photos.application.interfaces.usecases.query.get_presigned_urls_use_case import (
+    IGetPresignedUrlsUseCase,
+)
+from photos.application.interfaces.usecases.query.list_photos_use_case import (
+    IListPhotosUseCase,
+)
 from photos.infrastructure.di.container.container import PhotoContainer
 from photos.presentation.http.fastapi.controllers import (
+    collection_router,
     command_router,
     query_router,
+    webhook_router,
 )
+from photos.presentation.http.fastapi.upload_limit import UploadBodyLimit
+from photos.presentation.http.fastapi.webhook import StorageWebhookVerifier
 
 
 class PhotosApp(IHTTPApp):
@@ -31,11 +47,39 @@ class PhotosApp(IHTTPApp):
         self.server.override_dependency(
             IUploadPhotoUseCase, self.container.upload_photo_use_case()
         )
+        self.server.override_dependency(
+            UploadBodyLimit,
+            UploadBodyLimit(
+                self.container.max_upload_size(),
+                self.container.max_upload_body_overhead(),
+            ),
+        )
+        self.server.override_dependency(
+            IRequestPhotoUploadUseCase,
+            self.container.request_photo_upload_use_case(),
+        )
+        self.server.override_dependency(
+            IConfirmPhotoUploadUseCase,
+            self.container.confirm_photo_upload_use_case(),
+        )
+        self.server.override_dependency(
+            StorageWebhookVerifier,
+            StorageWebhookVerifier(self.container.storage_webhook_token()),
+        )
         self.server.override_dependency(
             IGetPresignedUrlUseCase,
             self.container.get_presigned_url_use_case(),
         )
+        self.server.override_dependency(
+            IGetPresignedUrlsUseCase,
+            self.container.get_presigned_urls_use_case(),
+        )
+        self.server.override_dependency(
+            IListPhotosUseCase, self.container.list_photos_use_case()
+        )
 
     def register_routers(self) -> None:
         self.server.register_router(query_router, self.prefix, self.tags)
         self.server.register_router(command_router, self.prefix, self.tags)
+        self.server.register_router(webhook_router, self.prefix, self.tags)
+        self.server.register_router(collection_router, "", self.tags)
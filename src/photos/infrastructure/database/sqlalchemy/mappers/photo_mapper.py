@@ -1,4 +1,5 @@
 from photos.domain.entity.photo import Photo
+from photos.domain.value_objects.photo_status import PhotoStatus
 from photos.infrastructure.database.sqlalchemy.models.photo_base import (
     PhotoBase,
 )
@@ -12,6 +13,7 @@ class PhotoMapper:
             user_id=base.user_id,
             name=base.name,
             mime=base.mime,
+            status=PhotoStatus(base.status),
         )
 
     @classmethod
@@ -21,4 +23,5 @@ class PhotoMapper:
             user_id=photo.user_id,
             name=photo.name,
             mime=photo.mime,
+            status=photo.status.value,
         )
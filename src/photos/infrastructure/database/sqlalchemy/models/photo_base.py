@@ -1,21 +1,38 @@
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from common.infrastructure.database.sqlalchemy.models.base import Base
+from photos.domain.value_objects.photo_status import PhotoStatus
 
 
 class PhotoBase(Base):
     __tablename__ = "photos"
+    # NOTE: serves both lookups by user and keyset pagination; the name
+    # index backs the object-name checks before rendering variants
+    __table_args__ = (
+        Index(
+            "ix_photos_user_id_created_at_photo_id",
+            "user_id",
+            "created_at",
+            "photo_id",
+        ),
+        Index("ix_photos_name", "name"),
+    )
 
     photo_id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True)
     user_id: Mapped[UUID] = mapped_column(
         PGUUID,
         ForeignKey("users.user_id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: Mapped[str] = mapped_column(String, nullable=False)
     mime: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default=PhotoStatus.ACTIVE.value,
+        server_default=PhotoStatus.ACTIVE.value,
+    )
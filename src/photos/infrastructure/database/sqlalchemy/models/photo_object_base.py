@@ -0,0 +1,11 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from common.infrastructure.database.sqlalchemy.models.base import Base
+
+
+class PhotoObjectBase(Base):
+    __tablename__ = "photo_objects"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    refcount: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,31 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from photos.application.interfaces.repositories.photo_object_repository import (
+    IPhotoObjectRepository,
+)
+from photos.infrastructure.database.sqlalchemy.models.photo_object_base import (
+    PhotoObjectBase,
+)
+
+
+class PhotoObjectRepository(IPhotoObjectRepository):
+    def __init__(self, executor: QueryExecutor) -> None:
+        self.executor = executor
+
+    async def acquire(self, name: str) -> int:
+        # NOTE: a single upsert, the conflicting row is locked until commit
+        stmt = (
+            insert(PhotoObjectBase)
+            .values(name=name, refcount=1)
+            .on_conflict_do_update(
+                index_elements=[PhotoObjectBase.name],
+                set_={
+                    "refcount": PhotoObjectBase.refcount + 1,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(PhotoObjectBase.refcount)
+        )
+        return await self.executor.execute_scalar(stmt)
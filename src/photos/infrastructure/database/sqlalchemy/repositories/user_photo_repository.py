@@ -1,12 +1,16 @@
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Integer, Row, bindparam, select, tuple_, update
 
+from common.application.exceptions import NotFoundError
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from photos.application.dtos.dtos import PhotoCursor, PhotoPage
 from photos.application.interfaces.repositories.user_photo_repository import (
     IUserPhotoRepository,
 )
 from photos.domain.entity.photo import Photo
+from photos.domain.value_objects.photo_status import PhotoStatus
 from photos.infrastructure.database.sqlalchemy.mappers.photo_mapper import (
     PhotoMapper,
 )
@@ -15,15 +19,115 @@ from photos.infrastructure.database.sqlalchemy.models.photo_base import (
 )
 
 
+# NOTE: newest first; the page after a cursor is a range scan on
+# ix_photos_user_id_created_at_photo_id, so deep pages cost no OFFSET
+PHOTOS = PhotoBase.__table__
+LIST_PHOTOS_PAGE = (
+    select(
+        PHOTOS.c.photo_id,
+        PHOTOS.c.user_id,
+        PHOTOS.c.name,
+        PHOTOS.c.mime,
+        PHOTOS.c.status,
+        PHOTOS.c.created_at,
+    )
+    .where(
+        PHOTOS.c.user_id == bindparam("user_id"),
+        PHOTOS.c.status == PhotoStatus.ACTIVE.value,
+    )
+    .order_by(PHOTOS.c.created_at.desc(), PHOTOS.c.photo_id.desc())
+    .limit(bindparam("limit", type_=Integer))
+)
+LIST_PHOTOS_PAGE_AFTER = LIST_PHOTOS_PAGE.where(
+    tuple_(PHOTOS.c.created_at, PHOTOS.c.photo_id)
+    < tuple_(
+        bindparam("created_at", type_=PHOTOS.c.created_at.type),
+        bindparam("photo_id", type_=PHOTOS.c.photo_id.type),
+    )
+)
+# NOTE: deduplicated photos share one object name, any active row will do
+GET_ACTIVE_PHOTO_BY_NAME = (
+    select(PHOTOS.c.photo_id)
+    .where(
+        PHOTOS.c.name == bindparam("name"),
+        PHOTOS.c.status == PhotoStatus.ACTIVE.value,
+    )
+    .limit(1)
+)
+
+
 class UserPhotoRepository(IUserPhotoRepository):
     def __init__(self, executor: QueryExecutor) -> None:
         self.executor = executor
 
+    async def get_by_id(self, photo_id: UUID, lock: bool = False) -> Photo:
+        stmt = select(PhotoBase).where(PhotoBase.photo_id == photo_id)
+        if lock:
+            # NOTE: locked reads always go to the primary
+            stmt = stmt.with_for_update()
+        model = await self.executor.execute_scalar_one(stmt)
+        if model is None:
+            raise NotFoundError(photo_id)
+        return PhotoMapper.to_domain(model)
+
+    async def exists_active(self, name: str) -> bool:
+        row = await self.executor.execute_row(
+            GET_ACTIVE_PHOTO_BY_NAME, {"name": name}
+        )
+        return row is not None
+
     async def add(self, entity: Photo) -> None:
         model = PhotoMapper.to_persistence(entity)
         await self.executor.add(model)
 
+    async def save(self, entity: Photo) -> None:
+        # NOTE: status is the only mutable column
+        stmt = (
+            update(PhotoBase)
+            .where(PhotoBase.photo_id == entity.photo_id)
+            .values(status=entity.status.value)
+        )
+        await self.executor.execute(stmt)
+
     async def list_by_user_id(self, user_id: UUID) -> list[Photo]:
-        stmt = select(PhotoBase).where(PhotoBase.user_id == user_id)
+        stmt = select(PhotoBase).where(
+            PhotoBase.user_id == user_id,
+            PhotoBase.status == PhotoStatus.ACTIVE.value,
+        )
         result = await self.executor.execute_scalar_many(stmt)
         return [PhotoMapper.to_domain(model) for model in result]
+
+    async def list_page_by_user_id(
+        self, user_id: UUID, limit: int, after: PhotoCursor | None = None
+    ) -> PhotoPage:
+        # NOTE: one extra row tells whether another page exists
+        params: dict[str, Any] = {"user_id": user_id, "limit": limit + 1}
+        stmt = LIST_PHOTOS_PAGE
+        if after is not None:
+            stmt = LIST_PHOTOS_PAGE_AFTER
+            params |= {
+                "created_at": after.created_at,
+                "photo_id": after.photo_id,
+            }
+        rows = await self.executor.execute_rows(stmt, params)
+
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last = page[-1]
+            next_cursor = PhotoCursor(
+                created_at=last.created_at, photo_id=last.photo_id
+            )
+        return PhotoPage(
+            photos=[self._to_photo(row) for row in page],
+            next_cursor=next_cursor,
+        )
+
+    def _to_photo(self, row: Row[Any]) -> Photo:
+        return Photo(
+            photo_id=row.photo_id,
+            user_id=row.user_id,
+            name=row.name,
+            mime=row.mime,
+            status=PhotoStatus(row.status),
+        )
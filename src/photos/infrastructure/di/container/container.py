@@ -1,40 +1,92 @@
 from dependency_injector import containers, providers
 
-from photos.application.usecases.command.upload_photo_use_case import (
-    UploadPhotoUseCase,
+from common.infrastructure.config.photo_variants_config import (
+    PhotoVariantsConfig,
+)
+from photos.application.usecases.command.confirm_photo_upload_use_case import (
+    ConfirmPhotoUploadUseCase,
+)
+from photos.application.usecases.command.request_photo_upload_use_case import (
+    RequestPhotoUploadUseCase,
 )
 from photos.application.usecases.query.get_presigned_url_use_case import (
     GetPresignedUrlUseCase,
 )
+from photos.application.usecases.query.get_presigned_urls_use_case import (
+    GetPresignedUrlsUseCase,
+)
+from photos.application.usecases.query.list_photos_use_case import (
+    ListPhotosUseCase,
+)
 from photos.domain.factories.photo_factory import PhotoFactory
 from photos.domain.policies.extenstion_policy import ExtensionWhitelistPolicy
+from photos.infrastructure.database.sqlalchemy.repositories.photo_object_repository import (
+    PhotoObjectRepository,
+)
 from photos.infrastructure.database.sqlalchemy.repositories.user_photo_repository import (
     UserPhotoRepository,
 )
 from photos.infrastructure.di.container.providers import (
-    provide_minio_photo_repository,
+    provide_photo_variant_service,
+    provide_s3_photo_repository,
+    provide_upload_photo_use_case,
 )
 from photos.infrastructure.services.file_type_introspector import (
     FileTypeIntrospector,
 )
+from photos.infrastructure.services.image_renderer import (
+    ProcessPoolImageRenderer,
+)
 
 
 class PhotoContainer(containers.DeclarativeContainer):
     presigned_url_expiration_delta = providers.Dependency()
+    upload_expiration_delta = providers.Dependency()
+    max_upload_size = providers.Dependency()
+    max_upload_body_overhead = providers.Dependency(
+        instance_of=int, default=64 * 1024
+    )
     allowed_extensions = providers.Dependency()
+    storage_webhook_token = providers.Dependency()
+    variants_config = providers.Dependency(
+        instance_of=PhotoVariantsConfig, default=PhotoVariantsConfig()
+    )
 
     uuid_generator = providers.Dependency()
     query_executor = providers.Dependency()
     minio_storage = providers.Dependency()
+    storage_circuit_breaker = providers.Dependency()
+    metrics_registry = providers.Dependency()
+    task_publisher = providers.Dependency()
 
     file_type_introspector = providers.Singleton(FileTypeIntrospector)
 
     photo_repository = providers.Singleton(
-        provide_minio_photo_repository, minio_storage
+        provide_s3_photo_repository,
+        minio_storage,
+        storage_circuit_breaker,
+        metrics_registry,
     )
     user_photo_repository = providers.Singleton(
         UserPhotoRepository, query_executor
     )
+    photo_object_repository = providers.Singleton(
+        PhotoObjectRepository, query_executor
+    )
+
+    image_renderer = providers.Singleton(
+        ProcessPoolImageRenderer,
+        workers=variants_config.provided.workers,
+        quality=variants_config.provided.quality,
+    )
+    photo_variant_service = providers.Singleton(
+        provide_photo_variant_service,
+        config=variants_config,
+        photo_repository=photo_repository,
+        user_photo_repository=user_photo_repository,
+        image_renderer=image_renderer,
+        task_publisher=task_publisher,
+    )
 
     extension_policy = providers.Singleton(
         ExtensionWhitelistPolicy, allowed_extensions
@@ -46,15 +98,48 @@ class PhotoContainer(containers.DeclarativeContainer):
     )
 
     upload_photo_use_case = providers.Singleton(
-        UploadPhotoUseCase,
+        provide_upload_photo_use_case,
+        storage=minio_storage,
         photo_factory=photo_factory,
         photo_repository=photo_repository,
         user_photo_repository=user_photo_repository,
+        photo_object_repository=photo_object_repository,
         file_type_introspector=file_type_introspector,
+        photo_variant_service=photo_variant_service,
+        max_size=max_upload_size,
+    )
+
+    request_photo_upload_use_case = providers.Singleton(
+        RequestPhotoUploadUseCase,
+        photo_factory=photo_factory,
+        photo_repository=photo_repository,
+        user_photo_repository=user_photo_repository,
+        file_type_introspector=file_type_introspector,
+        max_size=max_upload_size,
+        expiration_delta=upload_expiration_delta,
+    )
+    confirm_photo_upload_use_case = providers.Singleton(
+        ConfirmPhotoUploadUseCase,
+        photo_repository=photo_repository,
+        user_photo_repository=user_photo_repository,
+        file_type_introspector=file_type_introspector,
+        photo_variant_service=photo_variant_service,
     )
 
     get_presigned_url_use_case = providers.Singleton(
         GetPresignedUrlUseCase,
         photo_repository=photo_repository,
+        photo_variant_service=photo_variant_service,
+        expiration_delta=presigned_url_expiration_delta,
+    )
+    get_presigned_urls_use_case = providers.Singleton(
+        GetPresignedUrlsUseCase,
+        photo_repository=photo_repository,
+        expiration_delta=presigned_url_expiration_delta,
+    )
+    list_photos_use_case = providers.Singleton(
+        ListPhotosUseCase,
+        photo_repository=photo_repository,
+        user_photo_repository=user_photo_repository,
         expiration_delta=presigned_url_expiration_delta,
     )
@@ -1,13 +1,121 @@
+from common.application.interfaces.metrics.metrics_registry import (
+    IMetricsRegistry,
+)
+from common.application.interfaces.tasks.background_task_publisher import (
+    IBackgroundTaskPublisher,
+)
+from common.infrastructure.config.photo_variants_config import (
+    PhotoVariantsConfig,
+)
+from common.infrastructure.resilience.circuit_breaker import CircuitBreaker
 from common.infrastructure.storage.minio.storage import MinioStorage
+from photos.application.interfaces.repositories.photo_object_repository import (
+    IPhotoObjectRepository,
+)
 from photos.application.interfaces.repositories.photo_repository import (
     IPhotoRepository,
 )
-from photos.infrastructure.storage.minio.repositories.photo_repository import (
-    MinioPhotoRepository,
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.file_type_introspector import (
+    IFileTypeIntrospector,
+)
+from photos.application.interfaces.services.image_renderer import (
+    IImageRenderer,
+)
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
+from photos.application.interfaces.usecases.command.upload_photo_use_case import (
+    IUploadPhotoUseCase,
+)
+from photos.application.services.photo_variant_service import (
+    PhotoVariantService,
+)
+from photos.application.usecases.command.deduplicating_upload_photo_use_case import (
+    DeduplicatingUploadPhotoUseCase,
 )
+from photos.application.usecases.command.upload_photo_use_case import (
+    UploadPhotoUseCase,
+)
+from photos.domain.interfaces.photo_factory import IPhotoFactory
+from photos.domain.value_objects.photo_variant import PhotoVariant
+from photos.infrastructure.storage.repositories.circuit_breaker_photo_repository import (
+    CircuitBreakerPhotoRepository,
+)
+from photos.infrastructure.storage.s3.repositories.photo_repository import (
+    S3PhotoRepository,
+)
+
+
+def provide_s3_photo_repository(
+    storage: MinioStorage,
+    breaker: CircuitBreaker,
+    metrics_registry: IMetricsRegistry,
+) -> IPhotoRepository:
+    metrics_registry.register("storage.s3", storage.stats)
+    config = storage.get_config()
+    repository = S3PhotoRepository(
+        storage.get_client(),
+        storage.get_bucket_name(),
+        part_size=config.multipart_part_size,
+        concurrency=config.multipart_concurrency,
+        part_retries=config.multipart_part_retries,
+        retry_backoff=config.multipart_retry_backoff,
+    )
+    return CircuitBreakerPhotoRepository(repository, breaker)
+
+
+def provide_upload_photo_use_case(
+    storage: MinioStorage,
+    photo_factory: IPhotoFactory,
+    photo_repository: IPhotoRepository,
+    user_photo_repository: IUserPhotoRepository,
+    photo_object_repository: IPhotoObjectRepository,
+    file_type_introspector: IFileTypeIntrospector,
+    photo_variant_service: IPhotoVariantService,
+    max_size: int,
+) -> IUploadPhotoUseCase:
+    config = storage.get_config()
+    if not config.deduplicate_uploads:
+        return UploadPhotoUseCase(
+            photo_factory=photo_factory,
+            photo_repository=photo_repository,
+            user_photo_repository=user_photo_repository,
+            file_type_introspector=file_type_introspector,
+            photo_variant_service=photo_variant_service,
+            max_size=max_size,
+        )
+    # NOTE: content up to one part is buffered anyway, so it is hashed
+    # before anything is written
+    return DeduplicatingUploadPhotoUseCase(
+        photo_factory=photo_factory,
+        photo_repository=photo_repository,
+        user_photo_repository=user_photo_repository,
+        photo_object_repository=photo_object_repository,
+        file_type_introspector=file_type_introspector,
+        photo_variant_service=photo_variant_service,
+        max_size=max_size,
+        buffer_size=config.multipart_part_size,
+    )
 
 
-def provide_minio_photo_repository(storage: MinioStorage) -> IPhotoRepository:
-    return MinioPhotoRepository(
-        storage.get_client(), storage.get_bucket_name()
+def provide_photo_variant_service(
+    config: PhotoVariantsConfig,
+    photo_repository: IPhotoRepository,
+    user_photo_repository: IUserPhotoRepository,
+    image_renderer: IImageRenderer,
+    task_publisher: IBackgroundTaskPublisher,
+) -> IPhotoVariantService:
+    return PhotoVariantService(
+        photo_repository=photo_repository,
+        user_photo_repository=user_photo_repository,
+        image_renderer=image_renderer,
+        task_publisher=task_publisher,
+        variants=[
+            PhotoVariant(name, max_size)
+            for name, max_size in config.presets.items()
+        ],
+        eager=config.eager,
     )
@@ -1,5 +1,3 @@
-from typing import BinaryIO
-
 import filetype  # pyright: ignore[reportMissingTypeStubs]
 from filetype.types import Type  # pyright: ignore[reportMissingTypeStubs]
 
@@ -10,12 +8,25 @@ from photos.application.interfaces.services.file_type_introspector import (
 )
 
 
+# NOTE: the longest signature checked by `filetype`
+HEAD_SIZE = 261
+
+
 class FileTypeIntrospector(IFileTypeIntrospector):
-    def extract(self, data: BinaryIO) -> FileType:
-        head = data.read(261)
-        data.seek(0)
-        kind: Type | None = filetype.guess(head)  # type: ignore
+    @property
+    def head_size(self) -> int:
+        return HEAD_SIZE
+
+    def extract(self, head: bytes) -> FileType:
+        kind: Type | None = filetype.guess(head[:HEAD_SIZE])  # type: ignore
         if kind is None:
             raise InvalidFileTypeError
 
         return FileType(extension=kind.extension, mime=kind.mime)  # type: ignore
+
+    def from_mime(self, mime: str) -> FileType:
+        kind: Type | None = filetype.get_type(mime=mime)  # type: ignore
+        if kind is None:
+            raise InvalidFileTypeError(f"Unsupported content type: {mime}")
+
+        return FileType(extension=kind.extension, mime=kind.mime)  # type: ignore
@@ -0,0 +1,63 @@
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from PIL import Image, ImageOps
+
+from common.application.exceptions import (
+    InvalidContentError,
+    ServiceUnavailableError,
+)
+from photos.application.interfaces.services.image_renderer import (
+    IImageRenderer,
+)
+
+
+def _render(data: bytes, max_size: int, quality: int) -> bytes:
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            # NOTE: JPEG is decoded at the smallest scale that still
+            # covers the target size
+            source.draft("RGB", (max_size, max_size))
+            image = ImageOps.exif_transpose(source)
+            image.thumbnail((max_size, max_size))
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert(
+                    "RGBA" if image.has_transparency_data else "RGB"
+                )
+            output = io.BytesIO()
+            image.save(output, "WEBP", quality=quality)
+            return output.getvalue()
+    except (Image.DecompressionBombError, OSError) as e:
+        # NOTE: unidentified and truncated images surface as OSError
+        raise InvalidContentError(f"Cannot render image: {e}") from None
+
+
+class ProcessPoolImageRenderer(IImageRenderer):
+    # NOTE: decoding and resizing hold the GIL, so they run in worker
+    # processes; the pool is started on first use
+    def __init__(self, workers: int = 2, quality: int = 80) -> None:
+        self.workers = workers
+        self.quality = quality
+
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def render(self, data: bytes, max_size: int) -> bytes:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._executor, _render, data, max_size, self.quality
+            )
+        except BrokenProcessPool as e:
+            # NOTE: a killed worker breaks the pool, the next call
+            # starts a fresh one
+            self.shutdown()
+            raise ServiceUnavailableError("Image renderer unavailable") from e
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
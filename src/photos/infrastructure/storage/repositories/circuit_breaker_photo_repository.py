@@ -0,0 +1,94 @@
+from collections.abc import AsyncIterable, Sequence
+from datetime import timedelta
+
+from common.application.exceptions import ServiceUnavailableError
+from common.infrastructure.exceptions import CircuitOpenError
+from common.infrastructure.resilience.circuit_breaker import CircuitBreaker
+from photos.application.dtos.dtos import UploadPolicy
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+
+
+class CircuitBreakerPhotoRepository(IPhotoRepository):
+    def __init__(self, repository: IPhotoRepository, breaker: CircuitBreaker):
+        self.repository = repository
+        self.breaker = breaker
+
+    async def upload_photo(
+        self, name: str, mime: str, data: AsyncIterable[bytes]
+    ) -> None:
+        try:
+            await self.breaker.call(
+                self.repository.upload_photo, name, mime, data
+            )
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
+
+    async def create_upload_policy(
+        self, name: str, mime: str, max_size: int, expires_in: timedelta
+    ) -> UploadPolicy:
+        try:
+            return await self.breaker.call(
+                self.repository.create_upload_policy,
+                name,
+                mime,
+                max_size,
+                expires_in,
+            )
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
+
+    async def read_head(self, name: str, size: int) -> bytes:
+        try:
+            return await self.breaker.call(
+                self.repository.read_head, name, size
+            )
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
+
+    async def download_photo(self, name: str) -> bytes:
+        try:
+            return await self.breaker.call(
+                self.repository.download_photo, name
+            )
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
+
+    async def photo_exists(self, name: str) -> bool:
+        try:
+            return await self.breaker.call(self.repository.photo_exists, name)
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
+
+    async def copy_photo(self, source: str, name: str) -> None:
+        try:
+            await self.breaker.call(self.repository.copy_photo, source, name)
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
+
+    async def delete_photo(self, name: str) -> None:
+        try:
+            await self.breaker.call(self.repository.delete_photo, name)
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
+
+    async def get_presigned_get_url(
+        self, name: str, expires_in: timedelta
+    ) -> str:
+        try:
+            return await self.breaker.call(
+                self.repository.get_presigned_get_url, name, expires_in
+            )
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
+
+    async def get_presigned_get_urls(
+        self, names: Sequence[str], expires_in: timedelta
+    ) -> list[str]:
+        try:
+            return await self.breaker.call(
+                self.repository.get_presigned_get_urls, names, expires_in
+            )
+        except CircuitOpenError as e:
+            raise ServiceUnavailableError("Photo storage unavailable") from e
@@ -0,0 +1,220 @@
+import asyncio
+from collections.abc import AsyncIterable, Sequence
+from datetime import timedelta
+
+import httpx
+
+from common.application.exceptions import NotFoundError, RepositoryError
+from common.infrastructure.storage.s3.client import (
+    S3Client,
+    S3ClientError,
+    UploadedPart,
+)
+from photos.application.dtos.dtos import UploadPolicy
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+
+
+def _is_transient(error: Exception) -> bool:
+    if isinstance(error, S3ClientError):
+        return error.status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class S3PhotoRepository(IPhotoRepository):
+    # NOTE: uploads are forwarded part by part as the content arrives;
+    # up to `concurrency` parts are in flight while the next one fills, so
+    # at most `concurrency + 1` parts (plus one incoming chunk) are held in
+    # memory; content smaller than a part is sent with a single PUT
+    # NOTE: a part failing with a transient error is retried on its own,
+    # the parts already stored are kept
+    def __init__(
+        self,
+        client: S3Client,
+        bucket_name: str,
+        part_size: int = 8 * 1024 * 1024,
+        concurrency: int = 4,
+        part_retries: int = 2,
+        retry_backoff: float = 0.2,
+    ):
+        self.client = client
+        self.bucket_name = bucket_name
+        self.part_size = part_size
+        self.concurrency = max(concurrency, 1)
+        self.part_retries = part_retries
+        self.retry_backoff = retry_backoff
+
+    async def upload_photo(
+        self, name: str, mime: str, data: AsyncIterable[bytes]
+    ) -> None:
+        upload_id: str | None = None
+        parts: list[UploadedPart] = []
+        pending: set[asyncio.Task[UploadedPart]] = set()
+        number = 0
+        buffer = bytearray()
+        try:
+            async for chunk in data:
+                buffer += chunk
+                while len(buffer) >= self.part_size:
+                    if upload_id is None:
+                        upload_id = await self.client.create_multipart_upload(
+                            self.bucket_name, name, mime
+                        )
+                    if len(pending) >= self.concurrency:
+                        pending = await self._collect(
+                            pending, parts, asyncio.FIRST_COMPLETED
+                        )
+                    number += 1
+                    part = bytes(buffer[: self.part_size])
+                    del buffer[: self.part_size]
+                    pending.add(
+                        asyncio.create_task(
+                            self._upload_part(name, upload_id, number, part)
+                        )
+                    )
+
+            if upload_id is None:
+                await self.client.put_object(
+                    self.bucket_name, name, bytes(buffer), mime
+                )
+                return
+
+            if buffer:
+                number += 1
+                pending.add(
+                    asyncio.create_task(
+                        self._upload_part(
+                            name, upload_id, number, bytes(buffer)
+                        )
+                    )
+                )
+            pending = await self._collect(
+                pending, parts, asyncio.ALL_COMPLETED
+            )
+            parts.sort(key=lambda part: part.number)
+            await self.client.complete_multipart_upload(
+                self.bucket_name, name, upload_id, parts
+            )
+        except BaseException as e:
+            await self._cancel(pending)
+            if upload_id is not None:
+                await self._abort_upload(name, upload_id)
+            if isinstance(e, (S3ClientError, httpx.HTTPError)):
+                raise RepositoryError(
+                    f"Failed to upload photo '{name}'"
+                ) from e
+            raise
+
+    async def create_upload_policy(
+        self, name: str, mime: str, max_size: int, expires_in: timedelta
+    ) -> UploadPolicy:
+        url, fields = self.client.presigned_post_policy(
+            self.bucket_name, name, mime, max_size, expires_in
+        )
+        return UploadPolicy(url=url, fields=fields)
+
+    async def read_head(self, name: str, size: int) -> bytes:
+        try:
+            return await self.client.get_object_range(
+                self.bucket_name, name, 0, size - 1
+            )
+        except S3ClientError as e:
+            if e.status == 404:
+                raise NotFoundError(name) from e
+            if e.status == 416:
+                # NOTE: the range is not satisfiable for empty objects
+                return b""
+            raise RepositoryError(f"Failed to read photo '{name}'") from e
+        except httpx.HTTPError as e:
+            raise RepositoryError(f"Failed to read photo '{name}'") from e
+
+    async def download_photo(self, name: str) -> bytes:
+        try:
+            return await self.client.get_object(self.bucket_name, name)
+        except S3ClientError as e:
+            if e.status == 404:
+                raise NotFoundError(name) from e
+            raise RepositoryError(f"Failed to read photo '{name}'") from e
+        except httpx.HTTPError as e:
+            raise RepositoryError(f"Failed to read photo '{name}'") from e
+
+    async def photo_exists(self, name: str) -> bool:
+        try:
+            return await self.client.object_exists(self.bucket_name, name)
+        except (S3ClientError, httpx.HTTPError) as e:
+            raise RepositoryError(f"Failed to read photo '{name}'") from e
+
+    async def copy_photo(self, source: str, name: str) -> None:
+        try:
+            await self.client.copy_object(self.bucket_name, source, name)
+        except (S3ClientError, httpx.HTTPError) as e:
+            raise RepositoryError(f"Failed to copy photo '{source}'") from e
+
+    async def delete_photo(self, name: str) -> None:
+        try:
+            await self.client.remove_object(self.bucket_name, name)
+        except (S3ClientError, httpx.HTTPError) as e:
+            raise RepositoryError(f"Failed to delete photo '{name}'") from e
+
+    async def get_presigned_get_url(
+        self, name: str, expires_in: timedelta
+    ) -> str:
+        # NOTE: signing is local, a missing object surfaces as 404 on use
+        return self.client.presigned_get_object(
+            self.bucket_name, name, expires_in
+        )
+
+    async def get_presigned_get_urls(
+        self, names: Sequence[str], expires_in: timedelta
+    ) -> list[str]:
+        return [
+            self.client.presigned_get_object(
+                self.bucket_name, name, expires_in
+            )
+            for name in names
+        ]
+
+    async def _upload_part(
+        self, name: str, upload_id: str, number: int, data: bytes
+    ) -> UploadedPart:
+        attempt = 0
+        while True:
+            try:
+                return await self.client.upload_part(
+                    self.bucket_name, name, upload_id, number, data
+                )
+            except (S3ClientError, httpx.HTTPError) as e:
+                if attempt >= self.part_retries or not _is_transient(e):
+                    raise
+            await asyncio.sleep(self.retry_backoff * 2**attempt)
+            attempt += 1
+
+    async def _collect(
+        self,
+        pending: set[asyncio.Task[UploadedPart]],
+        parts: list[UploadedPart],
+        return_when: str,
+    ) -> set[asyncio.Task[UploadedPart]]:
+        done, pending = await asyncio.wait(pending, return_when=return_when)
+        for task in done:
+            # NOTE: the first failed part fails the whole upload
+            parts.append(task.result())
+        return pending
+
+    async def _cancel(self, pending: set[asyncio.Task[UploadedPart]]) -> None:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _abort_upload(self, name: str, upload_id: str) -> None:
+        try:
+            # NOTE: shielded so a cancelled request still releases the parts
+            await asyncio.shield(
+                self.client.abort_multipart_upload(
+                    self.bucket_name, name, upload_id
+                )
+            )
+        except Exception:
+            # NOTE: the original upload error is the one worth reporting
+            pass
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+
+
+class RequestPhotoUploadRequest(BaseModel):
+    content_type: str
+    size: int
+
+
+class StorageEventObject(BaseModel):
+    key: str
+
+
+class StorageEventEntity(BaseModel):
+    object: StorageEventObject
+
+
+class StorageEventRecord(BaseModel):
+    event_name: str = Field(alias="eventName")
+    s3: StorageEventEntity
+
+
+class StorageEventRequest(BaseModel):
+    records: list[StorageEventRecord] = Field(
+        default_factory=list, alias="Records"
+    )
+
+
+class PresignedUrlsRequest(BaseModel):
+    names: list[str] = Field(min_length=1, max_length=100)
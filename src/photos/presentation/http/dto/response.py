@@ -0,0 +1,51 @@
+from typing import Self
+
+from pydantic import BaseModel
+
+from photos.application.dtos.dtos import (
+    PhotoDTO,
+    PhotoPageDTO,
+    PhotoUploadDTO,
+    PresignedUrlDTO,
+)
+
+
+class PhotoUploadResponse(BaseModel):
+    name: str
+    url: str
+    fields: dict[str, str]
+
+    @classmethod
+    def from_dto(cls, dto: PhotoUploadDTO) -> Self:
+        return cls(name=dto.name, url=dto.url, fields=dto.fields)
+
+
+class PhotoResponse(BaseModel):
+    name: str
+    mime: str
+    url: str
+
+    @classmethod
+    def from_dto(cls, dto: PhotoDTO) -> Self:
+        return cls(name=dto.name, mime=dto.mime, url=dto.url)
+
+
+class PhotoPageResponse(BaseModel):
+    photos: list[PhotoResponse]
+    next_cursor: str | None
+
+    @classmethod
+    def from_dto(cls, dto: PhotoPageDTO) -> Self:
+        return cls(
+            photos=[PhotoResponse.from_dto(photo) for photo in dto.photos],
+            next_cursor=dto.next_cursor,
+        )
+
+
+class PresignedUrlResponse(BaseModel):
+    name: str
+    url: str
+
+    @classmethod
+    def from_dto(cls, dto: PresignedUrlDTO) -> Self:
+        return cls(name=dto.name, url=dto.url)
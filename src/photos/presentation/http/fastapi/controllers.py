@@ -1,64 +1,210 @@
 from typing import Annotated
+from urllib.parse import unquote_plus
 
 from fastapi import (
     APIRouter,
     Depends,
+    Header,
     HTTPException,
     Query,
-    UploadFile,
+    Request,
     status,
 )
 from fastapi_utils.cbv import cbv
 
+from auth.application.interfaces.services.token_service import (
+    ITokenIntrospector,
+)
 from auth.presentation.http.fastapi.auth import (
     get_descriptor,
+    oauth2_scheme_no_error,
     require_authenticated,
 )
-from common.presentation.http.dto.response import StringResponse
+from common.application.exceptions import (
+    ContentTooLargeError,
+    InvalidContentError,
+    NotFoundError,
+)
+from common.presentation.http.dto.response import (
+    EmptyResponse,
+    StringResponse,
+)
+from common.presentation.http.fastapi.multipart import stream_multipart_file
 from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.command.confirm_photo_upload_command import (
+    ConfirmPhotoUploadCommand,
+)
+from photos.application.dtos.command.request_photo_upload_command import (
+    RequestPhotoUploadCommand,
+)
 from photos.application.dtos.command.upload_photo_command import (
     UploadPhotoCommand,
 )
 from photos.application.dtos.query.get_presigned_url_query import (
     GetPresignedUrlQuery,
 )
-from photos.application.exceptions import InvalidFileTypeError
+from photos.application.dtos.query.get_presigned_urls_query import (
+    GetPresignedUrlsQuery,
+)
+from photos.application.dtos.query.list_photos_query import ListPhotosQuery
+from photos.application.exceptions import (
+    InvalidFileTypeError,
+    InvalidPhotoCursorError,
+    InvalidUploadSizeError,
+    UnknownPhotoVariantError,
+)
+from photos.application.interfaces.usecases.command.confirm_photo_upload_use_case import (
+    IConfirmPhotoUploadUseCase,
+)
+from photos.application.interfaces.usecases.command.request_photo_upload_use_case import (
+    IRequestPhotoUploadUseCase,
+)
 from photos.application.interfaces.usecases.command.upload_photo_use_case import (
     IUploadPhotoUseCase,
 )
 from photos.application.interfaces.usecases.query.get_presigned_url_use_case import (
     IGetPresignedUrlUseCase,
 )
+from photos.application.interfaces.usecases.query.get_presigned_urls_use_case import (
+    IGetPresignedUrlsUseCase,
+)
+from photos.application.interfaces.usecases.query.list_photos_use_case import (
+    IListPhotosUseCase,
+)
+from photos.domain.exceptions import (
+    InvalidExtensionTypeError,
+    InvalidPhotoNameError,
+)
+from photos.presentation.http.dto.request import (
+    PresignedUrlsRequest,
+    RequestPhotoUploadRequest,
+    StorageEventRequest,
+)
+from photos.presentation.http.dto.response import (
+    PhotoPageResponse,
+    PhotoUploadResponse,
+    PresignedUrlResponse,
+)
+from photos.presentation.http.fastapi.upload_limit import UploadBodyLimit
+from photos.presentation.http.fastapi.webhook import StorageWebhookVerifier
 
 
 command_router = APIRouter()
 
+UPLOAD_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "properties": {"file": {"type": "string", "format": "binary"}},
+                "required": ["file"],
+            }
+        }
+    },
+}
+
 
 @cbv(command_router)
 class PhotoCommandController:
     upload_photo_use_case: IUploadPhotoUseCase = Depends()
+    request_photo_upload_use_case: IRequestPhotoUploadUseCase = Depends()
+    upload_body_limit: UploadBodyLimit = Depends()
 
     @command_router.post(
         "/upload",
         response_model=StringResponse,
         dependencies=[Depends(require_authenticated)],
+        openapi_extra={"requestBody": UPLOAD_REQUEST_BODY},
     )
     async def upload(
         self,
-        file: UploadFile,
+        request: Request,
         user: Annotated[UserDescriptor, Depends(get_descriptor)],
     ):
+        # NOTE: the body is streamed instead of being spooled by UploadFile
+        content = stream_multipart_file(
+            request, "file", self.upload_body_limit.max_size
+        )
         try:
             result = await self.upload_photo_use_case.execute(
-                UploadPhotoCommand(file.file), user
+                UploadPhotoCommand(content), user
             )
             return StringResponse.from_str(result)
-        except InvalidFileTypeError as exc:
+        except (InvalidUploadSizeError, ContentTooLargeError) as exc:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail={"error": type(exc).__name__, "message": str(exc)},
+            ) from exc
+        except (InvalidFileTypeError, InvalidContentError) as exc:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={"error": type(exc).__name__, "message": str(exc)},
             )
 
+    @command_router.post(
+        "/uploads",
+        response_model=PhotoUploadResponse,
+        dependencies=[Depends(require_authenticated)],
+    )
+    async def request_upload(
+        self,
+        request: RequestPhotoUploadRequest,
+        user: Annotated[UserDescriptor, Depends(get_descriptor)],
+    ):
+        try:
+            result = await self.request_photo_upload_use_case.execute(
+                RequestPhotoUploadCommand(
+                    mime=request.content_type, size=request.size
+                ),
+                user,
+            )
+            return PhotoUploadResponse.from_dto(result)
+        except (
+            InvalidFileTypeError,
+            InvalidUploadSizeError,
+            InvalidExtensionTypeError,
+        ) as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": type(exc).__name__, "message": str(exc)},
+            ) from exc
+
+
+webhook_router = APIRouter()
+
+
+@cbv(webhook_router)
+class StorageWebhookController:
+    confirm_photo_upload_use_case: IConfirmPhotoUploadUseCase = Depends()
+    webhook_verifier: StorageWebhookVerifier = Depends()
+
+    @webhook_router.post("/uploads/events", response_model=EmptyResponse)
+    async def on_storage_event(
+        self,
+        event: StorageEventRequest,
+        authorization: Annotated[str | None, Header()] = None,
+    ):
+        if not self.webhook_verifier.verify(authorization):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid webhook token",
+            )
+
+        for record in event.records:
+            if not record.event_name.startswith("s3:ObjectCreated:"):
+                continue
+            try:
+                await self.confirm_photo_upload_use_case.execute(
+                    ConfirmPhotoUploadCommand(
+                        name=unquote_plus(record.s3.object.key)
+                    )
+                )
+            except (NotFoundError, InvalidPhotoNameError):
+                # NOTE: objects uploaded through the API have no pending row
+                continue
+        return EmptyResponse()
+
 
 query_router = APIRouter()
 
@@ -66,12 +212,75 @@ query_router = APIRouter()
 @cbv(query_router)
 class PhotoQueryController:
     get_presigned_url_use_case: IGetPresignedUrlUseCase = Depends()
+    get_presigned_urls_use_case: IGetPresignedUrlsUseCase = Depends()
+    token_introspector: ITokenIntrospector = Depends()
 
     @query_router.get("/presigned-url", response_model=StringResponse)
     async def get_presigned_url(
-        self, name: str = Query(..., description="Photo name / object key")
+        self,
+        request: Request,
+        token: Annotated[str | None, Depends(oauth2_scheme_no_error)],
+        name: str = Query(..., description="Photo name / object key"),
+        variant: str | None = Query(
+            None, description="Size preset, e.g. thumb; original if omitted"
+        ),
     ):
-        url = await self.get_presigned_url_use_case.execute(
-            GetPresignedUrlQuery(name=name)
+        # NOTE: a missing variant is rendered on request, which downloads,
+        # decodes and uploads the original, so it takes a signed-in user
+        if variant is not None:
+            require_authenticated(token is not None)
+            if token is not None:
+                await get_descriptor(request, token, self.token_introspector)
+        try:
+            url = await self.get_presigned_url_use_case.execute(
+                GetPresignedUrlQuery(name=name, variant=variant)
+            )
+            return StringResponse.from_str(url)
+        except (UnknownPhotoVariantError, InvalidContentError) as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": type(exc).__name__, "message": str(exc)},
+            ) from exc
+
+    @query_router.post(
+        "/presigned-urls", response_model=list[PresignedUrlResponse]
+    )
+    async def get_presigned_urls(self, request: PresignedUrlsRequest):
+        result = await self.get_presigned_urls_use_case.execute(
+            GetPresignedUrlsQuery(names=request.names)
         )
-        return StringResponse.from_str(url)
+        return [PresignedUrlResponse.from_dto(dto) for dto in result]
+
+
+# NOTE: cbv cannot register an empty path under the "/photos" prefix, so
+# the collection route is mounted at the root
+collection_router = APIRouter()
+
+
+@cbv(collection_router)
+class PhotoCollectionController:
+    list_photos_use_case: IListPhotosUseCase = Depends()
+
+    @collection_router.get(
+        "/photos",
+        response_model=PhotoPageResponse,
+        dependencies=[Depends(require_authenticated)],
+    )
+    async def list_photos(
+        self,
+        user: Annotated[UserDescriptor, Depends(get_descriptor)],
+        limit: int = Query(20, ge=1, le=100),
+        cursor: str | None = Query(
+            None, description="next_cursor of the previous page"
+        ),
+    ):
+        try:
+            result = await self.list_photos_use_case.execute(
+                ListPhotosQuery(limit=limit, cursor=cursor), user
+            )
+            return PhotoPageResponse.from_dto(result)
+        except InvalidPhotoCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"error": type(exc).__name__, "message": str(exc)},
+            ) from exc
@@ -0,0 +1,5 @@
+class UploadBodyLimit:
+    # NOTE: bounds the raw request body; the exact file size is enforced
+    # by the upload use case
+    def __init__(self, max_file_size: int, overhead: int):
+        self.max_size = max_file_size + overhead
@@ -0,0 +1,13 @@
+import hmac
+
+
+class StorageWebhookVerifier:
+    # NOTE: MinIO sends the configured auth token as is in Authorization
+    def __init__(self, token: str):
+        self._token = token
+
+    def verify(self, authorization: str | None) -> bool:
+        if not self._token or authorization is None:
+            return False
+        credentials = authorization.removeprefix("Bearer ").strip()
+        return hmac.compare_digest(credentials, self._token)
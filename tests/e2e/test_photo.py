@@ -1,9 +1,11 @@
+import io
 from typing import Any
 
 import httpx
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from PIL import Image
 
 
 @pytest.mark.asyncio
@@ -151,6 +153,37 @@ class TestPhoto:
             b"\xff\xd8\xff\xe0"
         )  # JPEG magic number
 
+    async def test_retrieve_photo_variant_is_rendered(self):
+        # Arrange
+        tokens = await self.register_user()
+        headers = self.make_auth_headers(tokens["access_token"])
+        image = io.BytesIO()
+        Image.new("RGB", (1024, 512)).save(image, "PNG")
+
+        response = await self.client.post(
+            "photos/upload",
+            files={"file": ("big.png", image.getvalue(), "image/png")},
+            headers=headers,
+        )
+        photo_name = response.json()["value"]
+
+        response = await self.client.get(
+            "photos/presigned-url",
+            params={"name": photo_name, "variant": "thumb"},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        presigned_url = response.json()["value"]
+
+        # Act
+        async with httpx.AsyncClient() as client:
+            response = await client.get(presigned_url)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.headers["content-type"] == "image/webp"
+        assert Image.open(io.BytesIO(response.content)).size == (256, 128)
+
     async def test_retrieve_photo_with_invalid_presigned_url(self):
         # Arrange
         test_photo_name = "test-photo.jpg"
@@ -167,3 +200,32 @@ class TestPhoto:
 
         # Assert
         assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+    async def test_list_photos_paginates_with_urls(self):
+        # Arrange
+        tokens = await self.register_user()
+        headers = self.make_auth_headers(tokens["access_token"])
+        names = set()
+        for _ in range(3):
+            response = await self.client.post(
+                "photos/upload", files=self.test_file, headers=headers
+            )
+            names.add(response.json()["value"])
+
+        # Act
+        first = await self.client.get(
+            "photos", params={"limit": 2}, headers=headers
+        )
+        second = await self.client.get(
+            "photos",
+            params={"limit": 2, "cursor": first.json()["next_cursor"]},
+            headers=headers,
+        )
+
+        # Assert
+        assert first.status_code == status.HTTP_200_OK, first.json()
+        assert second.status_code == status.HTTP_200_OK, second.json()
+        photos = first.json()["photos"] + second.json()["photos"]
+        assert {photo["name"] for photo in photos} == names
+        assert all(photo["name"] in photo["url"] for photo in photos)
+        assert second.json()["next_cursor"] is None
@@ -1,11 +1,22 @@
-import json
 from typing import Any
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from auth.infrastructure.serializers.marshmallow.shemas import (
+    UserDescriptorSchema,
+)
+from common.infrastructure.config.cache_config import CacheSerializerFormat
 from common.infrastructure.database.redis.redis import RedisDatabase
+from common.infrastructure.di.container.providers import (
+    provide_cache_serializer,
+)
+from identity.application.read_models.user_read_model import UserReadModel
+from identity.domain.value_objects.descriptor import UserDescriptor
+from identity.infrastructure.serializers.marshmallow.shemas import (
+    UserReadModelSchema,
+)
 
 
 @pytest.mark.asyncio
@@ -16,6 +27,15 @@ class TestUserCache:
         self.redis = redis
         self.redis_client = redis.get_client()
         self.test_user = {"username": "testuser", "password": "password123"}
+        # NOTE: readers understand every cache format regardless of writer
+        self.descriptor_serializer = provide_cache_serializer(
+            UserDescriptor,
+            UserDescriptorSchema(),
+            CacheSerializerFormat.ORJSON,
+        )
+        self.read_model_serializer = provide_cache_serializer(
+            UserReadModel, UserReadModelSchema(), CacheSerializerFormat.ORJSON
+        )
 
     async def register_user(self) -> Any:
         response = await self.client.post(
@@ -52,9 +72,9 @@ class TestUserCache:
             cached_data is not None
         ), f"No cache entry found for key {cache_key}"
 
-        deserialized = json.loads(cached_data)
-        assert deserialized["user_id"] == user_id
-        assert deserialized["username"] == self.test_user["username"]
+        deserialized = self.descriptor_serializer.deserialize(cached_data)
+        assert str(deserialized.user_id) == user_id
+        assert deserialized.username == self.test_user["username"]
 
     async def test_cache_user_read_model_after_me(self):
         # Arrange
@@ -73,6 +93,6 @@ class TestUserCache:
             cached_data is not None
         ), f"No cache entry found for key {cache_key}"
 
-        deserialized = json.loads(cached_data)
-        assert deserialized["user_id"] == user_id
-        assert deserialized["username"] == self.test_user["username"]
+        deserialized = self.read_model_serializer.deserialize(cached_data)
+        assert str(deserialized.user_id) == user_id
+        assert deserialized.username == self.test_user["username"]
@@ -2,6 +2,8 @@ import pytest
 from minio import Minio  # type: ignore
 from testcontainers.minio import MinioContainer  # type: ignore
 
+from common.infrastructure.config.s3_config import S3Config
+
 
 @pytest.fixture(scope="session")
 def minio_container():
@@ -15,13 +17,24 @@ def minio_container():
 
 
 @pytest.fixture(scope="session")
-def minio(minio_container: MinioContainer):
+def s3_config(minio_container: MinioContainer) -> S3Config:
     host = minio_container.get_container_host_ip()
     port = minio_container.get_exposed_port("9000")
-    client = Minio(
+    return S3Config(
         endpoint=f"{host}:{port}",
         access_key="minioadmin",
         secret_key="minioadmin",
         secure=False,
+        bucket_name="test-bucket",
+    )
+
+
+@pytest.fixture(scope="session")
+def minio(s3_config: S3Config):
+    client = Minio(
+        endpoint=s3_config.endpoint,
+        access_key=s3_config.access_key,
+        secret_key=s3_config.secret_key,
+        secure=s3_config.secure,
     )
     return client
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from datetime import timedelta
 from io import BytesIO
 from uuid import uuid4
@@ -7,24 +8,38 @@ import pytest
 import pytest_asyncio
 from minio import Minio  # type: ignore
 
-from photos.infrastructure.storage.minio.repositories.photo_repository import (
-    MinioPhotoRepository,
+from common.infrastructure.config.s3_config import S3Config
+from common.infrastructure.storage.s3.client import S3Client
+from photos.infrastructure.storage.s3.repositories.photo_repository import (
+    S3PhotoRepository,
 )
 
 
+PART_SIZE = 5 * 1024 * 1024
+
+
+async def _chunks(data: bytes, size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
 @pytest.mark.asyncio
-class TestMinioPhotoRepository:
+class TestS3PhotoRepository:
     @pytest_asyncio.fixture(autouse=True)
-    async def setup(self, minio: Minio):
-        self.bucket_name = "test-bucket"
+    async def setup(self, minio: Minio, s3_config: S3Config):
+        self.bucket_name = s3_config.bucket_name
         self.client = minio
-        self.repository = MinioPhotoRepository(self.client, self.bucket_name)
+        self.s3_client = S3Client.create(s3_config)
+        self.repository = S3PhotoRepository(
+            self.s3_client, self.bucket_name, part_size=PART_SIZE
+        )
 
-        if not minio.bucket_exists(self.bucket_name):
-            minio.make_bucket(self.bucket_name)
+        if not await self.s3_client.bucket_exists(self.bucket_name):
+            await self.s3_client.make_bucket(self.bucket_name)
         async with httpx.AsyncClient() as http_client:
             self.http_client = http_client
             yield
+        await self.s3_client.aclose()
         # Clean up
         objects = self.client.list_objects(self.bucket_name, recursive=True)
         for obj in objects:
@@ -51,7 +66,7 @@ class TestMinioPhotoRepository:
         # Arrange
         photo_name = self._get_photo_name()
         mime = "image/jpeg"
-        data = self._get_image_data()
+        data = _chunks(b"fake_image_data")
 
         # Act
         await self.repository.upload_photo(photo_name, mime, data)
@@ -63,6 +78,49 @@ class TestMinioPhotoRepository:
         stat = self.client.stat_object(self.bucket_name, photo_name)
         assert stat.content_type == mime
 
+    async def test_upload_photo_multipart_success(self):
+        # Arrange
+        photo_name = self._get_photo_name()
+        mime = "image/jpeg"
+        content = bytes(range(256)) * (PART_SIZE * 2 // 256 + 1000)
+
+        # Act
+        await self.repository.upload_photo(photo_name, mime, _chunks(content))
+
+        # Assert
+        stat = self.client.stat_object(self.bucket_name, photo_name)
+        assert stat.size == len(content)
+        assert stat.content_type == mime
+        assert stat.etag is not None and stat.etag.endswith("-3")
+        response = self.client.get_object(self.bucket_name, photo_name)
+        try:
+            assert response.read() == content
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def test_upload_photo_interrupted_leaves_no_object(self):
+        # Arrange
+        photo_name = self._get_photo_name()
+
+        async def interrupted() -> AsyncIterator[bytes]:
+            async for chunk in _chunks(b"x" * (PART_SIZE + 1)):
+                yield chunk
+            raise ConnectionResetError
+
+        # Act
+        with pytest.raises(ConnectionResetError):
+            await self.repository.upload_photo(
+                photo_name, "image/jpeg", interrupted()
+            )
+
+        # Assert
+        assert list(self.client.list_objects(self.bucket_name)) == []
+        uploads = self.client._list_multipart_uploads(  # type: ignore
+            self.bucket_name, prefix=photo_name
+        )
+        assert not uploads.uploads
+
     async def test_get_presigned_get_url_success(self):
         # Arrange
         photo_name = self._get_photo_name()
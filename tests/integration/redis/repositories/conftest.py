@@ -27,7 +27,6 @@ async def redis_client(redis_config: RedisConfig):
         host=redis_config.host,
         port=redis_config.port,
         db=redis_config.db,
-        decode_responses=True,
     )
     yield redis
     await redis.flushdb()  # type: ignore
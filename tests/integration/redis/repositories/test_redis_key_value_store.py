@@ -92,3 +92,25 @@ class TestRedisKeyValueStoreGeneric:
         await asyncio.sleep(2)
         with pytest.raises(NotFoundError):
             await self.store.get(str(self.instance.user_id))
+
+    async def test_set_many_success(self):
+        # Arrange
+        other = self.instance.__class__(
+            user_id=uuid4(), username="otheruser"
+        )
+
+        # Act
+        await self.store.set_many(
+            {
+                str(self.instance.user_id): self.instance,
+                str(other.user_id): other,
+            },
+            expire=300,
+        )
+
+        # Assert
+        assert await self.store.get(str(self.instance.user_id)) == (
+            self.instance
+        )
+        assert await self.store.get(str(other.user_id)) == other
+        assert 0 < await self.redis_client.ttl(self.key) <= 300
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+
+from common.infrastructure.config.redis_config import (
+    RedisConfig,
+    RedisTrackingMode,
+)
+from common.infrastructure.database.redis.redis import RedisDatabase
+from common.infrastructure.di.container.providers import (
+    redis_key_value_store_provider,
+)
+from common.infrastructure.serializers.orjson.serializer import (
+    OrjsonDataclassSerializer,
+)
+from identity.domain.value_objects.descriptor import UserDescriptor
+
+
+@pytest_asyncio.fixture(params=list(RedisTrackingMode))
+async def tracking_redis(
+    request: pytest.FixtureRequest, redis_config: RedisConfig
+):
+    config = redis_config.model_copy(
+        update={"tracking_enabled": True, "tracking_mode": request.param}
+    )
+    redis = RedisDatabase.create(config, logging.getLogger())
+    await redis.start_tracking()
+    yield redis
+    await redis.flush_db()
+    await redis.shutdown()
+
+
+@pytest.mark.asyncio
+class TestTrackingRedisKeyValueStore:
+    @pytest.fixture(autouse=True)
+    def setup(self, tracking_redis: RedisDatabase, redis_client: Redis):
+        self.redis_client = redis_client
+        self.store = redis_key_value_store_provider(
+            tracking_redis,
+            OrjsonDataclassSerializer(UserDescriptor),
+            namespace="user",
+        )
+        self.descriptor = UserDescriptor(user_id=uuid4(), username="user")
+        self.key = str(self.descriptor.user_id)
+
+    async def test_repeat_get_served_locally(self):
+        # Arrange
+        await self.store.set(self.key, self.descriptor, expire=300)
+        await asyncio.sleep(0.1)
+
+        # Act
+        first = await self.store.get(self.key)
+        second = await self.store.get(self.key)
+
+        # Assert
+        assert first == second == self.descriptor
+        assert self.store.stats().hits == 1  # type: ignore
+
+    async def test_external_write_invalidates_local_entry(self):
+        # Arrange
+        await self.store.set(self.key, self.descriptor, expire=300)
+        await asyncio.sleep(0.1)
+        await self.store.get(self.key)
+        updated = UserDescriptor(
+            user_id=self.descriptor.user_id, username="renamed"
+        )
+        serialized = OrjsonDataclassSerializer(UserDescriptor).serialize(
+            updated
+        )
+
+        # Act
+        await self.redis_client.set(f"user:{self.key}", serialized)
+        await asyncio.sleep(0.1)
+        result = await self.store.get(self.key)
+
+        # Assert
+        assert result == updated
+        assert self.store.stats().invalidations == 1  # type: ignore
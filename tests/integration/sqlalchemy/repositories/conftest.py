@@ -12,6 +12,9 @@ from auth.infrastructure.database.sqlalchemy.models.token_base import TokenBase
 from common.infrastructure.config.database_config import DatabaseConfig
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from common.infrastructure.database.sqlalchemy.models.base import Base
+from common.infrastructure.database.sqlalchemy.read_only_executor import (
+    ReadOnlyQueryExecutor,
+)
 from common.infrastructure.database.sqlalchemy.session_factory import (
     ISessionFactory,
 )
@@ -22,6 +25,9 @@ from identity.infrastructure.database.sqlalchemy.models.user_base import (
 from photos.infrastructure.database.sqlalchemy.models.photo_base import (
     PhotoBase,
 )
+from photos.infrastructure.database.sqlalchemy.models.photo_object_base import (
+    PhotoObjectBase,
+)
 
 
 # Needed for proper database configuration, e.g. fkeys and tables
@@ -29,6 +35,7 @@ __models__: list[type[Base]] = [
     UserBase,
     TokenBase,
     PhotoBase,
+    PhotoObjectBase,
 ]
 
 
@@ -99,3 +106,13 @@ def uow(session_factory: ISessionFactory):
 @pytest.fixture
 def query_executor(uow: UnitOfWork):
     return QueryExecutor(uow)
+
+
+@pytest.fixture
+def read_only_query_executor(uow: UnitOfWork, engine: AsyncEngine):
+    maker = async_sessionmaker(
+        bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    return ReadOnlyQueryExecutor(uow, maker)
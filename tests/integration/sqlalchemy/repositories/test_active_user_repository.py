@@ -0,0 +1,76 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.application.dtos.models.token import Token, TokenTypeEnum
+from auth.infrastructure.database.sqlalchemy.mappers.token_mapper import (
+    TokenMapper,
+)
+from auth.infrastructure.database.sqlalchemy.repositories.active_user_repository import (
+    ActiveUserRepository,
+)
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+
+
+@pytest.mark.asyncio
+class TestActiveUserRepository:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        maker: async_sessionmaker[AsyncSession],
+        query_executor: QueryExecutor,
+    ):
+        self.maker = maker
+        self.repository = ActiveUserRepository(query_executor)
+        self.now = datetime(2025, 7, 22, tzinfo=UTC)
+
+    async def _add_tokens(self, *tokens: tuple[UUID, datetime]) -> None:
+        async with self.maker() as session:
+            for user_id, issued_at in tokens:
+                token = Token(
+                    token_id=uuid4(),
+                    user_id=user_id,
+                    value=str(uuid4()),
+                    token_type=TokenTypeEnum.REFRESH,
+                    issued_at=issued_at,
+                    expires_at=issued_at + timedelta(days=7),
+                    revoked=False,
+                )
+                session.add(TokenMapper.to_persistence(token))
+            await session.commit()
+
+    async def test_orders_by_latest_token(self):
+        # Arrange
+        first, second, third = uuid4(), uuid4(), uuid4()
+        await self._add_tokens(
+            (first, self.now - timedelta(hours=5)),
+            (first, self.now - timedelta(hours=1)),
+            (second, self.now - timedelta(hours=3)),
+            (third, self.now - timedelta(hours=2)),
+        )
+
+        # Act
+        result = await self.repository.get_recently_active(
+            self.now - timedelta(days=1), limit=2
+        )
+
+        # Assert
+        assert result == [first, third]
+
+    async def test_ignores_tokens_before_since(self):
+        # Arrange
+        recent, stale = uuid4(), uuid4()
+        await self._add_tokens(
+            (recent, self.now - timedelta(hours=1)),
+            (stale, self.now - timedelta(days=30)),
+        )
+
+        # Act
+        result = await self.repository.get_recently_active(
+            self.now - timedelta(days=1), limit=10
+        )
+
+        # Assert
+        assert result == [recent]
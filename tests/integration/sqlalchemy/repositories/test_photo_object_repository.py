@@ -0,0 +1,31 @@
+import pytest
+
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from photos.infrastructure.database.sqlalchemy.repositories.photo_object_repository import (
+    PhotoObjectRepository,
+)
+
+
+@pytest.mark.asyncio
+class TestPhotoObjectRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self, query_executor: QueryExecutor):
+        self.photo_object_repository = PhotoObjectRepository(query_executor)
+
+    async def test_acquire_new_object(self):
+        # Act
+        result = await self.photo_object_repository.acquire("ab.jpg")
+
+        # Assert
+        assert result == 1
+
+    async def test_acquire_existing_object_counts_references(self):
+        # Arrange
+        await self.photo_object_repository.acquire("ab.jpg")
+        await self.photo_object_repository.acquire("cd.jpg")
+
+        # Act
+        result = await self.photo_object_repository.acquire("ab.jpg")
+
+        # Assert
+        assert result == 2
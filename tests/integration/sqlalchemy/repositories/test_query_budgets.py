@@ -0,0 +1,183 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+from tests.integration.sqlalchemy.support import (
+    QueryBudgetExceededError,
+    assert_max_queries,
+)
+
+from auth.application.dtos.commands.login_command import LoginCommand
+from auth.application.dtos.commands.refresh_token_command import (
+    RefreshTokenCommand,
+)
+from auth.application.dtos.commands.register_user_command import (
+    RegisterUserCommand,
+)
+from auth.application.interfaces.services.password_hash_service import (
+    IPasswordHasher,
+)
+from auth.application.interfaces.services.user_cache_warmer import (
+    IUserCacheWarmer,
+)
+from auth.application.usecases.command.login_use_case import LoginUseCase
+from auth.application.usecases.command.refresh_token_use_case import (
+    RefreshTokenUseCase,
+)
+from auth.application.usecases.command.register_user_use_case import (
+    RegisterUserUseCase,
+)
+from auth.infrastructure.database.sqlalchemy.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from auth.infrastructure.database.sqlalchemy.repositories.user_descriptor_repository import (
+    UserDescriptorRepository,
+)
+from auth.infrastructure.services.jwt.token_issuer import JWTTokenIssuer
+from auth.infrastructure.services.jwt.token_refresher import JWTTokenRefresher
+from auth.infrastructure.services.jwt.token_revoker import JWTTokenRevoker
+from common.infrastructure.config.auth_config import AuthConfig
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from common.infrastructure.services.clock import FixedClock
+from common.infrastructure.services.id_generator import UUID4Generator
+from common.infrastructure.services.secrets_token_generator import (
+    SecretsTokenGenerator,
+)
+from identity.domain.entity.user import User
+from identity.domain.factories.user_factory import UserFactory
+from identity.infrastructure.database.sqlalchemy.repositories.user_read_repository import (
+    UserReadRepository,
+)
+from identity.infrastructure.database.sqlalchemy.repositories.user_repository import (
+    UserRepository,
+)
+
+
+@pytest.mark.asyncio
+class TestQueryBudgets:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        engine: AsyncEngine,
+        uow: UnitOfWork,
+        query_executor: QueryExecutor,
+    ):
+        self.engine = engine
+        self.uow = uow
+
+        config = AuthConfig(secret_key="secret", issuer="test")
+        clock = FixedClock(datetime.now(UTC))
+        uuid_generator = UUID4Generator()
+        self.user_repository = UserRepository(query_executor)
+        self.user_read_repository = UserReadRepository(query_executor)
+        self.user_descriptor_repository = UserDescriptorRepository(
+            query_executor
+        )
+        refresh_token_repository = RefreshTokenRepository(query_executor)
+
+        self.password_hasher = Mock(spec=IPasswordHasher)
+        self.password_hasher.hash.return_value = "hash"
+        self.password_hasher.verify.return_value = True
+        user_cache_warmer = Mock(spec=IUserCacheWarmer)
+
+        issuer = JWTTokenIssuer(
+            config,
+            SecretsTokenGenerator(),
+            uuid_generator,
+            clock,
+            refresh_token_repository,
+        )
+        revoker = JWTTokenRevoker(clock, refresh_token_repository)
+        refresher = JWTTokenRefresher(
+            issuer, revoker, clock, refresh_token_repository
+        )
+
+        self.login = LoginUseCase(
+            self.user_repository,
+            self.password_hasher,
+            issuer,
+            user_cache_warmer,
+        )
+        self.register = RegisterUserUseCase(
+            UserFactory(uuid_generator),
+            self.user_repository,
+            self.password_hasher,
+            user_cache_warmer,
+        )
+        self.refresh = RefreshTokenUseCase(refresher, user_cache_warmer)
+
+    async def _add_user(self) -> User:
+        user = User(uuid4(), f"user-{uuid4()}", "hash")
+        async with self.uow:
+            await self.user_repository.add(user)
+        return user
+
+    async def test_login(self):
+        # Arrange
+        user = await self._add_user()
+
+        # Act & Assert
+        async with assert_max_queries(self.engine, 2):
+            async with self.uow:
+                await self.login.execute(LoginCommand(user.username, "pass"))
+
+    async def test_register(self):
+        # Act & Assert
+        async with assert_max_queries(self.engine, 2):
+            async with self.uow:
+                await self.register.execute(
+                    RegisterUserCommand(f"user-{uuid4()}", "pass")
+                )
+
+    async def test_refresh(self):
+        # Arrange
+        user = await self._add_user()
+        async with self.uow:
+            tokens = await self.login.execute(
+                LoginCommand(user.username, "pass")
+            )
+
+        # Act & Assert
+        # NOTE: the refresher and the revoker each load the token
+        async with assert_max_queries(self.engine, 4):
+            async with self.uow:
+                await self.refresh.execute(
+                    RefreshTokenCommand(tokens.refresh_token)
+                )
+
+    async def test_get_self(self):
+        # Arrange
+        user = await self._add_user()
+
+        # Act & Assert
+        async with assert_max_queries(self.engine, 1):
+            await self.user_read_repository.get_by_id(user.user_id)
+
+    async def test_descriptor_lookup(self):
+        # Arrange
+        user = await self._add_user()
+
+        # Act & Assert
+        async with assert_max_queries(self.engine, 1):
+            await self.user_descriptor_repository.get_by_id(user.user_id)
+
+    async def test_budget_exceeded_lists_statements(self):
+        # Arrange
+        user = await self._add_user()
+
+        # Act & Assert
+        with pytest.raises(QueryBudgetExceededError, match="2 statements"):
+            async with assert_max_queries(self.engine, 1):
+                await self.user_repository.get_by_id(user.user_id)
+                await self.user_repository.get_by_id(user.user_id)
+
+    async def test_collects_no_statements_when_idle(self):
+        # Act
+        async with assert_max_queries(self.engine, 0) as statements:
+            pass
+
+        # Assert
+        assert statements == []
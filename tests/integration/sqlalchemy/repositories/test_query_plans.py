@@ -0,0 +1,92 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from tests.integration.sqlalchemy.support import (
+    assert_no_seq_scan,
+    iter_plan_nodes,
+)
+
+from auth.infrastructure.database.sqlalchemy.repositories.active_user_repository import (
+    GET_RECENTLY_ACTIVE,
+)
+from auth.infrastructure.database.sqlalchemy.repositories.refresh_token_repository import (
+    GET_TOKEN_BY_VALUE,
+)
+from auth.infrastructure.database.sqlalchemy.repositories.user_descriptor_repository import (
+    GET_DESCRIPTOR_BY_ID,
+    GET_DESCRIPTORS_BY_IDS,
+)
+from identity.infrastructure.database.sqlalchemy.repositories.user_repository import (
+    GET_USER_BY_ID,
+    GET_USER_BY_USERNAME,
+    GET_USERS_BY_IDS,
+)
+from photos.infrastructure.database.sqlalchemy.repositories.user_photo_repository import (
+    GET_ACTIVE_PHOTO_BY_NAME,
+    LIST_PHOTOS_PAGE,
+    LIST_PHOTOS_PAGE_AFTER,
+)
+
+
+@pytest.mark.asyncio
+class TestHotQueryPlans:
+    @pytest.fixture(autouse=True)
+    def setup(self, engine: AsyncEngine):
+        self.engine = engine
+
+    @pytest.mark.parametrize(
+        "statement, params",
+        [
+            (GET_TOKEN_BY_VALUE, {"value": "token"}),
+            (GET_USER_BY_ID, {"user_id": uuid4()}),
+            (GET_USER_BY_USERNAME, {"username": "user"}),
+            (GET_USERS_BY_IDS, {"user_ids": [uuid4(), uuid4()]}),
+            (GET_DESCRIPTORS_BY_IDS, {"user_ids": [uuid4(), uuid4()]}),
+            (LIST_PHOTOS_PAGE, {"user_id": uuid4(), "limit": 21}),
+            (GET_ACTIVE_PHOTO_BY_NAME, {"name": "photo.jpg"}),
+            (
+                LIST_PHOTOS_PAGE_AFTER,
+                {
+                    "user_id": uuid4(),
+                    "limit": 21,
+                    "created_at": datetime.now(UTC),
+                    "photo_id": uuid4(),
+                },
+            ),
+        ],
+    )
+    async def test_hot_query_uses_index(self, statement, params):
+        # Act & Assert
+        async with self.engine.connect() as conn:
+            await assert_no_seq_scan(conn, statement, params)
+
+    async def test_descriptor_lookup_is_index_only(self):
+        # Arrange
+        # NOTE: index-only scans need an up to date visibility map
+        async with self.engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM ANALYZE users"))
+
+        # Act
+        async with self.engine.connect() as conn:
+            plan = await assert_no_seq_scan(
+                conn, GET_DESCRIPTOR_BY_ID, {"user_id": uuid4()}
+            )
+
+        # Assert
+        node_types = {node["Node Type"] for node in iter_plan_nodes(plan)}
+        assert "Index Only Scan" in node_types
+
+    async def test_recently_active_users_uses_issued_at_index(self):
+        # Arrange
+        params = {
+            "since": datetime.now(UTC) - timedelta(days=7),
+            "limit": 10,
+        }
+
+        # Act & Assert
+        async with self.engine.connect() as conn:
+            await assert_no_seq_scan(conn, GET_RECENTLY_ACTIVE, params)
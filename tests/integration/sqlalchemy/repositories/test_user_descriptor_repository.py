@@ -0,0 +1,72 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.infrastructure.database.sqlalchemy.repositories.user_descriptor_repository import (
+    UserDescriptorRepository,
+)
+from common.infrastructure.database.sqlalchemy.read_only_executor import (
+    ReadOnlyQueryExecutor,
+)
+from identity.application.exceptions import UserNotFoundError
+from identity.domain.entity.user import User
+from identity.infrastructure.database.sqlalchemy.mappers.user_mapper import (
+    UserMapper,
+)
+
+
+@pytest.mark.asyncio
+class TestUserDescriptorRepository:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        maker: async_sessionmaker[AsyncSession],
+        read_only_query_executor: ReadOnlyQueryExecutor,
+    ):
+        self.maker = maker
+        self.repository = UserDescriptorRepository(read_only_query_executor)
+
+    async def _add_users(self, count: int) -> list[User]:
+        users = [User(uuid4(), f"user {i}", "hash") for i in range(count)]
+        async with self.maker() as session:
+            session.add_all([UserMapper.to_persistence(u) for u in users])
+            await session.commit()
+        return users
+
+    async def test_get_by_id_success(self):
+        # Arrange
+        (user,) = await self._add_users(1)
+
+        # Act
+        result = await self.repository.get_by_id(user.user_id)
+
+        # Assert
+        assert result == user.descriptor()
+
+    async def test_get_by_id_not_found(self):
+        # Act & Assert
+        with pytest.raises(UserNotFoundError):
+            await self.repository.get_by_id(uuid4())
+
+    async def test_get_by_ids_returns_existing(self):
+        # Arrange
+        users = await self._add_users(3)
+
+        # Act
+        result = await self.repository.get_by_ids(
+            [users[0].user_id, users[2].user_id, uuid4()]
+        )
+
+        # Assert
+        assert sorted(result, key=lambda d: d.username) == [
+            users[0].descriptor(),
+            users[2].descriptor(),
+        ]
+
+    async def test_get_by_ids_empty(self):
+        # Act
+        result = await self.repository.get_by_ids([])
+
+        # Assert
+        assert result == []
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid4
 
 import pytest
@@ -11,6 +12,7 @@ from identity.infrastructure.database.sqlalchemy.mappers.user_mapper import (
     UserMapper,
 )
 from photos.domain.entity.photo import Photo
+from photos.domain.value_objects.photo_status import PhotoStatus
 from photos.infrastructure.database.sqlalchemy.mappers.photo_mapper import (
     PhotoMapper,
 )
@@ -52,6 +54,21 @@ class TestUserPhotoRepository:
             await session.commit()
         return photo
 
+    async def _add_photos(
+        self, count: int, status: PhotoStatus = PhotoStatus.ACTIVE
+    ) -> list[Photo]:
+        # NOTE: newest first, one minute apart
+        now = datetime.now(UTC)
+        photos = [self._get_photo() for _ in range(count)]
+        async with self.maker() as session:
+            for i, photo in enumerate(photos):
+                photo.status = status
+                model = PhotoMapper.to_persistence(photo)
+                model.created_at = now - timedelta(minutes=i)
+                session.add(model)
+            await session.commit()
+        return photos
+
     def _get_photo(self) -> Photo:
         return Photo(
             photo_id=uuid4(),
@@ -104,3 +121,76 @@ class TestUserPhotoRepository:
         # Assert
         assert len(result) == 0
         assert result == []
+
+    async def test_list_page_walks_newest_first(self):
+        # Arrange
+        photos = await self._add_photos(5)
+
+        # Act
+        first = await self.repository.list_page_by_user_id(
+            self.user.user_id, 2
+        )
+        second = await self.repository.list_page_by_user_id(
+            self.user.user_id, 2, first.next_cursor
+        )
+        third = await self.repository.list_page_by_user_id(
+            self.user.user_id, 2, second.next_cursor
+        )
+
+        # Assert
+        assert first.photos == photos[:2]
+        assert second.photos == photos[2:4]
+        assert third.photos == photos[4:]
+        assert third.next_cursor is None
+
+    async def test_list_page_exact_fit_has_no_next_cursor(self):
+        # Arrange
+        photos = await self._add_photos(2)
+
+        # Act
+        page = await self.repository.list_page_by_user_id(
+            self.user.user_id, 2
+        )
+
+        # Assert
+        assert page.photos == photos
+        assert page.next_cursor is None
+
+    async def test_list_page_skips_pending_photos(self):
+        # Arrange
+        await self._add_photos(1, PhotoStatus.PENDING)
+
+        # Act
+        page = await self.repository.list_page_by_user_id(
+            self.user.user_id, 10
+        )
+
+        # Assert
+        assert page.photos == []
+
+    async def test_exists_active_finds_active_photo(self):
+        # Arrange
+        (photo,) = await self._add_photos(1)
+
+        # Act
+        result = await self.repository.exists_active(photo.name)
+
+        # Assert
+        assert result is True
+
+    async def test_exists_active_ignores_pending_photo(self):
+        # Arrange
+        (photo,) = await self._add_photos(1, PhotoStatus.PENDING)
+
+        # Act
+        result = await self.repository.exists_active(photo.name)
+
+        # Assert
+        assert result is False
+
+    async def test_exists_active_unknown_name(self):
+        # Act
+        result = await self.repository.exists_active("missing.jpg")
+
+        # Assert
+        assert result is False
@@ -4,6 +4,9 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.read_only_executor import (
+    ReadOnlyQueryExecutor,
+)
 from identity.application.exceptions import UserNotFoundError
 from identity.application.read_models.user_read_model import UserReadModel
 from identity.domain.entity.user import User
@@ -45,3 +48,28 @@ class TestUserRepository:
     async def test_get_by_id_not_found(self):
         with pytest.raises(UserNotFoundError):
             await self.user_repository.get_by_id(uuid4())
+
+
+@pytest.mark.asyncio
+class TestReadOnlyUserReadRepository:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        maker: async_sessionmaker[AsyncSession],
+        read_only_query_executor: ReadOnlyQueryExecutor,
+    ):
+        self.maker = maker
+        self.user_repository = UserReadRepository(read_only_query_executor)
+
+    async def test_get_by_id_success(self):
+        user = User(uuid4(), "test user", "hash")
+        async with self.maker() as session:
+            session.add(UserMapper.to_persistence(user))
+            await session.commit()
+
+        result = await self.user_repository.get_by_id(user.user_id)
+        assert result == UserReadModel(user.user_id, user.username)
+
+    async def test_get_by_id_not_found(self):
+        with pytest.raises(UserNotFoundError):
+            await self.user_repository.get_by_id(uuid4())
@@ -58,6 +58,27 @@ class TestUserRepository:
         with pytest.raises(UserNotFoundError):
             await self.user_repository.get_by_id(uuid4())
 
+    async def test_get_by_ids_returns_existing_users(self):
+        # Arrange
+        users = [User(uuid4(), f"user {i}", "hash") for i in range(3)]
+        async with self.maker() as session:
+            session.add_all(UserMapper.to_persistence(u) for u in users)
+            await session.commit()
+
+        # Act
+        result = await self.user_repository.get_by_ids(
+            [users[0].user_id, users[2].user_id, uuid4()]
+        )
+
+        # Assert
+        assert sorted(result, key=lambda u: u.username) == [
+            users[0],
+            users[2],
+        ]
+
+    async def test_get_by_ids_empty(self):
+        assert await self.user_repository.get_by_ids([]) == []
+
     async def test_exists_by_username_true(self):
         user = await self._add_user()
         assert await self.user_repository.exists_by_username(user.username)
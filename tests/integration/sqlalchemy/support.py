@@ -0,0 +1,109 @@
+# Test support for guarding hot database paths against regressions:
+# statement budgets per use case and EXPLAIN checks for hot queries.
+import json
+import re
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.sql import Executable
+
+from common.infrastructure.database.sqlalchemy.instrumentation import (
+    normalize_sql,
+)
+
+
+# NOTE: savepoints come from test isolation (nested transactions), they
+# are not issued in production
+_TRANSACTION_CONTROL = re.compile(
+    r"^\s*(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT|BEGIN|COMMIT"
+    r"|ROLLBACK)\b",
+    re.IGNORECASE,
+)
+
+
+class QueryBudgetExceededError(AssertionError):
+    pass
+
+
+@asynccontextmanager
+async def assert_max_queries(
+    engine: AsyncEngine, budget: int
+) -> AsyncIterator[list[str]]:
+    statements: list[str] = []
+
+    def on_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        if not _TRANSACTION_CONTROL.match(statement):
+            statements.append(statement)
+
+    target = engine.sync_engine
+    event.listen(target, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", on_execute)
+
+    if len(statements) > budget:
+        listing = "\n".join(f"  {normalize_sql(s)}" for s in statements)
+        raise QueryBudgetExceededError(
+            f"{len(statements)} statements executed, budget is {budget}:\n"
+            f"{listing}"
+        )
+
+
+async def explain(
+    conn: AsyncConnection,
+    statement: Executable,
+    params: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    # NOTE: seq scans are disabled so the planner falls back to them only
+    # when no usable index exists, which makes tiny test tables meaningful
+    if params:
+        statement = statement.params(**params)  # type: ignore
+    compiled = statement.compile(
+        dialect=conn.dialect,
+        compile_kwargs={"literal_binds": True, "render_postcompile": True},
+    )
+    async with conn.begin():
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        result = await conn.execute(
+            text(f"EXPLAIN (FORMAT JSON) {compiled}")
+        )
+        plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def iter_plan_nodes(plan: Mapping[str, Any]) -> Iterator[Mapping[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+async def assert_no_seq_scan(
+    conn: AsyncConnection,
+    statement: Executable,
+    params: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    plan = await explain(conn, statement, params)
+    scans = [
+        node.get("Relation Name", "?")
+        for node in iter_plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan"
+    ]
+    assert not scans, (
+        f"sequential scan on {', '.join(scans)}:\n"
+        f"{json.dumps(plan, indent=2)}"
+    )
+    return plan
@@ -1,9 +1,11 @@
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from tests.integration.sqlalchemy.transactions.conftest import MockModel
 
+from common.application.exceptions import RepositoryError
 from common.infrastructure.database.sqlalchemy.session_factory import (
     MakerSessionFactory,
 )
@@ -161,3 +163,35 @@ class TestSQLAlchemyTransactionManager:
 
         assert await self._is_saved(model1)
         assert await self._is_saved(model2)
+
+    async def test_transaction_rollback_only(self):
+        model = self._get()
+        async with self.uow:
+            session = self._get_session_raises()
+            await self._create(model, session)
+            async with self.uow:
+                self.uow.set_rollback_only()
+
+        assert not await self._is_saved(model)
+        assert self._get_session() is None
+
+    async def test_rollback_only_is_not_kept_for_next_transaction(self):
+        async with self.uow:
+            self.uow.set_rollback_only()
+
+        model = self._get()
+        async with self.uow:
+            session = self._get_session_raises()
+            await self._create(model, session)
+
+        assert await self._is_saved(model)
+
+    async def test_session_cleared_when_commit_fails(self):
+        with pytest.raises(RepositoryError):
+            async with self.uow:
+                session = self._get_session_raises()
+                session.commit = AsyncMock(  # type: ignore
+                    side_effect=RuntimeError("commit failed")
+                )
+
+        assert self._get_session() is None
@@ -61,3 +61,43 @@ class TestCachingUserDescriptorRepository:
         self.key_value_cache.set.assert_awaited_once_with(
             self.key, self.descriptor
         )
+
+    async def test_prime_sets_cache(self):
+        # Arrange
+        descriptor = UserDescriptor(self.user_id, "user")
+
+        # Act
+        await self.repository.prime(descriptor)
+
+        # Assert
+        self.key_value_cache.set.assert_awaited_once_with(self.key, descriptor)
+        self.user_descriptor_repository.get_by_id.assert_not_called()
+
+    async def test_prime_many_sets_cache_in_bulk(self):
+        # Arrange
+        descriptor = UserDescriptor(self.user_id, "user")
+
+        # Act
+        await self.repository.prime_many([descriptor])
+
+        # Assert
+        self.key_value_cache.set_many_or_raise.assert_awaited_once_with(
+            {self.key: descriptor}
+        )
+
+    async def test_get_by_ids_fetches_in_bulk_and_caches(self):
+        # Arrange
+        descriptor = UserDescriptor(self.user_id, "user")
+        self.user_descriptor_repository.get_by_ids.return_value = [descriptor]
+
+        # Act
+        result = await self.repository.get_by_ids([self.user_id])
+
+        # Assert
+        assert result == [descriptor]
+        self.user_descriptor_repository.get_by_ids.assert_awaited_once_with(
+            [self.user_id]
+        )
+        self.key_value_cache.set_many.assert_awaited_once_with(
+            {self.key: descriptor}
+        )
@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+from uuid import UUID, uuid4
+
+import pytest
+
+from auth.application.interfaces.repositories.active_user_repository import (
+    IActiveUserRepository,
+)
+from auth.application.interfaces.repositories.descriptor_repository import (
+    IUserDescriptorRepository,
+)
+from auth.application.repositories.caching_descriptor_repository import (
+    CachingUserDescriptorRepository,
+)
+from auth.application.services.user_cache_prewarmer import (
+    UserCachePrewarmer,
+)
+from common.application.exceptions import RepositoryError
+from common.domain.clock import IClock
+from common.domain.value_objects.datetime import DateTime
+from identity.domain.entity.user import User
+from identity.domain.value_objects.descriptor import UserDescriptor
+
+
+@pytest.mark.asyncio
+class TestUserCachePrewarmer:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.now = datetime(2025, 7, 22, tzinfo=UTC)
+        self.clock = Mock(spec=IClock)
+        self.clock.now.return_value = DateTime(self.now)
+
+        self.users = [User(uuid4(), f"user {i}", "hash") for i in range(5)]
+        self.active_user_repository = Mock(spec=IActiveUserRepository)
+        self.active_user_repository.get_recently_active.return_value = [
+            user.user_id for user in self.users
+        ]
+
+        by_id = {user.user_id: user.descriptor() for user in self.users}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def get_by_ids(
+            user_ids: Sequence[UUID],
+        ) -> list[UserDescriptor]:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return [by_id[user_id] for user_id in user_ids]
+
+        self.user_descriptor_repository = Mock(spec=IUserDescriptorRepository)
+        self.user_descriptor_repository.get_by_ids.side_effect = get_by_ids
+        self.caching_user_descriptor_repository = Mock(
+            spec=CachingUserDescriptorRepository
+        )
+
+        self.prewarmer = UserCachePrewarmer(
+            self.clock,
+            self.active_user_repository,
+            self.user_descriptor_repository,
+            self.caching_user_descriptor_repository,
+            limit=5,
+            window=timedelta(days=1),
+            batch_size=2,
+            concurrency=1,
+        )
+
+    async def test_prewarm_loads_active_users_in_batches(self):
+        # Act
+        result = await self.prewarmer.prewarm()
+
+        # Assert
+        self.active_user_repository.get_recently_active.assert_awaited_once_with(
+            self.now - timedelta(days=1), 5
+        )
+        assert self.user_descriptor_repository.get_by_ids.await_count == 3
+        primed = [
+            descriptor
+            for call in self.caching_user_descriptor_repository.prime_many.await_args_list
+            for descriptor in call.args[0]
+        ]
+        assert primed == [user.descriptor() for user in self.users]
+        assert result.users == 5
+        assert result.warmed == 5
+        assert result.failed_batches == 0
+
+    async def test_prewarm_respects_concurrency(self):
+        # Act
+        await self.prewarmer.prewarm()
+
+        # Assert
+        assert self.max_in_flight == 1
+
+    async def test_prewarm_counts_failed_batches(self):
+        # Arrange
+        self.caching_user_descriptor_repository.prime_many.side_effect = [
+            None,
+            RepositoryError("redis down"),
+            None,
+        ]
+
+        # Act
+        result = await self.prewarmer.prewarm()
+
+        # Assert
+        assert result.warmed == 3
+        assert result.failed_batches == 1
+
+    async def test_prewarm_without_active_users(self):
+        # Arrange
+        self.active_user_repository.get_recently_active.return_value = []
+
+        # Act
+        result = await self.prewarmer.prewarm()
+
+        # Assert
+        assert result.users == 0
+        self.user_descriptor_repository.get_by_ids.assert_not_called()
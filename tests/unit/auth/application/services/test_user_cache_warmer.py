@@ -0,0 +1,83 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from auth.application.repositories.caching_descriptor_repository import (
+    CachingUserDescriptorRepository,
+)
+from auth.application.services.user_cache_warmer import UserCacheWarmer
+from common.application.interfaces.tasks.background_task_publisher import (
+    IBackgroundTaskPublisher,
+)
+from identity.application.read_models.user_read_model import UserReadModel
+from identity.application.repositories.caching_user_read_repository import (
+    CachingUserReadRepository,
+)
+from identity.domain.value_objects.descriptor import UserDescriptor
+
+
+@pytest.mark.asyncio
+class TestUserCacheWarmer:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.task_publisher = Mock(spec=IBackgroundTaskPublisher)
+        self.user_descriptor_repository = Mock(
+            spec=CachingUserDescriptorRepository
+        )
+        self.user_read_repository = Mock(spec=CachingUserReadRepository)
+
+        self.warmer = UserCacheWarmer(
+            self.task_publisher,
+            self.user_descriptor_repository,
+            self.user_read_repository,
+        )
+
+        self.user_id = uuid4()
+        self.descriptor = UserDescriptor(self.user_id, "user")
+        self.read_model = UserReadModel(self.user_id, "user")
+
+    async def _run_published(self):
+        self.task_publisher.publish.assert_called_once()
+        task = self.task_publisher.publish.call_args.args[0]
+        await task()
+
+    async def test_warm_only_schedules(self):
+        # Act
+        self.warmer.warm(self.descriptor)
+
+        # Assert
+        self.task_publisher.publish.assert_called_once()
+        self.user_descriptor_repository.prime.assert_not_called()
+        self.user_read_repository.prime.assert_not_called()
+
+    async def test_warm_primes_both_caches(self):
+        # Act
+        self.warmer.warm(self.descriptor)
+        await self._run_published()
+
+        # Assert
+        self.user_descriptor_repository.prime.assert_awaited_once_with(
+            self.descriptor
+        )
+        self.user_read_repository.prime.assert_awaited_once_with(
+            self.read_model
+        )
+
+    async def test_warm_by_id_reads_through_descriptor_cache(self):
+        # Arrange
+        self.user_descriptor_repository.get_by_id.return_value = (
+            self.descriptor
+        )
+
+        # Act
+        self.warmer.warm_by_id(self.user_id)
+        await self._run_published()
+
+        # Assert
+        self.user_descriptor_repository.get_by_id.assert_awaited_once_with(
+            self.user_id
+        )
+        self.user_read_repository.prime.assert_awaited_once_with(
+            self.read_model
+        )
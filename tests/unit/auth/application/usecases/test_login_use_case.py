@@ -13,7 +13,11 @@ from auth.application.interfaces.services.password_hash_service import (
     IPasswordHasher,
 )
 from auth.application.interfaces.services.token_service import ITokenIssuer
+from auth.application.interfaces.services.user_cache_warmer import (
+    IUserCacheWarmer,
+)
 from auth.application.usecases.command.login_use_case import LoginUseCase
+from identity.application.exceptions import UserNotFoundError
 from identity.application.interfaces.repositories.user_repository import (
     IUserRepository,
 )
@@ -29,7 +33,6 @@ class TestLoginUseCase:
 
         self.user_repository = Mock(spec=IUserRepository)
         self.user_repository.get_by_username.return_value = self.user
-        self.user_repository.exists_by_username.return_value = True
 
         self.password_hasher = Mock(spec=IPasswordHasher)
         self.password_hasher.verify = Mock(return_value=True)
@@ -39,11 +42,16 @@ class TestLoginUseCase:
         self.tokens = AuthTokens(self.user_id, "access_token", "refresh_token")
         self.token_issuer.issue_tokens.return_value = self.tokens
 
+        self.user_cache_warmer = Mock(spec=IUserCacheWarmer)
+
         self.command = LoginCommand(
             username=self.user.username, password="correct_password"
         )
         self.use_case = LoginUseCase(
-            self.user_repository, self.password_hasher, self.token_issuer
+            self.user_repository,
+            self.password_hasher,
+            self.token_issuer,
+            self.user_cache_warmer,
         )
 
     async def test_login_success(self):
@@ -53,9 +61,7 @@ class TestLoginUseCase:
         assert result.access_token == "access_token"
         assert result.refresh_token == "refresh_token"
 
-        self.user_repository.exists_by_username.assert_awaited_once_with(
-            self.user.username
-        )
+        self.user_repository.exists_by_username.assert_not_called()
         self.user_repository.get_by_username.assert_awaited_once_with(
             self.user.username
         )
@@ -63,13 +69,20 @@ class TestLoginUseCase:
             "correct_password", self.user.password
         )
         self.token_issuer.issue_tokens.assert_awaited_once_with(self.user_id)
+        self.user_cache_warmer.warm.assert_called_once_with(
+            self.user.descriptor()
+        )
 
     async def test_login_invalid_username(self):
-        self.user_repository.exists_by_username.return_value = False
+        self.user_repository.get_by_username.side_effect = UserNotFoundError(
+            self.user.username
+        )
         with pytest.raises(InvalidUsernameError):
             await self.use_case.execute(self.command)
+        self.token_issuer.issue_tokens.assert_not_called()
 
     async def test_login_invalid_password(self):
         self.password_hasher.verify.return_value = False
         with pytest.raises(InvalidPasswordError):
             await self.use_case.execute(self.command)
+        self.user_cache_warmer.warm.assert_not_called()
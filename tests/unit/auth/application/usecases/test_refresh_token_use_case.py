@@ -8,6 +8,9 @@ from auth.application.dtos.commands.refresh_token_command import (
 )
 from auth.application.dtos.models.auth_tokens import AuthTokens
 from auth.application.interfaces.services.token_service import ITokenRefresher
+from auth.application.interfaces.services.user_cache_warmer import (
+    IUserCacheWarmer,
+)
 from auth.application.usecases.command.refresh_token_use_case import (
     RefreshTokenUseCase,
 )
@@ -24,8 +27,12 @@ class TestRefreshTokenUseCase:
             return_value=self.tokens
         )
 
+        self.user_cache_warmer = Mock(spec=IUserCacheWarmer)
+
         self.command = RefreshTokenCommand(refresh_token="refresh_token")
-        self.use_case = RefreshTokenUseCase(self.token_refresher)
+        self.use_case = RefreshTokenUseCase(
+            self.token_refresher, self.user_cache_warmer
+        )
 
     async def test_refresh_token_success(self):
         result = await self.use_case.execute(self.command)
@@ -37,3 +44,6 @@ class TestRefreshTokenUseCase:
         self.token_refresher.refresh_tokens.assert_awaited_once_with(
             "refresh_token"
         )
+        self.user_cache_warmer.warm_by_id.assert_called_once_with(
+            self.tokens.user_id
+        )
@@ -9,6 +9,9 @@ from auth.application.dtos.commands.register_user_command import (
 from auth.application.interfaces.services.password_hash_service import (
     IPasswordHasher,
 )
+from auth.application.interfaces.services.user_cache_warmer import (
+    IUserCacheWarmer,
+)
 from auth.application.usecases.command.register_user_use_case import (
     RegisterUserUseCase,
 )
@@ -36,6 +39,8 @@ class TestRegisterUserUseCase:
         self.user_repository = Mock(spec=IUserRepository)
         self.user_repository.exists_by_username.return_value = False
 
+        self.user_cache_warmer = Mock(spec=IUserCacheWarmer)
+
         self.command = RegisterUserCommand(
             username="test user", password="password"
         )
@@ -43,6 +48,7 @@ class TestRegisterUserUseCase:
             user_factory=self.user_factory,
             user_repository=self.user_repository,
             password_hasher=self.password_hasher,
+            user_cache_warmer=self.user_cache_warmer,
         )
 
     async def test_register_success(self):
@@ -57,6 +63,9 @@ class TestRegisterUserUseCase:
             self.command.password
         )
         self.user_repository.add.assert_awaited_once()
+        self.user_cache_warmer.warm.assert_called_once_with(
+            self.user.descriptor()
+        )
 
     async def test_register_username_already_taken(self):
         self.user_repository.exists_by_username.return_value = True
@@ -68,3 +77,4 @@ class TestRegisterUserUseCase:
             self.command.username
         )
         self.user_repository.add.assert_not_awaited()
+        self.user_cache_warmer.warm.assert_not_called()
@@ -0,0 +1,103 @@
+import pytest
+from pydantic import ValidationError
+from redis.asyncio import BlockingConnectionPool, Redis, RedisCluster
+from redis.asyncio.sentinel import SentinelConnectionPool
+
+from common.infrastructure.config.redis_config import (
+    RedisConfig,
+    RedisTopology,
+)
+from common.infrastructure.database.redis.redis import RedisDatabase
+
+
+class TestRedisDatabaseClientFactory:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.config = RedisConfig(
+            host="localhost",
+            port=6379,
+            password="secret",
+            max_connections=7,
+            pool_timeout=0.5,
+            socket_connect_timeout=0.25,
+            socket_timeout=0.75,
+            health_check_interval=10,
+            retry_attempts=2,
+        )
+
+    def test_standalone_uses_blocking_pool(self):
+        # Act
+        client = RedisDatabase.create_redis_client(self.config)
+
+        # Assert
+        assert isinstance(client, Redis)
+        pool = client.connection_pool
+        assert isinstance(pool, BlockingConnectionPool)
+        assert pool.max_connections == 7
+        assert pool.timeout == 0.5
+        kwargs = pool.connection_kwargs
+        assert kwargs["socket_connect_timeout"] == 0.25
+        assert kwargs["socket_timeout"] == 0.75
+        assert kwargs["socket_keepalive"] is True
+        assert kwargs["health_check_interval"] == 10
+        assert kwargs["retry"].get_retries() == 2
+
+    def test_sentinel_uses_sentinel_pool(self):
+        # Arrange
+        config = self.config.model_copy(
+            update={
+                "topology": RedisTopology.SENTINEL,
+                "sentinel_nodes": ["sentinel-1:26379", "sentinel-2:26379"],
+                "sentinel_service_name": "cache",
+            }
+        )
+
+        # Act
+        client = RedisDatabase.create_redis_client(config)
+
+        # Assert
+        assert isinstance(client, Redis)
+        pool = client.connection_pool
+        assert isinstance(pool, SentinelConnectionPool)
+        assert pool.service_name == "cache"
+        assert pool.max_connections == 7
+
+    def test_cluster_uses_cluster_client(self):
+        # Arrange
+        config = self.config.model_copy(
+            update={
+                "topology": RedisTopology.CLUSTER,
+                "cluster_nodes": ["node-1:7000", "node-2:7001"],
+            }
+        )
+
+        # Act
+        client = RedisDatabase.create_redis_client(config)
+
+        # Assert
+        assert isinstance(client, RedisCluster)
+
+    def test_node_addresses_default_to_host_and_port(self):
+        # Assert
+        assert self.config.sentinel_addresses == [("localhost", 6379)]
+        assert self.config.cluster_addresses == [("localhost", 6379)]
+
+    def test_cluster_rejects_non_zero_db(self):
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            RedisConfig(
+                host="localhost",
+                port=6379,
+                db=1,
+                topology=RedisTopology.CLUSTER,
+            )
+
+    def test_cluster_rejects_client_tracking(self):
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            RedisConfig(
+                host="localhost",
+                port=6379,
+                topology=RedisTopology.CLUSTER,
+                tracking_enabled=True,
+            )
@@ -0,0 +1,96 @@
+import logging
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+from redis.asyncio import Redis
+
+from common.infrastructure.config.redis_config import (
+    RedisConfig,
+    RedisTrackingMode,
+)
+from common.infrastructure.database.redis.redis import RedisDatabase
+from common.infrastructure.database.redis.tracking import (
+    RedisInvalidationListener,
+)
+
+
+class TestRedisInvalidationListener:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.client = Redis(host="localhost", port=6379)
+        self.callback = Mock()
+
+    def make_listener(
+        self, mode: RedisTrackingMode
+    ) -> RedisInvalidationListener:
+        config = RedisConfig(
+            host="localhost",
+            port=6379,
+            tracking_enabled=True,
+            tracking_mode=mode,
+            tracking_prefixes=["user:"],
+        )
+        listener = RedisInvalidationListener(
+            self.client,
+            config,
+            logging.getLogger(),
+            client_factory=partial(RedisDatabase.create_node_client, config),
+        )
+        listener.subscribe(self.callback)
+        return listener
+
+    def test_default_mode_uses_dedicated_client(self):
+        # Act
+        listener = self.make_listener(RedisTrackingMode.DEFAULT)
+
+        # Assert
+        assert listener.get_client() is not self.client
+
+    def test_bcast_mode_uses_main_client(self):
+        # Act
+        listener = self.make_listener(RedisTrackingMode.BCAST)
+
+        # Assert
+        assert listener.get_client() is self.client
+
+    def test_inactive_listener_tracks_nothing(self):
+        # Arrange
+        listener = self.make_listener(RedisTrackingMode.DEFAULT)
+
+        # Act & Assert
+        assert not listener.active
+        assert not listener.is_tracking("user:1")
+
+    def test_bcast_mode_tracks_configured_prefixes(self):
+        # Arrange
+        listener = self.make_listener(RedisTrackingMode.BCAST)
+        listener._client_id = 1  # type: ignore
+
+        # Act & Assert
+        assert listener.is_tracking("user:1")
+        assert not listener.is_tracking("photo:1")
+
+    def test_invalidation_message_notifies_subscribers(self):
+        # Arrange
+        listener = self.make_listener(RedisTrackingMode.DEFAULT)
+
+        # Act
+        listener._dispatch([b"user:1", b"user:2"])  # type: ignore
+
+        # Assert
+        self.callback.assert_called_once_with(["user:1", "user:2"])
+        stats = listener.stats()
+        assert stats.messages == 1
+        assert stats.keys == 2
+
+    def test_flush_message_notifies_subscribers(self):
+        # Arrange
+        listener = self.make_listener(RedisTrackingMode.DEFAULT)
+
+        # Act
+        listener._dispatch(None)  # type: ignore
+
+        # Assert
+        self.callback.assert_called_once_with(None)
+        assert listener.stats().flushes == 1
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import UUID, uuid4
 
 import pytest
@@ -135,3 +135,42 @@ class TestRedisKeyValueStoreUnit:
         self.redis_client.set.assert_awaited_once_with(
             self.key, self.serialized_data, ex=300
         )
+
+    def _pipeline(self) -> MagicMock:
+        pipe = MagicMock()
+        pipe.__aenter__.return_value = pipe
+        pipe.execute = AsyncMock()
+        self.redis_client.pipeline = Mock(return_value=pipe)
+        return pipe
+
+    async def test_set_many_uses_single_pipeline(self):
+        # Arrange
+        pipe = self._pipeline()
+        other = uuid4()
+        self.serializer.serialize.side_effect = [b"a", b"b"]
+
+        # Act
+        await self.store.set_many(
+            {str(self.id): self.id, str(other): other}, expire=300
+        )
+
+        # Assert
+        self.redis_client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.set.call_count == 2
+        pipe.set.assert_any_call(self.key, b"a", ex=300)
+        pipe.set.assert_any_call(
+            self.store.make_key(str(other)), b"b", ex=300
+        )
+        pipe.execute.assert_awaited_once()
+
+    async def test_set_many_with_redis_error(self):
+        # Arrange
+        pipe = self._pipeline()
+        self.serializer.serialize.return_value = self.serialized_data
+        pipe.execute.side_effect = RedisError("Redis connection error")
+
+        # Act & Assert
+        with pytest.raises(
+            RepositoryError, match="Unnable to save values in cache"
+        ):
+            await self.store.set_many({str(self.id): self.id}, expire=300)
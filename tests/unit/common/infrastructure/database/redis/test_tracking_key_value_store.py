@@ -0,0 +1,153 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID, uuid4
+
+import pytest
+
+from common.application.exceptions import NotFoundError
+from common.infrastructure.database.redis.repositories.tracking_key_value_store import (
+    TrackingRedisKeyValueStore,
+)
+from common.infrastructure.database.redis.tracking import (
+    RedisInvalidationListener,
+)
+from common.infrastructure.serializers.serializer import ISerializer
+
+
+@pytest.mark.asyncio
+class TestTrackingRedisKeyValueStore:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.redis_client = AsyncMock()
+        self.serializer = Mock(spec=ISerializer)
+        self.listener = Mock(spec=RedisInvalidationListener)
+        self.listener.is_tracking.return_value = True
+        self.listener.generation = 1
+
+        self.store = TrackingRedisKeyValueStore[UUID](
+            redis_client=self.redis_client,
+            serializer=self.serializer,
+            listener=self.listener,
+            namespace="test",
+            max_entries=2,
+        )
+        self.id = uuid4()
+        self.key = self.store.make_key(str(self.id))
+        self.serialized_data = str(self.id).encode()
+
+        self.redis_client.get.return_value = self.serialized_data
+        self.serializer.deserialize.return_value = self.id
+
+    async def test_subscribes_to_invalidations(self):
+        # Assert
+        self.listener.subscribe.assert_called_once_with(self.store.invalidate)
+
+    async def test_repeat_get_served_locally(self):
+        # Act
+        first = await self.store.get(str(self.id))
+        second = await self.store.get(str(self.id))
+
+        # Assert
+        assert first == second == self.id
+        self.redis_client.get.assert_awaited_once_with(self.key)
+        stats = self.store.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+
+    async def test_invalidation_evicts_local_entry(self):
+        # Arrange
+        await self.store.get(str(self.id))
+
+        # Act
+        self.store.invalidate([self.key])
+        await self.store.get(str(self.id))
+
+        # Assert
+        assert self.redis_client.get.await_count == 2
+        assert self.store.stats().invalidations == 1
+
+    async def test_flush_clears_local_cache(self):
+        # Arrange
+        await self.store.get(str(self.id))
+
+        # Act
+        self.store.invalidate(None)
+
+        # Assert
+        stats = self.store.stats()
+        assert stats.size == 0
+        assert stats.flushes == 1
+
+    async def test_invalidation_during_read_is_not_cached(self):
+        # Arrange
+        async def get(key: str) -> bytes:
+            self.store.invalidate([key])
+            return self.serialized_data
+
+        self.redis_client.get.side_effect = get
+
+        # Act
+        result = await self.store.get(str(self.id))
+
+        # Assert
+        assert result == self.id
+        assert self.store.stats().size == 0
+
+    async def test_reconnect_during_read_is_not_cached(self):
+        # Arrange
+        async def get(key: str) -> bytes:
+            self.listener.generation = 2
+            return self.serialized_data
+
+        self.redis_client.get.side_effect = get
+
+        # Act
+        await self.store.get(str(self.id))
+
+        # Assert
+        assert self.store.stats().size == 0
+
+    async def test_untracked_key_bypasses_local_cache(self):
+        # Arrange
+        self.listener.is_tracking.return_value = False
+
+        # Act
+        await self.store.get(str(self.id))
+        await self.store.get(str(self.id))
+
+        # Assert
+        assert self.redis_client.get.await_count == 2
+        assert self.store.stats().size == 0
+
+    async def test_not_found_is_not_cached(self):
+        # Arrange
+        self.redis_client.get.return_value = None
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await self.store.get(str(self.id))
+        assert self.store.stats().size == 0
+
+    async def test_set_drops_local_entry(self):
+        # Arrange
+        await self.store.get(str(self.id))
+        self.serializer.serialize.return_value = self.serialized_data
+
+        # Act
+        await self.store.set(str(self.id), self.id, expire=300)
+
+        # Assert
+        assert self.store.stats().size == 0
+        self.redis_client.set.assert_awaited_once_with(
+            self.key, self.serialized_data, ex=300
+        )
+
+    async def test_local_cache_is_bounded(self):
+        # Act
+        for _ in range(3):
+            await self.store.get(str(uuid4()))
+
+        # Assert
+        stats = self.store.stats()
+        assert stats.size == 2
+        assert stats.evictions == 1
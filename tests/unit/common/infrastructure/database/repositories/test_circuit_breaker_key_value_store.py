@@ -0,0 +1,104 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.application.exceptions import NotFoundError, RepositoryError
+from common.application.interfaces.repositories.key_value_store import (
+    IKeyValueStore,
+)
+from common.infrastructure.config.circuit_breaker_config import (
+    CircuitBreakerConfig,
+)
+from common.infrastructure.database.repositories.circuit_breaker_key_value_store import (
+    CircuitBreakerKeyValueStore,
+)
+from common.infrastructure.database.repositories.key_value_cache import (
+    TTLKeyValueCache,
+)
+from common.infrastructure.exceptions import CircuitOpenError
+from common.infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+
+
+@pytest.mark.asyncio
+class TestCircuitBreakerKeyValueStore:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.inner = AsyncMock(spec=IKeyValueStore)
+        self.breaker = CircuitBreaker(
+            "redis",
+            CircuitBreakerConfig(window_size=2, minimum_calls=2),
+        )
+        self.store = CircuitBreakerKeyValueStore[str](
+            self.inner, self.breaker
+        )
+
+    async def trip(self) -> None:
+        self.inner.get.side_effect = RepositoryError("timeout")
+        for _ in range(2):
+            with pytest.raises(RepositoryError):
+                await self.store.get("key")
+        self.inner.get.reset_mock()
+
+    async def test_get_delegates_when_closed(self):
+        # Arrange
+        self.inner.get.return_value = "value"
+
+        # Act
+        result = await self.store.get("key")
+
+        # Assert
+        assert result == "value"
+        self.inner.get.assert_awaited_once_with("key")
+
+    async def test_set_delegates_when_closed(self):
+        # Act
+        await self.store.set("key", "value", 300)
+
+        # Assert
+        self.inner.set.assert_awaited_once_with("key", "value", 300)
+
+    async def test_set_many_delegates_when_closed(self):
+        # Act
+        await self.store.set_many({"key": "value"}, 300)
+
+        # Assert
+        self.inner.set_many.assert_awaited_once_with({"key": "value"}, 300)
+
+    async def test_not_found_does_not_trip(self):
+        # Arrange
+        self.inner.get.side_effect = NotFoundError("key")
+
+        # Act
+        for _ in range(4):
+            with pytest.raises(NotFoundError):
+                await self.store.get("key")
+
+        # Assert
+        assert self.breaker.state == CircuitState.CLOSED
+
+    async def test_open_circuit_raises_repository_error(self):
+        # Arrange
+        await self.trip()
+
+        # Act & Assert
+        with pytest.raises(RepositoryError) as exc_info:
+            await self.store.get("key")
+        assert isinstance(exc_info.value.__cause__, CircuitOpenError)
+        self.inner.get.assert_not_awaited()
+
+    async def test_cache_degrades_to_miss_when_open(self):
+        # Arrange
+        await self.trip()
+        cache = TTLKeyValueCache[str](self.store)
+
+        # Act
+        result = await cache.get("key")
+        await cache.set("key", "value")
+
+        # Assert
+        assert result is None
+        self.inner.get.assert_not_awaited()
+        self.inner.set.assert_not_awaited()
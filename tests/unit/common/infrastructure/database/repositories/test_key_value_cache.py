@@ -129,6 +129,41 @@ class TestTTLKeyValueCache:
             self.key, self.descriptor, self.ttl
         )
 
+    async def test_set_many_success(self):
+        # Arrange
+        items = {self.key: self.descriptor}
+
+        # Act
+        await self.cache.set_many(items)
+
+        # Assert
+        self.store.set_many.assert_awaited_once_with(items, self.ttl)
+
+    async def test_set_many_repository_error_swallowed(self):
+        # Arrange
+        self.store.set_many.side_effect = RepositoryError("Storage error")
+
+        # Act
+        await self.cache.set_many({self.key: self.descriptor})
+
+        # Assert
+        self.store.set_many.assert_awaited_once()
+
+    async def test_set_many_or_raise_repository_error(self):
+        # Arrange
+        self.store.set_many.side_effect = RepositoryError("Storage error")
+
+        # Act & Assert
+        with pytest.raises(RepositoryError, match="Storage error"):
+            await self.cache.set_many_or_raise({self.key: self.descriptor})
+
+    async def test_set_many_empty_skips_store(self):
+        # Act
+        await self.cache.set_many_or_raise({})
+
+        # Assert
+        self.store.set_many.assert_not_awaited()
+
     async def test_make_key_single_part(self):
         # Act
         result = self.cache.make_key("part1")
@@ -0,0 +1,118 @@
+import logging
+
+import pytest
+
+from common.infrastructure.config.database_config import DatabaseConfig
+from common.infrastructure.database.sqlalchemy.database import Database
+from common.infrastructure.database.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+)
+
+
+@pytest.mark.asyncio
+class TestDatabaseEngine:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.config = DatabaseConfig(
+            db_name="db",
+            db_user="user",
+            db_pass="password",
+            db_host="localhost",
+            db_port=5432,
+            db_pool_size=7,
+            db_max_overflow=3,
+            db_pool_timeout=1.5,
+            db_pool_recycle=600,
+            db_statement_cache_size=50,
+            db_server_settings={"application_name": "test"},
+        )
+
+    async def test_engine_uses_pool_config(self):
+        # Act
+        database = Database.create(self.config, logging.getLogger("test"))
+
+        # Assert
+        pool = database.get_engine().pool
+        assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+        assert pool.size() == 7
+        assert pool.timeout() == 1.5
+        stats = database.pool_stats()
+        assert stats["capacity"] == 10
+        assert stats["checked_out"] == 0
+
+        await database.shutdown()
+
+    async def test_connect_args(self):
+        # Act
+        args = Database.connect_args(self.config)
+
+        # Assert
+        assert args["timeout"] == self.config.db_connect_timeout
+        assert args["command_timeout"] == self.config.db_command_timeout
+        assert args["statement_cache_size"] == 50
+        assert args["prepared_statement_cache_size"] == 50
+        assert args["server_settings"] == {"application_name": "test"}
+        assert "prepared_statement_name_func" not in args
+
+    async def test_connect_args_pgbouncer_disables_statement_cache(self):
+        # Arrange
+        config = self.config.model_copy(update={"db_pgbouncer": True})
+
+        # Act
+        args = Database.connect_args(config)
+
+        # Assert
+        assert args["statement_cache_size"] == 0
+        assert args["prepared_statement_cache_size"] == 0
+        name_func = args["prepared_statement_name_func"]
+        assert name_func() != name_func()
+
+    async def test_creates_replica_engines(self):
+        # Arrange
+        config = self.config.model_copy(
+            update={"db_replicas": ["replica-1:5433", "replica-2:5434"]}
+        )
+
+        # Act
+        database = Database.create(config, logging.getLogger("test"))
+
+        # Assert
+        router = database.get_replica_router()
+        assert router is not None
+        assert [r.name for r in router.replicas] == [
+            "replica-1:5433",
+            "replica-2:5434",
+        ]
+        url = router.replicas[0].engine.url
+        assert (url.host, url.port, url.database) == ("replica-1", 5433, "db")
+        stats = database.replica_stats()
+        assert stats["replicas"]["replica-2:5434"]["healthy"] is False
+        assert stats["replicas"]["replica-2:5434"]["pool"]["capacity"] == 10
+
+        await database.shutdown()
+
+    async def test_no_replicas_configured(self):
+        # Act
+        database = Database.create(self.config, logging.getLogger("test"))
+
+        # Assert
+        assert database.get_replica_router() is None
+        assert database.replica_stats() == {}
+
+        await database.shutdown()
+
+    async def test_read_only_session_maker_uses_autocommit(self):
+        # Act
+        database = Database.create(self.config, logging.getLogger("test"))
+
+        # Assert
+        session = database.get_read_only_session_maker()()
+        bind = session.bind
+        assert bind.get_execution_options()["isolation_level"] == (
+            "AUTOCOMMIT"
+        )
+        assert session.sync_session.autoflush is False
+        assert bind.pool is database.get_engine().pool
+
+        await session.close()
+        await database.shutdown()
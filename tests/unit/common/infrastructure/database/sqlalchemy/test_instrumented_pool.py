@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from common.infrastructure.database.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+)
+
+
+@pytest.mark.asyncio
+class TestInstrumentedAsyncAdaptedQueuePool:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.pool = InstrumentedAsyncAdaptedQueuePool(
+            MagicMock, pool_size=1, max_overflow=1, timeout=0.01
+        )
+
+    async def test_records_checkouts_and_saturation(self):
+        # Act
+        first = await greenlet_spawn(self.pool.connect)
+        second = await greenlet_spawn(self.pool.connect)
+
+        # Assert
+        stats = self.pool.stats()
+        assert stats["capacity"] == 2
+        assert stats["checked_out"] == 2
+        assert stats["overflow"] == 1
+        assert stats["saturation"] == 1.0
+        assert stats["checkouts"] == 2
+        assert stats["wait_ms_max"] >= stats["wait_ms_avg"] >= 0
+
+        await greenlet_spawn(first.close)
+        await greenlet_spawn(second.close)
+        assert self.pool.stats()["checked_out"] == 0
+
+    async def test_records_timeouts(self):
+        # Arrange
+        connections = [
+            await greenlet_spawn(self.pool.connect) for _ in range(2)
+        ]
+
+        # Act & Assert
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(self.pool.connect)
+        assert self.pool.stats()["timeouts"] == 1
+
+        for connection in connections:
+            await greenlet_spawn(connection.close)
+
+    async def test_recreate_keeps_stats(self):
+        # Arrange
+        connection = await greenlet_spawn(self.pool.connect)
+        await greenlet_spawn(connection.close)
+
+        # Act
+        pool = self.pool.recreate()
+
+        # Assert
+        assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+        assert pool.stats()["checkouts"] == 1
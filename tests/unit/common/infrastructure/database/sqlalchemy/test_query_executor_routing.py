@@ -0,0 +1,139 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import sqlalchemy.exc
+from sqlalchemy import bindparam, column, delete, select, table
+
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.replicas import (
+    Replica,
+    ReplicaRouter,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+
+
+users = table("users", column("id"))
+
+
+@pytest.mark.asyncio
+class TestQueryExecutorRouting:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.primary_session = MagicMock()
+        self.primary_session.execute = AsyncMock(return_value="primary")
+        self.primary_session.commit = AsyncMock()
+        self.primary_session.rollback = AsyncMock()
+        self.primary_session.close = AsyncMock()
+        self.primary_session.is_active = True
+        session_factory = MagicMock()
+        session_factory.create.return_value = self.primary_session
+        self.uow = UnitOfWork(session_factory)
+
+        self.replica_session = MagicMock()
+        self.replica_session.execute = AsyncMock(return_value="replica")
+        self.replica = Replica("replica:5432", MagicMock())
+        self.replica.healthy = True
+
+        @asynccontextmanager
+        async def session_maker():
+            yield self.replica_session
+
+        self.replica.session_maker = session_maker  # type: ignore
+        self.router = ReplicaRouter([self.replica], sticky_window=5.0)
+        self.executor = QueryExecutor(self.uow, self.router)
+
+    async def test_select_goes_to_replica(self):
+        # Act
+        result = await self.executor.execute(select(users))
+
+        # Assert
+        assert result == "replica"
+        self.primary_session.execute.assert_not_awaited()
+
+    async def test_select_for_update_goes_to_primary(self):
+        # Act
+        result = await self.executor.execute(
+            select(users).with_for_update()
+        )
+
+        # Assert
+        assert result == "primary"
+
+    async def test_select_after_write_in_transaction_goes_to_primary(self):
+        # Act
+        async with self.uow:
+            await self.executor.execute(delete(users))
+            result = await self.executor.execute(select(users))
+
+        # Assert
+        assert result == "primary"
+        self.replica_session.execute.assert_not_awaited()
+
+    async def test_select_within_sticky_window_goes_to_primary(self):
+        # Arrange
+        await self.executor.execute(delete(users))
+
+        # Act
+        result = await self.executor.execute(select(users))
+
+        # Assert
+        assert result == "primary"
+
+    async def test_select_in_read_only_transaction_goes_to_replica(self):
+        # Act
+        async with self.uow:
+            result = await self.executor.execute(select(users))
+
+        # Assert
+        assert result == "replica"
+
+    async def test_unavailable_replica_falls_back_to_primary(self):
+        # Arrange
+        self.replica_session.execute.side_effect = (
+            sqlalchemy.exc.OperationalError("SELECT", {}, OSError())
+        )
+
+        # Act
+        result = await self.executor.execute(select(users))
+
+        # Assert
+        assert result == "primary"
+        assert self.replica.healthy is False
+        assert self.router.stats()["fallbacks"] == 1
+
+    async def test_query_error_on_replica_is_raised(self):
+        # Arrange
+        self.replica_session.execute.side_effect = (
+            sqlalchemy.exc.ProgrammingError("SELECT", {}, Exception())
+        )
+
+        # Act & Assert
+        with pytest.raises(sqlalchemy.exc.ProgrammingError):
+            await self.executor.execute(select(users))
+        assert self.replica.healthy is True
+
+    async def test_without_router_uses_primary(self):
+        # Arrange
+        executor = QueryExecutor(self.uow)
+
+        # Act
+        result = await executor.execute(select(users))
+
+        # Assert
+        assert result == "primary"
+
+    async def test_execute_row_passes_params_to_replica(self):
+        # Arrange
+        result = MagicMock()
+        result.one_or_none.return_value = "row"
+        self.replica_session.execute.return_value = result
+        stmt = select(users).where(users.c.id == bindparam("id"))
+
+        # Act
+        row = await self.executor.execute_row(stmt, {"id": 1})
+
+        # Assert
+        assert row == "row"
+        self.replica_session.execute.assert_awaited_once_with(stmt, {"id": 1})
+        result.unique.assert_not_called()
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from common.infrastructure.database.sqlalchemy.instrumentation import (
+    QueryInstrumentation,
+    QueryStats,
+    normalize_sql,
+    track_queries,
+)
+
+
+class TestNormalizeSql:
+    def test_replaces_literals_and_params(self):
+        # Act
+        result = normalize_sql(
+            "SELECT users.user_id\n  FROM users\n"
+            "WHERE users.username = $1::VARCHAR AND note = 'it''s'"
+            " LIMIT 10"
+        )
+
+        # Assert
+        assert result == (
+            "SELECT users.user_id FROM users "
+            "WHERE users.username = ?::VARCHAR AND note = ? LIMIT ?"
+        )
+
+    def test_collapses_in_lists(self):
+        # Act
+        short = normalize_sql("SELECT a FROM t WHERE a IN ($1::UUID, $2::UUID)")
+        long = normalize_sql("SELECT a FROM t WHERE a IN ($1, $2, $3, $4)")
+
+        # Assert
+        assert short == "SELECT a FROM t WHERE a IN (?)"
+        assert long == short
+
+    def test_keeps_identifiers_with_digits(self):
+        # Act
+        result = normalize_sql("SELECT anon_1.x FROM t AS anon_1")
+
+        # Assert
+        assert result == "SELECT anon_1.x FROM t AS anon_1"
+
+
+@pytest.mark.asyncio
+class TestQueryInstrumentation:
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self):
+        self.engine = create_async_engine("sqlite+aiosqlite://")
+        self.logger = logging.getLogger("test.queries")
+        self.instrumentation = QueryInstrumentation(
+            self.logger, slow_query_threshold_ms=1000.0
+        )
+        self.instrumentation.attach(self.engine)
+        yield
+        await self.engine.dispose()
+
+    async def _query(self, value: int = 1) -> None:
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT :value"), {"value": value})
+
+    async def test_tracks_queries_per_context(self):
+        # Act
+        with track_queries("request") as stats:
+            await self._query()
+            await asyncio.create_task(self._query(2))
+        await self._query()
+
+        # Assert
+        assert stats.count == 2
+        assert stats.total_ms > 0
+        assert stats.slowest == "SELECT ?"
+        assert self.instrumentation.stats()["statements"] == 3
+
+    async def test_untracked_queries_only_update_totals(self):
+        # Act
+        await self._query()
+
+        # Assert
+        assert self.instrumentation.stats()["statements"] == 1
+        assert self.instrumentation.stats()["slow_statements"] == 0
+
+    async def test_logs_slow_queries(self, caplog: pytest.LogCaptureFixture):
+        # Arrange
+        instrumentation = QueryInstrumentation(
+            self.logger, slow_query_threshold_ms=0.0
+        )
+        instrumentation.attach(self.engine)
+
+        # Act
+        with caplog.at_level(logging.WARNING, logger="test.queries"):
+            with track_queries("request-id"):
+                await self._query()
+
+        # Assert
+        (record,) = [r for r in caplog.records if r.msg == "slow query"]
+        assert record.extra["statement"] == "SELECT ?"  # type: ignore
+        assert record.extra["request_id"] == "request-id"  # type: ignore
+        assert instrumentation.stats()["slow_statements"] == 1
+
+    async def test_failed_statement_is_not_recorded(self):
+        # Act
+        with track_queries() as stats:
+            with pytest.raises(OperationalError):
+                async with self.engine.connect() as conn:
+                    await conn.execute(text("SELECT * FROM missing"))
+            await self._query()
+
+        # Assert
+        assert stats.count == 1
+
+    async def test_stats_as_dict(self):
+        # Arrange
+        stats = QueryStats()
+        stats.record(1.5, "SELECT 1")
+        stats.record(3.0, "SELECT * FROM users WHERE id = 7")
+
+        # Act
+        result = stats.as_dict()
+
+        # Assert
+        assert result == {
+            "db_queries": 2,
+            "db_time_ms": "4.50",
+            "db_slowest_ms": "3.00",
+            "db_slowest": "SELECT * FROM users WHERE id = ?",
+        }
@@ -0,0 +1,107 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import column, delete, select, table
+
+from common.infrastructure.database.sqlalchemy.read_only_executor import (
+    ReadOnlyQueryExecutor,
+)
+from common.infrastructure.database.sqlalchemy.replicas import (
+    Replica,
+    ReplicaRouter,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+
+
+users = table("users", column("id"))
+
+
+def make_session(result: str) -> MagicMock:
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    session.is_active = True
+    return session
+
+
+def make_maker(session: MagicMock):
+    @asynccontextmanager
+    async def maker():
+        yield session
+
+    return maker
+
+
+@pytest.mark.asyncio
+class TestReadOnlyQueryExecutor:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.uow_session = make_session("uow")
+        session_factory = MagicMock()
+        session_factory.create.return_value = self.uow_session
+        self.uow = UnitOfWork(session_factory)
+
+        self.read_only_session = make_session("read_only")
+        self.executor = ReadOnlyQueryExecutor(
+            self.uow, make_maker(self.read_only_session)
+        )
+
+    async def test_select_uses_autocommit_session(self):
+        # Act
+        result = await self.executor.execute(select(users))
+
+        # Assert
+        assert result == "read_only"
+        self.uow_session.execute.assert_not_awaited()
+        self.uow_session.commit.assert_not_awaited()
+
+    async def test_select_inside_unit_of_work_skips_its_session(self):
+        # Act
+        async with self.uow:
+            result = await self.executor.execute(select(users))
+
+        # Assert
+        assert result == "read_only"
+        self.uow_session.execute.assert_not_awaited()
+
+    async def test_select_after_write_uses_unit_of_work_session(self):
+        # Act
+        async with self.uow:
+            self.uow.mark_write()
+            result = await self.executor.execute(select(users))
+
+        # Assert
+        assert result == "uow"
+        self.read_only_session.execute.assert_not_awaited()
+
+    async def test_select_prefers_healthy_replica(self):
+        # Arrange
+        replica = Replica("replica:5432", MagicMock())
+        replica.healthy = True
+        replica_session = make_session("replica")
+        replica.session_maker = make_maker(replica_session)  # type: ignore
+        executor = ReadOnlyQueryExecutor(
+            self.uow,
+            make_maker(self.read_only_session),
+            ReplicaRouter([replica], sticky_window=5.0),
+        )
+
+        # Act
+        result = await executor.execute(select(users))
+
+        # Assert
+        assert result == "replica"
+
+    async def test_rejects_writes(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await self.executor.execute(delete(users))
+        with pytest.raises(ValueError):
+            await self.executor.add(MagicMock())
+        with pytest.raises(ValueError):
+            await self.executor.add_all([MagicMock()])
+        with pytest.raises(ValueError):
+            await self.executor.save(MagicMock())
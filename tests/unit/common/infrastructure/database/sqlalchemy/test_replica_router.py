@@ -0,0 +1,157 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from common.infrastructure.database.sqlalchemy.replicas import (
+    Replica,
+    ReplicaMonitor,
+    ReplicaRouter,
+)
+
+
+def make_replica(name: str, healthy: bool = True) -> Replica:
+    replica = Replica(name, MagicMock())
+    replica.healthy = healthy
+    return replica
+
+
+@pytest.mark.asyncio
+class TestReplicaRouter:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.now = 100.0
+        self.first = make_replica("replica-1:5432")
+        self.second = make_replica("replica-2:5432")
+        self.router = ReplicaRouter(
+            [self.first, self.second],
+            sticky_window=5.0,
+            clock=lambda: self.now,
+        )
+
+    async def test_pick_round_robins_healthy_replicas(self):
+        # Act
+        picked = [self.router.pick() for _ in range(4)]
+
+        # Assert
+        assert picked == [self.first, self.second, self.first, self.second]
+
+    async def test_pick_skips_unhealthy_replicas(self):
+        # Arrange
+        self.first.healthy = False
+
+        # Act
+        picked = [self.router.pick() for _ in range(2)]
+
+        # Assert
+        assert picked == [self.second, self.second]
+
+    async def test_pick_returns_none_when_no_replica_is_healthy(self):
+        # Arrange
+        self.first.healthy = False
+        self.second.healthy = False
+
+        # Act
+        picked = self.router.pick()
+
+        # Assert
+        assert picked is None
+        assert self.router.stats()["primary_reads"] == 1
+
+    async def test_is_sticky_within_window_after_write(self):
+        # Arrange
+        self.router.mark_write()
+
+        # Act
+        self.now += 4.9
+        sticky = self.router.is_sticky()
+        self.now += 0.2
+        expired = self.router.is_sticky()
+
+        # Assert
+        assert sticky is True
+        assert expired is False
+
+    async def test_mark_failed_removes_replica_from_rotation(self):
+        # Act
+        self.router.mark_failed(self.first)
+
+        # Assert
+        assert self.router.pick() is self.second
+        stats = self.router.stats()
+        assert stats["fallbacks"] == 1
+        assert stats["replicas"]["replica-1:5432"]["failures"] == 1
+        assert stats["replicas"]["replica-1:5432"]["healthy"] is False
+
+
+@pytest.mark.asyncio
+class TestReplicaMonitor:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.replica = make_replica("replica:5432", healthy=False)
+        self.router = ReplicaRouter([self.replica], sticky_window=5.0)
+        self.monitor = ReplicaMonitor(
+            self.router,
+            max_lag=5.0,
+            interval=60.0,
+            logger=logging.getLogger("test"),
+        )
+
+    def _mock_lag(self, lag: float | None = None, error: bool = False):
+        conn = MagicMock()
+        if error:
+            conn.scalar.side_effect = OSError("connection refused")
+        else:
+
+            async def scalar(_):
+                return lag
+
+            conn.scalar.side_effect = scalar
+        connect = self.replica.engine.connect.return_value
+        connect.__aenter__.return_value = conn
+
+    async def test_check_marks_replica_healthy_within_lag(self):
+        # Arrange
+        self._mock_lag(1.5)
+
+        # Act
+        await self.monitor.check()
+
+        # Assert
+        assert self.replica.healthy is True
+        assert self.replica.lag == 1.5
+
+    async def test_check_marks_lagging_replica_unhealthy(self):
+        # Arrange
+        self.replica.healthy = True
+        self._mock_lag(30.0)
+
+        # Act
+        await self.monitor.check()
+
+        # Assert
+        assert self.replica.healthy is False
+        assert self.replica.lag == 30.0
+
+    async def test_check_marks_unreachable_replica_unhealthy(self):
+        # Arrange
+        self.replica.healthy = True
+        self._mock_lag(error=True)
+
+        # Act
+        await self.monitor.check()
+
+        # Assert
+        assert self.replica.healthy is False
+        assert self.replica.lag is None
+
+    async def test_start_checks_and_stop_cancels(self):
+        # Arrange
+        self._mock_lag(0.0)
+
+        # Act
+        await self.monitor.start()
+        await self.monitor.stop()
+
+        # Assert
+        assert self.replica.healthy is True
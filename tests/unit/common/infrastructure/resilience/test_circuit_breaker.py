@@ -0,0 +1,151 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.application.exceptions import NotFoundError, RepositoryError
+from common.infrastructure.config.circuit_breaker_config import (
+    CircuitBreakerConfig,
+)
+from common.infrastructure.exceptions import CircuitOpenError
+from common.infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+class TestCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.clock = FakeClock()
+        self.config = CircuitBreakerConfig(
+            failure_rate_threshold=0.5,
+            window_size=4,
+            minimum_calls=4,
+            open_timeout=10.0,
+            half_open_max_calls=2,
+        )
+        self.breaker = CircuitBreaker("test", self.config, clock=self.clock)
+        self.ok = AsyncMock(return_value="ok")
+        self.fail = AsyncMock(side_effect=RepositoryError("boom"))
+
+    async def trip(self) -> None:
+        for _ in range(self.config.minimum_calls):
+            with pytest.raises(RepositoryError):
+                await self.breaker.call(self.fail)
+
+    async def test_closed_passes_calls_through(self):
+        # Act
+        result = await self.breaker.call(self.ok)
+
+        # Assert
+        assert result == "ok"
+        assert self.breaker.state == CircuitState.CLOSED
+
+    async def test_opens_when_failure_rate_reaches_threshold(self):
+        # Arrange
+        await self.breaker.call(self.ok)
+        await self.breaker.call(self.ok)
+
+        # Act
+        for _ in range(2):
+            with pytest.raises(RepositoryError):
+                await self.breaker.call(self.fail)
+
+        # Assert
+        assert self.breaker.state == CircuitState.OPEN
+
+    async def test_stays_closed_below_minimum_calls(self):
+        # Act
+        for _ in range(self.config.minimum_calls - 1):
+            with pytest.raises(RepositoryError):
+                await self.breaker.call(self.fail)
+
+        # Assert
+        assert self.breaker.state == CircuitState.CLOSED
+
+    async def test_open_rejects_without_calling(self):
+        # Arrange
+        await self.trip()
+
+        # Act & Assert
+        with pytest.raises(CircuitOpenError):
+            await self.breaker.call(self.ok)
+        self.ok.assert_not_awaited()
+        assert self.breaker.stats()["rejected"] == 1
+
+    async def test_ignored_errors_do_not_count(self):
+        # Arrange
+        not_found = AsyncMock(side_effect=NotFoundError("key"))
+
+        # Act
+        for _ in range(self.config.window_size):
+            with pytest.raises(NotFoundError):
+                await self.breaker.call(not_found)
+
+        # Assert
+        assert self.breaker.state == CircuitState.CLOSED
+        assert self.breaker.stats()["failures"] == 0
+
+    async def test_half_open_after_timeout(self):
+        # Arrange
+        await self.trip()
+
+        # Act
+        self.clock.now += self.config.open_timeout
+
+        # Assert
+        assert self.breaker.state == CircuitState.HALF_OPEN
+
+    async def test_half_open_closes_after_successful_probes(self):
+        # Arrange
+        await self.trip()
+        self.clock.now += self.config.open_timeout
+
+        # Act
+        for _ in range(self.config.half_open_max_calls):
+            await self.breaker.call(self.ok)
+
+        # Assert
+        assert self.breaker.state == CircuitState.CLOSED
+
+    async def test_half_open_reopens_on_probe_failure(self):
+        # Arrange
+        await self.trip()
+        self.clock.now += self.config.open_timeout
+
+        # Act
+        with pytest.raises(RepositoryError):
+            await self.breaker.call(self.fail)
+
+        # Assert
+        assert self.breaker.state == CircuitState.OPEN
+        assert self.breaker.stats()["opened"] == 2
+
+    async def test_half_open_limits_concurrent_probes(self):
+        # Arrange
+        self.config.half_open_max_calls = 1
+        await self.trip()
+        self.clock.now += self.config.open_timeout
+
+        async def probe() -> None:
+            with pytest.raises(CircuitOpenError):
+                await self.breaker.call(self.ok)
+
+        blocking = AsyncMock(side_effect=probe)
+
+        # Act
+        await self.breaker.call(blocking)
+        await self.breaker.call(self.ok)
+
+        # Assert
+        assert self.breaker.state == CircuitState.CLOSED
+        self.ok.assert_awaited_once()
@@ -26,7 +26,7 @@ class TestMarshmallowSerializer:
         result = self.serializer.serialize(self.test_obj)
 
         # Assert
-        assert result == self.serialized_data
+        assert result == self.serialized_data.encode()
         self.schema.dumps.assert_called_once_with(self.test_obj)
 
     def test_serialize_raises_serialization_error(self):
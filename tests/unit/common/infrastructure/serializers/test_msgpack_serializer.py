@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from uuid import UUID, uuid4
+
+import msgpack
+import pytest
+
+from common.infrastructure.exceptions import SerializationError
+from common.infrastructure.serializers.msgpack.serializer import (
+    MsgpackDataclassSerializer,
+)
+
+
+class Role(str, Enum):
+    ADMIN = "admin"
+    USER = "user"
+
+
+@dataclass(frozen=True)
+class Sample:
+    sample_id: UUID
+    name: str
+    role: Role
+    created_at: datetime
+
+
+class TestMsgpackDataclassSerializer:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.serializer = MsgpackDataclassSerializer[Sample](Sample)
+        self.sample = Sample(
+            sample_id=uuid4(),
+            name="sample",
+            role=Role.USER,
+            created_at=datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+        )
+
+    def test_serialize_packs_fields_positionally(self):
+        # Act
+        result = self.serializer.serialize(self.sample)
+
+        # Assert
+        assert isinstance(result, bytes)
+        assert msgpack.unpackb(result) == [
+            self.sample.sample_id.bytes,
+            "sample",
+            "user",
+            "2024-01-01T12:30:00+00:00",
+        ]
+
+    def test_roundtrip_restores_field_types(self):
+        # Act
+        result = self.serializer.deserialize(
+            self.serializer.serialize(self.sample)
+        )
+
+        # Assert
+        assert result == self.sample
+        assert isinstance(result.sample_id, UUID)
+        assert isinstance(result.role, Role)
+
+    def test_deserialize_wrong_arity_raises_serialization_error(self):
+        # Arrange
+        data = msgpack.packb([self.sample.sample_id.bytes, "sample"])
+
+        # Act & Assert
+        with pytest.raises(SerializationError):
+            self.serializer.deserialize(data)  # type: ignore
+
+    def test_deserialize_garbage_raises_serialization_error(self):
+        # Act & Assert
+        with pytest.raises(SerializationError):
+            self.serializer.deserialize(b"\xc1")
@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from uuid import UUID, uuid4
+
+import orjson
+import pytest
+
+from common.infrastructure.exceptions import SerializationError
+from common.infrastructure.serializers.orjson.serializer import (
+    OrjsonDataclassSerializer,
+)
+
+
+class Role(str, Enum):
+    ADMIN = "admin"
+    USER = "user"
+
+
+@dataclass(frozen=True)
+class Sample:
+    sample_id: UUID
+    name: str
+    role: Role
+    created_at: datetime
+
+
+class TestOrjsonDataclassSerializer:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.serializer = OrjsonDataclassSerializer[Sample](Sample)
+        self.sample = Sample(
+            sample_id=uuid4(),
+            name="sample",
+            role=Role.ADMIN,
+            created_at=datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+        )
+
+    def test_serialize_returns_json_bytes(self):
+        # Act
+        result = self.serializer.serialize(self.sample)
+
+        # Assert
+        assert isinstance(result, bytes)
+        assert orjson.loads(result) == {
+            "sample_id": str(self.sample.sample_id),
+            "name": "sample",
+            "role": "admin",
+            "created_at": "2024-01-01T12:30:00+00:00",
+        }
+
+    def test_roundtrip_restores_field_types(self):
+        # Act
+        result = self.serializer.deserialize(
+            self.serializer.serialize(self.sample)
+        )
+
+        # Assert
+        assert result == self.sample
+        assert isinstance(result.sample_id, UUID)
+        assert isinstance(result.role, Role)
+
+    def test_deserialize_ignores_unknown_fields(self):
+        # Arrange
+        data = orjson.dumps(
+            {
+                "sample_id": str(self.sample.sample_id),
+                "name": "sample",
+                "role": "user",
+                "created_at": "2024-01-01T12:30:00+00:00",
+                "extra": 1,
+            }
+        )
+
+        # Act
+        result = self.serializer.deserialize(data)
+
+        # Assert
+        assert result.role == Role.USER
+
+    def test_deserialize_missing_field_raises_serialization_error(self):
+        # Arrange
+        data = orjson.dumps({"name": "sample"})
+
+        # Act & Assert
+        with pytest.raises(SerializationError):
+            self.serializer.deserialize(data)
+
+    def test_deserialize_invalid_json_raises_serialization_error(self):
+        # Act & Assert
+        with pytest.raises(SerializationError):
+            self.serializer.deserialize(b"not-json")
+
+    def test_serialize_unsupported_type_raises_serialization_error(self):
+        # Act & Assert
+        with pytest.raises(SerializationError):
+            self.serializer.serialize(object())  # type: ignore
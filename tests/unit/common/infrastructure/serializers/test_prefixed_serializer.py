@@ -0,0 +1,87 @@
+from unittest.mock import Mock
+
+import pytest
+
+from common.infrastructure.exceptions import SerializationError
+from common.infrastructure.serializers.prefixed.serializer import (
+    FormatPrefixedSerializer,
+)
+from common.infrastructure.serializers.serializer import ISerializer
+
+
+class TestFormatPrefixedSerializer:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.fast = Mock(spec=ISerializer)
+        self.slow = Mock(spec=ISerializer)
+        self.legacy = Mock(spec=ISerializer)
+        self.serializer = FormatPrefixedSerializer[dict[str, str]](
+            writer="fs1",
+            serializers={"fs1": self.fast, "sl1": self.slow},
+            legacy=self.legacy,
+        )
+        self.test_obj = {"key": "value"}
+
+    def test_serialize_prepends_writer_header(self):
+        # Arrange
+        self.fast.serialize.return_value = b"payload"
+
+        # Act
+        result = self.serializer.serialize(self.test_obj)
+
+        # Assert
+        assert result == b"\x00fs1payload"
+        self.fast.serialize.assert_called_once_with(self.test_obj)
+        self.slow.serialize.assert_not_called()
+
+    def test_deserialize_dispatches_by_tag(self):
+        # Arrange
+        self.slow.deserialize.return_value = self.test_obj
+
+        # Act
+        result = self.serializer.deserialize(b"\x00sl1payload")
+
+        # Assert
+        assert result == self.test_obj
+        self.slow.deserialize.assert_called_once_with(b"payload")
+        self.fast.deserialize.assert_not_called()
+
+    def test_deserialize_without_header_uses_legacy(self):
+        # Arrange
+        self.legacy.deserialize.return_value = self.test_obj
+
+        # Act
+        result = self.serializer.deserialize(b'{"key": "value"}')
+
+        # Assert
+        assert result == self.test_obj
+        self.legacy.deserialize.assert_called_once_with(b'{"key": "value"}')
+
+    def test_deserialize_unknown_tag_raises_serialization_error(self):
+        # Act & Assert
+        with pytest.raises(SerializationError):
+            self.serializer.deserialize(b"\x00zz9payload")
+
+    def test_deserialize_without_header_and_legacy_raises(self):
+        # Arrange
+        serializer = FormatPrefixedSerializer[dict[str, str]](
+            writer="fs1", serializers={"fs1": self.fast}
+        )
+
+        # Act & Assert
+        with pytest.raises(SerializationError):
+            serializer.deserialize(b'{"key": "value"}')
+
+    def test_unknown_writer_raises_value_error(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            FormatPrefixedSerializer(
+                writer="xx1", serializers={"fs1": self.fast}
+            )
+
+    def test_invalid_tag_length_raises_value_error(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            FormatPrefixedSerializer(
+                writer="long", serializers={"long": self.fast}
+            )
@@ -0,0 +1,70 @@
+import logging
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import NullPool, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from common.infrastructure.database.sqlalchemy.instrumentation import (
+    QueryInstrumentation,
+)
+from common.infrastructure.server.fastapi.middleware.logging_middleware import (
+    LoggingMiddleware,
+)
+
+
+@pytest.mark.asyncio
+class TestLoggingMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup(self, caplog: pytest.LogCaptureFixture):
+        self.caplog = caplog
+        self.logger = logging.getLogger("test.requests")
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=NullPool)
+        QueryInstrumentation(self.logger, 1000.0).attach(engine)
+
+        self.app = FastAPI()
+        self.app.add_middleware(LoggingMiddleware, logger=self.logger)
+
+        @self.app.get("/queries")
+        async def queries():
+            async with engine.connect() as conn:
+                for value in range(3):
+                    await conn.execute(text("SELECT :v"), {"v": value})
+            return {}
+
+        @self.app.get("/not-found")
+        async def not_found():
+            raise HTTPException(status_code=404)
+
+        self.client = TestClient(self.app)
+
+    def _completed(self) -> dict:
+        (record,) = [
+            r for r in self.caplog.records if r.msg.startswith("request comp")
+        ]
+        return record.extra  # type: ignore
+
+    async def test_logs_request_query_stats(self):
+        # Act
+        with self.caplog.at_level(logging.INFO, logger="test.requests"):
+            response = self.client.get("/queries")
+
+        # Assert
+        assert response.status_code == 200
+        extra = self._completed()
+        assert extra["db_queries"] == 3
+        assert float(extra["db_time_ms"]) > 0
+        assert extra["db_slowest"] == "SELECT ?"
+
+    async def test_logs_zero_queries_on_error_status(self):
+        # Act
+        with self.caplog.at_level(logging.INFO, logger="test.requests"):
+            response = self.client.get("/not-found")
+
+        # Assert
+        assert response.status_code == 404
+        extra = self._completed()
+        assert extra["status_code"] == 404
+        assert extra["db_queries"] == 0
+        assert extra["db_slowest"] is None
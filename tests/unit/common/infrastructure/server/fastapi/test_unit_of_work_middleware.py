@@ -0,0 +1,77 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.infrastructure.database.sqlalchemy.session_factory import (
+    ISessionFactory,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from common.infrastructure.server.fastapi.middleware.unit_of_work_middleware import (
+    UnitOfWorkMiddleware,
+)
+
+
+@pytest.mark.asyncio
+class TestUnitOfWorkMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.session = AsyncMock(spec=AsyncSession)
+        self.session.is_active = True
+        self.session_factory = Mock(spec=ISessionFactory)
+        self.session_factory.create.return_value = self.session
+        self.uow = UnitOfWork(self.session_factory)
+
+        self.sessions: list[AsyncSession] = []
+
+        self.app = FastAPI()
+        self.app.add_middleware(UnitOfWorkMiddleware, unit_of_work=self.uow)
+
+        @self.app.get("/ok")
+        async def ok():
+            for _ in range(2):
+                async with self.uow.get_session() as session:
+                    self.sessions.append(session)
+            return {}
+
+        @self.app.get("/not-found")
+        async def not_found():
+            raise HTTPException(status_code=404)
+
+        @self.app.get("/error")
+        async def error():
+            raise RuntimeError("boom")
+
+        self.client = TestClient(self.app)
+
+    async def test_request_shares_one_session_and_commit(self):
+        # Act
+        response = self.client.get("/ok")
+
+        # Assert
+        assert response.status_code == 200
+        self.session_factory.create.assert_called_once()
+        assert self.sessions == [self.session, self.session]
+        self.session.commit.assert_awaited_once()
+        self.session.rollback.assert_not_awaited()
+        self.session.close.assert_awaited_once()
+
+    async def test_error_status_rolls_back(self):
+        # Act
+        response = self.client.get("/not-found")
+
+        # Assert
+        assert response.status_code == 404
+        self.session.commit.assert_not_awaited()
+        self.session.rollback.assert_awaited_once()
+        self.session.close.assert_awaited_once()
+
+    async def test_exception_rolls_back_and_propagates(self):
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="boom"):
+            self.client.get("/error")
+        self.session.commit.assert_not_awaited()
+        self.session.rollback.assert_awaited_once()
+        self.session.close.assert_awaited_once()
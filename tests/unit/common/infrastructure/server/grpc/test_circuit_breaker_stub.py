@@ -0,0 +1,77 @@
+from unittest.mock import AsyncMock, Mock
+
+import grpc
+import pytest
+
+from common.application.exceptions import ServiceUnavailableError
+from common.infrastructure.config.circuit_breaker_config import (
+    CircuitBreakerConfig,
+)
+from common.infrastructure.resilience.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from common.infrastructure.server.grpc.circuit_breaker import (
+    CircuitBreakerStub,
+    is_grpc_failure,
+)
+
+
+def rpc_error(code: grpc.StatusCode) -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(
+        code, grpc.aio.Metadata(), grpc.aio.Metadata(), details="details"
+    )
+
+
+@pytest.mark.asyncio
+class TestCircuitBreakerStub:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.stub = Mock()
+        self.stub.Introspect = AsyncMock()
+        self.breaker = CircuitBreaker(
+            "grpc",
+            CircuitBreakerConfig(window_size=2, minimum_calls=2),
+            is_failure=is_grpc_failure,
+        )
+        self.guarded = CircuitBreakerStub(self.stub, self.breaker)
+
+    async def test_call_is_forwarded(self):
+        # Arrange
+        self.stub.Introspect.return_value = "response"
+
+        # Act
+        result = await self.guarded.Introspect("request", timeout=1)
+
+        # Assert
+        assert result == "response"
+        self.stub.Introspect.assert_awaited_once_with("request", timeout=1)
+
+    async def test_business_errors_do_not_trip(self):
+        # Arrange
+        self.stub.Introspect.side_effect = rpc_error(
+            grpc.StatusCode.UNAUTHENTICATED
+        )
+
+        # Act
+        for _ in range(4):
+            with pytest.raises(grpc.aio.AioRpcError):
+                await self.guarded.Introspect("request")
+
+        # Assert
+        assert self.breaker.state == CircuitState.CLOSED
+
+    async def test_unavailable_trips_and_fails_fast(self):
+        # Arrange
+        self.stub.Introspect.side_effect = rpc_error(
+            grpc.StatusCode.UNAVAILABLE
+        )
+        for _ in range(2):
+            with pytest.raises(grpc.aio.AioRpcError):
+                await self.guarded.Introspect("request")
+        self.stub.Introspect.reset_mock()
+
+        # Act & Assert
+        with pytest.raises(ServiceUnavailableError):
+            await self.guarded.Introspect("request")
+        self.stub.Introspect.assert_not_awaited()
@@ -0,0 +1,83 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import grpc
+import pytest
+from grpc import aio
+
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from common.infrastructure.server.grpc.interceptors import (
+    UnitOfWorkInterceptor,
+)
+
+
+@pytest.mark.asyncio
+class TestUnitOfWorkInterceptor:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.uow = MagicMock(spec=UnitOfWork)
+        self.uow.__aenter__ = AsyncMock(return_value=self.uow)
+        self.uow.__aexit__ = AsyncMock(return_value=None)
+        self.interceptor = UnitOfWorkInterceptor(self.uow)
+
+        self.context = Mock(spec=aio.ServicerContext)
+        self.context.code.return_value = None
+        self.behavior = AsyncMock(return_value="response")
+
+    async def _intercept(self, handler: Any) -> grpc.RpcMethodHandler:
+        continuation = AsyncMock(return_value=handler)
+        return await self.interceptor.intercept_service(
+            continuation, Mock(spec=grpc.HandlerCallDetails)
+        )
+
+    async def test_unary_call_runs_in_unit_of_work(self):
+        # Arrange
+        handler = await self._intercept(
+            grpc.unary_unary_rpc_method_handler(self.behavior)
+        )
+
+        # Act
+        result = await handler.unary_unary("request", self.context)
+
+        # Assert
+        assert result == "response"
+        self.behavior.assert_awaited_once_with("request", self.context)
+        self.uow.__aenter__.assert_awaited_once()
+        self.uow.__aexit__.assert_awaited_once_with(None, None, None)
+        self.uow.set_rollback_only.assert_not_called()
+
+    async def test_error_status_marks_rollback(self):
+        # Arrange
+        self.context.code.return_value = grpc.StatusCode.NOT_FOUND
+        handler = await self._intercept(
+            grpc.unary_unary_rpc_method_handler(self.behavior)
+        )
+
+        # Act
+        await handler.unary_unary("request", self.context)
+
+        # Assert
+        self.uow.set_rollback_only.assert_called_once()
+
+    async def test_abort_exits_with_error(self):
+        # Arrange
+        self.behavior.side_effect = aio.AbortError()
+        handler = await self._intercept(
+            grpc.unary_unary_rpc_method_handler(self.behavior)
+        )
+
+        # Act & Assert
+        with pytest.raises(aio.AbortError):
+            await handler.unary_unary("request", self.context)
+        exc_type = self.uow.__aexit__.await_args.args[0]
+        assert exc_type is aio.AbortError
+
+    async def test_streaming_handlers_are_not_wrapped(self):
+        # Arrange
+        stream_handler = grpc.unary_stream_rpc_method_handler(Mock())
+
+        # Act
+        handler = await self._intercept(stream_handler)
+
+        # Assert
+        assert handler is stream_handler
@@ -0,0 +1,100 @@
+from uuid import UUID
+
+import pytest
+
+from common.infrastructure.services.id_generator import (
+    UUID4Generator,
+    UUID7Generator,
+)
+
+
+class TestUUID4Generator:
+    def test_create_version(self):
+        assert UUID4Generator().create().version == 4
+
+
+class TestUUID7Generator:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.now_ms = 1_750_000_000_000
+        self.seed = 0
+        self.gen = UUID7Generator(
+            time_ms=lambda: self.now_ms, randbits=lambda _: self.seed
+        )
+
+    def _timestamp(self, value: UUID) -> int:
+        return value.int >> 80
+
+    def test_layout(self):
+        # Arrange
+        gen = UUID7Generator()
+
+        # Act
+        value = gen.create()
+
+        # Assert
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_millisecond_timestamp(self):
+        # Act
+        value = self.gen.create()
+
+        # Assert
+        assert self._timestamp(value) == self.now_ms
+
+    def test_monotonic_within_millisecond(self):
+        # Act
+        values = [self.gen.create() for _ in range(1000)]
+
+        # Assert
+        assert values == sorted(values)
+        assert len(set(values)) == 1000
+        assert {self._timestamp(v) for v in values} == {self.now_ms}
+
+    def test_orders_across_milliseconds(self):
+        # Arrange
+        self.seed = (1 << 73) - 1
+        first = self.gen.create()
+        self.now_ms += 1
+        self.seed = 0
+
+        # Act
+        second = self.gen.create()
+
+        # Assert
+        assert first < second
+
+    def test_clock_going_back_stays_monotonic(self):
+        # Arrange
+        first = self.gen.create()
+        self.now_ms -= 10
+
+        # Act
+        second = self.gen.create()
+
+        # Assert
+        assert first < second
+        assert self._timestamp(second) == self._timestamp(first)
+
+    def test_counter_overflow_advances_timestamp(self):
+        # Arrange
+        self.seed = (1 << 73) - 1
+        first = self.gen.create()
+        self.gen._counter = (1 << 74) - 1
+
+        # Act
+        second = self.gen.create()
+
+        # Assert
+        assert first < second
+        assert self._timestamp(second) == self.now_ms + 1
+        assert second.version == 7
+
+    def test_random_part_differs_between_generators(self):
+        # Act
+        first = UUID7Generator().create()
+        second = UUID7Generator().create()
+
+        # Assert
+        assert first != second
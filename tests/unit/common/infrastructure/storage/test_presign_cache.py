@@ -0,0 +1,68 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from common.infrastructure.storage.s3.presign_cache import PresignedUrlCache
+
+
+class TestPresignedUrlCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.now = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+        self.cache = PresignedUrlCache(max_entries=2, margin=60)
+
+    def test_get_returns_stored_url(self):
+        # Arrange
+        key = ("GET", "photos", "a.png", 900, None)
+        self.cache.put(key, "url-a", self.now + timedelta(seconds=900))
+
+        # Act
+        result = self.cache.get(key, self.now)
+
+        # Assert
+        assert result == "url-a"
+        assert self.cache.stats().hits == 1
+
+    def test_get_within_margin_misses(self):
+        # Arrange
+        key = ("GET", "photos", "a.png", 900, None)
+        self.cache.put(key, "url-a", self.now + timedelta(seconds=900))
+
+        # Act
+        result = self.cache.get(key, self.now + timedelta(seconds=840))
+
+        # Assert
+        assert result is None
+        stats = self.cache.stats()
+        assert stats.misses == 1
+        assert stats.size == 0
+
+    def test_put_evicts_least_recently_used(self):
+        # Arrange
+        expires_at = self.now + timedelta(seconds=900)
+        a = ("GET", "photos", "a.png", 900, None)
+        b = ("GET", "photos", "b.png", 900, None)
+        c = ("GET", "photos", "c.png", 900, None)
+        self.cache.put(a, "url-a", expires_at)
+        self.cache.put(b, "url-b", expires_at)
+        self.cache.get(a, self.now)
+
+        # Act
+        self.cache.put(c, "url-c", expires_at)
+
+        # Assert
+        assert self.cache.get(a, self.now) == "url-a"
+        assert self.cache.get(b, self.now) is None
+        assert self.cache.get(c, self.now) == "url-c"
+        assert self.cache.stats().evictions == 1
+
+    def test_zero_entries_disables_cache(self):
+        # Arrange
+        cache = PresignedUrlCache(max_entries=0)
+        key = ("GET", "photos", "a.png", 900, None)
+
+        # Act
+        cache.put(key, "url-a", self.now + timedelta(seconds=900))
+
+        # Assert
+        assert cache.get(key, self.now) is None
@@ -0,0 +1,417 @@
+import asyncio
+import base64
+import json
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from common.infrastructure.config.s3_config import S3Config
+from common.infrastructure.storage.s3.client import (
+    S3Client,
+    S3ClientError,
+    UploadedPart,
+)
+
+
+def _xml(body: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        + body.replace(
+            ">", ' xmlns="http://s3.amazonaws.com/doc/2006-03-01/">', 1
+        )
+    ).encode()
+
+
+@pytest.mark.asyncio
+class TestS3Client:
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self):
+        self.requests: list[httpx.Request] = []
+        self.responses: list[httpx.Response] = []
+        self.config = S3Config(
+            endpoint="localhost:9000",
+            access_key="minio",
+            secret_key="minio-secret",
+            bucket_name="photos",
+            max_connections=4,
+        )
+        self.now = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+        http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self._handle)
+        )
+        self.client = S3Client(http_client, self.config, lambda: self.now)
+        yield
+        await self.client.aclose()
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.responses.pop(0)
+
+    async def test_put_object_signs_request(self):
+        # Arrange
+        self.responses.append(httpx.Response(200, headers={"ETag": '"abc"'}))
+
+        # Act
+        etag = await self.client.put_object(
+            "photos", "a.png", b"data", "image/png"
+        )
+
+        # Assert
+        request = self.requests[0]
+        assert etag == "abc"
+        assert request.method == "PUT"
+        assert str(request.url) == "http://localhost:9000/photos/a.png"
+        assert request.content == b"data"
+        assert request.headers["Content-Type"] == "image/png"
+        assert request.headers["x-amz-content-sha256"] == "UNSIGNED-PAYLOAD"
+        assert request.headers["Authorization"].startswith(
+            "AWS4-HMAC-SHA256 Credential=minio/20250102/us-east-1/s3/"
+        )
+
+    async def test_multipart_upload_flow(self):
+        # Arrange
+        self.responses.extend(
+            [
+                httpx.Response(
+                    200,
+                    content=_xml(
+                        "<InitiateMultipartUploadResult>"
+                        "<UploadId>up+1</UploadId>"
+                        "</InitiateMultipartUploadResult>"
+                    ),
+                ),
+                httpx.Response(200, headers={"ETag": '"e1"'}),
+                httpx.Response(
+                    200,
+                    content=_xml(
+                        "<CompleteMultipartUploadResult>"
+                        "</CompleteMultipartUploadResult>"
+                    ),
+                ),
+            ]
+        )
+
+        # Act
+        upload_id = await self.client.create_multipart_upload(
+            "photos", "a.png", "image/png"
+        )
+        part = await self.client.upload_part(
+            "photos", "a.png", upload_id, 1, b"part"
+        )
+        await self.client.complete_multipart_upload(
+            "photos", "a.png", upload_id, [part]
+        )
+
+        # Assert
+        create, upload, complete = self.requests
+        assert upload_id == "up+1"
+        assert part == UploadedPart(1, "e1")
+        assert str(create.url).endswith("/photos/a.png?uploads")
+        assert upload.url.params["uploadId"] == "up+1"
+        assert upload.url.params["partNumber"] == "1"
+        assert b'<PartNumber>1</PartNumber><ETag>"e1"</ETag>' in (
+            complete.content
+        )
+
+    async def test_error_response_raises(self):
+        # Arrange
+        self.responses.append(
+            httpx.Response(
+                403,
+                content=_xml(
+                    "<Error><Code>AccessDenied</Code>"
+                    "<Message>denied</Message></Error>"
+                ),
+            )
+        )
+
+        # Act & Assert
+        with pytest.raises(S3ClientError) as exc_info:
+            await self.client.put_object("photos", "a.png", b"", "image/png")
+        assert exc_info.value.status == 403
+        assert exc_info.value.code == "AccessDenied"
+        assert self.client.stats()["failures"] == 1
+
+    async def test_complete_error_in_ok_response_raises(self):
+        # Arrange
+        self.responses.append(
+            httpx.Response(
+                200,
+                content=_xml(
+                    "<Error><Code>InternalError</Code>"
+                    "<Message>retry</Message></Error>"
+                ),
+            )
+        )
+
+        # Act & Assert
+        with pytest.raises(S3ClientError, match="InternalError"):
+            await self.client.complete_multipart_upload(
+                "photos", "a.png", "up", [UploadedPart(1, "e1")]
+            )
+
+    async def test_bucket_exists(self):
+        # Arrange
+        self.responses.extend([httpx.Response(200), httpx.Response(404)])
+
+        # Act & Assert
+        assert await self.client.bucket_exists("photos") is True
+        assert await self.client.bucket_exists("missing") is False
+
+    async def test_presigned_get_object_is_local(self):
+        # Act
+        url = self.client.presigned_get_object(
+            "photos", "a.png", timedelta(minutes=15)
+        )
+
+        # Assert
+        assert url.startswith("http://localhost:9000/photos/a.png?")
+        assert "X-Amz-Expires=900" in url
+        assert "X-Amz-Signature=" in url
+        assert self.requests == []
+
+    async def test_presigned_get_object_is_memoized(self):
+        # Arrange
+        expires = timedelta(minutes=15)
+        first = self.client.presigned_get_object("photos", "a.png", expires)
+
+        # Act
+        self.now += timedelta(minutes=5)
+        cached = self.client.presigned_get_object("photos", "a.png", expires)
+        self.now += timedelta(minutes=9, seconds=30)
+        renewed = self.client.presigned_get_object("photos", "a.png", expires)
+
+        # Assert
+        assert cached == first
+        assert renewed != first
+        assert "X-Amz-Date=20250102T031835Z" in renewed
+        stats = self.client.stats()
+        assert stats["presign_cache_hits"] == 1
+        assert stats["presign_cache_misses"] == 2
+
+    async def test_presigned_get_object_cache_is_per_expiry(self):
+        # Act
+        short = self.client.presigned_get_object(
+            "photos", "a.png", timedelta(minutes=5)
+        )
+        long = self.client.presigned_get_object(
+            "photos", "a.png", timedelta(minutes=15)
+        )
+
+        # Assert
+        assert "X-Amz-Expires=300" in short
+        assert "X-Amz-Expires=900" in long
+
+    async def test_presigned_get_object_is_aligned_to_window(self):
+        # Arrange
+        config = self.config.model_copy(
+            update={"presign_window": 300, "presign_min_validity": 60}
+        )
+        client = S3Client(
+            httpx.AsyncClient(transport=httpx.MockTransport(self._handle)),
+            config,
+            lambda: self.now,
+        )
+        expires = timedelta(minutes=15)
+
+        # Act
+        first = client.presigned_get_object("photos", "a.png", expires)
+        self.now += timedelta(seconds=50)
+        same = client.presigned_get_object("photos", "a.png", expires)
+        self.now += timedelta(minutes=5)
+        next_window = client.presigned_get_object("photos", "a.png", expires)
+        await client.aclose()
+
+        # Assert
+        assert same == first
+        assert "X-Amz-Date=20250102T030000Z" in first
+        assert "X-Amz-Expires=1200" in first
+        assert "X-Amz-Date=20250102T030500Z" in next_window
+
+    async def test_presigned_get_object_window_extends_short_expiry(self):
+        # Arrange
+        config = self.config.model_copy(
+            update={"presign_window": 300, "presign_min_validity": 60}
+        )
+        client = S3Client(
+            httpx.AsyncClient(transport=httpx.MockTransport(self._handle)),
+            config,
+            lambda: self.now,
+        )
+
+        # Act
+        url = client.presigned_get_object(
+            "photos", "a.png", timedelta(minutes=1)
+        )
+        await client.aclose()
+
+        # Assert
+        assert "X-Amz-Expires=360" in url
+
+    async def test_presigned_get_object_late_in_window_keeps_expiry(self):
+        # Arrange
+        config = self.config.model_copy(
+            update={"presign_window": 300, "presign_min_validity": 60}
+        )
+        client = S3Client(
+            httpx.AsyncClient(transport=httpx.MockTransport(self._handle)),
+            config,
+            lambda: self.now,
+        )
+        expires = timedelta(minutes=15)
+        window_start = datetime(2025, 1, 2, 3, 0, 0, tzinfo=UTC)
+        self.now = window_start + timedelta(seconds=295)
+
+        # Act
+        url = client.presigned_get_object("photos", "a.png", expires)
+        await client.aclose()
+
+        # Assert
+        assert "X-Amz-Date=20250102T030000Z" in url
+        assert "X-Amz-Expires=1200" in url
+        expires_at = window_start + timedelta(seconds=1200)
+        assert expires_at - self.now >= expires
+
+    async def test_presigned_post_policy_constrains_upload(self):
+        # Act
+        url, fields = self.client.presigned_post_policy(
+            "photos", "a.png", "image/png", 1024, timedelta(minutes=15)
+        )
+
+        # Assert
+        policy = json.loads(base64.b64decode(fields["policy"]))
+        assert url == "http://localhost:9000/photos"
+        assert fields["key"] == "a.png"
+        assert fields["Content-Type"] == "image/png"
+        assert fields["x-amz-credential"].startswith("minio/20250102/")
+        assert len(fields["x-amz-signature"]) == 64
+        assert policy["expiration"] == "2025-01-02T03:19:05.000Z"
+        assert ["content-length-range", 1, 1024] in policy["conditions"]
+        assert {"key": "a.png"} in policy["conditions"]
+        assert {"Content-Type": "image/png"} in policy["conditions"]
+        assert self.requests == []
+
+    async def test_get_object_reads_body(self):
+        # Arrange
+        self.responses.append(httpx.Response(200, content=b"body"))
+
+        # Act
+        data = await self.client.get_object("photos", "a.png")
+
+        # Assert
+        assert data == b"body"
+        assert self.requests[0].method == "GET"
+        assert "Range" not in self.requests[0].headers
+
+    async def test_object_exists(self):
+        # Arrange
+        self.responses.extend([httpx.Response(200), httpx.Response(404)])
+
+        # Act & Assert
+        assert await self.client.object_exists("photos", "a.png") is True
+        assert await self.client.object_exists("photos", "b.png") is False
+        assert [request.method for request in self.requests] == [
+            "HEAD",
+            "HEAD",
+        ]
+
+    async def test_get_object_range_requests_bytes(self):
+        # Arrange
+        self.responses.append(httpx.Response(206, content=b"head"))
+
+        # Act
+        data = await self.client.get_object_range("photos", "a.png", 0, 3)
+
+        # Assert
+        assert data == b"head"
+        assert self.requests[0].headers["Range"] == "bytes=0-3"
+
+    async def test_copy_object_sends_copy_source(self):
+        # Arrange
+        self.responses.append(
+            httpx.Response(
+                200,
+                content=_xml(
+                    '<CopyObjectResult><ETag>"e1"</ETag></CopyObjectResult>'
+                ),
+            )
+        )
+
+        # Act
+        await self.client.copy_object("photos", "staging one.png", "ab.png")
+
+        # Assert
+        request = self.requests[0]
+        assert request.method == "PUT"
+        assert str(request.url) == "http://localhost:9000/photos/ab.png"
+        assert request.headers["x-amz-copy-source"] == (
+            "/photos/staging%20one.png"
+        )
+
+    async def test_copy_object_error_in_ok_response_raises(self):
+        # Arrange
+        self.responses.append(
+            httpx.Response(
+                200,
+                content=_xml(
+                    "<Error><Code>InternalError</Code>"
+                    "<Message>retry</Message></Error>"
+                ),
+            )
+        )
+
+        # Act & Assert
+        with pytest.raises(S3ClientError, match="InternalError"):
+            await self.client.copy_object("photos", "a.png", "b.png")
+
+    async def test_set_bucket_notification(self):
+        # Arrange
+        self.responses.append(httpx.Response(200))
+
+        # Act
+        await self.client.set_bucket_notification(
+            "photos", "arn:minio:sqs::PHOTOS:webhook", ["s3:ObjectCreated:Put"]
+        )
+
+        # Assert
+        request = self.requests[0]
+        assert request.method == "PUT"
+        assert "notification" in request.url.params
+        assert b"<Queue>arn:minio:sqs::PHOTOS:webhook</Queue>" in (
+            request.content
+        )
+        assert b"<Event>s3:ObjectCreated:Put</Event>" in request.content
+
+    async def test_stats_track_in_flight_requests(self):
+        # Arrange
+        release = asyncio.Event()
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(200)
+
+        client = S3Client(
+            httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+            self.config,
+        )
+        tasks = [
+            asyncio.create_task(client.bucket_exists("photos"))
+            for _ in range(6)
+        ]
+        await asyncio.sleep(0)
+
+        # Act
+        during = client.stats()
+        release.set()
+        await asyncio.gather(*tasks)
+        after = client.stats()
+        await client.aclose()
+
+        # Assert
+        assert during["in_flight"] == 6
+        assert during["waiting"] == 2
+        assert after["in_flight"] == 0
+        assert after["peak_in_flight"] == 6
+        assert after["requests"] == 6
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from contextvars import ContextVar
+
+import pytest
+
+from common.infrastructure.tasks.asyncio_task_publisher import (
+    AsyncioBackgroundTaskPublisher,
+)
+
+
+request_scope: ContextVar[str | None] = ContextVar(
+    "request_scope", default=None
+)
+
+
+@pytest.mark.asyncio
+class TestAsyncioBackgroundTaskPublisher:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.publisher = AsyncioBackgroundTaskPublisher(
+            logging.getLogger("test"), max_pending=2
+        )
+
+    async def test_publish_does_not_wait_for_task(self):
+        # Arrange
+        release = asyncio.Event()
+        done = asyncio.Event()
+
+        async def task():
+            await release.wait()
+            done.set()
+
+        # Act
+        self.publisher.publish(task, name="task")
+
+        # Assert
+        assert self.publisher.pending == 1
+        assert not done.is_set()
+
+        release.set()
+        await self.publisher.shutdown()
+        assert done.is_set()
+        assert self.publisher.pending == 0
+        assert self.publisher.stats().completed == 1
+
+    async def test_task_runs_outside_caller_context(self):
+        # Arrange
+        seen: list[str | None] = []
+
+        async def task():
+            seen.append(request_scope.get())
+
+        request_scope.set("request")
+
+        # Act
+        self.publisher.publish(task)
+        await self.publisher.shutdown()
+
+        # Assert
+        assert seen == [None]
+
+    async def test_failure_is_logged_and_not_raised(self):
+        # Arrange
+        async def task():
+            raise RuntimeError("boom")
+
+        # Act
+        self.publisher.publish(task, name="failing")
+        await self.publisher.shutdown()
+
+        # Assert
+        stats = self.publisher.stats()
+        assert stats.failed == 1
+        assert stats.completed == 0
+
+    async def test_drops_tasks_over_limit(self):
+        # Arrange
+        release = asyncio.Event()
+
+        async def task():
+            await release.wait()
+
+        # Act
+        for _ in range(3):
+            self.publisher.publish(task)
+
+        # Assert
+        assert self.publisher.pending == 2
+        assert self.publisher.stats().dropped == 1
+
+        release.set()
+        await self.publisher.shutdown()
+
+    async def test_shutdown_cancels_stuck_tasks(self):
+        # Arrange
+        async def task():
+            await asyncio.Event().wait()
+
+        self.publisher.publish(task)
+
+        # Act
+        await self.publisher.shutdown(timeout=0.01)
+
+        # Assert
+        assert self.publisher.pending == 0
+
+    async def test_publish_after_shutdown_is_dropped(self):
+        # Arrange
+        await self.publisher.shutdown()
+
+        async def task():
+            pass
+
+        # Act
+        self.publisher.publish(task)
+
+        # Assert
+        assert self.publisher.pending == 0
+        assert self.publisher.stats().dropped == 1
@@ -0,0 +1,168 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import Request
+from starlette.types import Message
+
+from common.application.exceptions import (
+    ContentTooLargeError,
+    InvalidContentError,
+)
+from common.presentation.http.fastapi.multipart import stream_multipart_file
+
+
+BOUNDARY = "test-boundary"
+
+
+def _part(name: str, data: bytes, filename: str | None = None) -> bytes:
+    disposition = f'form-data; name="{name}"'
+    if filename is not None:
+        disposition += f'; filename="{filename}"'
+    return (
+        f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n"
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + data + b"\r\n"
+
+
+def _body(*parts: bytes) -> bytes:
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+@pytest.mark.asyncio
+class TestStreamMultipartFile:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.received: list[int] = []
+        self.content_type = f"multipart/form-data; boundary={BOUNDARY}"
+
+    def _request(
+        self,
+        body: bytes,
+        chunk_size: int = 7,
+        content_length: int | None = None,
+    ) -> Request:
+        chunks = [
+            body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+        ] or [b""]
+
+        async def receive() -> Message:
+            index = len(self.received)
+            self.received.append(index)
+            if index >= len(chunks):
+                return {"type": "http.disconnect"}
+            return {
+                "type": "http.request",
+                "body": chunks[index],
+                "more_body": index < len(chunks) - 1,
+            }
+
+        headers = [(b"content-type", self.content_type.encode())]
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode()))
+        scope = {"type": "http", "method": "POST", "headers": headers}
+        return Request(scope, receive)
+
+    async def _collect(self, stream: AsyncIterator[bytes]) -> list[bytes]:
+        return [chunk async for chunk in stream]
+
+    async def test_yields_file_content_incrementally(self):
+        # Arrange
+        content = bytes(range(256)) * 4
+        request = self._request(_body(_part("file", content, "a.jpg")))
+
+        # Act
+        chunks = await self._collect(stream_multipart_file(request, "file"))
+
+        # Assert
+        assert b"".join(chunks) == content
+        assert len(chunks) > 1
+        assert all(chunks)
+
+    async def test_skips_other_fields(self):
+        # Arrange
+        request = self._request(
+            _body(
+                _part("description", b"ignored"),
+                _part("file", b"payload", "a.jpg"),
+            )
+        )
+
+        # Act
+        chunks = await self._collect(stream_multipart_file(request, "file"))
+
+        # Assert
+        assert b"".join(chunks) == b"payload"
+
+    async def test_stops_reading_after_field(self):
+        # Arrange
+        body = _body(
+            _part("file", b"payload", "a.jpg"), _part("other", b"x" * 4096)
+        )
+        request = self._request(body, chunk_size=64)
+
+        # Act
+        await self._collect(stream_multipart_file(request, "file"))
+
+        # Assert
+        assert len(self.received) < len(body) // 64
+
+    async def test_declared_length_over_limit_fails_before_reading(self):
+        # Arrange
+        body = _body(_part("file", b"payload", "a.jpg"))
+        request = self._request(body, content_length=len(body))
+
+        # Act & Assert
+        with pytest.raises(ContentTooLargeError):
+            await self._collect(
+                stream_multipart_file(request, "file", len(body) - 1)
+            )
+        assert self.received == []
+
+    async def test_received_bytes_over_limit_fail(self):
+        # Arrange
+        body = _body(_part("file", b"payload" * 100, "a.jpg"))
+        request = self._request(body, chunk_size=64)
+
+        # Act & Assert
+        with pytest.raises(ContentTooLargeError):
+            await self._collect(stream_multipart_file(request, "file", 256))
+        assert len(self.received) == 5
+
+    async def test_body_within_limit_is_streamed(self):
+        # Arrange
+        body = _body(_part("file", b"payload", "a.jpg"))
+        request = self._request(body, content_length=len(body))
+
+        # Act
+        result = await self._collect(
+            stream_multipart_file(request, "file", len(body))
+        )
+
+        # Assert
+        assert b"".join(result) == b"payload"
+
+    async def test_missing_field_fails(self):
+        # Arrange
+        request = self._request(_body(_part("other", b"payload")))
+
+        # Act & Assert
+        with pytest.raises(InvalidContentError, match="Missing file field"):
+            await self._collect(stream_multipart_file(request, "file"))
+
+    async def test_truncated_body_fails(self):
+        # Arrange
+        body = _body(_part("file", b"payload" * 10, "a.jpg"))
+        request = self._request(body[:60])
+
+        # Act & Assert
+        with pytest.raises(InvalidContentError):
+            await self._collect(stream_multipart_file(request, "file"))
+
+    async def test_not_multipart_fails(self):
+        # Arrange
+        self.content_type = "application/json"
+        request = self._request(b"{}")
+
+        # Act & Assert
+        with pytest.raises(InvalidContentError, match="multipart"):
+            await self._collect(stream_multipart_file(request, "file"))
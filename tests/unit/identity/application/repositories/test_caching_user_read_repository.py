@@ -57,3 +57,14 @@ class TestCachingUserReadModelRepository:
             self.user_id
         )
         self.key_value_cache.set.assert_awaited_once_with(self.key, self.user)
+
+    async def test_prime_sets_cache(self):
+        # Arrange
+        user = UserReadModel(self.user_id, "user")
+
+        # Act
+        await self.repository.prime(user)
+
+        # Assert
+        self.key_value_cache.set.assert_awaited_once_with(self.key, user)
+        self.user_read_repository.get_by_id.assert_not_called()
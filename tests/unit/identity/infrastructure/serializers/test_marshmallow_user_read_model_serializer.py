@@ -31,8 +31,8 @@ class TestMarshmallowSerializerUserReadModel:
         result = self.serializer.serialize(self.descriptor)
 
         # Assert
-        assert result == self.serialized_data
-        assert isinstance(result, str)
+        assert result == self.serialized_data.encode()
+        assert isinstance(result, bytes)
 
     def test_deserialize_success(self):
         # Act
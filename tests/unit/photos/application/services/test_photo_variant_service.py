@@ -0,0 +1,174 @@
+import asyncio
+from collections.abc import AsyncIterable
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from common.application.exceptions import NotFoundError
+from common.application.interfaces.tasks.background_task_publisher import (
+    IBackgroundTaskPublisher,
+)
+from photos.application.exceptions import UnknownPhotoVariantError
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.image_renderer import (
+    IImageRenderer,
+)
+from photos.application.services.photo_variant_service import (
+    PhotoVariantService,
+)
+from photos.domain.exceptions import InvalidPhotoNameError
+from photos.domain.value_objects.photo_variant import PhotoVariant
+
+
+@pytest.mark.asyncio
+class TestPhotoVariantService:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.name = "a.jpg"
+        self.stored: set[str] = set()
+        self.uploaded: dict[str, bytes] = {}
+
+        self.photo_repository = AsyncMock(spec=IPhotoRepository)
+        self.photo_repository.photo_exists.side_effect = (
+            lambda name: name in self.stored
+        )
+        self.photo_repository.download_photo.return_value = b"original"
+        self.photo_repository.upload_photo.side_effect = self._consume
+        self.user_photo_repository = AsyncMock(spec=IUserPhotoRepository)
+        self.user_photo_repository.exists_active.return_value = True
+        self.image_renderer = AsyncMock(spec=IImageRenderer)
+        self.image_renderer.render.side_effect = (
+            lambda data, max_size: f"{max_size}".encode()
+        )
+        self.task_publisher = Mock(spec=IBackgroundTaskPublisher)
+
+        self.service = self._service(eager=False)
+
+    def _service(self, eager: bool) -> PhotoVariantService:
+        return PhotoVariantService(
+            photo_repository=self.photo_repository,
+            user_photo_repository=self.user_photo_repository,
+            image_renderer=self.image_renderer,
+            task_publisher=self.task_publisher,
+            variants=[PhotoVariant("thumb", 256), PhotoVariant("big", 1280)],
+            eager=eager,
+        )
+
+    async def _consume(
+        self, name: str, mime: str, data: AsyncIterable[bytes]
+    ) -> None:
+        assert mime == "image/webp"
+        self.uploaded[name] = b"".join([chunk async for chunk in data])
+        self.stored.add(name)
+
+    async def test_ensure_renders_missing_variant(self):
+        # Act
+        result = await self.service.ensure(self.name, "thumb")
+
+        # Assert
+        assert result == "variants/thumb/a.jpg.webp"
+        assert self.uploaded == {result: b"256"}
+        self.photo_repository.download_photo.assert_awaited_once_with(
+            self.name
+        )
+
+    async def test_ensure_reuses_stored_variant(self):
+        # Arrange
+        self.stored.add("variants/thumb/a.jpg.webp")
+
+        # Act
+        result = await self.service.ensure(self.name, "thumb")
+
+        # Assert
+        assert result == "variants/thumb/a.jpg.webp"
+        self.photo_repository.download_photo.assert_not_awaited()
+        self.image_renderer.render.assert_not_awaited()
+
+    async def test_ensure_concurrent_requests_share_render(self):
+        # Arrange
+        release = asyncio.Event()
+
+        async def render(data: bytes, max_size: int) -> bytes:
+            await release.wait()
+            return b"rendered"
+
+        self.image_renderer.render.side_effect = render
+
+        # Act
+        waiters = [
+            asyncio.create_task(self.service.ensure(self.name, "thumb"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        # Assert
+        assert set(results) == {"variants/thumb/a.jpg.webp"}
+        self.image_renderer.render.assert_awaited_once()
+        self.photo_repository.upload_photo.assert_awaited_once()
+
+    async def test_ensure_unknown_variant_fails(self):
+        # Act & Assert
+        with pytest.raises(UnknownPhotoVariantError):
+            await self.service.ensure(self.name, "huge")
+        self.photo_repository.photo_exists.assert_not_awaited()
+
+    async def test_ensure_variant_of_variant_fails(self):
+        # Act & Assert
+        with pytest.raises(InvalidPhotoNameError):
+            await self.service.ensure("variants/thumb/a.jpg.webp", "thumb")
+        self.user_photo_repository.exists_active.assert_not_awaited()
+        self.image_renderer.render.assert_not_awaited()
+
+    async def test_ensure_inactive_photo_fails(self):
+        # Arrange
+        self.user_photo_repository.exists_active.return_value = False
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await self.service.ensure(self.name, "thumb")
+        self.user_photo_repository.exists_active.assert_awaited_once_with(
+            self.name
+        )
+        self.photo_repository.photo_exists.assert_not_awaited()
+        self.photo_repository.download_photo.assert_not_awaited()
+
+    async def test_ensure_missing_original_fails(self):
+        # Arrange
+        self.photo_repository.download_photo.side_effect = NotFoundError(
+            self.name
+        )
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await self.service.ensure(self.name, "thumb")
+        self.photo_repository.upload_photo.assert_not_awaited()
+
+    async def test_schedule_is_noop_when_lazy(self):
+        # Act
+        self.service.schedule(self.name)
+
+        # Assert
+        self.task_publisher.publish.assert_not_called()
+
+    async def test_schedule_renders_missing_variants(self):
+        # Arrange
+        service = self._service(eager=True)
+        self.stored.add("variants/thumb/a.jpg.webp")
+
+        # Act
+        service.schedule(self.name)
+        task = self.task_publisher.publish.call_args.args[0]
+        await task()
+
+        # Assert
+        assert self.uploaded == {"variants/big/a.jpg.webp": b"1280"}
+        self.photo_repository.download_photo.assert_awaited_once_with(
+            self.name
+        )
@@ -0,0 +1,165 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from common.application.exceptions import NotFoundError
+from photos.application.dtos.command.confirm_photo_upload_command import (
+    ConfirmPhotoUploadCommand,
+)
+from photos.application.dtos.dtos import FileType
+from photos.application.exceptions import InvalidFileTypeError
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.file_type_introspector import (
+    IFileTypeIntrospector,
+)
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
+from photos.application.usecases.command.confirm_photo_upload_use_case import (
+    ConfirmPhotoUploadUseCase,
+)
+from photos.domain.entity.photo import Photo
+from photos.domain.exceptions import InvalidPhotoNameError
+from photos.domain.value_objects.photo_status import PhotoStatus
+
+
+@pytest.mark.asyncio
+class TestConfirmPhotoUploadUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.photo = Photo.create(
+            uuid4(),
+            uuid4(),
+            "png",
+            "image/png",
+            status=PhotoStatus.PENDING,
+        )
+        self.head = b"\x89PNG\x0d\x0a\x1a\x0a"
+
+        self.photo_repository = AsyncMock(spec=IPhotoRepository)
+        self.photo_repository.read_head.return_value = self.head
+        self.user_photo_repository = AsyncMock(spec=IUserPhotoRepository)
+        self.user_photo_repository.get_by_id.return_value = self.photo
+        self.file_type_introspector = Mock(spec=IFileTypeIntrospector)
+        self.file_type_introspector.head_size = 261
+        self.file_type_introspector.extract.return_value = FileType(
+            extension="png", mime="image/png"
+        )
+        self.photo_variant_service = Mock(spec=IPhotoVariantService)
+
+        self.use_case = ConfirmPhotoUploadUseCase(
+            photo_repository=self.photo_repository,
+            user_photo_repository=self.user_photo_repository,
+            file_type_introspector=self.file_type_introspector,
+            photo_variant_service=self.photo_variant_service,
+        )
+        self.command = ConfirmPhotoUploadCommand(name=self.photo.name)
+
+    async def test_confirm_matching_content_activates(self):
+        # Act
+        result = await self.use_case.execute(self.command)
+
+        # Assert
+        assert result == PhotoStatus.ACTIVE
+        self.user_photo_repository.get_by_id.assert_awaited_once_with(
+            self.photo.photo_id, lock=True
+        )
+        self.photo_repository.read_head.assert_awaited_once_with(
+            self.photo.name, 261
+        )
+        self.file_type_introspector.extract.assert_called_once_with(
+            self.head
+        )
+        self.user_photo_repository.save.assert_awaited_once_with(self.photo)
+        self.photo_repository.delete_photo.assert_not_awaited()
+        self.photo_variant_service.schedule.assert_called_once_with(
+            self.photo.name
+        )
+
+    async def test_confirm_mismatching_content_rejects_and_deletes(self):
+        # Arrange
+        self.file_type_introspector.extract.return_value = FileType(
+            extension="jpg", mime="image/jpeg"
+        )
+
+        # Act
+        result = await self.use_case.execute(self.command)
+
+        # Assert
+        assert result == PhotoStatus.REJECTED
+        self.photo_repository.delete_photo.assert_awaited_once_with(
+            self.photo.name
+        )
+        self.user_photo_repository.save.assert_awaited_once_with(self.photo)
+        self.photo_variant_service.schedule.assert_not_called()
+
+    async def test_confirm_unrecognized_content_rejects(self):
+        # Arrange
+        self.file_type_introspector.extract.side_effect = (
+            InvalidFileTypeError
+        )
+
+        # Act
+        result = await self.use_case.execute(self.command)
+
+        # Assert
+        assert result == PhotoStatus.REJECTED
+        self.user_photo_repository.save.assert_awaited_once_with(self.photo)
+
+    async def test_confirm_missing_object_rejects(self):
+        # Arrange
+        self.photo_repository.read_head.side_effect = NotFoundError(
+            self.photo.name
+        )
+
+        # Act
+        result = await self.use_case.execute(self.command)
+
+        # Assert
+        assert result == PhotoStatus.REJECTED
+        self.file_type_introspector.extract.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "status", [PhotoStatus.ACTIVE, PhotoStatus.REJECTED]
+    )
+    async def test_confirm_is_idempotent(self, status: PhotoStatus):
+        # Arrange
+        self.photo.status = status
+
+        # Act
+        result = await self.use_case.execute(self.command)
+
+        # Assert
+        assert result == status
+        self.photo_repository.read_head.assert_not_awaited()
+        self.photo_repository.delete_photo.assert_not_awaited()
+        self.user_photo_repository.save.assert_not_awaited()
+
+    async def test_confirm_unknown_photo_fails(self):
+        # Arrange
+        self.user_photo_repository.get_by_id.side_effect = NotFoundError(
+            self.photo.photo_id
+        )
+
+        # Act
+        with pytest.raises(NotFoundError):
+            await self.use_case.execute(self.command)
+
+        # Assert
+        self.user_photo_repository.save.assert_not_awaited()
+
+    async def test_confirm_foreign_object_name_fails(self):
+        # Act
+        with pytest.raises(InvalidPhotoNameError):
+            await self.use_case.execute(
+                ConfirmPhotoUploadCommand(name="avatars/me.png")
+            )
+
+        # Assert
+        self.user_photo_repository.get_by_id.assert_not_awaited()
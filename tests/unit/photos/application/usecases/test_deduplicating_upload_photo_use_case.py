@@ -0,0 +1,200 @@
+import hashlib
+from collections.abc import AsyncIterable, AsyncIterator
+from unittest.mock import ANY, AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from common.application.exceptions import RepositoryError
+from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.command.upload_photo_command import (
+    UploadPhotoCommand,
+)
+from photos.application.interfaces.repositories.photo_object_repository import (
+    IPhotoObjectRepository,
+)
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.file_type_introspector import (
+    IFileTypeIntrospector,
+)
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
+from photos.application.usecases.command.deduplicating_upload_photo_use_case import (
+    DeduplicatingUploadPhotoUseCase,
+)
+from photos.domain.entity.photo import Photo
+from photos.domain.interfaces.photo_factory import IPhotoFactory
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+class TestDeduplicatingUploadPhotoUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.photo_id = uuid4()
+        self.user_id = uuid4()
+        self.descriptor = UserDescriptor(
+            user_id=self.user_id, username="testuser"
+        )
+        self.staging = f"{self.photo_id}.jpg"
+        self.photo = Photo(
+            photo_id=self.photo_id,
+            user_id=self.user_id,
+            name=self.staging,
+            mime="image/jpeg",
+        )
+
+        self.photo_factory = Mock(spec=IPhotoFactory)
+        self.photo_factory.create.return_value = self.photo
+
+        self.uploaded: dict[str, bytes] = {}
+        self.photo_repository = AsyncMock(spec=IPhotoRepository)
+        self.photo_repository.upload_photo.side_effect = self._consume
+        self.user_photo_repository = AsyncMock(spec=IUserPhotoRepository)
+        self.photo_object_repository = AsyncMock(spec=IPhotoObjectRepository)
+        self.photo_object_repository.acquire.return_value = 1
+        self.file_type_introspector = Mock(spec=IFileTypeIntrospector)
+        self.file_type_introspector.head_size = 4
+        self.file_type_introspector.extract.return_value = Mock(
+            extension="jpg", mime="image/jpeg"
+        )
+        self.photo_variant_service = Mock(spec=IPhotoVariantService)
+
+        self.use_case = DeduplicatingUploadPhotoUseCase(
+            photo_factory=self.photo_factory,
+            photo_repository=self.photo_repository,
+            user_photo_repository=self.user_photo_repository,
+            photo_object_repository=self.photo_object_repository,
+            file_type_introspector=self.file_type_introspector,
+            photo_variant_service=self.photo_variant_service,
+            max_size=1024,
+            buffer_size=16,
+        )
+
+    async def _consume(
+        self, name: str, mime: str, data: AsyncIterable[bytes]
+    ) -> None:
+        self.uploaded[name] = b"".join([chunk async for chunk in data])
+
+    def _name(self, content: bytes) -> str:
+        return f"{hashlib.sha256(content).hexdigest()}.jpg"
+
+    async def test_execute_small_content_stored_under_digest(self):
+        # Arrange
+        chunks = [b"fake", b"_image"]
+        name = self._name(b"".join(chunks))
+
+        # Act
+        result = await self.use_case.execute(
+            UploadPhotoCommand(content=_chunks(*chunks)), self.descriptor
+        )
+
+        # Assert
+        assert result == name
+        assert self.uploaded == {name: b"fake_image"}
+        self.photo_object_repository.acquire.assert_awaited_once_with(name)
+        self.photo_repository.copy_photo.assert_not_awaited()
+        self.photo_repository.delete_photo.assert_not_awaited()
+        self.user_photo_repository.add.assert_awaited_once_with(self.photo)
+        self.photo_variant_service.schedule.assert_called_once_with(name)
+
+    async def test_execute_small_duplicate_skips_upload(self):
+        # Arrange
+        self.photo_object_repository.acquire.return_value = 2
+
+        # Act
+        result = await self.use_case.execute(
+            UploadPhotoCommand(content=_chunks(b"fake_image")),
+            self.descriptor,
+        )
+
+        # Assert
+        assert result == self._name(b"fake_image")
+        self.photo_repository.upload_photo.assert_not_awaited()
+        self.user_photo_repository.add.assert_awaited_once_with(self.photo)
+
+    async def test_execute_large_content_staged_and_copied(self):
+        # Arrange
+        chunks = [b"fake", b"_image_data", b"_that_is", b"_large"]
+        content = b"".join(chunks)
+        name = self._name(content)
+
+        # Act
+        result = await self.use_case.execute(
+            UploadPhotoCommand(content=_chunks(*chunks)), self.descriptor
+        )
+
+        # Assert
+        assert result == name
+        assert self.uploaded == {self.staging: content}
+        self.photo_object_repository.acquire.assert_awaited_once_with(name)
+        self.photo_repository.copy_photo.assert_awaited_once_with(
+            self.staging, name
+        )
+        self.photo_repository.delete_photo.assert_awaited_once_with(
+            self.staging
+        )
+
+    async def test_execute_large_duplicate_deletes_staging(self):
+        # Arrange
+        self.photo_object_repository.acquire.return_value = 3
+
+        # Act
+        await self.use_case.execute(
+            UploadPhotoCommand(content=_chunks(b"x" * 10, b"y" * 10)),
+            self.descriptor,
+        )
+
+        # Assert
+        self.photo_repository.copy_photo.assert_not_awaited()
+        self.photo_repository.delete_photo.assert_awaited_once_with(
+            self.staging
+        )
+
+    async def test_execute_copy_failure_deletes_staging(self):
+        # Arrange
+        self.photo_repository.copy_photo.side_effect = RepositoryError(
+            "error"
+        )
+
+        # Act
+        with pytest.raises(RepositoryError):
+            await self.use_case.execute(
+                UploadPhotoCommand(content=_chunks(b"x" * 10, b"y" * 10)),
+                self.descriptor,
+            )
+
+        # Assert
+        self.photo_repository.delete_photo.assert_awaited_once_with(
+            self.staging
+        )
+        self.user_photo_repository.add.assert_not_awaited()
+
+    async def test_execute_failed_upload_is_not_added(self):
+        # Arrange
+        self.photo_repository.upload_photo.side_effect = RepositoryError(
+            "error"
+        )
+
+        # Act
+        with pytest.raises(RepositoryError):
+            await self.use_case.execute(
+                UploadPhotoCommand(content=_chunks(b"fake_image")),
+                self.descriptor,
+            )
+
+        # Assert
+        self.photo_repository.upload_photo.assert_awaited_once_with(
+            name=ANY, mime="image/jpeg", data=ANY
+        )
+        self.user_photo_repository.add.assert_not_awaited()
@@ -7,9 +7,13 @@ import pytest
 from photos.application.dtos.query.get_presigned_url_query import (
     GetPresignedUrlQuery,
 )
+from photos.application.exceptions import UnknownPhotoVariantError
 from photos.application.interfaces.repositories.photo_repository import (
     IPhotoRepository,
 )
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
 from photos.application.usecases.query.get_presigned_url_use_case import (
     GetPresignedUrlUseCase,
 )
@@ -23,11 +27,14 @@ class TestGetPresignedUrlUseCase:
         self.url = f"my-cloud/photos/{self.photo_name}"
 
         self.photo_repository = AsyncMock(spec=IPhotoRepository)
+        self.photo_variant_service = AsyncMock(spec=IPhotoVariantService)
 
         self.photo_repository.get_presigned_get_url.return_value = self.url
 
         self.use_case = GetPresignedUrlUseCase(
-            self.photo_repository, timedelta(minutes=15)
+            self.photo_repository,
+            self.photo_variant_service,
+            timedelta(minutes=15),
         )
 
         self.query = GetPresignedUrlQuery(self.photo_name)
@@ -38,3 +45,35 @@ class TestGetPresignedUrlUseCase:
 
         # Assert
         assert result == self.url
+        self.photo_variant_service.ensure.assert_not_awaited()
+
+    async def test_execute_variant_signs_variant_object(self):
+        # Arrange
+        variant_name = f"variants/thumb/{self.photo_name}.webp"
+        self.photo_variant_service.ensure.return_value = variant_name
+
+        # Act
+        await self.use_case.execute(
+            GetPresignedUrlQuery(self.photo_name, variant="thumb")
+        )
+
+        # Assert
+        self.photo_variant_service.ensure.assert_awaited_once_with(
+            self.photo_name, "thumb"
+        )
+        self.photo_repository.get_presigned_get_url.assert_awaited_once_with(
+            variant_name, timedelta(minutes=15)
+        )
+
+    async def test_execute_unknown_variant_fails(self):
+        # Arrange
+        self.photo_variant_service.ensure.side_effect = (
+            UnknownPhotoVariantError("huge")
+        )
+
+        # Act & Assert
+        with pytest.raises(UnknownPhotoVariantError):
+            await self.use_case.execute(
+                GetPresignedUrlQuery(self.photo_name, variant="huge")
+            )
+        self.photo_repository.get_presigned_get_url.assert_not_awaited()
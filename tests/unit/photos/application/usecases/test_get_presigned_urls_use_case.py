@@ -0,0 +1,48 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from photos.application.dtos.dtos import PresignedUrlDTO
+from photos.application.dtos.query.get_presigned_urls_query import (
+    GetPresignedUrlsQuery,
+)
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.usecases.query.get_presigned_urls_use_case import (
+    GetPresignedUrlsUseCase,
+)
+
+
+@pytest.mark.asyncio
+class TestGetPresignedUrlsUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.names = [f"{uuid4()}.jpg", f"{uuid4()}.png"]
+        self.expiration_delta = timedelta(minutes=15)
+
+        self.photo_repository = AsyncMock(spec=IPhotoRepository)
+        self.photo_repository.get_presigned_get_urls.return_value = [
+            f"url/{name}" for name in self.names
+        ]
+
+        self.use_case = GetPresignedUrlsUseCase(
+            self.photo_repository, self.expiration_delta
+        )
+
+    async def test_execute_success(self):
+        # Act
+        result = await self.use_case.execute(
+            GetPresignedUrlsQuery(names=self.names)
+        )
+
+        # Assert
+        assert result == [
+            PresignedUrlDTO(name=name, url=f"url/{name}")
+            for name in self.names
+        ]
+        self.photo_repository.get_presigned_get_urls.assert_awaited_once_with(
+            self.names, self.expiration_delta
+        )
@@ -0,0 +1,109 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.dtos import (
+    PhotoCursor,
+    PhotoDTO,
+    PhotoPage,
+    PhotoPageDTO,
+)
+from photos.application.dtos.query.list_photos_query import ListPhotosQuery
+from photos.application.exceptions import InvalidPhotoCursorError
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.usecases.query.list_photos_use_case import (
+    ListPhotosUseCase,
+)
+from photos.domain.entity.photo import Photo
+
+
+@pytest.mark.asyncio
+class TestListPhotosUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.user_id = uuid4()
+        self.descriptor = UserDescriptor(
+            user_id=self.user_id, username="testuser"
+        )
+        self.expiration_delta = timedelta(minutes=15)
+        self.photos = [
+            Photo.create(uuid4(), self.user_id, "png", "image/png"),
+            Photo.create(uuid4(), self.user_id, "jpg", "image/jpeg"),
+        ]
+        self.cursor = PhotoCursor(
+            created_at=datetime(2025, 1, 2, 3, 4, 5, 6, tzinfo=UTC),
+            photo_id=self.photos[1].photo_id,
+        )
+
+        self.photo_repository = AsyncMock(spec=IPhotoRepository)
+        self.photo_repository.get_presigned_get_urls.side_effect = (
+            lambda names, expires_in: [f"url/{name}" for name in names]
+        )
+        self.user_photo_repository = AsyncMock(spec=IUserPhotoRepository)
+        self.user_photo_repository.list_page_by_user_id.return_value = (
+            PhotoPage(photos=self.photos, next_cursor=self.cursor)
+        )
+
+        self.use_case = ListPhotosUseCase(
+            photo_repository=self.photo_repository,
+            user_photo_repository=self.user_photo_repository,
+            expiration_delta=self.expiration_delta,
+        )
+
+    async def test_list_photos_signs_page_in_one_batch(self):
+        # Act
+        result = await self.use_case.execute(
+            ListPhotosQuery(limit=2), self.descriptor
+        )
+
+        # Assert
+        assert result == PhotoPageDTO(
+            photos=[
+                PhotoDTO(
+                    name=photo.name, mime=photo.mime, url=f"url/{photo.name}"
+                )
+                for photo in self.photos
+            ],
+            next_cursor=self.cursor.encode(),
+        )
+        self.user_photo_repository.list_page_by_user_id.assert_awaited_once_with(
+            self.user_id, 2, None
+        )
+        self.photo_repository.get_presigned_get_urls.assert_awaited_once_with(
+            [photo.name for photo in self.photos], self.expiration_delta
+        )
+
+    async def test_list_photos_resumes_after_cursor(self):
+        # Arrange
+        self.user_photo_repository.list_page_by_user_id.return_value = (
+            PhotoPage(photos=[], next_cursor=None)
+        )
+
+        # Act
+        result = await self.use_case.execute(
+            ListPhotosQuery(limit=2, cursor=self.cursor.encode()),
+            self.descriptor,
+        )
+
+        # Assert
+        assert result == PhotoPageDTO(photos=[], next_cursor=None)
+        self.user_photo_repository.list_page_by_user_id.assert_awaited_once_with(
+            self.user_id, 2, self.cursor
+        )
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "bm9waXBl", "YXxi"])
+    async def test_list_photos_invalid_cursor_fails(self, cursor: str):
+        # Act & Assert
+        with pytest.raises(InvalidPhotoCursorError):
+            await self.use_case.execute(
+                ListPhotosQuery(limit=2, cursor=cursor), self.descriptor
+            )
+        self.user_photo_repository.list_page_by_user_id.assert_not_awaited()
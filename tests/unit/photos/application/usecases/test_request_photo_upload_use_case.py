@@ -0,0 +1,124 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.command.request_photo_upload_command import (
+    RequestPhotoUploadCommand,
+)
+from photos.application.dtos.dtos import (
+    FileType,
+    PhotoUploadDTO,
+    UploadPolicy,
+)
+from photos.application.exceptions import (
+    InvalidFileTypeError,
+    InvalidUploadSizeError,
+)
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.application.interfaces.repositories.user_photo_repository import (
+    IUserPhotoRepository,
+)
+from photos.application.interfaces.services.file_type_introspector import (
+    IFileTypeIntrospector,
+)
+from photos.application.usecases.command.request_photo_upload_use_case import (
+    RequestPhotoUploadUseCase,
+)
+from photos.domain.entity.photo import Photo
+from photos.domain.interfaces.photo_factory import IPhotoFactory
+from photos.domain.value_objects.photo_status import PhotoStatus
+
+
+@pytest.mark.asyncio
+class TestRequestPhotoUploadUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.user_id = uuid4()
+        self.descriptor = UserDescriptor(
+            user_id=self.user_id, username="testuser"
+        )
+        self.max_size = 1024
+        self.expiration_delta = timedelta(minutes=5)
+        self.photo = Photo.create(
+            uuid4(),
+            self.user_id,
+            "png",
+            "image/png",
+            status=PhotoStatus.PENDING,
+        )
+        self.policy = UploadPolicy(
+            url="http://storage/photos", fields={"key": self.photo.name}
+        )
+
+        self.photo_factory = Mock(spec=IPhotoFactory)
+        self.photo_factory.create_pending.return_value = self.photo
+        self.photo_repository = AsyncMock(spec=IPhotoRepository)
+        self.photo_repository.create_upload_policy.return_value = self.policy
+        self.user_photo_repository = AsyncMock(spec=IUserPhotoRepository)
+        self.file_type_introspector = Mock(spec=IFileTypeIntrospector)
+        self.file_type_introspector.from_mime.return_value = FileType(
+            extension="png", mime="image/png"
+        )
+
+        self.use_case = RequestPhotoUploadUseCase(
+            photo_factory=self.photo_factory,
+            photo_repository=self.photo_repository,
+            user_photo_repository=self.user_photo_repository,
+            file_type_introspector=self.file_type_introspector,
+            max_size=self.max_size,
+            expiration_delta=self.expiration_delta,
+        )
+
+    async def test_request_upload_success(self):
+        # Arrange
+        command = RequestPhotoUploadCommand(mime="image/png", size=512)
+
+        # Act
+        result = await self.use_case.execute(command, self.descriptor)
+
+        # Assert
+        assert result == PhotoUploadDTO(
+            name=self.photo.name,
+            url=self.policy.url,
+            fields=self.policy.fields,
+        )
+        self.photo_factory.create_pending.assert_called_once_with(
+            self.user_id, extension="png", mime="image/png"
+        )
+        self.user_photo_repository.add.assert_awaited_once_with(self.photo)
+        self.photo_repository.create_upload_policy.assert_awaited_once_with(
+            self.photo.name, "image/png", 512, self.expiration_delta
+        )
+
+    @pytest.mark.parametrize("size", [0, -1, 1025])
+    async def test_request_upload_invalid_size_fails(self, size: int):
+        # Arrange
+        command = RequestPhotoUploadCommand(mime="image/png", size=size)
+
+        # Act
+        with pytest.raises(InvalidUploadSizeError):
+            await self.use_case.execute(command, self.descriptor)
+
+        # Assert
+        self.user_photo_repository.add.assert_not_awaited()
+        self.photo_repository.create_upload_policy.assert_not_awaited()
+
+    async def test_request_upload_unsupported_type_fails(self):
+        # Arrange
+        self.file_type_introspector.from_mime.side_effect = (
+            InvalidFileTypeError
+        )
+        command = RequestPhotoUploadCommand(mime="text/plain", size=512)
+
+        # Act
+        with pytest.raises(InvalidFileTypeError):
+            await self.use_case.execute(command, self.descriptor)
+
+        # Assert
+        self.photo_factory.create_pending.assert_not_called()
+        self.user_photo_repository.add.assert_not_awaited()
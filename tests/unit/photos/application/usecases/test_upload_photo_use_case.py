@@ -1,5 +1,5 @@
-from io import BytesIO
-from unittest.mock import AsyncMock, Mock
+from collections.abc import AsyncIterable, AsyncIterator
+from unittest.mock import ANY, AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
@@ -9,6 +9,10 @@ from identity.domain.value_objects.descriptor import UserDescriptor
 from photos.application.dtos.command.upload_photo_command import (
     UploadPhotoCommand,
 )
+from photos.application.exceptions import (
+    InvalidFileTypeError,
+    InvalidUploadSizeError,
+)
 from photos.application.interfaces.repositories.photo_repository import (
     IPhotoRepository,
 )
@@ -18,6 +22,9 @@ from photos.application.interfaces.repositories.user_photo_repository import (
 from photos.application.interfaces.services.file_type_introspector import (
     IFileTypeIntrospector,
 )
+from photos.application.interfaces.services.photo_variant_service import (
+    IPhotoVariantService,
+)
 from photos.application.usecases.command.upload_photo_use_case import (
     UploadPhotoUseCase,
 )
@@ -25,6 +32,11 @@ from photos.domain.entity.photo import Photo
 from photos.domain.interfaces.photo_factory import IPhotoFactory
 
 
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
 @pytest.mark.asyncio
 class TestUploadPhotoUseCase:
     @pytest.fixture(autouse=True)
@@ -36,7 +48,7 @@ class TestUploadPhotoUseCase:
         )
         self.extension = "jpg"
         self.mime = "image/jpeg"
-        self.content = BytesIO(b"fake_image_data")
+        self.chunks = [b"fake_", b"image", b"_data", b"_tail"]
         self.photo_name = f"{self.photo_id}.{self.extension}"
         self.photo = Photo(
             photo_id=self.photo_id,
@@ -48,21 +60,33 @@ class TestUploadPhotoUseCase:
         self.photo_factory = Mock(spec=IPhotoFactory)
         self.photo_factory.create.return_value = self.photo
 
+        self.uploaded: list[bytes] = []
         self.photo_repository = AsyncMock(spec=IPhotoRepository)
+        self.photo_repository.upload_photo.side_effect = self._consume
         self.user_photo_repository = AsyncMock(spec=IUserPhotoRepository)
         self.file_type_introspector = Mock(spec=IFileTypeIntrospector)
+        self.file_type_introspector.head_size = 12
         self.file_type_introspector.extract.return_value = Mock(
             extension=self.extension, mime=self.mime
         )
+        self.photo_variant_service = Mock(spec=IPhotoVariantService)
 
         self.use_case = UploadPhotoUseCase(
             photo_factory=self.photo_factory,
             photo_repository=self.photo_repository,
             user_photo_repository=self.user_photo_repository,
             file_type_introspector=self.file_type_introspector,
+            photo_variant_service=self.photo_variant_service,
+            max_size=64,
         )
 
-        self.command = UploadPhotoCommand(content=self.content)
+        self.command = UploadPhotoCommand(content=_chunks(*self.chunks))
+
+    async def _consume(
+        self, name: str, mime: str, data: AsyncIterable[bytes]
+    ) -> None:
+        async for chunk in data:
+            self.uploaded.append(chunk)
 
     async def test_execute_success(self):
         # Act
@@ -70,16 +94,20 @@ class TestUploadPhotoUseCase:
 
         # Assert
         self.file_type_introspector.extract.assert_called_once_with(
-            self.content
+            b"fake_image_data"
         )
         self.photo_factory.create.assert_called_once_with(
             self.descriptor.user_id, extension=self.extension, mime=self.mime
         )
         self.user_photo_repository.add.assert_awaited_once_with(self.photo)
         self.photo_repository.upload_photo.assert_awaited_once_with(
-            name=self.photo_name, mime=self.mime, data=self.content
+            name=self.photo_name, mime=self.mime, data=ANY
         )
+        assert b"".join(self.uploaded) == b"".join(self.chunks)
         assert result == self.photo_name
+        self.photo_variant_service.schedule.assert_called_once_with(
+            self.photo_name
+        )
 
     async def test_execute_add_not_awaited_when_upload_fails(self):
         # Arrange
@@ -93,6 +121,83 @@ class TestUploadPhotoUseCase:
 
         # Assert
         self.photo_repository.upload_photo.assert_awaited_once_with(
-            name=self.photo_name, mime=self.mime, data=self.content
+            name=self.photo_name, mime=self.mime, data=ANY
         )
         self.user_photo_repository.add.assert_not_awaited()
+        self.photo_variant_service.schedule.assert_not_called()
+
+    async def test_execute_reads_only_head_before_upload(self):
+        # Arrange
+        read: list[bytes] = []
+
+        async def tracked() -> AsyncIterator[bytes]:
+            for chunk in self.chunks:
+                read.append(chunk)
+                yield chunk
+
+        def extract(head: bytes) -> Mock:
+            assert read == self.chunks[:3]
+            return Mock(extension=self.extension, mime=self.mime)
+
+        self.file_type_introspector.extract.side_effect = extract
+
+        # Act
+        await self.use_case.execute(
+            UploadPhotoCommand(content=tracked()), self.descriptor
+        )
+
+        # Assert
+        assert b"".join(self.uploaded) == b"".join(self.chunks)
+
+    async def test_execute_short_content_passes_whole_head(self):
+        # Act
+        await self.use_case.execute(
+            UploadPhotoCommand(content=_chunks(b"tiny")), self.descriptor
+        )
+
+        # Assert
+        self.file_type_introspector.extract.assert_called_once_with(b"tiny")
+        assert self.uploaded == [b"tiny"]
+
+    async def test_execute_invalid_file_type_does_not_upload(self):
+        # Arrange
+        self.file_type_introspector.extract.side_effect = (
+            InvalidFileTypeError()
+        )
+
+        # Act
+        with pytest.raises(InvalidFileTypeError):
+            await self.use_case.execute(self.command, self.descriptor)
+
+        # Assert
+        self.photo_repository.upload_photo.assert_not_awaited()
+        self.user_photo_repository.add.assert_not_awaited()
+
+    async def test_execute_oversized_content_stops_reading(self):
+        # Arrange
+        read: list[bytes] = []
+
+        async def oversized() -> AsyncIterator[bytes]:
+            for _ in range(10):
+                read.append(b"x" * 20)
+                yield b"x" * 20
+
+        # Act
+        with pytest.raises(InvalidUploadSizeError):
+            await self.use_case.execute(
+                UploadPhotoCommand(content=oversized()), self.descriptor
+            )
+
+        # Assert
+        assert len(read) == 4
+        self.user_photo_repository.add.assert_not_awaited()
+
+    async def test_execute_content_at_limit_succeeds(self):
+        # Act
+        await self.use_case.execute(
+            UploadPhotoCommand(content=_chunks(b"x" * 32, b"y" * 32)),
+            self.descriptor,
+        )
+
+        # Assert
+        assert b"".join(self.uploaded) == b"x" * 32 + b"y" * 32
@@ -0,0 +1,78 @@
+from uuid import uuid4
+
+import pytest
+
+from common.domain.exceptions import InvariantViolationError
+from photos.domain.entity.photo import Photo
+from photos.domain.exceptions import InvalidPhotoNameError
+from photos.domain.value_objects.photo_status import PhotoStatus
+
+
+class TestPhoto:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.photo_id = uuid4()
+        self.photo = Photo.create(
+            self.photo_id,
+            uuid4(),
+            "jpg",
+            "image/jpeg",
+            status=PhotoStatus.PENDING,
+        )
+
+    def test_create_defaults_to_active(self):
+        # Act
+        photo = Photo.create(self.photo_id, uuid4(), "jpg", "image/jpeg")
+
+        # Assert
+        assert photo.status == PhotoStatus.ACTIVE
+        assert not photo.is_pending()
+
+    def test_activate_pending(self):
+        # Act
+        self.photo.activate()
+
+        # Assert
+        assert self.photo.status == PhotoStatus.ACTIVE
+
+    def test_reject_pending(self):
+        # Act
+        self.photo.reject()
+
+        # Assert
+        assert self.photo.status == PhotoStatus.REJECTED
+
+    @pytest.mark.parametrize(
+        "status", [PhotoStatus.ACTIVE, PhotoStatus.REJECTED]
+    )
+    def test_transition_from_final_status_fails(self, status: PhotoStatus):
+        # Arrange
+        self.photo.status = status
+
+        # Act & Assert
+        with pytest.raises(InvariantViolationError):
+            self.photo.activate()
+        with pytest.raises(InvariantViolationError):
+            self.photo.reject()
+        assert self.photo.status == status
+
+    def test_id_from_name(self):
+        # Act
+        result = Photo.id_from_name(self.photo.name)
+
+        # Assert
+        assert result == self.photo_id
+
+    @pytest.mark.parametrize("name", ["photo.jpg", "", "../etc/passwd"])
+    def test_id_from_invalid_name_fails(self, name: str):
+        # Act & Assert
+        with pytest.raises(InvalidPhotoNameError):
+            Photo.id_from_name(name)
+
+    def test_address_by_content_keeps_extension(self):
+        # Act
+        self.photo.address_by_content("ab12")
+
+        # Assert
+        assert self.photo.name == "ab12.jpg"
+        assert self.photo.photo_id == self.photo_id
@@ -8,6 +8,7 @@ from photos.domain.entity.photo import Photo
 from photos.domain.exceptions import InvalidExtensionTypeError
 from photos.domain.factories.photo_factory import PhotoFactory
 from photos.domain.interfaces.extenstion_policy import IExtensionPolicy
+from photos.domain.value_objects.photo_status import PhotoStatus
 
 
 class TestPhotoFactory:
@@ -53,3 +54,24 @@ class TestPhotoFactory:
 
         # Assert
         self.ext_policy.is_allowed.assert_called_once_with(self.extension)
+
+    def test_photo_factory_create_pending_success(self):
+        # Act
+        result = self.factory.create_pending(
+            self.user_id, self.extension, self.mime
+        )
+
+        # Assert
+        assert result.photo_id == self.photo_id
+        assert result.status == PhotoStatus.PENDING
+        self.ext_policy.is_allowed.assert_called_once_with(self.extension)
+
+    def test_photo_factory_create_pending_invalid_extension_fails(self):
+        # Arrange
+        self.ext_policy.is_allowed.return_value = False
+
+        # Act & Assert
+        with pytest.raises(InvalidExtensionTypeError):
+            self.factory.create_pending(
+                self.user_id, self.extension, self.mime
+            )
@@ -1,5 +1,3 @@
-from io import BytesIO
-
 import pytest
 
 from photos.application.dtos.dtos import FileType
@@ -14,17 +12,14 @@ class TestFileTypeIntrospector:
     def setup(self):
         self.file_type_introspector = FileTypeIntrospector()
         # JPEG magic number (simplified header for testing)
-        self.jpeg_content = BytesIO(
-            b"\xff\xd8\xff\xe0" + b"\x00" * 257  # 261 bytes total
-        )
+        self.jpeg_content = b"\xff\xd8\xff\xe0" + b"\x00" * 257
         # PNG magic number
-        self.png_content = BytesIO(
-            b"\x89PNG\x0d\x0a\x1a\x0a" + b"\x00" * 253  # 261 bytes total
-        )
+        self.png_content = b"\x89PNG\x0d\x0a\x1a\x0a" + b"\x00" * 253
         # Invalid content (non-recognizable file type)
-        self.invalid_content = BytesIO(
-            b"invalid_data" + b"\x00" * 250
-        )  # 261 bytes total
+        self.invalid_content = b"invalid_data" + b"\x00" * 250
+
+    def test_head_size(self):
+        assert self.file_type_introspector.head_size == 261
 
     def test_extract_jpeg_success(self):
         # Act
@@ -34,7 +29,6 @@ class TestFileTypeIntrospector:
         assert isinstance(result, FileType)
         assert result.extension == "jpg"
         assert result.mime == "image/jpeg"
-        assert self.jpeg_content.tell() == 0  # Stream position reset
 
     def test_extract_png_success(self):
         # Act
@@ -44,10 +38,34 @@ class TestFileTypeIntrospector:
         assert isinstance(result, FileType)
         assert result.extension == "png"
         assert result.mime == "image/png"
-        assert self.png_content.tell() == 0  # Stream position reset
+
+    def test_extract_longer_head_success(self):
+        # Act
+        result = self.file_type_introspector.extract(
+            self.png_content + b"\x00" * 4096
+        )
+
+        # Assert
+        assert result.extension == "png"
 
     def test_extract_invalid_file_type_fails(self):
         # Act & Assert
         with pytest.raises(InvalidFileTypeError):
             self.file_type_introspector.extract(self.invalid_content)
-        assert self.invalid_content.tell() == 0  # Stream position reset
+
+    def test_extract_empty_fails(self):
+        # Act & Assert
+        with pytest.raises(InvalidFileTypeError):
+            self.file_type_introspector.extract(b"")
+
+    def test_from_mime_success(self):
+        # Act
+        result = self.file_type_introspector.from_mime("image/png")
+
+        # Assert
+        assert result == FileType(extension="png", mime="image/png")
+
+    def test_from_mime_unsupported_fails(self):
+        # Act & Assert
+        with pytest.raises(InvalidFileTypeError):
+            self.file_type_introspector.from_mime("text/plain")
@@ -0,0 +1,57 @@
+import io
+
+import pytest
+import pytest_asyncio
+from PIL import Image
+
+from common.application.exceptions import InvalidContentError
+from photos.infrastructure.services.image_renderer import (
+    ProcessPoolImageRenderer,
+)
+
+
+def _image(size: tuple[int, int], mode: str, fmt: str) -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, size).save(output, fmt)
+    return output.getvalue()
+
+
+@pytest.mark.asyncio
+class TestProcessPoolImageRenderer:
+    @pytest_asyncio.fixture(autouse=True)
+    async def setup(self):
+        self.renderer = ProcessPoolImageRenderer(workers=1, quality=70)
+        yield
+        self.renderer.shutdown()
+
+    async def _render(self, data: bytes, max_size: int) -> Image.Image:
+        result = await self.renderer.render(data, max_size)
+        image = Image.open(io.BytesIO(result))
+        assert image.format == "WEBP"
+        return image
+
+    async def test_render_fits_longest_edge(self):
+        # Act
+        image = await self._render(_image((400, 200), "RGB", "JPEG"), 100)
+
+        # Assert
+        assert image.size == (100, 50)
+
+    async def test_render_never_upscales(self):
+        # Act
+        image = await self._render(_image((40, 20), "RGB", "PNG"), 100)
+
+        # Assert
+        assert image.size == (40, 20)
+
+    async def test_render_keeps_transparency(self):
+        # Act
+        image = await self._render(_image((64, 64), "LA", "PNG"), 32)
+
+        # Assert
+        assert image.mode == "RGBA"
+
+    async def test_render_invalid_content_fails(self):
+        # Act & Assert
+        with pytest.raises(InvalidContentError):
+            await self.renderer.render(b"not an image", 100)
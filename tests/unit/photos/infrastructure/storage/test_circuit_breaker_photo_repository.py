@@ -0,0 +1,103 @@
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.application.exceptions import (
+    InvalidContentError,
+    RepositoryError,
+    ServiceUnavailableError,
+)
+from common.infrastructure.config.circuit_breaker_config import (
+    CircuitBreakerConfig,
+)
+from common.infrastructure.resilience.circuit_breaker import CircuitBreaker
+from photos.application.interfaces.repositories.photo_repository import (
+    IPhotoRepository,
+)
+from photos.infrastructure.storage.repositories.circuit_breaker_photo_repository import (
+    CircuitBreakerPhotoRepository,
+)
+
+
+async def _data() -> AsyncIterator[bytes]:
+    yield b"data"
+
+
+@pytest.mark.asyncio
+class TestCircuitBreakerPhotoRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.inner = AsyncMock(spec=IPhotoRepository)
+        self.breaker = CircuitBreaker(
+            "storage",
+            CircuitBreakerConfig(window_size=2, minimum_calls=2),
+        )
+        self.repository = CircuitBreakerPhotoRepository(
+            self.inner, self.breaker
+        )
+        self.expires_in = timedelta(minutes=5)
+
+    async def test_delegates_when_closed(self):
+        # Arrange
+        self.inner.get_presigned_get_url.return_value = "url"
+
+        # Act
+        result = await self.repository.get_presigned_get_url(
+            "photo.png", self.expires_in
+        )
+
+        # Assert
+        assert result == "url"
+        self.inner.get_presigned_get_url.assert_awaited_once_with(
+            "photo.png", self.expires_in
+        )
+
+    async def test_connection_errors_trip_and_fail_fast(self):
+        # Arrange
+        self.inner.upload_photo.side_effect = ConnectionError("refused")
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await self.repository.upload_photo(
+                    "photo.png", "image/png", _data()
+                )
+
+        # Act & Assert
+        with pytest.raises(ServiceUnavailableError):
+            await self.repository.get_presigned_get_urls(
+                ["photo.png"], self.expires_in
+            )
+        self.inner.get_presigned_get_urls.assert_not_awaited()
+
+    async def test_repository_errors_trip(self):
+        # Arrange
+        self.inner.get_presigned_get_url.side_effect = RepositoryError("s3")
+        for _ in range(2):
+            with pytest.raises(RepositoryError):
+                await self.repository.get_presigned_get_url(
+                    "photo.png", self.expires_in
+                )
+
+        # Act & Assert
+        with pytest.raises(ServiceUnavailableError):
+            await self.repository.upload_photo(
+                "photo.png", "image/png", _data()
+            )
+
+    async def test_invalid_content_does_not_trip(self):
+        # Arrange
+        self.inner.upload_photo.side_effect = InvalidContentError()
+        for _ in range(2):
+            with pytest.raises(InvalidContentError):
+                await self.repository.upload_photo(
+                    "photo.png", "image/png", _data()
+                )
+
+        # Act
+        await self.repository.get_presigned_get_url(
+            "photo.png", self.expires_in
+        )
+
+        # Assert
+        self.inner.get_presigned_get_url.assert_awaited_once()
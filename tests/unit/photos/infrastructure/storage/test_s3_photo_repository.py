@@ -0,0 +1,369 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from common.application.exceptions import (
+    InvalidContentError,
+    NotFoundError,
+    RepositoryError,
+)
+from common.infrastructure.storage.s3.client import (
+    S3Client,
+    S3ClientError,
+    UploadedPart,
+)
+from photos.infrastructure.storage.s3.repositories.photo_repository import (
+    S3PhotoRepository,
+)
+
+
+async def _chunks(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _broken(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+    raise InvalidContentError()
+
+
+@pytest.mark.asyncio
+class TestS3PhotoRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.client = AsyncMock(spec=S3Client)
+        self.client.presigned_get_object = Mock(
+            side_effect=lambda bucket, name, expires: f"url/{name}"
+        )
+        self.client.presigned_post_policy = Mock(
+            return_value=("url/photos", {"key": "a.png"})
+        )
+        self.client.create_multipart_upload.return_value = "upload-1"
+        self.client.upload_part.side_effect = (
+            lambda bucket, name, upload_id, number, data: UploadedPart(
+                number, f"etag-{number}"
+            )
+        )
+        self.repository = S3PhotoRepository(
+            self.client, "photos", part_size=10, retry_backoff=0
+        )
+
+    def _uploaded_parts(self) -> list[tuple[int, bytes]]:
+        return [
+            (call.args[3], call.args[4])
+            for call in self.client.upload_part.await_args_list
+        ]
+
+    async def test_small_content_uses_single_put(self):
+        # Act
+        await self.repository.upload_photo(
+            "a.png", "image/png", _chunks(b"abc", b"def")
+        )
+
+        # Assert
+        self.client.put_object.assert_awaited_once_with(
+            "photos", "a.png", b"abcdef", "image/png"
+        )
+        self.client.create_multipart_upload.assert_not_awaited()
+
+    async def test_large_content_uploads_fixed_size_parts(self):
+        # Act
+        await self.repository.upload_photo(
+            "a.png", "image/png", _chunks(b"0123456", b"789abcdefghij", b"k")
+        )
+
+        # Assert
+        self.client.create_multipart_upload.assert_awaited_once_with(
+            "photos", "a.png", "image/png"
+        )
+        assert self._uploaded_parts() == [
+            (1, b"0123456789"),
+            (2, b"abcdefghij"),
+            (3, b"k"),
+        ]
+        self.client.complete_multipart_upload.assert_awaited_once_with(
+            "photos",
+            "a.png",
+            "upload-1",
+            [UploadedPart(n, f"etag-{n}") for n in (1, 2, 3)],
+        )
+        self.client.put_object.assert_not_awaited()
+
+    async def test_exact_multiple_has_no_empty_last_part(self):
+        # Act
+        await self.repository.upload_photo(
+            "a.png", "image/png", _chunks(b"0123456789" * 2)
+        )
+
+        # Assert
+        assert [n for n, _ in self._uploaded_parts()] == [1, 2]
+        self.client.complete_multipart_upload.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            S3ClientError(500, "InternalError", "boom"),
+            httpx.ConnectError("refused"),
+        ],
+    )
+    async def test_storage_error_aborts_upload(self, error: Exception):
+        # Arrange
+        self.client.upload_part.side_effect = error
+
+        # Act & Assert
+        with pytest.raises(RepositoryError):
+            await self.repository.upload_photo(
+                "a.png", "image/png", _chunks(b"0123456789" * 2)
+            )
+        self.client.abort_multipart_upload.assert_awaited_once_with(
+            "photos", "a.png", "upload-1"
+        )
+        self.client.complete_multipart_upload.assert_not_awaited()
+
+    async def test_failed_abort_keeps_original_error(self):
+        # Arrange
+        self.client.upload_part.side_effect = S3ClientError(
+            500, "InternalError", "boom"
+        )
+        self.client.abort_multipart_upload.side_effect = httpx.ConnectError(
+            "refused"
+        )
+
+        # Act & Assert
+        with pytest.raises(RepositoryError) as exc_info:
+            await self.repository.upload_photo(
+                "a.png", "image/png", _chunks(b"0123456789" * 2)
+            )
+        assert isinstance(exc_info.value.__cause__, S3ClientError)
+
+    async def test_broken_stream_aborts_and_propagates(self):
+        # Act & Assert
+        with pytest.raises(InvalidContentError):
+            await self.repository.upload_photo(
+                "a.png", "image/png", _broken(b"0123456789" * 2)
+            )
+        self.client.abort_multipart_upload.assert_awaited_once()
+        self.client.complete_multipart_upload.assert_not_awaited()
+
+    async def test_broken_stream_before_first_part_skips_storage(self):
+        # Act & Assert
+        with pytest.raises(InvalidContentError):
+            await self.repository.upload_photo(
+                "a.png", "image/png", _broken(b"0123")
+            )
+        self.client.put_object.assert_not_awaited()
+        self.client.abort_multipart_upload.assert_not_awaited()
+
+    async def test_parts_upload_concurrently_up_to_limit(self):
+        # Arrange
+        repository = S3PhotoRepository(
+            self.client, "photos", part_size=10, concurrency=2
+        )
+        in_flight = 0
+        peak = 0
+
+        async def upload_part(bucket, name, upload_id, number, data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return UploadedPart(number, f"etag-{number}")
+
+        self.client.upload_part.side_effect = upload_part
+
+        # Act
+        await repository.upload_photo(
+            "a.png", "image/png", _chunks(b"0123456789" * 5)
+        )
+
+        # Assert
+        assert peak == 2
+        assert [n for n, _ in self._uploaded_parts()] == [1, 2, 3, 4, 5]
+
+    async def test_parts_completed_in_order(self):
+        # Arrange
+        async def upload_part(bucket, name, upload_id, number, data):
+            # NOTE: earlier parts finish last
+            await asyncio.sleep(0.01 * (4 - number))
+            return UploadedPart(number, f"etag-{number}")
+
+        self.client.upload_part.side_effect = upload_part
+
+        # Act
+        await self.repository.upload_photo(
+            "a.png", "image/png", _chunks(b"0123456789" * 3)
+        )
+
+        # Assert
+        self.client.complete_multipart_upload.assert_awaited_once_with(
+            "photos",
+            "a.png",
+            "upload-1",
+            [UploadedPart(n, f"etag-{n}") for n in (1, 2, 3)],
+        )
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            S3ClientError(503, "SlowDown", "busy"),
+            httpx.ReadTimeout("timeout"),
+        ],
+    )
+    async def test_transient_part_error_retries_only_that_part(
+        self, error: Exception
+    ):
+        # Arrange
+        failures = [error]
+
+        async def upload_part(bucket, name, upload_id, number, data):
+            if number == 2 and failures:
+                raise failures.pop()
+            return UploadedPart(number, f"etag-{number}")
+
+        self.client.upload_part.side_effect = upload_part
+
+        # Act
+        await self.repository.upload_photo(
+            "a.png", "image/png", _chunks(b"0123456789" * 3)
+        )
+
+        # Assert
+        assert sorted(n for n, _ in self._uploaded_parts()) == [1, 2, 2, 3]
+        self.client.create_multipart_upload.assert_awaited_once()
+        self.client.complete_multipart_upload.assert_awaited_once()
+        self.client.abort_multipart_upload.assert_not_awaited()
+
+    async def test_client_part_error_is_not_retried(self):
+        # Arrange
+        self.client.upload_part.side_effect = S3ClientError(
+            400, "InvalidPart", "bad part"
+        )
+
+        # Act & Assert
+        with pytest.raises(RepositoryError):
+            await self.repository.upload_photo(
+                "a.png", "image/png", _chunks(b"0123456789")
+            )
+        self.client.upload_part.assert_awaited_once()
+        self.client.abort_multipart_upload.assert_awaited_once()
+
+    async def test_presigned_urls_are_signed_locally(self):
+        # Arrange
+        expires_in = timedelta(minutes=5)
+
+        # Act
+        urls = await self.repository.get_presigned_get_urls(
+            ["a.png", "b.png"], expires_in
+        )
+
+        # Assert
+        assert urls == ["url/a.png", "url/b.png"]
+        self.client.presigned_get_object.assert_any_call(
+            "photos", "a.png", expires_in
+        )
+
+    async def test_upload_policy_is_signed_locally(self):
+        # Arrange
+        expires_in = timedelta(minutes=5)
+
+        # Act
+        policy = await self.repository.create_upload_policy(
+            "a.png", "image/png", 1024, expires_in
+        )
+
+        # Assert
+        assert policy.url == "url/photos"
+        assert policy.fields == {"key": "a.png"}
+        self.client.presigned_post_policy.assert_called_once_with(
+            "photos", "a.png", "image/png", 1024, expires_in
+        )
+
+    async def test_read_head_requests_range(self):
+        # Arrange
+        self.client.get_object_range.return_value = b"head"
+
+        # Act
+        result = await self.repository.read_head("a.png", 4)
+
+        # Assert
+        assert result == b"head"
+        self.client.get_object_range.assert_awaited_once_with(
+            "photos", "a.png", 0, 3
+        )
+
+    async def test_read_head_missing_object_fails(self):
+        # Arrange
+        self.client.get_object_range.side_effect = S3ClientError(
+            404, "NoSuchKey", "missing"
+        )
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await self.repository.read_head("a.png", 4)
+
+    async def test_read_head_empty_object_is_empty(self):
+        # Arrange
+        self.client.get_object_range.side_effect = S3ClientError(
+            416, "InvalidRange", "empty"
+        )
+
+        # Act
+        result = await self.repository.read_head("a.png", 4)
+
+        # Assert
+        assert result == b""
+
+    async def test_copy_photo_copies_within_bucket(self):
+        # Act
+        await self.repository.copy_photo("staging.png", "ab.png")
+
+        # Assert
+        self.client.copy_object.assert_awaited_once_with(
+            "photos", "staging.png", "ab.png"
+        )
+
+    async def test_copy_photo_storage_error_fails(self):
+        # Arrange
+        self.client.copy_object.side_effect = httpx.ConnectError("down")
+
+        # Act & Assert
+        with pytest.raises(RepositoryError):
+            await self.repository.copy_photo("staging.png", "ab.png")
+
+    async def test_download_photo_reads_object(self):
+        # Arrange
+        self.client.get_object.return_value = b"data"
+
+        # Act
+        result = await self.repository.download_photo("a.png")
+
+        # Assert
+        assert result == b"data"
+        self.client.get_object.assert_awaited_once_with("photos", "a.png")
+
+    async def test_download_photo_missing_object_fails(self):
+        # Arrange
+        self.client.get_object.side_effect = S3ClientError(
+            404, "NoSuchKey", "missing"
+        )
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await self.repository.download_photo("a.png")
+
+    async def test_photo_exists(self):
+        # Arrange
+        self.client.object_exists.return_value = False
+
+        # Act
+        result = await self.repository.photo_exists("a.png")
+
+        # Assert
+        assert result is False
+        self.client.object_exists.assert_awaited_once_with("photos", "a.png")
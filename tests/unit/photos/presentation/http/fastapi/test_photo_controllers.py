@@ -11,22 +11,60 @@ from auth.application.interfaces.services.token_service import (
     ITokenIntrospector,
 )
 from identity.domain.value_objects.descriptor import UserDescriptor
+from photos.application.dtos.command.confirm_photo_upload_command import (
+    ConfirmPhotoUploadCommand,
+)
+from photos.application.dtos.command.request_photo_upload_command import (
+    RequestPhotoUploadCommand,
+)
 from photos.application.dtos.command.upload_photo_command import (
     UploadPhotoCommand,
 )
+from photos.application.dtos.dtos import (
+    PhotoDTO,
+    PhotoPageDTO,
+    PhotoUploadDTO,
+    PresignedUrlDTO,
+)
 from photos.application.dtos.query.get_presigned_url_query import (
     GetPresignedUrlQuery,
 )
+from photos.application.dtos.query.get_presigned_urls_query import (
+    GetPresignedUrlsQuery,
+)
+from photos.application.dtos.query.list_photos_query import ListPhotosQuery
+from photos.application.exceptions import (
+    InvalidPhotoCursorError,
+    InvalidUploadSizeError,
+    UnknownPhotoVariantError,
+)
+from photos.application.interfaces.usecases.command.confirm_photo_upload_use_case import (
+    IConfirmPhotoUploadUseCase,
+)
+from photos.application.interfaces.usecases.command.request_photo_upload_use_case import (
+    IRequestPhotoUploadUseCase,
+)
 from photos.application.interfaces.usecases.command.upload_photo_use_case import (
     IUploadPhotoUseCase,
 )
 from photos.application.interfaces.usecases.query.get_presigned_url_use_case import (
     IGetPresignedUrlUseCase,
 )
+from photos.application.interfaces.usecases.query.get_presigned_urls_use_case import (
+    IGetPresignedUrlsUseCase,
+)
+from photos.application.interfaces.usecases.query.list_photos_use_case import (
+    IListPhotosUseCase,
+)
+from photos.domain.value_objects.photo_status import PhotoStatus
 from photos.presentation.http.fastapi.controllers import (
+    collection_router,
     command_router,
     query_router,
+    webhook_router,
 )
+from photos.presentation.http.fastapi.upload_limit import UploadBodyLimit
+from photos.presentation.http.fastapi.webhook import StorageWebhookVerifier
 
 
 @pytest.mark.asyncio
@@ -34,14 +72,26 @@ class TestPhotoControllers:
     @pytest.fixture(autouse=True)
     def setup(self):
         self.app = FastAPI()
-        self.app.include_router(command_router)
-        self.app.include_router(query_router)
+        self.app.include_router(command_router, prefix="/photos")
+        self.app.include_router(query_router, prefix="/photos")
+        self.app.include_router(webhook_router, prefix="/photos")
+        self.app.include_router(collection_router)
         self.client: TestClient = TestClient(self.app)
 
         self.upload_photo_use_case = AsyncMock(spec=IUploadPhotoUseCase)
+        self.request_photo_upload_use_case = AsyncMock(
+            spec=IRequestPhotoUploadUseCase
+        )
+        self.confirm_photo_upload_use_case = AsyncMock(
+            spec=IConfirmPhotoUploadUseCase
+        )
         self.get_presigned_url_use_case = AsyncMock(
             spec=IGetPresignedUrlUseCase
         )
+        self.get_presigned_urls_use_case = AsyncMock(
+            spec=IGetPresignedUrlsUseCase
+        )
+        self.list_photos_use_case = AsyncMock(spec=IListPhotosUseCase)
         self.token_introspector = AsyncMock(spec=ITokenIntrospector)
         self.user_descriptor = self._get_user_descriptor()
         self.token_introspector.extract_user.return_value = (
@@ -51,9 +101,27 @@ class TestPhotoControllers:
         self.app.dependency_overrides[IUploadPhotoUseCase] = (
             lambda: self.upload_photo_use_case
         )
+        self.app.dependency_overrides[IRequestPhotoUploadUseCase] = (
+            lambda: self.request_photo_upload_use_case
+        )
+        self.app.dependency_overrides[IConfirmPhotoUploadUseCase] = (
+            lambda: self.confirm_photo_upload_use_case
+        )
+        self.app.dependency_overrides[UploadBodyLimit] = (
+            lambda: UploadBodyLimit(200_000, 1024)
+        )
+        self.app.dependency_overrides[StorageWebhookVerifier] = (
+            lambda: StorageWebhookVerifier("webhook-secret")
+        )
         self.app.dependency_overrides[IGetPresignedUrlUseCase] = (
             lambda: self.get_presigned_url_use_case
         )
+        self.app.dependency_overrides[IGetPresignedUrlsUseCase] = (
+            lambda: self.get_presigned_urls_use_case
+        )
+        self.app.dependency_overrides[IListPhotosUseCase] = (
+            lambda: self.list_photos_use_case
+        )
         self.app.dependency_overrides[ITokenIntrospector] = (
             lambda: self.token_introspector
         )
@@ -71,7 +139,7 @@ class TestPhotoControllers:
 
         # Act
         response = self.client.post(
-            "/upload",
+            "/photos/upload",
             files={"file": (photo_name, file_content, "image/jpeg")},
             headers={"Authorization": "Bearer valid_token"},
         )
@@ -84,6 +152,93 @@ class TestPhotoControllers:
             self.user_descriptor,
         )
 
+    async def test_upload_photo_streams_file_content(self):
+        # Arrange
+        file_content = b"\x89PNG" + b"\x00" * 100_000
+        received: list[bytes] = []
+
+        async def execute(
+            command: UploadPhotoCommand, user: UserDescriptor
+        ) -> str:
+            received.extend([chunk async for chunk in command.content])
+            return "photo.png"
+
+        self.upload_photo_use_case.execute.side_effect = execute
+
+        # Act
+        response = self.client.post(
+            "/photos/upload",
+            data={"description": "ignored"},
+            files={"file": ("photo.png", file_content, "image/png")},
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(received) == file_content
+
+    async def test_upload_photo_declared_oversized_body_fails(self):
+        # Arrange
+        read: list[bytes] = []
+
+        async def execute(
+            command: UploadPhotoCommand, user: UserDescriptor
+        ) -> str:
+            read.extend([chunk async for chunk in command.content])
+            return "photo.png"
+
+        self.upload_photo_use_case.execute.side_effect = execute
+
+        # Act
+        response = self.client.post(
+            "/photos/upload",
+            files={"file": ("photo.png", b"\x89PNG" * 60_000, "image/png")},
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert response.json()["detail"]["error"] == "ContentTooLargeError"
+        assert read == []
+
+    async def test_upload_photo_oversized_file_fails(self):
+        # Arrange
+        self.upload_photo_use_case.execute.side_effect = (
+            InvalidUploadSizeError(300_000, 200_000)
+        )
+
+        # Act
+        response = self.client.post(
+            "/photos/upload",
+            files={"file": ("photo.png", b"\x89PNG", "image/png")},
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert response.json()["detail"]["error"] == "InvalidUploadSizeError"
+
+    async def test_upload_photo_missing_file_fails(self):
+        # Arrange
+        async def execute(
+            command: UploadPhotoCommand, user: UserDescriptor
+        ) -> str:
+            await anext(command.content)
+            return "photo.png"
+
+        self.upload_photo_use_case.execute.side_effect = execute
+
+        # Act
+        response = self.client.post(
+            "/photos/upload",
+            files={"other": ("photo.png", b"data", "image/png")},
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"]["error"] == "InvalidContentError"
+
     async def test_upload_photo_unauthenticated_fails(self):
         # Arrange
         photo_name = "test-photo.jpg"
@@ -91,7 +246,7 @@ class TestPhotoControllers:
 
         # Act
         response = self.client.post(
-            "/upload", files={"file": (photo_name, file_content, "image/jpeg")}
+            "/photos/upload", files={"file": (photo_name, file_content, "image/jpeg")}
         )
 
         # Assert
@@ -99,6 +254,95 @@ class TestPhotoControllers:
         assert response.json() == {"detail": "Authentication required"}
         self.upload_photo_use_case.execute.assert_not_awaited()
 
+    async def test_request_upload_success(self):
+        # Arrange
+        self.request_photo_upload_use_case.execute.return_value = (
+            PhotoUploadDTO(
+                name="photo.png",
+                url="http://storage/photos",
+                fields={"key": "photo.png"},
+            )
+        )
+
+        # Act
+        response = self.client.post(
+            "/photos/uploads",
+            json={"content_type": "image/png", "size": 512},
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "name": "photo.png",
+            "url": "http://storage/photos",
+            "fields": {"key": "photo.png"},
+        }
+        self.request_photo_upload_use_case.execute.assert_awaited_once_with(
+            RequestPhotoUploadCommand(mime="image/png", size=512),
+            self.user_descriptor,
+        )
+
+    async def test_request_upload_invalid_size_fails(self):
+        # Arrange
+        self.request_photo_upload_use_case.execute.side_effect = (
+            InvalidUploadSizeError(0, 1024)
+        )
+
+        # Act
+        response = self.client.post(
+            "/photos/uploads",
+            json={"content_type": "image/png", "size": 0},
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"]["error"] == "InvalidUploadSizeError"
+
+    async def test_storage_event_confirms_created_objects(self):
+        # Arrange
+        self.confirm_photo_upload_use_case.execute.return_value = (
+            PhotoStatus.ACTIVE
+        )
+        event = {
+            "Records": [
+                {
+                    "eventName": "s3:ObjectCreated:Post",
+                    "s3": {"object": {"key": "a%2Bb.png"}},
+                },
+                {
+                    "eventName": "s3:ObjectRemoved:Delete",
+                    "s3": {"object": {"key": "c.png"}},
+                },
+            ]
+        }
+
+        # Act
+        response = self.client.post(
+            "/photos/uploads/events",
+            json=event,
+            headers={"Authorization": "Bearer webhook-secret"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        self.confirm_photo_upload_use_case.execute.assert_awaited_once_with(
+            ConfirmPhotoUploadCommand(name="a+b.png")
+        )
+
+    async def test_storage_event_invalid_token_fails(self):
+        # Act
+        response = self.client.post(
+            "/photos/uploads/events",
+            json={"Records": []},
+            headers={"Authorization": "Bearer wrong"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        self.confirm_photo_upload_use_case.execute.assert_not_awaited()
+
     async def test_get_presigned_url_success(self):
         # Arrange
         photo_name = "test-photo.jpg"
@@ -106,7 +350,7 @@ class TestPhotoControllers:
         self.get_presigned_url_use_case.execute.return_value = mock_url
 
         # Act
-        response = self.client.get(f"/presigned-url?name={photo_name}")
+        response = self.client.get(f"/photos/presigned-url?name={photo_name}")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -115,13 +359,154 @@ class TestPhotoControllers:
             GetPresignedUrlQuery(name=photo_name)
         )
 
+    async def test_get_presigned_url_variant_success(self):
+        # Arrange
+        photo_name = "test_photo.jpg"
+        mock_url = "url/variants/thumb/test_photo.jpg.webp"
+        self.get_presigned_url_use_case.execute.return_value = mock_url
+
+        # Act
+        response = self.client.get(
+            f"/photos/presigned-url?name={photo_name}&variant=thumb",
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"value": mock_url}
+        self.get_presigned_url_use_case.execute.assert_awaited_once_with(
+            GetPresignedUrlQuery(name=photo_name, variant="thumb")
+        )
+        self.token_introspector.extract_user.assert_awaited_once_with(
+            "valid_token"
+        )
+
+    async def test_get_presigned_url_variant_unauthenticated_fails(self):
+        # Act
+        response = self.client.get(
+            "/photos/presigned-url?name=test_photo.jpg&variant=thumb"
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        self.get_presigned_url_use_case.execute.assert_not_awaited()
+
+    async def test_get_presigned_url_unknown_variant_fails(self):
+        # Arrange
+        self.get_presigned_url_use_case.execute.side_effect = (
+            UnknownPhotoVariantError("huge")
+        )
+
+        # Act
+        response = self.client.get(
+            "/photos/presigned-url?name=test_photo.jpg&variant=huge",
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert (
+            response.json()["detail"]["error"] == "UnknownPhotoVariantError"
+        )
+
     async def test_get_presigned_url_missing_name_fails(self):
         # Act
         response = self.client.get(
-            "/presigned-url"
+            "/photos/presigned-url"
         )  # Missing 'name' query parameter
 
         # Assert
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
         assert "detail" in response.json()
         self.get_presigned_url_use_case.execute.assert_not_awaited()
+
+    async def test_list_photos_success(self):
+        # Arrange
+        self.list_photos_use_case.execute.return_value = PhotoPageDTO(
+            photos=[PhotoDTO(name="a.png", mime="image/png", url="url/a")],
+            next_cursor="next",
+        )
+
+        # Act
+        response = self.client.get(
+            "/photos?limit=1&cursor=prev",
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "photos": [{"name": "a.png", "mime": "image/png", "url": "url/a"}],
+            "next_cursor": "next",
+        }
+        self.list_photos_use_case.execute.assert_awaited_once_with(
+            ListPhotosQuery(limit=1, cursor="prev"), self.user_descriptor
+        )
+
+    async def test_list_photos_invalid_cursor_fails(self):
+        # Arrange
+        self.list_photos_use_case.execute.side_effect = (
+            InvalidPhotoCursorError("bad")
+        )
+
+        # Act
+        response = self.client.get(
+            "/photos?cursor=bad",
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"]["error"] == "InvalidPhotoCursorError"
+
+    @pytest.mark.parametrize("limit", [0, 101])
+    async def test_list_photos_invalid_limit_fails(self, limit: int):
+        # Act
+        response = self.client.get(
+            f"/photos?limit={limit}",
+            headers={"Authorization": "Bearer valid_token"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        self.list_photos_use_case.execute.assert_not_awaited()
+
+    async def test_list_photos_unauthenticated_fails(self):
+        # Act
+        response = self.client.get("/photos")
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        self.list_photos_use_case.execute.assert_not_awaited()
+
+    async def test_get_presigned_urls_success(self):
+        # Arrange
+        self.get_presigned_urls_use_case.execute.return_value = [
+            PresignedUrlDTO(name="a.png", url="url/a"),
+            PresignedUrlDTO(name="b.png", url="url/b"),
+        ]
+
+        # Act
+        response = self.client.post(
+            "/photos/presigned-urls", json={"names": ["a.png", "b.png"]}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"name": "a.png", "url": "url/a"},
+            {"name": "b.png", "url": "url/b"},
+        ]
+        self.get_presigned_urls_use_case.execute.assert_awaited_once_with(
+            GetPresignedUrlsQuery(names=["a.png", "b.png"])
+        )
+
+    async def test_get_presigned_urls_empty_names_fails(self):
+        # Act
+        response = self.client.post(
+            "/photos/presigned-urls", json={"names": []}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        self.get_presigned_urls_use_case.execute.assert_not_awaited()